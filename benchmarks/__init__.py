@@ -0,0 +1,5 @@
+"""Offline benchmark suite for the governed pipeline (tooling-only, not evidence).
+
+Run ``python -m benchmarks.run`` from the repository root. See
+``benchmarks/run.py`` for profiles, baselines and the compare mode.
+"""
@@ -0,0 +1,226 @@
+"""Deterministic synthetic inputs for the benchmark suite.
+
+Every generator is a pure function of its size arguments, so two runs (or
+two machines) benchmark the same bytes.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+
+def strategy_source(strategies: int) -> str:
+    """Surface DSL program with ``strategies`` momentum-style strategies."""
+    forms = [
+        f"(defstrategy strategy-{idx}\n"
+        f"  (params (window {idx % 90 + 10}) (threshold 0.0{idx % 9 + 1}))\n"
+        "  (let ((s (signal ma-diff price window)))\n"
+        "    (if (> s threshold)\n"
+        "        (buy size)\n"
+        "        (sell size))))"
+        for idx in range(strategies)
+    ]
+    return "\n".join(forms) + "\n"
+
+
+def program_ir(steps: int) -> Dict[str, object]:
+    """ProgramIR whose default plan has exactly ``steps`` NOOP steps."""
+    operator_ids = [f"SURF_{idx:06d}" for idx in range(steps)]
+    return {
+        "program_id": f"bench_steps_{steps}",
+        "hamiltonian": {
+            "terms": [
+                {"operator_id": operator_id, "cls": "U" if idx % 2 else "M", "coefficient": 1.0}
+                for idx, operator_id in enumerate(operator_ids)
+            ]
+        },
+        "operators": {
+            operator_id: {"type": "unspecified", "commutes_with": [], "backend_map": []}
+            for operator_id in operator_ids
+        },
+        "invariants": [],
+        "scheduler": {"collapse_policy": "unspecified", "authorized_observers": []},
+    }
+
+
+def ns_state(grid: int) -> Dict[str, object]:
+    """Smooth ``grid`` x ``grid`` velocity field in the NS fixture layout."""
+    state = _ns_header(grid)
+    state["field"] = [cell for row in range(grid) for cell in _ns_row(grid, row)]
+    return state
+
+
+def write_ns_state(path: Path, grid: int) -> Path:
+    """Stream ``ns_state(grid)`` to ``path`` as ``write_json`` would.
+
+    Rows are serialized one at a time, so a 2048 x 2048 fixture never has
+    to exist as one Python object.
+    """
+    head, tail = _json_frame(_ns_header(grid), "field")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write(head)
+        for row in range(grid):
+            cells = ", ".join(json.dumps(cell, sort_keys=True) for cell in _ns_row(grid, row))
+            handle.write(cells if row == 0 else ", " + cells)
+        handle.write(tail)
+    return path
+
+
+def price_series(ticks: int, symbol: str = "BENCH") -> Dict[str, object]:
+    """Deterministic random-walk price series with ``ticks`` prices."""
+    return {"prices": list(_prices(ticks)), "symbol": symbol}
+
+
+def write_price_series(path: Path, ticks: int, symbol: str = "BENCH") -> Path:
+    """Stream ``price_series(ticks)`` to ``path`` as ``write_json`` would."""
+    head, tail = _json_frame({"prices": None, "symbol": symbol}, "prices")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write(head)
+        chunk: List[str] = []
+        first = True
+        for price in _prices(ticks):
+            chunk.append(repr(price))
+            if len(chunk) == _CHUNK:
+                handle.write(("" if first else ", ") + ", ".join(chunk))
+                chunk = []
+                first = False
+        if chunk:
+            handle.write(("" if first else ", ") + ", ".join(chunk))
+        handle.write(tail)
+    return path
+
+
+def trading_policy() -> Dict[str, object]:
+    """Paper-trading policy with limits wide enough for any series length."""
+    return {
+        "policy_id": "policy_bench",
+        "signal_threshold": 0.0005,
+        "order_size": 10,
+        "spread_bps": 5,
+        "slippage_bps": 2,
+        "initial_equity": 1000000,
+        "max_drawdown": 0.5,
+        "max_position": 1000000,
+    }
+
+
+def shadow_policy() -> Dict[str, object]:
+    return {
+        "signal_threshold": 0.0005,
+        "order_size": 1.0,
+        "initial_equity": 1000000.0,
+        "max_drawdown": 0.5,
+        "spread_bps": 2.0,
+        "slippage_bps": 3.0,
+        "max_slippage_bps": 250.0,
+        "max_staleness_steps": 50,
+        "min_fill_ratio": 0.1,
+        "max_uncertainty": 1000.0,
+    }
+
+
+def shadow_model() -> Dict[str, object]:
+    return {
+        "model_id": "shadow_bench",
+        "seed": "0123456789abcdef" * 4,
+        "latency_steps": 2,
+        "spread_bps": 5.0,
+        "slippage_bps": 8.0,
+        "partial_fill_ratio": 0.6,
+        "regime_shift_bps": 12.0,
+        "seed_jitter_bps": 1.5,
+    }
+
+
+_CHUNK = 4096
+
+
+def _ns_header(grid: int) -> Dict[str, object]:
+    return {
+        "grid": {"nx": grid, "ny": grid, "dx": 1.0, "dy": 1.0},
+        "field": None,
+        "t": 0.0,
+        "dt": 0.1,
+        "nu": 0.01,
+        "metadata": {"state_id": f"ns_state_bench_{grid}"},
+    }
+
+
+def _ns_row(grid: int, row: int) -> List[Dict[str, float]]:
+    y = 2.0 * math.pi * row / grid
+    cells = []
+    for col in range(grid):
+        x = 2.0 * math.pi * col / grid
+        u = 0.2 * math.sin(x) * math.cos(y)
+        v = -0.2 * math.cos(x) * math.sin(y)
+        cells.append({"u": round(u, 6), "v": round(v, 6)})
+    return cells
+
+
+def _prices(ticks: int) -> Iterator[float]:
+    # 32-bit LCG: identical on every platform, unlike ``random``'s float paths.
+    state = 0x2545F491
+    price = 100.0
+    for _ in range(ticks):
+        yield price
+        state = (1664525 * state + 1013904223) & 0xFFFFFFFF
+        price = round(max(1.0, price * (1.0 + ((state >> 8) / float(1 << 24) - 0.5) * 0.002)), 4)
+
+
+def _json_frame(document: Dict[str, object], key: str) -> Tuple[str, str]:
+    """``write_json`` output of ``document`` split around the ``key`` list."""
+    marker = "__hpl_stream__"
+    rendered = json.dumps({**document, key: [marker]}, sort_keys=True)
+    head, tail = rendered.split(json.dumps(marker))
+    return head, tail
+
+
+def ns_policy() -> Dict[str, object]:
+    return {
+        "policy_id": "ns_policy_bench",
+        "nonlinear_coeff": 0.1,
+        "max_energy": 1.0e9,
+        "max_divergence": 1.0e9,
+        "max_dissipation": 1.0e9,
+        "max_cfl": 1.0e9,
+        "max_dt": 1.0,
+    }
+
+
+def write_json(path: Path, payload: Dict[str, object]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+    return path
+
+
+def write_files(directory: Path, files: int, total_bytes: int) -> List[Path]:
+    """Write ``files`` text files totalling ``total_bytes`` into ``directory``.
+
+    Contents are plain log-like lines with no secret-shaped tokens, so the
+    redaction scanner reads every byte and reports nothing.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    paths: List[Path] = []
+    base, remainder = divmod(total_bytes, files)
+    for idx in range(files):
+        size = base + (1 if idx < remainder else 0)
+        paths.append(_write_text_file(directory / f"artifact_{idx:05d}.log", idx, size))
+    return paths
+
+
+def _write_text_file(path: Path, seed: int, size: int) -> Path:
+    lines: List[str] = []
+    written = 0
+    line_no = 0
+    while written < size:
+        line = f"step {line_no} seed {seed} value {(line_no * 7919 + seed * 104729) % 1000003}\n"
+        lines.append(line)
+        written += len(line)
+        line_no += 1
+    path.write_text("".join(lines)[:size], encoding="utf-8")
+    return path
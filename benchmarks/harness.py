@@ -0,0 +1,129 @@
+"""Timing, summary statistics and baseline comparison for benchmark cases."""
+
+from __future__ import annotations
+
+import math
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+RESULTS_FORMAT = "hpl.benchmarks.v1"
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_METRIC = "p50"
+LATENCY_METRICS = ("min", "mean", "p50", "p90", "p99", "max")
+
+
+def measure(
+    operation: Callable[[], object],
+    units: int,
+    unit: str,
+    repeat: int,
+    warmup: int = 1,
+) -> Dict[str, object]:
+    """Time ``operation`` ``repeat`` times after ``warmup`` untimed calls.
+
+    ``units`` is the amount of work one call does (steps, files, bytes ...),
+    so throughput is comparable across sizes.
+    """
+    for _ in range(warmup):
+        operation()
+    samples: List[float] = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        operation()
+        samples.append(time.perf_counter() - start)
+    latency = summarize(samples)
+    p50 = latency["p50"]
+    return {
+        "unit": unit,
+        "units_per_call": units,
+        "repeat": len(samples),
+        "latency_s": latency,
+        "throughput_per_s": round(units / p50, 3) if p50 else None,
+    }
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "min": round(ordered[0], 9),
+        "mean": round(sum(ordered) / len(ordered), 9),
+        "p50": round(percentile(ordered, 50), 9),
+        "p90": round(percentile(ordered, 90), 9),
+        "p99": round(percentile(ordered, 99), 9),
+        "max": round(ordered[-1], 9),
+    }
+
+
+def percentile(ordered: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty sequence."""
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def compare(
+    current: Dict[str, object],
+    baseline: Dict[str, object],
+    tolerance: float = DEFAULT_TOLERANCE,
+    metric: str = DEFAULT_METRIC,
+) -> Dict[str, object]:
+    """Flag cases whose ``metric`` latency grew by more than ``tolerance``.
+
+    Cases present on only one side are listed but never fail the comparison,
+    so adding or retiring a case does not need a baseline refresh.
+    """
+    if metric not in LATENCY_METRICS:
+        raise ValueError(f"unknown latency metric: {metric}")
+    current_results = _results(current)
+    baseline_results = _results(baseline)
+    regressions: List[Dict[str, object]] = []
+    improvements: List[Dict[str, object]] = []
+    for key in sorted(set(current_results) & set(baseline_results)):
+        now = _latency(current_results[key], metric)
+        before = _latency(baseline_results[key], metric)
+        if now is None or not before:
+            continue
+        entry = {"case": key, "baseline_s": before, "current_s": now, "ratio": round(now / before, 3)}
+        if now > before * (1.0 + tolerance):
+            regressions.append(entry)
+        elif now < before * (1.0 - tolerance):
+            improvements.append(entry)
+    return {
+        "ok": not regressions,
+        "metric": metric,
+        "tolerance": tolerance,
+        "regressions": regressions,
+        "improvements": improvements,
+        "missing_in_current": sorted(set(baseline_results) - set(current_results)),
+        "missing_in_baseline": sorted(set(current_results) - set(baseline_results)),
+    }
+
+
+def environment() -> Dict[str, object]:
+    from hpl import __version__
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "hpl_version": __version__,
+        "executable_bits": 64 if sys.maxsize > 2**32 else 32,
+    }
+
+
+def _results(payload: Dict[str, object]) -> Dict[str, Dict[str, object]]:
+    if payload.get("format") != RESULTS_FORMAT:
+        raise ValueError(f"unsupported benchmark results format: {payload.get('format')}")
+    results = payload.get("results")
+    return results if isinstance(results, dict) else {}
+
+
+def _latency(result: Dict[str, object], metric: str) -> Optional[float]:
+    latency = result.get("latency_s")
+    if not isinstance(latency, dict):
+        return None
+    value = latency.get(metric)
+    return float(value) if isinstance(value, (int, float)) else None
@@ -0,0 +1,133 @@
+"""Run the benchmark suite, store baselines and compare against them.
+
+    python -m benchmarks.run --profile quick
+    python -m benchmarks.run --profile full --save-baseline
+    python -m benchmarks.run --profile quick --compare --tolerance 0.3
+
+Results are JSON (``hpl.benchmarks.v1``): per case and size, latency
+percentiles over ``--repeat`` timed calls and throughput in the case's unit.
+Baselines live in ``benchmarks/baselines/<profile>.json``; compare mode
+exits 1 when a case's latency grew by more than ``--tolerance``. Stored
+caches are disabled while timing so every run does the full work, and
+nothing touches the network.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = ROOT / "src"
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from benchmarks import harness  # noqa: E402
+from benchmarks.suite import CASES, PROFILES  # noqa: E402
+
+BASELINE_DIR = ROOT / "benchmarks" / "baselines"
+DEFAULT_REPEAT = {"quick": 5, "full": 20}
+
+
+def baseline_path(profile: str) -> Path:
+    return BASELINE_DIR / f"{profile}.json"
+
+
+def run_suite(
+    profile: str,
+    cases: Optional[Sequence[str]] = None,
+    repeat: Optional[int] = None,
+    warmup: int = 1,
+) -> Dict[str, object]:
+    if profile not in PROFILES:
+        raise ValueError(f"unknown benchmark profile: {profile}")
+    selected = list(cases) if cases else list(CASES)
+    unknown = sorted(set(selected) - set(CASES))
+    if unknown:
+        raise ValueError(f"unknown benchmark cases: {', '.join(unknown)}")
+    count = repeat if repeat is not None else DEFAULT_REPEAT[profile]
+
+    results: Dict[str, object] = {}
+    with _caches_disabled(), tempfile.TemporaryDirectory(prefix="hpl_bench_") as tmp_dir:
+        for name in selected:
+            case = CASES[name]
+            for index, (key, params) in enumerate(case.keys(profile)):
+                work_dir = Path(tmp_dir) / name / str(index)
+                work_dir.mkdir(parents=True)
+                operation, units = case.setup(params, work_dir)
+                results[key] = harness.measure(operation, units, case.unit, repeat=count, warmup=warmup)
+    return {
+        "format": harness.RESULTS_FORMAT,
+        "profile": profile,
+        "environment": harness.environment(),
+        "results": results,
+    }
+
+
+@contextmanager
+def _caches_disabled() -> Iterator[None]:
+    from hpl.cache import CACHE_DISABLED_ENV
+
+    previous = os.environ.get(CACHE_DISABLED_ENV)
+    os.environ[CACHE_DISABLED_ENV] = "1"
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(CACHE_DISABLED_ENV, None)
+        else:
+            os.environ[CACHE_DISABLED_ENV] = previous
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the HPL pipeline offline.")
+    parser.add_argument("--profile", choices=PROFILES, default="quick")
+    parser.add_argument("--case", action="append", choices=sorted(CASES), help="run only this case (repeatable)")
+    parser.add_argument("--repeat", type=int, help="timed calls per case and size")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed calls before timing")
+    parser.add_argument("--out", type=Path, help="write results JSON here")
+    parser.add_argument("--save-baseline", action="store_true", help="store results as the profile baseline")
+    parser.add_argument(
+        "--compare",
+        nargs="?",
+        type=Path,
+        const=Path(),
+        help="compare against a results file (default: the profile baseline)",
+    )
+    parser.add_argument("--tolerance", type=float, default=harness.DEFAULT_TOLERANCE)
+    parser.add_argument("--metric", choices=harness.LATENCY_METRICS, default=harness.DEFAULT_METRIC)
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.profile, cases=args.case, repeat=args.repeat, warmup=args.warmup)
+    rendered = json.dumps(results, indent=2, sort_keys=True)
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(rendered + "\n", encoding="utf-8")
+    if args.save_baseline:
+        target = baseline_path(args.profile)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(rendered + "\n", encoding="utf-8")
+
+    if args.compare is None:
+        print(rendered)
+        return 0
+    reference = args.compare if args.compare != Path() else baseline_path(args.profile)
+    if not reference.exists():
+        print(f"Baseline not found: {reference}")
+        return 1
+    baseline = json.loads(reference.read_text(encoding="utf-8"))
+    report = harness.compare(results, baseline, tolerance=args.tolerance, metric=args.metric)
+    print(json.dumps(report, indent=2))
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
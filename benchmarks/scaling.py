@@ -0,0 +1,267 @@
+"""Scaling benchmarks for the NS and trading effect packs.
+
+    python -m benchmarks.scaling
+    python -m benchmarks.scaling --pack ns --max-grid 2048
+    python -m benchmarks.scaling --pack trading_paper --max-ticks 10000000 --out scaling.json
+
+Each pack runs its scheduler track through ``RuntimeEngine`` once per size
+class, on fixtures generated by ``benchmarks.generators``: NS states from
+16x16 to 2048x2048 and price series from 10^2 to 10^7 ticks. The record
+for a class holds wall and CPU time, peak RSS, per-step costs from
+``RuntimeProfiler`` and the size of every artifact written.
+
+The artifacts are also digested and checked against
+``benchmarks/reference_digests.json``. An optimisation has to keep every
+recorded digest to pass. ``--record-digests`` adds or refreshes entries
+after an intended output change. Each class runs in a fresh process
+(``--in-process`` to opt out), so peak RSS belongs to that class alone.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = ROOT / "src"
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from benchmarks import generators  # noqa: E402
+
+SCALING_FORMAT = "hpl.benchmarks.scaling.v1"
+DIGESTS_FORMAT = "hpl.benchmarks.reference_digests.v1"
+REFERENCE_DIGESTS = ROOT / "benchmarks" / "reference_digests.json"
+NS_GRIDS = (16, 32, 64, 128, 256, 512, 1024, 2048)
+PRICE_TICKS = (10**2, 10**3, 10**4, 10**5, 10**6, 10**7)
+DEFAULT_MAX_GRID = 256
+DEFAULT_MAX_TICKS = 10**5
+
+Fixtures = Callable[[int, Path], Dict[str, object]]
+
+
+@dataclass(frozen=True)
+class Pack:
+    name: str
+    track: str
+    size_param: str
+    sizes: Tuple[int, ...]
+    fixtures: Fixtures
+
+
+def _ns_fixtures(grid: int, inputs: Path) -> Dict[str, object]:
+    return {
+        "ns_state_path": generators.write_ns_state(inputs / "ns_state.json", grid),
+        "ns_policy_path": generators.write_json(inputs / "ns_policy.json", generators.ns_policy()),
+    }
+
+
+def _trading_paper_fixtures(ticks: int, inputs: Path) -> Dict[str, object]:
+    return {
+        "trading_fixture_path": generators.write_price_series(inputs / "price_series.json", ticks),
+        "trading_policy_path": generators.write_json(inputs / "policy.json", generators.trading_policy()),
+    }
+
+
+def _trading_shadow_fixtures(ticks: int, inputs: Path) -> Dict[str, object]:
+    return {
+        "trading_fixture_path": generators.write_price_series(inputs / "price_series.json", ticks),
+        "trading_policy_path": generators.write_json(inputs / "shadow_policy.json", generators.shadow_policy()),
+        "trading_shadow_model_path": generators.write_json(inputs / "shadow_model.json", generators.shadow_model()),
+    }
+
+
+PACKS: Dict[str, Pack] = {
+    pack.name: pack
+    for pack in (
+        Pack("ns", "navier_stokes", "grid", NS_GRIDS, _ns_fixtures),
+        Pack("trading_paper", "trading_paper_mode", "ticks", PRICE_TICKS, _trading_paper_fixtures),
+        Pack("trading_shadow", "trading_shadow_mode", "ticks", PRICE_TICKS, _trading_shadow_fixtures),
+    )
+}
+
+
+def case_key(pack: Pack, size: int) -> str:
+    return f"{pack.name}/{pack.size_param}={size}"
+
+
+def run_class(pack_name: str, size: int) -> Dict[str, object]:
+    """Generate fixtures for one size class, plan and run it, and measure."""
+    from hpl import scheduler
+    from hpl.execution_token import ExecutionToken
+    from hpl.runtime.context import RuntimeContext
+    from hpl.runtime.contracts import ExecutionContract
+    from hpl.runtime.engine import RuntimeEngine
+    from hpl.runtime.profiling import RuntimeProfiler, _max_rss_bytes
+
+    pack = PACKS[pack_name]
+    with tempfile.TemporaryDirectory(prefix="hpl_scaling_") as tmp_dir:
+        inputs = Path(tmp_dir) / "inputs"
+        work_dir = Path(tmp_dir) / "work"
+        work_dir.mkdir(parents=True)
+        fixtures = pack.fixtures(size, inputs)
+        fixture_bytes = sum(path.stat().st_size for path in inputs.iterdir())
+
+        ctx = scheduler.SchedulerContext(track=pack.track, emit_effect_steps=True, **fixtures)
+        plan = scheduler.plan(generators.program_ir(0), ctx).to_dict()
+        token = plan.get("execution_token")
+        runtime_ctx = RuntimeContext(
+            execution_token=ExecutionToken.from_dict(token) if isinstance(token, dict) else None,
+            trace_sink=work_dir,
+        )
+        contract = ExecutionContract(allowed_steps={str(step["step_id"]) for step in plan.get("steps", [])})
+        profiler = RuntimeProfiler()
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        result = RuntimeEngine(profiler=profiler).run(plan, runtime_ctx, contract)
+        wall_s = time.perf_counter() - wall_start
+        cpu_s = time.process_time() - cpu_start
+
+        artifacts = {
+            path.name: {"bytes": path.stat().st_size, "digest": _digest_file(path)}
+            for path in sorted(work_dir.iterdir())
+            if path.is_file()
+        }
+
+    digests = {name: entry["digest"] for name, entry in artifacts.items()}
+    return {
+        "case": case_key(pack, size),
+        "pack": pack.name,
+        pack.size_param: size,
+        "status": result.status,
+        "reasons": list(result.reasons),
+        "wall_s": round(wall_s, 6),
+        "cpu_s": round(cpu_s, 6),
+        "peak_rss_bytes": _max_rss_bytes(),
+        "fixture_bytes": fixture_bytes,
+        "artifact_bytes": sum(int(entry["bytes"]) for entry in artifacts.values()),
+        "artifacts": artifacts,
+        "output_digest": _digest_text(json.dumps(digests, sort_keys=True, separators=(",", ":"))),
+        "steps": profiler.to_dict()["steps"],
+    }
+
+
+def run_scaling(
+    packs: Sequence[str],
+    max_grid: int = DEFAULT_MAX_GRID,
+    max_ticks: int = DEFAULT_MAX_TICKS,
+    isolate: bool = True,
+    reference: Optional[Dict[str, str]] = None,
+) -> Dict[str, object]:
+    limits = {"grid": max_grid, "ticks": max_ticks}
+    classes = [
+        (pack_name, size)
+        for pack_name in packs
+        for size in PACKS[pack_name].sizes
+        if size <= limits[PACKS[pack_name].size_param]
+    ]
+    records: List[Dict[str, object]] = []
+    for pack_name, size in classes:
+        if isolate:
+            # A fresh interpreter per class keeps ru_maxrss from carrying over.
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                records.append(pool.submit(run_class, pack_name, size).result())
+        else:
+            records.append(run_class(pack_name, size))
+
+    reference = reference if reference is not None else load_reference_digests()
+    for record in records:
+        expected = reference.get(str(record["case"]))
+        if expected is None:
+            record["digest_check"] = "unrecorded"
+        else:
+            record["digest_check"] = "match" if expected == record["output_digest"] else "mismatch"
+    return {
+        "format": SCALING_FORMAT,
+        "ok": all(item["status"] == "completed" and item["digest_check"] != "mismatch" for item in records),
+        "classes": records,
+    }
+
+
+def load_reference_digests(path: Path = REFERENCE_DIGESTS) -> Dict[str, str]:
+    if not path.exists():
+        return {}
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if payload.get("format") != DIGESTS_FORMAT:
+        raise ValueError(f"unsupported reference digests format: {payload.get('format')}")
+    digests = payload.get("digests")
+    return dict(digests) if isinstance(digests, dict) else {}
+
+
+def record_reference_digests(records: Sequence[Dict[str, object]], path: Path = REFERENCE_DIGESTS) -> None:
+    digests = load_reference_digests(path)
+    for record in records:
+        if record["status"] == "completed":
+            digests[str(record["case"])] = str(record["output_digest"])
+    payload = {"format": DIGESTS_FORMAT, "digests": {key: digests[key] for key in sorted(digests)}}
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Scaling benchmarks for the NS and trading effect packs.")
+    parser.add_argument("--pack", action="append", choices=sorted(PACKS), help="run only this pack (repeatable)")
+    parser.add_argument("--max-grid", type=int, default=DEFAULT_MAX_GRID, help=f"largest NS grid, up to {NS_GRIDS[-1]}")
+    parser.add_argument(
+        "--max-ticks", type=int, default=DEFAULT_MAX_TICKS, help=f"longest price series, up to {PRICE_TICKS[-1]}"
+    )
+    parser.add_argument("--in-process", action="store_true", help="run every class in this process")
+    parser.add_argument("--out", type=Path, help="write the full report JSON here")
+    parser.add_argument("--record-digests", action="store_true", help="store output digests as the reference")
+    args = parser.parse_args(argv)
+
+    report = run_scaling(
+        args.pack or list(PACKS),
+        max_grid=args.max_grid,
+        max_ticks=args.max_ticks,
+        isolate=not args.in_process,
+    )
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    if args.record_digests:
+        record_reference_digests(report["classes"])  # type: ignore[arg-type]
+
+    summary = [
+        {
+            "case": item["case"],
+            "status": item["status"],
+            "wall_s": item["wall_s"],
+            "peak_rss_bytes": item["peak_rss_bytes"],
+            "artifact_bytes": item["artifact_bytes"],
+            "digest_check": item["digest_check"],
+        }
+        for item in report["classes"]  # type: ignore[union-attr]
+    ]
+    print(json.dumps({"ok": report["ok"], "classes": summary}, indent=2))
+    if args.record_digests:
+        return 0 if all(item["status"] == "completed" for item in summary) else 1
+    return 0 if report["ok"] else 1
+
+
+def _digest_file(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            hasher.update(block)
+    return f"sha256:{hasher.hexdigest()}"
+
+
+def _digest_text(text: str) -> str:
+    return f"sha256:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
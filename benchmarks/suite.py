@@ -0,0 +1,286 @@
+"""Benchmark cases: what each one measures and at which sizes.
+
+A case's ``setup`` builds its inputs under a scratch directory and returns
+the operation to time plus the units of work one call performs. Sizes are
+listed per profile: ``quick`` finishes in seconds and suits CI, ``full``
+shows how each stage scales.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Tuple
+
+from . import generators
+
+
+Operation = Callable[[], object]
+Setup = Callable[[Mapping[str, int], Path], Tuple[Operation, int]]
+PROFILES = ("quick", "full")
+_BENCH_SEED = bytes(range(32))
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    unit: str
+    setup: Setup
+    sizes: Dict[str, Tuple[Dict[str, int], ...]]
+
+    def keys(self, profile: str) -> List[Tuple[str, Dict[str, int]]]:
+        return [(case_key(self.name, params), params) for params in self.sizes[profile]]
+
+
+def case_key(name: str, params: Mapping[str, int]) -> str:
+    return name + "/" + ",".join(f"{key}={value}" for key, value in params.items())
+
+
+def _setup_compile(params: Mapping[str, int], work_dir: Path) -> Tuple[Operation, int]:
+    from hpl.compile_cache import compile_source
+
+    text = generators.strategy_source(params["strategies"])
+    return (lambda: compile_source(text, program_id="bench_compile")), params["strategies"]
+
+
+def _setup_plan(params: Mapping[str, int], work_dir: Path) -> Tuple[Operation, int]:
+    from hpl import scheduler
+
+    program_ir = generators.program_ir(params["steps"])
+    ctx = scheduler.SchedulerContext(budget_steps=params["steps"])
+    return (lambda: scheduler.plan(program_ir, ctx)), params["steps"]
+
+
+def _setup_run(params: Mapping[str, int], work_dir: Path) -> Tuple[Operation, int]:
+    from hpl import scheduler
+    from hpl.execution_token import ExecutionToken
+    from hpl.runtime.context import RuntimeContext
+    from hpl.runtime.contracts import ExecutionContract
+    from hpl.runtime.engine import RuntimeEngine
+
+    steps = params["steps"]
+    plan = scheduler.plan(generators.program_ir(steps), scheduler.SchedulerContext(budget_steps=steps))
+    ctx = RuntimeContext(execution_token=ExecutionToken.from_dict(plan.execution_token or {}))
+    contract = ExecutionContract(allowed_steps={step["operator_id"] for step in plan.steps})
+    engine = RuntimeEngine()
+
+    def operation() -> object:
+        result = engine.run(plan, ctx, contract)
+        if result.status != "completed":
+            raise RuntimeError(f"benchmark run did not complete: {result.reasons}")
+        return result
+
+    return operation, steps
+
+
+_NS_STEPS = (
+    ("NS_EVOLVE_LINEAR", {"state_path": "ns_state.json", "out_path": "ns_state_linear.json"}),
+    (
+        "NS_APPLY_DUHAMEL",
+        {"state_path": "ns_state_linear.json", "policy_path": "ns_policy.json", "out_path": "ns_state_nonlinear.json"},
+    ),
+    ("NS_PROJECT_LERAY", {"state_path": "ns_state_nonlinear.json", "out_path": "ns_state_projected.json"}),
+    ("NS_PRESSURE_RECOVER", {"state_path": "ns_state_projected.json", "out_path": "ns_pressure.json"}),
+    (
+        "NS_MEASURE_OBSERVABLES",
+        {"state_path": "ns_state_projected.json", "policy_path": "ns_policy.json", "out_path": "ns_observables.json"},
+    ),
+    (
+        "NS_CHECK_BARRIER",
+        {"observables_path": "ns_observables.json", "policy_path": "ns_policy.json", "out_path": "ns_gate.json"},
+    ),
+    ("NS_EMIT_STATE", {"state_path": "ns_state_projected.json", "out_path": "ns_state_final.json"}),
+)
+
+
+def _setup_ns_pipeline(params: Mapping[str, int], work_dir: Path) -> Tuple[Operation, int]:
+    from hpl.runtime.context import RuntimeContext
+    from hpl.runtime.effects import EffectStep, get_handler
+
+    grid = params["grid"]
+    generators.write_json(work_dir / "ns_state.json", generators.ns_state(grid))
+    generators.write_json(work_dir / "ns_policy.json", generators.ns_policy())
+    ctx = RuntimeContext(trace_sink=work_dir)
+    steps = [
+        EffectStep(step_id=effect_type.lower(), effect_type=effect_type, args=dict(args))
+        for effect_type, args in _NS_STEPS
+    ]
+
+    def operation() -> object:
+        for step in steps:
+            result = get_handler(step.effect_type)(step, ctx)
+            if not result.ok:
+                raise RuntimeError(f"{step.effect_type} refused: {result.refusal_type}")
+        return None
+
+    return operation, grid * grid
+
+
+def _setup_bundle(params: Mapping[str, int], work_dir: Path) -> Tuple[Operation, int]:
+    from tools import bundle_evidence
+
+    paths = generators.write_files(work_dir / "inputs", params["files"], params["bytes"])
+    artifacts = [bundle_evidence._artifact(f"bench_{idx:05d}", path) for idx, path in enumerate(paths)]
+    out_dir = work_dir / "bundles"
+
+    def operation() -> object:
+        return bundle_evidence.build_bundle(
+            out_dir=out_dir,
+            artifacts=artifacts,
+            epoch_anchor=None,
+            epoch_sig=None,
+            public_key=None,
+        )
+
+    return operation, params["files"]
+
+
+def _anchor_inputs(params: Mapping[str, int], work_dir: Path) -> object:
+    from nacl.signing import SigningKey
+
+    from tools.anchor_generator import AnchorInputs
+
+    bundle_dir = work_dir / "bundle"
+    generators.write_files(bundle_dir, params["files"], params["bytes"])
+    signing_key = SigningKey(_BENCH_SEED)
+    key_path = work_dir / "bench_ed25519.sk"
+    key_path.write_text(_BENCH_SEED.hex(), encoding="utf-8")
+    public_key_path = work_dir / "bench_ed25519.pub"
+    public_key_path.write_text(signing_key.verify_key.encode().hex(), encoding="utf-8")
+    return AnchorInputs(
+        bundle_dir=bundle_dir,
+        out_dir=work_dir / "anchor",
+        manifest_name="anchor_manifest.json",
+        leaves_name="anchor_leaves.json",
+        signature_name="anchor_manifest.sig",
+        repo="bench",
+        git_commit="0" * 40,
+        challenge_window_mode="blocks",
+        challenge_window_value="0",
+        challenge_window_chain="none",
+        challenge_window_policy="bench",
+        signing_key=key_path,
+        signing_key_env="HPL_BENCH_SIGNING_KEY",
+        public_key=public_key_path,
+        exclude=(),
+    )
+
+
+def _setup_generate_anchor(params: Mapping[str, int], work_dir: Path) -> Tuple[Operation, int]:
+    from tools.anchor_generator import generate_anchor
+
+    inputs = _anchor_inputs(params, work_dir)
+    return (lambda: generate_anchor(inputs)), params["files"]
+
+
+def _setup_verify_anchor(params: Mapping[str, int], work_dir: Path) -> Tuple[Operation, int]:
+    from tools.anchor_generator import generate_anchor
+    from tools.verify_anchor import verify_anchor
+
+    inputs = _anchor_inputs(params, work_dir)
+    generate_anchor(inputs)
+    out_dir = inputs.out_dir
+
+    def operation() -> object:
+        result = verify_anchor(
+            bundle_dir=inputs.bundle_dir,
+            manifest_path=out_dir / inputs.manifest_name,
+            leaves_path=out_dir / inputs.leaves_name,
+            signature_path=out_dir / inputs.signature_name,
+            public_key=inputs.public_key,
+        )
+        if not result.get("ok"):
+            raise RuntimeError(f"benchmark anchor did not verify: {result.get('errors')}")
+        return result
+
+    return operation, params["files"]
+
+
+def _setup_scan(params: Mapping[str, int], work_dir: Path) -> Tuple[Operation, int]:
+    from hpl.runtime.redaction import scan_artifacts
+
+    paths = generators.write_files(work_dir / "inputs", params["files"], params["bytes"])
+    return (lambda: scan_artifacts(paths)), params["bytes"]
+
+
+def _files(*pairs: Tuple[int, int]) -> Tuple[Dict[str, int], ...]:
+    return tuple({"files": files, "bytes": total} for files, total in pairs)
+
+
+CASES: Dict[str, Case] = {
+    case.name: case
+    for case in (
+        Case(
+            name="compile",
+            unit="strategies",
+            setup=_setup_compile,
+            sizes={
+                "quick": ({"strategies": 10}, {"strategies": 50}),
+                "full": ({"strategies": 10}, {"strategies": 100}, {"strategies": 500}),
+            },
+        ),
+        Case(
+            name="plan",
+            unit="steps",
+            setup=_setup_plan,
+            sizes={
+                "quick": ({"steps": 10}, {"steps": 200}),
+                "full": ({"steps": 10}, {"steps": 1000}, {"steps": 10000}),
+            },
+        ),
+        Case(
+            name="run",
+            unit="steps",
+            setup=_setup_run,
+            sizes={
+                "quick": ({"steps": 10}, {"steps": 200}),
+                "full": ({"steps": 10}, {"steps": 1000}, {"steps": 10000}),
+            },
+        ),
+        Case(
+            name="ns_pipeline",
+            unit="cells",
+            setup=_setup_ns_pipeline,
+            sizes={
+                "quick": ({"grid": 8}, {"grid": 32}),
+                "full": ({"grid": 16}, {"grid": 64}, {"grid": 256}),
+            },
+        ),
+        Case(
+            name="build_bundle",
+            unit="files",
+            setup=_setup_bundle,
+            sizes={
+                "quick": _files((10, 64 * 1024)),
+                "full": _files((10, 64 * 1024), (200, 16 * 1024 * 1024)),
+            },
+        ),
+        Case(
+            name="generate_anchor",
+            unit="files",
+            setup=_setup_generate_anchor,
+            sizes={
+                "quick": _files((10, 64 * 1024)),
+                "full": _files((10, 64 * 1024), (200, 16 * 1024 * 1024)),
+            },
+        ),
+        Case(
+            name="verify_anchor",
+            unit="files",
+            setup=_setup_verify_anchor,
+            sizes={
+                "quick": _files((10, 64 * 1024)),
+                "full": _files((10, 64 * 1024), (200, 16 * 1024 * 1024)),
+            },
+        ),
+        Case(
+            name="scan_artifacts",
+            unit="bytes",
+            setup=_setup_scan,
+            sizes={
+                "quick": _files((10, 256 * 1024)),
+                "full": _files((10, 256 * 1024), (200, 32 * 1024 * 1024)),
+            },
+        ),
+    )
+}
@@ -6,13 +6,13 @@ from dataclasses import dataclass
 from typing import Any, Iterable, List, Optional, Union
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceLocation:
     line: int
     column: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Node:
     value: Union[str, float, int, List["Node"]]
     location: Optional[SourceLocation] = None
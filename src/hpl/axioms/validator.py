@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import Callable, List, Optional, Sequence, Tuple
 
 from ..ast import Node
 from ..errors import ValidationError
@@ -26,6 +26,23 @@ SURFACE_SYMBOLS = {
     "size",
 }
 
+# Paths are shared-prefix links ``(parent, index)`` and only turned into
+# ``List[int]`` when an error is reported.
+PathLink = Optional[Tuple["PathLink", int]]
+Term = Tuple[str, float, Node]
+Rule = Callable[[Node, PathLink, List[Term]], Optional[Sequence[Optional["Rule"]]]]
+
+
+class _Failure(Exception):
+    def __init__(self, message: str, node: Node, path: PathLink) -> None:
+        super().__init__(message)
+        self.message = message
+        self.node = node
+        self.path = path
+
+    def to_error(self) -> ValidationError:
+        return ValidationError(self.message, self.node.location, _materialize(self.path))
+
 
 def _is_symbol(node: Node) -> bool:
     return node.is_atom and isinstance(node.value, str)
@@ -39,180 +56,272 @@ def _fail(message: str, node: Node, path: List[int]) -> None:
     raise ValidationError(message, node.location, path)
 
 
+def _materialize(path: PathLink) -> List[int]:
+    indices: List[int] = []
+    while path is not None:
+        path, index = path
+        indices.append(index)
+    indices.reverse()
+    return indices
+
+
+def _link(path: Sequence[int]) -> PathLink:
+    link: PathLink = None
+    for index in path:
+        link = (link, index)
+    return link
+
+
 def validate_program(program: List[Node], trace: TraceCollector | None = None) -> None:
+    validate_and_collect_terms(program, trace=trace)
+
+
+def validate_and_collect_terms(
+    program: List[Node],
+    trace: TraceCollector | None = None,
+) -> List[Term]:
+    """Validate ``program`` and return its Hamiltonian terms from the same walk.
+
+    Terms are ``(operator_id, coefficient, term_node)`` in source order, as
+    ``ir_emitter`` would collect them.
+    """
     if trace:
         trace.record_phase(program, "axiomatic")
         trace.map_by_path("expanded", "axiomatic", "expanded_to_axiomatic")
 
+    terms: List[Term] = []
     for index, form in enumerate(program):
-        _reject_surface_symbols(form, [index])
-        _validate_form(form, [index])
+        _walk(form, (None, index), _rule_form, terms, reject_surface=True)
+    return terms
+
+
+def _walk(
+    root: Node,
+    root_path: PathLink,
+    rule: Optional[Rule],
+    terms: List[Term],
+    reject_surface: bool,
+) -> None:
+    """Validate one form with an explicit stack, in source (pre-)order.
+
+    Surface symbols anywhere in the form take precedence over structural
+    errors, so the first structural failure is held until the whole form has
+    been scanned for surface symbols.
+    """
+    failure: Optional[_Failure] = None
+    stack: List[Tuple[Node, PathLink, Optional[Rule]]] = [(root, root_path, rule)]
+    while stack:
+        node, path, rule = stack.pop()
+        value = node.value
+        if reject_surface and isinstance(value, str) and value in SURFACE_SYMBOLS:
+            _fail("Surface symbol found after macro expansion", node, _materialize(path))
+
+        child_rules = None
+        if rule is not None and failure is None:
+            try:
+                child_rules = rule(node, path, terms)
+            except _Failure as exc:
+                if not reject_surface:
+                    raise exc.to_error() from None
+                failure = exc
+
+        if not isinstance(value, list) or (child_rules is None and not reject_surface):
+            continue
+        for idx in range(len(value) - 1, -1, -1):
+            child_rule = child_rules[idx] if child_rules is not None else None
+            stack.append((value[idx], (path, idx), child_rule))
+
+    if failure is not None:
+        raise failure.to_error()
+
+
+def _require_list(node: Node, path: PathLink, message: str) -> List[Node]:
+    if node.is_atom:
+        raise _Failure(message, node, path)
+    return node.as_list()
 
 
-def _reject_surface_symbols(node: Node, path: List[int]) -> None:
-    if node.is_atom:
-        if isinstance(node.value, str) and node.value in SURFACE_SYMBOLS:
-            _fail("Surface symbol found after macro expansion", node, path)
-        return
+def _require_length(items: List[Node], expected: int, node: Node, path: PathLink, message: str) -> None:
+    if len(items) != expected:
+        raise _Failure(message, node, path)
 
-    for idx, item in enumerate(node.as_list()):
-        _reject_surface_symbols(item, path + [idx])
 
+def _require_symbol(items: List[Node], idx: int, path: PathLink, message: str) -> None:
+    if not _is_symbol(items[idx]):
+        raise _Failure(message, items[idx], (path, idx))
 
-def _validate_form(node: Node, path: List[int]) -> None:
-    if node.is_atom:
-        _fail("Form must be a list", node, path)
 
-    if not node.as_list():
-        _fail("Form cannot be empty", node, path)
+def _require_lambda(items: List[Node], path: PathLink, message: str) -> None:
+    if not _is_symbol(items[0]) or items[0].value != LAMBDA_SYMBOL:
+        raise _Failure(message, items[0], (path, 0))
 
-    head = node.as_list()[0]
-    if not _is_symbol(head):
-        _fail("Form head must be a symbol", head, path + [0])
 
-    head_value = head.value
-    if head_value == "operator":
-        _validate_operator(node, path)
-    elif head_value == "invariant":
-        _validate_invariant(node, path)
-    elif head_value == "scheduler":
-        _validate_scheduler(node, path)
-    elif head_value == "observer":
-        _validate_observer(node, path)
-    else:
-        _validate_expression(node, path)
+def _rule_form(node: Node, path: PathLink, terms: List[Term]):
+    items = _require_list(node, path, "Form must be a list")
+    if not items:
+        raise _Failure("Form cannot be empty", node, path)
+    if not _is_symbol(items[0]):
+        raise _Failure("Form head must be a symbol", items[0], (path, 0))
+    rule = _FORM_RULES.get(items[0].value, _rule_expression)
+    return rule(node, path, terms)
 
 
-def _validate_operator(node: Node, path: List[int]) -> None:
-    items = node.as_list()
-    if len(items) != 3:
-        _fail("operator form must have 3 elements", node, path)
-    if not _is_symbol(items[1]):
-        _fail("operator name must be a symbol", items[1], path + [1])
-    _validate_operator_body(items[2], path + [2])
+def _named_form_rule(kind: str) -> Rule:
+    def rule(node: Node, path: PathLink, terms: List[Term]):
+        items = node.as_list()
+        _require_length(items, 3, node, path, f"{kind} form must have 3 elements")
+        _require_symbol(items, 1, path, f"{kind} name must be a symbol")
+        return (None, None, _rule_expression)
 
+    return rule
 
-def _validate_operator_body(node: Node, path: List[int]) -> None:
-    if node.is_atom:
-        _fail("operator body must be a list", node, path)
+
+def _rule_operator(node: Node, path: PathLink, terms: List[Term]):
     items = node.as_list()
-    if len(items) != 3:
-        _fail("operator body must have 3 elements", node, path)
-    if not _is_symbol(items[0]) or items[0].value != LAMBDA_SYMBOL:
-        _fail("operator body must start with lambda symbol", items[0], path + [0])
-    _validate_arg_list(items[1], path + [1])
-    _validate_expression(items[2], path + [2])
+    _require_length(items, 3, node, path, "operator form must have 3 elements")
+    _require_symbol(items, 1, path, "operator name must be a symbol")
+    return (None, None, _rule_operator_body)
 
 
-def _validate_arg_list(node: Node, path: List[int]) -> None:
+def _rule_operator_body(node: Node, path: PathLink, terms: List[Term]):
+    items = _require_list(node, path, "operator body must be a list")
+    _require_length(items, 3, node, path, "operator body must have 3 elements")
+    _require_lambda(items, path, "operator body must start with lambda symbol")
+    return (None, _rule_arg_list, _rule_expression)
+
+
+def _rule_arg_list(node: Node, path: PathLink, terms: List[Term]):
+    items = _require_list(node, path, "argument list must be a list")
+    for idx in range(len(items)):
+        _require_symbol(items, idx, path, "argument must be a symbol")
+    return None
+
+
+def _rule_expression(node: Node, path: PathLink, terms: List[Term]):
     if node.is_atom:
-        _fail("argument list must be a list", node, path)
-    for idx, item in enumerate(node.as_list()):
-        if not _is_symbol(item):
-            _fail("argument must be a symbol", item, path + [idx])
+        return None
+    items = node.as_list()
+    if not items:
+        raise _Failure("expression cannot be empty list", node, path)
+    if not _is_symbol(items[0]):
+        raise _Failure("expression head must be a symbol", items[0], (path, 0))
+    rule = _EXPRESSION_RULES.get(items[0].value)
+    if rule is not None:
+        return rule(node, path, terms)
+    return (None,) + (_rule_expression,) * (len(items) - 1)
 
 
-def _validate_invariant(node: Node, path: List[int]) -> None:
+def _rule_hamiltonian(node: Node, path: PathLink, terms: List[Term]):
     items = node.as_list()
-    if len(items) != 3:
-        _fail("invariant form must have 3 elements", node, path)
-    if not _is_symbol(items[1]):
-        _fail("invariant name must be a symbol", items[1], path + [1])
-    _validate_expression(items[2], path + [2])
+    if len(items) < 2:
+        raise _Failure("hamiltonian must include at least one term", node, path)
+    return (None,) + (_rule_term,) * (len(items) - 1)
 
 
-def _validate_scheduler(node: Node, path: List[int]) -> None:
+def _rule_term(node: Node, path: PathLink, terms: List[Term]):
+    items = _require_list(node, path, "term must be a list")
+    _require_length(items, 3, node, path, "term must have 3 elements")
+    if not _is_symbol(items[0]) or items[0].value != "term":
+        raise _Failure("term must start with 'term'", items[0], (path, 0))
+    _require_symbol(items, 1, path, "operator-ref must be a symbol")
+    if not _is_number(items[2]):
+        raise _Failure("coefficient must be a number", items[2], (path, 2))
+    terms.append((items[1].value, float(items[2].value), node))
+    return None
+
+
+def _rule_evolve(node: Node, path: PathLink, terms: List[Term]):
     items = node.as_list()
-    if len(items) != 3:
-        _fail("scheduler form must have 3 elements", node, path)
-    if not _is_symbol(items[1]):
-        _fail("scheduler name must be a symbol", items[1], path + [1])
-    _validate_expression(items[2], path + [2])
+    _require_length(items, 3, node, path, "evolve must have 3 elements")
+    _require_symbol(items, 1, path, "evolve target must be a symbol")
+    return (None, None, _rule_expression)
 
 
-def _validate_observer(node: Node, path: List[int]) -> None:
+def _rule_measure(node: Node, path: PathLink, terms: List[Term]):
     items = node.as_list()
-    if len(items) != 3:
-        _fail("observer form must have 3 elements", node, path)
-    if not _is_symbol(items[1]):
-        _fail("observer name must be a symbol", items[1], path + [1])
-    _validate_expression(items[2], path + [2])
+    _require_length(items, 4, node, path, "measure must have 4 elements")
+    return (None, _rule_expression, _rule_expression, _rule_handler)
 
 
-def _validate_expression(node: Node, path: List[int]) -> None:
-    if node.is_atom:
-        return
+def _rule_handler(node: Node, path: PathLink, terms: List[Term]):
+    items = _require_list(node, path, "handler must be a list")
+    _require_length(items, 3, node, path, "handler must have 3 elements")
+    _require_lambda(items, path, "handler must start with lambda symbol")
+    return (None, _rule_arg_list, _rule_expression)
 
-    items = node.as_list()
-    if not items:
-        _fail("expression cannot be empty list", node, path)
 
-    head = items[0]
-    if not _is_symbol(head):
-        _fail("expression head must be a symbol", head, path + [0])
+_rule_invariant = _named_form_rule("invariant")
+_rule_scheduler = _named_form_rule("scheduler")
+_rule_observer = _named_form_rule("observer")
+
+_FORM_RULES = {
+    "operator": _rule_operator,
+    "invariant": _rule_invariant,
+    "scheduler": _rule_scheduler,
+    "observer": _rule_observer,
+}
+_EXPRESSION_RULES = {
+    "hamiltonian": _rule_hamiltonian,
+    "evolve": _rule_evolve,
+    "measure": _rule_measure,
+}
+
+
+def _check(rule: Optional[Rule], node: Node, path: List[int], reject_surface: bool = False) -> None:
+    _walk(node, _link(path), rule, [], reject_surface=reject_surface)
+
+
+def _reject_surface_symbols(node: Node, path: List[int]) -> None:
+    _check(None, node, path, reject_surface=True)
+
+
+def _validate_form(node: Node, path: List[int]) -> None:
+    _check(_rule_form, node, path)
+
+
+def _validate_operator(node: Node, path: List[int]) -> None:
+    _check(_rule_operator, node, path)
+
+
+def _validate_operator_body(node: Node, path: List[int]) -> None:
+    _check(_rule_operator_body, node, path)
+
+
+def _validate_arg_list(node: Node, path: List[int]) -> None:
+    _check(_rule_arg_list, node, path)
+
+
+def _validate_invariant(node: Node, path: List[int]) -> None:
+    _check(_rule_invariant, node, path)
+
 
-    head_value = head.value
-    if head_value == "hamiltonian":
-        _validate_hamiltonian(node, path)
-        return
-    if head_value == "evolve":
-        _validate_evolve(node, path)
-        return
-    if head_value == "measure":
-        _validate_measure(node, path)
-        return
+def _validate_scheduler(node: Node, path: List[int]) -> None:
+    _check(_rule_scheduler, node, path)
 
-    for idx, item in enumerate(items[1:], start=1):
-        _validate_expression(item, path + [idx])
+
+def _validate_observer(node: Node, path: List[int]) -> None:
+    _check(_rule_observer, node, path)
+
+
+def _validate_expression(node: Node, path: List[int]) -> None:
+    _check(_rule_expression, node, path)
 
 
 def _validate_hamiltonian(node: Node, path: List[int]) -> None:
-    items = node.as_list()
-    if len(items) < 2:
-        _fail("hamiltonian must include at least one term", node, path)
-    for idx, term in enumerate(items[1:], start=1):
-        _validate_term(term, path + [idx])
+    _check(_rule_hamiltonian, node, path)
 
 
 def _validate_term(node: Node, path: List[int]) -> None:
-    if node.is_atom:
-        _fail("term must be a list", node, path)
-    items = node.as_list()
-    if len(items) != 3:
-        _fail("term must have 3 elements", node, path)
-    if not _is_symbol(items[0]) or items[0].value != "term":
-        _fail("term must start with 'term'", items[0], path + [0])
-    if not _is_symbol(items[1]):
-        _fail("operator-ref must be a symbol", items[1], path + [1])
-    if not _is_number(items[2]):
-        _fail("coefficient must be a number", items[2], path + [2])
+    _check(_rule_term, node, path)
 
 
 def _validate_evolve(node: Node, path: List[int]) -> None:
-    items = node.as_list()
-    if len(items) != 3:
-        _fail("evolve must have 3 elements", node, path)
-    if not _is_symbol(items[1]):
-        _fail("evolve target must be a symbol", items[1], path + [1])
-    _validate_expression(items[2], path + [2])
+    _check(_rule_evolve, node, path)
 
 
 def _validate_measure(node: Node, path: List[int]) -> None:
-    items = node.as_list()
-    if len(items) != 4:
-        _fail("measure must have 4 elements", node, path)
-    _validate_expression(items[1], path + [1])
-    _validate_expression(items[2], path + [2])
-    _validate_handler(items[3], path + [3])
+    _check(_rule_measure, node, path)
 
 
 def _validate_handler(node: Node, path: List[int]) -> None:
-    if node.is_atom:
-        _fail("handler must be a list", node, path)
-    items = node.as_list()
-    if len(items) != 3:
-        _fail("handler must have 3 elements", node, path)
-    if not _is_symbol(items[0]) or items[0].value != LAMBDA_SYMBOL:
-        _fail("handler must start with lambda symbol", items[0], path + [0])
-    _validate_arg_list(items[1], path + [1])
-    _validate_expression(items[2], path + [2])
+    _check(_rule_handler, node, path)
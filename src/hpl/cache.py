@@ -0,0 +1,232 @@
+"""Persistent content-keyed cache (tooling-only, never evidence)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_CACHE_DIR = ROOT / ".hpl_cache"
+CACHE_DIR_ENV = "HPL_CACHE_DIR"
+CACHE_DISABLED_ENV = "HPL_CACHE_DISABLED"
+HASH_VERIFY_ENV = "HPL_HASH_VERIFY"
+HASH_INDEX_FORMAT = "hpl.file_hashes.v1"
+# Files modified this recently may change again within the same mtime tick,
+# so their hashes are never recorded.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def cache_enabled() -> bool:
+    return os.environ.get(CACHE_DISABLED_ENV, "").strip() not in {"1", "true", "yes"}
+
+
+def resolve_cache_dir() -> Path:
+    override = os.environ.get(CACHE_DIR_ENV, "").strip()
+    if override:
+        return Path(override)
+    return DEFAULT_CACHE_DIR
+
+
+def cache_key(*parts: str) -> str:
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+class JsonCache:
+    """JSON values stored one file per key under ``<cache dir>/<namespace>``.
+
+    Entries are looked up in memory first, then on disk. Unreadable or corrupt
+    entries are treated as misses and write failures are ignored, so a cache
+    problem can only cost time, never change a result.
+    """
+
+    def __init__(self, namespace: str, root: Optional[Path] = None) -> None:
+        self.namespace = namespace
+        self._root = root
+        self._memory: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> Path:
+        base = self._root if self._root is not None else resolve_cache_dir()
+        return base / self.namespace
+
+    def get(self, key: str) -> Optional[object]:
+        if not cache_enabled():
+            return None
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+        try:
+            value = json.loads(self._entry_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            self._memory[key] = value
+        return value
+
+    def put(self, key: str, value: object) -> None:
+        if not cache_enabled():
+            return
+        with self._lock:
+            self._memory[key] = value
+        path = self._entry_path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(_canonical_json(value), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+
+class FileHashCache:
+    """SHA-256 file digests reused while a file's stat tuple is unchanged.
+
+    Entries map an absolute path to ``(size, mtime_ns, inode, ctime_ns)``
+    and the digest, and live in a single index file under the cache
+    directory, loaded once and rewritten only when it changes; entries for
+    files that no longer exist are dropped on rewrite. A file whose
+    stat tuple differs is re-hashed. With ``verify`` (or ``HPL_HASH_VERIFY=1``)
+    every file is re-hashed and the index is only used to count mismatches.
+    """
+
+    def __init__(self, root: Optional[Path] = None, verify: Optional[bool] = None) -> None:
+        self._root = root
+        self._verify = verify
+        self._entries: Optional[Dict[str, List[object]]] = None
+        self._loaded_from: Optional[Path] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    @property
+    def index_path(self) -> Path:
+        base = self._root if self._root is not None else resolve_cache_dir()
+        return base / "file_hashes.json"
+
+    @property
+    def verify(self) -> bool:
+        if self._verify is not None:
+            return self._verify
+        return os.environ.get(HASH_VERIFY_ENV, "").strip() in {"1", "true", "yes"}
+
+    def stats(self) -> Dict[str, int]:
+        """Counters since construction; ``stale`` counts only in verify mode."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "stale": self.stale}
+
+    def digests(self, paths: Iterable[Path], max_workers: Optional[int] = None) -> Dict[Path, str]:
+        """Digest every path, hashing the uncached ones on a thread pool."""
+        paths = list(paths)
+        enabled = cache_enabled()
+        entries = self._load() if enabled else {}
+        verify = self.verify
+        results: Dict[Path, str] = {}
+        pending: List[Tuple[Path, str, List[object]]] = []
+        for path in paths:
+            stat = path.stat()
+            key = str(path.resolve())
+            fingerprint = [stat.st_size, stat.st_mtime_ns, stat.st_ino, stat.st_ctime_ns]
+            entry = entries.get(key)
+            if entry is not None and entry[:4] == fingerprint and not verify:
+                results[path] = str(entry[4])
+                continue
+            pending.append((path, key, fingerprint))
+
+        if pending:
+            workers = max_workers or min(8, os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pending)))) as pool:
+                hashed = list(pool.map(lambda item: _hash_file(item[0]), pending))
+            now_ns = time.time_ns()
+            with self._lock:
+                for (path, key, fingerprint), digest in zip(pending, hashed):
+                    results[path] = digest
+                    entry = entries.get(key)
+                    if entry is not None and entry[:4] == fingerprint:
+                        self.hits += 1
+                        if entry[4] != digest:
+                            self.stale += 1
+                    else:
+                        self.misses += 1
+                    if enabled and now_ns - int(fingerprint[1]) >= RACY_WINDOW_NS:
+                        entries[key] = fingerprint + [digest]
+                        self._dirty = True
+        with self._lock:
+            self.hits += len(paths) - len(pending)
+        if enabled:
+            self._save()
+        return results
+
+    def _load(self) -> Dict[str, List[object]]:
+        index_path = self.index_path
+        with self._lock:
+            # A shared instance follows HPL_CACHE_DIR rather than carrying one
+            # directory's entries into another.
+            if self._entries is None or self._loaded_from != index_path:
+                self._loaded_from = index_path
+                self._dirty = False
+                try:
+                    payload = json.loads(index_path.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    payload = {}
+                entries = payload.get("entries") if isinstance(payload, dict) else None
+                valid = payload.get("format") == HASH_INDEX_FORMAT and isinstance(entries, dict)
+                self._entries = dict(entries) if valid else {}
+            return self._entries
+
+    def _save(self) -> None:
+        with self._lock:
+            if not self._dirty or self._entries is None or self._loaded_from is None:
+                return
+            # Drop files that are gone (deleted checkouts, temp roots) so the
+            # index does not grow with every path it has ever seen.
+            for key in [key for key in self._entries if not os.path.isfile(key)]:
+                del self._entries[key]
+            text = _canonical_json({"format": HASH_INDEX_FORMAT, "entries": self._entries})
+            self._dirty = False
+            path = self._loaded_from
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+
+def _hash_file(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            hasher.update(block)
+    return f"sha256:{hasher.hexdigest()}"
+
+
+def _canonical_json(data: object) -> str:
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
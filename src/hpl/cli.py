@@ -3,36 +3,25 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import hashlib
-import importlib.util
 import json
 import shutil
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
 
-from .axioms.validator import validate_program
-from .dynamics.ir_emitter import emit_program_ir
-from .emergence.dsl.parser import parse_file
-from .emergence.macros.expander import expand_program
 from .errors import HplError
+from .execution_token import normalize_backend, parse_backends
 from . import __version__
-from .runtime.context import RuntimeContext
-from .runtime.contracts import ExecutionContract
-from .runtime.engine import RuntimeEngine
-from .audit.constraint_inversion import invert_constraints
-from .audit.constraint_witness import build_constraint_witness
-from .execution_token import ExecutionToken
-from .scheduler import SchedulerContext, plan as plan_program
-from .backends.classical_lowering import lower_program_ir_to_backend_ir
-from .backends.qasm_lowering import lower_backend_ir_to_qasm
-from .runtime.effects.measurement_selection import build_measurement_selection
 import os
 
+if TYPE_CHECKING:
+    from .runtime.profiling import RuntimeProfiler
+
 
 ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_PUBLIC_KEY = Path("config/keys/ci_ed25519.pub")
-BUNDLE_EVIDENCE_PATH = ROOT / "tools" / "bundle_evidence.py"
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -66,6 +55,25 @@ def main(argv: Optional[List[str]] = None) -> int:
     run_parser.add_argument("--backend", choices=["classical", "qasm"])
     run_parser.add_argument("--enable-io", action="store_true")
     run_parser.add_argument("--enable-net", action="store_true")
+    run_parser.add_argument("--budget-ledger", type=Path, help="shared budget ledger (SQLite) to debit")
+    run_parser.add_argument("--budget-account", help="existing ledger account charged by this run")
+    run_parser.add_argument("--budget-batch", type=int, default=1, help="units leased from the ledger at a time")
+    run_parser.add_argument("--profile", action="store_true", help="write runtime_profile.json next to --out")
+
+    replay_parser = subparsers.add_parser("replay")
+    replay_parser.add_argument("source", type=Path, help="archive directory or replay manifest")
+    replay_parser.add_argument("--out", type=Path, help="write the JSONL report here instead of stdout")
+    replay_parser.add_argument("--jobs", type=int, help="worker processes (default: CPU count)")
+    replay_parser.add_argument("--contract", type=Path, help="contract for pairs without their own contract.json")
+    replay_parser.add_argument(
+        "--backend", choices=["classical", "qasm"], help="backend the archived runs requested with hpl run --backend"
+    )
+    replay_parser.add_argument("--anchor", type=Path)
+    replay_parser.add_argument("--sig", type=Path)
+    replay_parser.add_argument("--pub", type=Path, default=DEFAULT_PUBLIC_KEY)
+    replay_parser.add_argument("--enable-io", action="store_true")
+    replay_parser.add_argument("--enable-net", action="store_true")
+    replay_parser.add_argument("--work-dir", type=Path, help="keep replay artifacts here (default: scratch dirs)")
 
     lower_parser = subparsers.add_parser("lower")
     lower_parser.add_argument("--backend", choices=["classical", "qasm"], required=True)
@@ -126,6 +134,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     lifecycle_parser.add_argument("--enable-net", action="store_true")
     lifecycle_parser.add_argument("--enforce-operator-registry", action="store_true")
     lifecycle_parser.add_argument("--operator-registry", type=Path, action="append")
+    lifecycle_parser.add_argument("--jobs", type=int, help="stages run concurrently (default: up to 4)")
 
     demo_parser = subparsers.add_parser("demo")
     demo_subparsers = demo_parser.add_subparsers(dest="demo_name", required=True)
@@ -195,6 +204,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     trading_io_shadow_demo.add_argument("--budget-steps", type=int, default=100)
     trading_io_shadow_demo.add_argument("--constraint-inversion-v1", action="store_true")
     trading_io_shadow_demo.add_argument("--enable-io", action="store_true")
+    trading_io_shadow_demo.add_argument("--profile", action="store_true", help="write runtime_profile.json to --out-dir")
     trading_io_live_demo = demo_subparsers.add_parser("trading-io-live-min")
     trading_io_live_demo.add_argument("--out-dir", type=Path, required=True)
     trading_io_live_demo.add_argument("--input", type=Path, default=Path("examples/momentum_trade.hpl"))
@@ -249,7 +259,36 @@ def main(argv: Optional[List[str]] = None) -> int:
     invert_parser.add_argument("--out", type=Path, required=True)
     invert_parser.add_argument("--pretty", action="store_true")
 
+    ledger_parser = subparsers.add_parser("ledger")
+    ledger_subparsers = ledger_parser.add_subparsers(dest="ledger_action", required=True)
+    ledger_open = ledger_subparsers.add_parser("open", help="create a budget account, or confirm an existing one")
+    ledger_open.add_argument("ledger", type=Path, help="budget ledger (SQLite), created if missing")
+    ledger_open.add_argument("--account", required=True)
+    ledger_open.add_argument("--parent", help="parent account; caps are intersected with its caps")
+    ledger_open.add_argument(
+        "--cap",
+        action="append",
+        default=[],
+        metavar="KIND=N",
+        help="cap one budget kind (steps, delta_s, io_calls, net_calls); repeatable, omitted kinds are uncapped",
+    )
+    ledger_show = ledger_subparsers.add_parser("show", help="print ledger balances")
+    ledger_show.add_argument("ledger", type=Path)
+    ledger_show.add_argument("--account", help="only this account and its ancestors")
+
+    serve_parser = subparsers.add_parser("serve")
+    serve_parser.add_argument("--socket", type=Path)
+    serve_parser.add_argument("--workers", type=int, default=1)
+
     args = parser.parse_args(argv)
+    # Exporters are registered only when asked for. The pipeline modules
+    # (compile_cache, scheduler, stage_graph, runtime.engine) still import
+    # hpl.tracing for their spans, which stay no-ops with no hooks registered;
+    # the lazy import here only spares commands that never load them.
+    if os.getenv("HPL_TRACE_JSONL") or os.getenv("HPL_TRACE_OTLP"):
+        from .tracing import configure_from_env
+
+        configure_from_env()
 
     try:
         if args.command == "ir":
@@ -258,6 +297,8 @@ def main(argv: Optional[List[str]] = None) -> int:
             return _cmd_plan(args)
         if args.command == "run":
             return _cmd_run(args)
+        if args.command == "replay":
+            return _cmd_replay(args)
         if args.command == "lower":
             return _cmd_lower(args)
         if args.command == "bundle":
@@ -268,6 +309,10 @@ def main(argv: Optional[List[str]] = None) -> int:
             return _cmd_invert(args)
         if args.command == "demo":
             return _cmd_demo(args)
+        if args.command == "ledger":
+            return _cmd_ledger(args)
+        if args.command == "serve":
+            return _cmd_serve(args)
     except HplError as exc:
         _write_refusal_evidence(
             command=args.command,
@@ -286,10 +331,9 @@ def main(argv: Optional[List[str]] = None) -> int:
 
 
 def _cmd_ir(args: argparse.Namespace) -> int:
-    program = parse_file(str(args.input))
-    expanded = expand_program(program)
-    validate_program(expanded)
-    program_ir = emit_program_ir(expanded, program_id=args.input.stem)
+    from .compile_cache import compile_file
+
+    program_ir = compile_file(args.input).program_ir
 
     _write_json(args.out, program_ir)
     evidence_path = _default_evidence_path(args.out, "ir")
@@ -305,13 +349,15 @@ def _cmd_ir(args: argparse.Namespace) -> int:
 
 
 def _cmd_plan(args: argparse.Namespace) -> int:
+    from .scheduler import SchedulerContext, plan as plan_program
+
     program_ir = json.loads(args.program_ir.read_text(encoding="utf-8"))
     ctx = SchedulerContext(
         require_epoch_verification=args.require_epoch,
         anchor_path=args.anchor,
         signature_path=args.sig,
         public_key_path=args.pub,
-        allowed_backends=_parse_backends(args.allowed_backends),
+        allowed_backends=parse_backends(args.allowed_backends),
         budget_steps=args.budget_steps,
         operator_registry_enforced=args.enforce_operator_registry,
         operator_registry_paths=args.operator_registry,
@@ -335,31 +381,54 @@ def _cmd_plan(args: argparse.Namespace) -> int:
 
 
 def _cmd_run(args: argparse.Namespace) -> int:
+    from .execution_token import ExecutionToken
+    from .runtime.context import RuntimeContext
+    from .runtime.contracts import load_contract
+    from .runtime.engine import RuntimeEngine
+
     plan_dict = json.loads(args.plan.read_text(encoding="utf-8"))
     token_dict = plan_dict.get("execution_token")
     execution_token = None
     if isinstance(token_dict, dict):
         execution_token = ExecutionToken.from_dict(token_dict)
+    ledger = None
+    budget_account = None
+    if getattr(args, "budget_ledger", None):
+        from .runtime.budget_ledger import BudgetLedger
+
+        if not args.budget_account:
+            raise ValueError("--budget-ledger requires --budget-account")
+        ledger = BudgetLedger(args.budget_ledger)
+        budget_account = ledger.account(args.budget_account, batch_size=args.budget_batch)
     ctx = RuntimeContext(
         epoch_anchor_path=args.anchor,
         epoch_sig_path=args.sig,
         ci_pubkey_path=args.pub,
         execution_token=execution_token,
-        requested_backend=_normalize_backend(args.backend) if args.backend else None,
+        requested_backend=normalize_backend(args.backend) if args.backend else None,
         io_enabled=getattr(args, "enable_io", False),
         net_enabled=getattr(args, "enable_net", False),
+        budget_account=budget_account,
     )
-    contract = _load_contract(args.contract, plan_dict)
-    if args.backend:
-        contract = ExecutionContract(
-            allowed_steps=contract.allowed_steps,
-            require_epoch_verification=contract.require_epoch_verification,
-            require_signature_verification=contract.require_signature_verification,
-            required_backend=_normalize_backend(args.backend),
-        )
-    result = RuntimeEngine().run(plan_dict, ctx, contract)
+    contract = load_contract(args.contract, plan_dict, required_backend=normalize_backend(args.backend))
+    profiler = _make_profiler(args)
+    try:
+        result = RuntimeEngine(profiler=profiler).run(plan_dict, ctx, contract)
+    finally:
+        if ledger is not None:
+            ledger.close()
     result_dict = result.to_dict()
     _write_json(args.out, result_dict)
+    if profiler is not None:
+        from .runtime.profiling import PROFILE_FILENAME
+
+        profiler.write_json(args.out.with_name(PROFILE_FILENAME))
+
+    outputs = {"runtime_result": _digest_file(args.out)}
+    if result.budget_ledger is not None:
+        ledger_path = args.out.with_name("budget_ledger.json")
+        _write_json(ledger_path, result.budget_ledger)
+        outputs["budget_ledger"] = _digest_file(ledger_path)
 
     ok = result.status == "completed"
     evidence_path = _default_evidence_path(args.out, "run")
@@ -369,12 +438,52 @@ def _cmd_run(args: argparse.Namespace) -> int:
         ok=ok,
         errors=list(result.reasons),
         inputs={"plan": _digest_file(args.plan)},
-        outputs={"runtime_result": _digest_file(args.out)},
+        outputs=outputs,
     )
     return 0
 
 
+def _cmd_replay(args: argparse.Namespace) -> int:
+    from .runtime.replay import ReplayOptions, default_jobs, load_pairs, replay, summarize
+
+    pairs = load_pairs(args.source)
+    options = ReplayOptions(
+        contract_path=args.contract,
+        anchor_path=args.anchor,
+        sig_path=args.sig,
+        pub_path=args.pub,
+        io_enabled=args.enable_io,
+        net_enabled=args.enable_net,
+        work_root=args.work_dir,
+        backend=args.backend,
+    )
+    reports = []
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+    stream = args.out.open("w", encoding="utf-8") if args.out else sys.stdout
+    try:
+        for report in replay(pairs, options, jobs=args.jobs or default_jobs()):
+            reports.append(report)
+            stream.write(_canonical_json(report) + "\n")
+            stream.flush()
+        summary = summarize(reports)
+        stream.write(_canonical_json(summary) + "\n")
+    finally:
+        if args.out:
+            stream.close()
+    return 0 if summary["ok"] else 1
+
+
+def _cmd_serve(args: argparse.Namespace) -> int:
+    from .service import serve
+
+    return serve(args)
+
+
 def _cmd_lower(args: argparse.Namespace) -> int:
+    from .backends.classical_lowering import lower_program_ir_to_backend_ir
+    from .backends.qasm_lowering import lower_backend_ir_to_qasm
+
     program_ir = json.loads(args.ir.read_text(encoding="utf-8"))
     backend_ir = lower_program_ir_to_backend_ir(program_ir, target=args.backend)
     backend_ir_dict = backend_ir.to_dict()
@@ -403,7 +512,9 @@ def _cmd_lower(args: argparse.Namespace) -> int:
 
 
 def _cmd_bundle(args: argparse.Namespace) -> int:
-    bundle_module = _load_bundle_module()
+    from .tool_loader import load_tool
+
+    bundle_module = load_tool("bundle_evidence")
     errors: List[str] = []
     artifacts: List[object] = []
 
@@ -564,6 +675,8 @@ def _cmd_bundle(args: argparse.Namespace) -> int:
 
 
 def _cmd_invert(args: argparse.Namespace) -> int:
+    from .audit.constraint_inversion import invert_constraints
+
     errors: List[str] = []
     if not args.witness.exists():
         errors.append(f"witness not found: {args.witness}")
@@ -594,6 +707,22 @@ def _cmd_invert(args: argparse.Namespace) -> int:
 
 
 def _cmd_lifecycle(args: argparse.Namespace) -> int:
+    from .audit.constraint_inversion import invert_constraints
+    from .audit.constraint_witness import build_constraint_witness
+    from .backends.classical_lowering import lower_program_ir_to_backend_ir
+    from .backends.qasm_lowering import lower_backend_ir_to_qasm
+    from .cache import JsonCache
+    from .compile_cache import compile_file
+    from .dynamics.ir_emitter import schema_digest
+    from .execution_token import ExecutionToken
+    from .runtime.context import RuntimeContext
+    from .runtime.contracts import ExecutionContract
+    from .runtime.effects.measurement_selection import build_measurement_selection
+    from .runtime.engine import RuntimeEngine
+    from .scheduler import SchedulerContext, plan as plan_program
+    from .stage_graph import Stage, StageGraph, package_fingerprint
+    from .tool_loader import load_tool
+
     out_dir = args.out_dir
     work_dir = out_dir / "work"
     if work_dir.exists():
@@ -607,13 +736,11 @@ def _cmd_lifecycle(args: argparse.Namespace) -> int:
     backend_ir_path = work_dir / "backend.ir.json"
     qasm_path = work_dir / "program.qasm"
     measurement_selection_path = work_dir / "measurement_selection.json"
+    token_path = work_dir / "execution_token.json"
+    use_kernel = not args.legacy
 
-    try:
-        # IR
-        program = parse_file(str(args.input))
-        expanded = expand_program(program)
-        validate_program(expanded)
-        program_ir = emit_program_ir(expanded, program_id=args.input.stem)
+    def stage_ir(results: Dict[str, object]) -> object:
+        program_ir = compile_file(args.input).program_ir
         _write_json(program_ir_path, program_ir)
         _write_evidence(
             work_dir / "ir_evidence.json",
@@ -623,17 +750,15 @@ def _cmd_lifecycle(args: argparse.Namespace) -> int:
             inputs={"input": _digest_file(args.input)},
             outputs={"program_ir": _digest_file(program_ir_path)},
         )
+        return program_ir
 
-        # ECMO selection (optional)
+    def stage_ecmo(results: Dict[str, object]) -> object:
+        # ECMO selection (optional) may tighten the epoch requirement or switch the backend.
         ecmo_input = args.ecmo or args.ecmo_input
-        selected_track = None
-        ecmo_errors: List[str] = []
-        require_epoch = args.require_epoch
-        backend = args.backend
-        constraint_inversion = args.constraint_inversion_v1
+        selection = {"errors": [], "require_epoch": args.require_epoch, "backend": args.backend}
         if ecmo_input:
             if not ecmo_input.exists():
-                ecmo_errors.append(f"ecmo input not found: {ecmo_input}")
+                selection["errors"] = [f"ecmo input not found: {ecmo_input}"]
             else:
                 boundary_conditions = json.loads(ecmo_input.read_text(encoding="utf-8"))
                 selection_result = build_measurement_selection(boundary_conditions)
@@ -641,18 +766,49 @@ def _cmd_lifecycle(args: argparse.Namespace) -> int:
                     selected_track = selection_result.selection.get("selected_track")
                     _write_json(measurement_selection_path, selection_result.selection)
                     if selected_track == "B":
-                        require_epoch = True
+                        selection["require_epoch"] = True
                     elif selected_track == "C":
-                        backend = "classical"
-                        constraint_inversion = True
+                        selection["backend"] = "classical"
                 else:
-                    ecmo_errors.extend(selection_result.errors)
+                    selection["errors"] = list(selection_result.errors)
+        return selection
 
-        # Plan
-        use_kernel = not args.legacy
-        if ecmo_errors:
-            plan_ok = False
-            plan_errors = list(ecmo_errors)
+    def plan_context(selection: Dict[str, object]) -> "SchedulerContext":
+        return SchedulerContext(
+            require_epoch_verification=bool(selection["require_epoch"]),
+            anchor_path=args.anchor,
+            signature_path=args.sig,
+            public_key_path=args.pub,
+            allowed_backends=parse_backends(args.allowed_backends),
+            budget_steps=args.budget_steps,
+            operator_registry_enforced=args.enforce_operator_registry,
+            operator_registry_paths=args.operator_registry,
+            emit_effect_steps=use_kernel,
+            backend_target=str(selection["backend"]),
+            artifact_paths=None,
+            ecmo_input_path=args.ecmo_input,
+            measurement_selection_path=measurement_selection_path,
+        )
+
+    def plan_key(results: Dict[str, object]) -> Optional[str]:
+        selection = results["ecmo"]
+        # Epoch verification and registry enforcement read repository state
+        # that the key cannot cover, so those plans are always recomputed.
+        if selection["errors"] or selection["require_epoch"] or args.enforce_operator_registry:
+            return None
+        return _canonical_json(
+            {
+                "code": package_fingerprint(),
+                "context": repr(plan_context(selection)),
+                "program_ir": _digest_text(_canonical_json(results["ir"])),
+            }
+        )
+
+    def stage_plan(results: Dict[str, object]) -> object:
+        program_ir = results["ir"]
+        selection = results["ecmo"]
+        if selection["errors"]:
+            plan_errors = list(selection["errors"])
             plan_core = {
                 "program_id": args.input.stem,
                 "status": "denied",
@@ -669,29 +825,13 @@ def _cmd_lifecycle(args: argparse.Namespace) -> int:
                 "witness_records": [],
                 "execution_token": None,
             }
-            _write_json(plan_path, plan_dict)
+            plan_ok = False
         else:
-            ctx = SchedulerContext(
-                require_epoch_verification=require_epoch,
-                anchor_path=args.anchor,
-                signature_path=args.sig,
-                public_key_path=args.pub,
-                allowed_backends=_parse_backends(args.allowed_backends),
-                budget_steps=args.budget_steps,
-                operator_registry_enforced=args.enforce_operator_registry,
-                operator_registry_paths=args.operator_registry,
-                emit_effect_steps=use_kernel,
-                backend_target=backend,
-                artifact_paths=None,
-                ecmo_input_path=args.ecmo_input,
-                measurement_selection_path=measurement_selection_path,
-            )
-            plan_obj = plan_program(program_ir, ctx)
+            plan_obj = plan_program(program_ir, plan_context(selection))
             plan_dict = plan_obj.to_dict()
-            _write_json(plan_path, plan_dict)
             plan_ok = plan_obj.status == "planned"
             plan_errors = list(plan_obj.reasons)
-
+        _write_json(plan_path, plan_dict)
         _write_evidence(
             work_dir / "plan_evidence.json",
             command="plan",
@@ -700,11 +840,21 @@ def _cmd_lifecycle(args: argparse.Namespace) -> int:
             inputs={"program_ir": _digest_file(program_ir_path)},
             outputs={"plan": _digest_file(plan_path)},
         )
+        return {"plan": plan_dict, "ok": plan_ok, "errors": plan_errors}
+
+    def stage_token(results: Dict[str, object]) -> object:
+        token_dict = results["plan"]["plan"].get("execution_token")
+        if token_dict:
+            _write_json(token_path, token_dict)
+        return bool(token_dict)
 
-        # Runtime
-        if ecmo_errors:
+    def stage_run(results: Dict[str, object]) -> object:
+        planned = results["plan"]
+        selection = results["ecmo"]
+        plan_dict = planned["plan"]
+        if selection["errors"]:
             run_ok = False
-            runtime_errors = list(plan_errors)
+            runtime_errors = list(planned["errors"])
             runtime_dict = {
                 "result_id": _digest_text(_canonical_json({"status": "denied", "reasons": runtime_errors})),
                 "status": "denied",
@@ -716,6 +866,8 @@ def _cmd_lifecycle(args: argparse.Namespace) -> int:
                 "transcript": [],
             }
         else:
+            require_epoch = bool(selection["require_epoch"])
+            backend = str(selection["backend"])
             token_dict = plan_dict.get("execution_token")
             execution_token = None
             if isinstance(token_dict, dict):
@@ -727,7 +879,7 @@ def _cmd_lifecycle(args: argparse.Namespace) -> int:
                 execution_token=execution_token,
                 io_enabled=getattr(args, "enable_io", False),
                 net_enabled=getattr(args, "enable_net", False),
-                requested_backend=_normalize_backend(backend),
+                requested_backend=normalize_backend(backend),
                 trace_sink=work_dir if use_kernel else None,
             )
             allowed_steps = set()
@@ -741,7 +893,7 @@ def _cmd_lifecycle(args: argparse.Namespace) -> int:
                 allowed_steps=allowed_steps,
                 require_epoch_verification=False if use_kernel else require_epoch,
                 require_signature_verification=False if use_kernel else bool(args.sig) if require_epoch else False,
-                required_backend=None if use_kernel else _normalize_backend(backend),
+                required_backend=None if use_kernel else normalize_backend(backend),
             )
             runtime_result = RuntimeEngine().run(plan_dict, runtime_ctx, contract)
             runtime_dict = runtime_result.to_dict()
@@ -757,55 +909,73 @@ def _cmd_lifecycle(args: argparse.Namespace) -> int:
             inputs={"plan": _digest_file(plan_path)},
             outputs={"runtime_result": _digest_file(runtime_path)},
         )
+        return {"result": runtime_dict, "ok": run_ok, "errors": runtime_errors}
 
+    def stage_inversion(results: Dict[str, object]) -> object:
         # Constraint inversion artifacts
+        planned = results["plan"]
+        ran = results["run"]
         constraint_witness: Optional[Dict[str, object]] = None
-        dual_proposal: Optional[Dict[str, object]] = None
-        if not plan_ok:
+        if not planned["ok"]:
             constraint_witness = build_constraint_witness(
                 stage="plan_refusal",
-                refusal_reasons=plan_errors,
-                artifact_digests={"plan": _digest_text(_canonical_json(plan_dict))},
+                refusal_reasons=planned["errors"],
+                artifact_digests={"plan": _digest_text(_canonical_json(planned["plan"]))},
                 observer_id="papas",
                 timestamp=None,
             )
-        elif not run_ok:
-            constraint_list = runtime_dict.get("constraint_witnesses", [])
+        elif not ran["ok"]:
+            constraint_list = ran["result"].get("constraint_witnesses", [])
             if isinstance(constraint_list, list) and constraint_list:
                 constraint_witness = constraint_list[0]
+        dual_proposal: Optional[Dict[str, object]] = None
         if constraint_witness:
             dual_proposal = invert_constraints(constraint_witness)
             _write_json(work_dir / "constraint_witness.json", constraint_witness)
             _write_json(work_dir / "dual_proposal.json", dual_proposal)
+        return {"constraint_witness": bool(constraint_witness), "dual_proposal": bool(dual_proposal)}
+
+    def lower_key(results: Dict[str, object]) -> Optional[str]:
+        return _canonical_json(
+            {
+                "backend": results["ecmo"]["backend"],
+                "code": package_fingerprint(),
+                "program_ir": _digest_text(_canonical_json(results["ir"])),
+            }
+        )
 
-        # Lower
-        if not use_kernel:
-            backend_ir = lower_program_ir_to_backend_ir(program_ir, target=backend).to_dict()
-            _write_json(backend_ir_path, backend_ir)
-            output_digests = {"backend_ir": _digest_text_value(_canonical_json(backend_ir))}
-            if backend == "qasm":
-                qasm = lower_backend_ir_to_qasm(backend_ir)
-                qasm_path.write_text(qasm, encoding="utf-8")
-                output_digests["qasm"] = _digest_text_value(qasm)
-            _write_evidence(
-                work_dir / "lower_evidence.json",
-                command="lower",
-                ok=True,
-                errors=[],
-                inputs={"program_ir": _digest_file(program_ir_path)},
-                outputs=output_digests,
-            )
-
-        # Bundle
-        bundle_module = _load_bundle_module()
+    def stage_lower(results: Dict[str, object]) -> object:
+        # Lowering reads only the IR, so it runs alongside plan and runtime.
+        backend = str(results["ecmo"]["backend"])
+        backend_ir = lower_program_ir_to_backend_ir(results["ir"], target=backend).to_dict()
+        _write_json(backend_ir_path, backend_ir)
+        output_digests = {"backend_ir": _digest_text_value(_canonical_json(backend_ir))}
+        if backend == "qasm":
+            qasm = lower_backend_ir_to_qasm(backend_ir)
+            qasm_path.write_text(qasm, encoding="utf-8")
+            output_digests["qasm"] = _digest_text_value(qasm)
+        _write_evidence(
+            work_dir / "lower_evidence.json",
+            command="lower",
+            ok=True,
+            errors=[],
+            inputs={"program_ir": _digest_file(program_ir_path)},
+            outputs=output_digests,
+        )
+        return True
+
+    def stage_bundle(results: Dict[str, object]) -> object:
+        planned = results["plan"]
+        ran = results["run"]
+        inversion = results["inversion"]
+        backend = results["ecmo"]["backend"]
+        bundle_module = load_tool("bundle_evidence")
         artifacts = [
             bundle_module._artifact("program_ir", program_ir_path),
             bundle_module._artifact("plan", plan_path),
             bundle_module._artifact("runtime_result", runtime_path),
         ]
-        if plan_dict.get("execution_token"):
-            token_path = work_dir / "execution_token.json"
-            _write_json(token_path, plan_dict.get("execution_token", {}))
+        if results["token"]:
             artifacts.append(bundle_module._artifact("execution_token", token_path))
         if backend_ir_path.exists():
             artifacts.append(bundle_module._artifact("backend_ir", backend_ir_path))
@@ -828,11 +998,11 @@ def _cmd_lifecycle(args: argparse.Namespace) -> int:
             else:
                 bundle_errors.append(f"signature not found: {args.sig}")
 
-        if constraint_witness:
+        if inversion["constraint_witness"]:
             artifacts.append(
                 bundle_module._artifact("constraint_witness", work_dir / "constraint_witness.json")
             )
-        if dual_proposal:
+        if inversion["dual_proposal"]:
             artifacts.append(
                 bundle_module._artifact("dual_proposal", work_dir / "dual_proposal.json")
             )
@@ -865,11 +1035,11 @@ def _cmd_lifecycle(args: argparse.Namespace) -> int:
         manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
 
         errors: List[str] = []
-        ok = plan_ok and run_ok
-        if plan_errors:
-            errors.extend(plan_errors)
-        if runtime_errors:
-            errors.extend(runtime_errors)
+        ok = planned["ok"] and ran["ok"]
+        if planned["errors"]:
+            errors.extend(planned["errors"])
+        if ran["errors"]:
+            errors.extend(ran["errors"])
         if bundle_errors:
             ok = False
             errors.extend(bundle_errors)
@@ -886,11 +1056,11 @@ def _cmd_lifecycle(args: argparse.Namespace) -> int:
                     errors.append("missing backend projection")
 
         if args.constraint_inversion_v1:
-            inversion = manifest.get("constraint_inversion_v1", {})
-            if not inversion.get("ok", False):
+            inversion_roles = manifest.get("constraint_inversion_v1", {})
+            if not inversion_roles.get("ok", False):
                 ok = False
                 errors.append("constraint inversion roles incomplete")
-                missing_required = inversion.get("missing_required", [])
+                missing_required = inversion_roles.get("missing_required", [])
                 if missing_required:
                     errors.append(f"missing_required={','.join(missing_required)}")
 
@@ -902,14 +1072,52 @@ def _cmd_lifecycle(args: argparse.Namespace) -> int:
             inputs={"input": _digest_file(args.input)},
             outputs={"bundle_manifest": _digest_file(manifest_path)},
         )
-
-        summary = {
+        return {
             "ok": ok,
             "bundle_path": str(bundle_dir),
             "bundle_id": manifest.get("bundle_id"),
             "errors": errors,
             "denied_reason": None if ok else "refusal",
         }
+
+    stages = [
+        Stage(
+            "ir",
+            stage_ir,
+            # The restored IR is not re-validated, so the schema is part of the key as in compile_cache.
+            key=lambda results: _canonical_json(
+                {"code": package_fingerprint(), "schema": schema_digest(), "input": _digest_file(args.input)}
+            ),
+            outputs=(program_ir_path, work_dir / "ir_evidence.json"),
+        ),
+        Stage("ecmo", stage_ecmo),
+        Stage(
+            "plan",
+            stage_plan,
+            deps=("ir", "ecmo"),
+            key=plan_key,
+            outputs=(plan_path, work_dir / "plan_evidence.json"),
+        ),
+        Stage("token", stage_token, deps=("plan",)),
+        Stage("run", stage_run, deps=("plan", "ecmo")),
+        Stage("inversion", stage_inversion, deps=("plan", "run")),
+    ]
+    if not use_kernel:
+        stages.append(
+            Stage(
+                "lower",
+                stage_lower,
+                deps=("ir", "ecmo"),
+                key=lower_key,
+                outputs=(backend_ir_path, qasm_path, work_dir / "lower_evidence.json"),
+            )
+        )
+    bundle_deps = tuple(stage.name for stage in stages)
+    stages.append(Stage("bundle", stage_bundle, deps=bundle_deps))
+
+    try:
+        graph = StageGraph(stages, max_workers=_lifecycle_jobs(args), cache=JsonCache("lifecycle"))
+        summary = graph.run()["bundle"]
         print(_canonical_json(summary))
         return 0
     except HplError as exc:
@@ -933,7 +1141,46 @@ def _cmd_lifecycle(args: argparse.Namespace) -> int:
         return 0
 
 
+def _cmd_ledger(args: argparse.Namespace) -> int:
+    from .runtime.budget_ledger import BudgetLedger
+
+    with BudgetLedger(args.ledger) as ledger:
+        if args.ledger_action == "open":
+            ledger.open_account(args.account, _parse_caps(args.cap), parent_id=args.parent)
+        snapshot = ledger.snapshot(args.account)
+    print(_canonical_json(snapshot))
+    return 0
+
+
+def _parse_caps(values: List[str]) -> Dict[str, int]:
+    caps: Dict[str, int] = {}
+    for value in values:
+        kind, sep, amount = value.partition("=")
+        if not sep or not amount.strip().isdigit():
+            raise ValueError(f"invalid --cap {value!r}; expected KIND=N")
+        caps[kind.strip()] = int(amount)
+    return caps
+
+
+def _lifecycle_jobs(args: argparse.Namespace) -> int:
+    jobs = getattr(args, "jobs", None)
+    if jobs is None:
+        return min(4, os.cpu_count() or 1)
+    return max(1, jobs)
+
+
 def _cmd_demo(args: argparse.Namespace) -> int:
+    from .cli_demos import (
+        _cmd_demo_agent_governance,
+        _cmd_demo_ci_governance,
+        _cmd_demo_navier_stokes,
+        _cmd_demo_net_shadow,
+        _cmd_demo_trading_io_live_min,
+        _cmd_demo_trading_io_shadow,
+        _cmd_demo_trading_paper,
+        _cmd_demo_trading_shadow,
+    )
+
     if args.demo_name == "ci-governance":
         return _cmd_demo_ci_governance(args)
     if args.demo_name == "agent-governance":
@@ -954,1570 +1201,74 @@ def _cmd_demo(args: argparse.Namespace) -> int:
     return 0
 
 
-def _cmd_demo_ci_governance(args: argparse.Namespace) -> int:
-    out_dir = args.out_dir
-    work_dir = out_dir / "work"
-    if work_dir.exists():
-        shutil.rmtree(work_dir)
-    work_dir.mkdir(parents=True, exist_ok=True)
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    repo_state_path = work_dir / "repo_state.json"
-    repo_state_path.write_text(_canonical_json({"clean": True}), encoding="utf-8")
-    repo_state_rel = Path("repo_state.json")
-
-    program_ir_path = work_dir / "program.ir.json"
-    plan_path = work_dir / "plan.json"
-    runtime_path = work_dir / "runtime.json"
-    backend_ir_path = work_dir / "backend.ir.json"
-
-    bundle_module = _load_bundle_module()
-    errors: List[str] = []
-
-    try:
-        program = parse_file(str(args.input))
-        expanded = expand_program(program)
-        validate_program(expanded)
-        program_ir = emit_program_ir(expanded, program_id=args.input.stem)
-        _write_json(program_ir_path, program_ir)
-
-        coupling_registry = _relative_to_root(args.coupling_registry)
-        ctx = SchedulerContext(
-            require_epoch_verification=args.require_epoch,
-            anchor_path=args.anchor,
-            signature_path=args.sig,
-            public_key_path=args.pub,
-            allowed_backends=_parse_backends("PYTHON,CLASSICAL,QASM"),
-            budget_steps=100,
-            emit_effect_steps=True,
-            backend_target=args.backend,
-            artifact_paths={
-                "backend_ir": "backend.ir.json",
-            },
-            track="ci_governance",
-            ci_repo_state_path=repo_state_rel,
-            ci_coupling_registry_path=coupling_registry,
-        )
-        plan_obj = plan_program(program_ir, ctx)
-        plan_dict = plan_obj.to_dict()
-        _write_json(plan_path, plan_dict)
-
-        plan_ok = plan_obj.status == "planned"
-        if not plan_ok:
-            errors.extend(plan_obj.reasons)
-
-        token_dict = plan_dict.get("execution_token")
-        execution_token = ExecutionToken.from_dict(token_dict) if isinstance(token_dict, dict) else None
-        runtime_ctx = RuntimeContext(
-            epoch_anchor_path=args.anchor,
-            epoch_sig_path=args.sig,
-            ci_pubkey_path=args.pub,
-            execution_token=execution_token,
-            io_enabled=getattr(args, "enable_io", False),
-            net_enabled=getattr(args, "enable_net", False),
-            requested_backend=_normalize_backend(args.backend),
-            trace_sink=work_dir,
-        )
-        allowed_steps = {str(step.get("step_id")) for step in plan_dict.get("steps", []) if isinstance(step, dict) and step.get("step_id")}
-        contract = ExecutionContract(allowed_steps=allowed_steps)
-        runtime_result = RuntimeEngine().run(plan_dict, runtime_ctx, contract)
-        runtime_dict = runtime_result.to_dict()
-        _write_json(runtime_path, runtime_dict)
-
-        run_ok = runtime_result.status == "completed"
-        if runtime_result.reasons:
-            errors.extend(runtime_result.reasons)
-
-        artifacts = [
-            bundle_module._artifact("program_ir", program_ir_path),
-            bundle_module._artifact("plan", plan_path),
-            bundle_module._artifact("runtime_result", runtime_path),
-        ]
-        if backend_ir_path.exists():
-            artifacts.append(bundle_module._artifact("backend_ir", backend_ir_path))
-        if token_dict:
-            token_path = work_dir / "execution_token.json"
-            _write_json(token_path, token_dict)
-            artifacts.append(bundle_module._artifact("execution_token", token_path))
-
-        bundle_dir, manifest = bundle_module.build_bundle(
-            out_dir=out_dir,
-            artifacts=artifacts,
-            epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
-            epoch_sig=args.sig if args.sig and args.sig.exists() else None,
-            public_key=args.pub,
-            quantum_semantics_v1=args.quantum_semantics_v1,
-        )
-        manifest_path = bundle_dir / "bundle_manifest.json"
-        manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
-
-        if not args.signing_key:
-            errors.append("signing_key required for ci-governance demo")
-        else:
-            sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
-            ok, sig_errors = bundle_module.verify_bundle_manifest_signature(
-                manifest_path,
-                sig_path,
-                args.pub,
-            )
-            if not ok:
-                errors.extend(sig_errors)
-
-        if args.quantum_semantics_v1:
-            quantum_module = _load_tool_module("validate_quantum_execution_semantics", ROOT / "tools" / "validate_quantum_execution_semantics.py")
-            quantum_result = quantum_module.validate_quantum_execution_semantics(
-                program_ir=program_ir_path,
-                plan=plan_path,
-                runtime_result=runtime_path,
-                backend_ir=backend_ir_path if backend_ir_path.exists() else None,
-                qasm=None,
-                bundle_manifest=manifest_path,
-            )
-            if not quantum_result.get("ok", False):
-                errors.extend(quantum_result.get("errors", []))
-
-        ok = plan_ok and run_ok and not errors
-        constraint_witness = None
-        dual_proposal = None
-        if not ok:
-            constraint_witness = build_constraint_witness(
-                stage="ci_governance_refusal",
-                refusal_reasons=errors,
-                artifact_digests={"plan": _digest_text(_canonical_json(plan_dict))},
-                observer_id="papas",
-                timestamp=None,
-            )
-            dual_proposal = invert_constraints(constraint_witness)
-            _write_json(work_dir / "constraint_witness.json", constraint_witness)
-            _write_json(work_dir / "dual_proposal.json", dual_proposal)
-
-            artifacts.append(bundle_module._artifact("constraint_witness", work_dir / "constraint_witness.json"))
-            artifacts.append(bundle_module._artifact("dual_proposal", work_dir / "dual_proposal.json"))
-
-            bundle_dir, manifest = bundle_module.build_bundle(
-                out_dir=out_dir,
-                artifacts=artifacts,
-                epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
-                epoch_sig=args.sig if args.sig and args.sig.exists() else None,
-                public_key=args.pub,
-                quantum_semantics_v1=args.quantum_semantics_v1,
-            )
-            manifest_path = bundle_dir / "bundle_manifest.json"
-            manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
-            if args.signing_key:
-                sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
-                ok_sig, sig_errors = bundle_module.verify_bundle_manifest_signature(
-                    manifest_path,
-                    sig_path,
-                    args.pub,
-                )
-                if not ok_sig:
-                    errors.extend(sig_errors)
-
-        summary = {
-            "ok": ok,
-            "bundle_path": str(bundle_dir),
-            "bundle_id": manifest.get("bundle_id"),
-            "errors": list(errors),
-            "denied_reason": None if ok else "refusal",
-        }
-        print(_canonical_json(summary))
-        return 0
-    except HplError as exc:
-        summary = {"ok": False, "errors": [str(exc)], "bundle_path": None, "bundle_id": None}
-        print(_canonical_json(summary))
-        return 0
+def _write_json(path: Path, payload: Dict[str, object]) -> None:
+    path.write_text(_canonical_json(payload), encoding="utf-8")
 
 
-def _cmd_demo_agent_governance(args: argparse.Namespace) -> int:
-    out_dir = args.out_dir
-    work_dir = out_dir / "work"
-    if work_dir.exists():
-        shutil.rmtree(work_dir)
-    work_dir.mkdir(parents=True, exist_ok=True)
-    out_dir.mkdir(parents=True, exist_ok=True)
+def _write_refusal_evidence(
+    command: str,
+    inputs: Dict[str, str],
+    errors: List[str],
+    evidence_path: Optional[Path],
+) -> None:
+    if not evidence_path:
+        return
+    _write_evidence(
+        evidence_path,
+        command=command,
+        ok=False,
+        errors=errors,
+        inputs={key: {"path": Path(value).name, "digest": "unavailable"} for key, value in inputs.items()},
+        outputs={},
+    )
 
-    proposal_path = work_dir / "agent_proposal.json"
-    policy_path = work_dir / "agent_policy.json"
-    decision_path = work_dir / "agent_decision.json"
 
-    program_ir_path = work_dir / "program.ir.json"
-    plan_path = work_dir / "plan.json"
-    runtime_path = work_dir / "runtime.json"
+def _write_evidence(
+    path: Path,
+    command: str,
+    ok: bool,
+    errors: List[str],
+    inputs: Dict[str, Dict[str, str]] | Dict[str, str],
+    outputs: Dict[str, Dict[str, str]] | Dict[str, str],
+) -> None:
+    def normalize(obj: Dict[str, Dict[str, str]] | Dict[str, str]) -> Dict[str, Dict[str, str]]:
+        if not obj:
+            return {}
+        sample = next(iter(obj.values()))
+        if isinstance(sample, dict):
+            return obj  # type: ignore[return-value]
+        return {key: {"path": key, "digest": value} for key, value in obj.items()}
 
-    bundle_module = _load_bundle_module()
-    errors: List[str] = []
+    evidence = {
+        "command": command,
+        "ok": ok,
+        "errors": list(errors),
+        "inputs": normalize(inputs),
+        "outputs": normalize(outputs),
+    }
+    path.write_text(_canonical_json(evidence), encoding="utf-8")
 
-    try:
-        program = parse_file(str(args.input))
-        expanded = expand_program(program)
-        validate_program(expanded)
-        program_ir = emit_program_ir(expanded, program_id=args.input.stem)
-        _write_json(program_ir_path, program_ir)
 
-        try:
-            proposal = json.loads(args.proposal.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
-            raise HplError(f"proposal invalid json: {args.proposal}") from exc
-        try:
-            policy = json.loads(args.policy.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
-            raise HplError(f"policy invalid json: {args.policy}") from exc
-        proposal_path.write_text(_canonical_json(proposal), encoding="utf-8")
-        policy_path.write_text(_canonical_json(policy), encoding="utf-8")
-
-        ctx = SchedulerContext(
-            require_epoch_verification=args.require_epoch,
-            anchor_path=args.anchor,
-            signature_path=args.sig,
-            public_key_path=args.pub,
-            allowed_backends=_parse_backends("PYTHON,CLASSICAL,QASM"),
-            budget_steps=100,
-            emit_effect_steps=True,
-            track="agent_governance",
-            agent_proposal_path=Path("agent_proposal.json"),
-            agent_policy_path=Path("agent_policy.json"),
-            agent_decision_path=Path("agent_decision.json"),
-        )
-        plan_obj = plan_program(program_ir, ctx)
-        plan_dict = plan_obj.to_dict()
-        _write_json(plan_path, plan_dict)
+def _make_profiler(args: argparse.Namespace) -> Optional["RuntimeProfiler"]:
+    if not getattr(args, "profile", False):
+        return None
+    from .runtime.profiling import RuntimeProfiler
 
-        plan_ok = plan_obj.status == "planned"
-        if not plan_ok:
-            errors.extend(plan_obj.reasons)
-
-        token_dict = plan_dict.get("execution_token")
-        execution_token = ExecutionToken.from_dict(token_dict) if isinstance(token_dict, dict) else None
-        runtime_ctx = RuntimeContext(
-            epoch_anchor_path=args.anchor,
-            epoch_sig_path=args.sig,
-            ci_pubkey_path=args.pub,
-            execution_token=execution_token,
-            io_enabled=getattr(args, "enable_io", False),
-            net_enabled=getattr(args, "enable_net", False),
-            trace_sink=work_dir,
-        )
-        allowed_steps = {
-            str(step.get("step_id"))
-            for step in plan_dict.get("steps", [])
-            if isinstance(step, dict) and step.get("step_id")
-        }
-        contract = ExecutionContract(allowed_steps=allowed_steps)
-        runtime_result = RuntimeEngine().run(plan_dict, runtime_ctx, contract)
-        runtime_dict = runtime_result.to_dict()
-        _write_json(runtime_path, runtime_dict)
+    return RuntimeProfiler()
 
-        run_ok = runtime_result.status == "completed"
-        if runtime_result.reasons:
-            errors.extend(runtime_result.reasons)
 
-        artifacts = [
-            bundle_module._artifact("program_ir", program_ir_path),
-            bundle_module._artifact("plan", plan_path),
-            bundle_module._artifact("runtime_result", runtime_path),
-            bundle_module._artifact("agent_proposal", proposal_path),
-            bundle_module._artifact("agent_policy", policy_path),
-        ]
-        if decision_path.exists():
-            artifacts.append(bundle_module._artifact("agent_decision", decision_path))
-        if token_dict:
-            token_path = work_dir / "execution_token.json"
-            _write_json(token_path, token_dict)
-            artifacts.append(bundle_module._artifact("execution_token", token_path))
+@contextlib.contextmanager
+def _no_phase(name: str) -> Iterator[None]:
+    yield
 
-        bundle_dir, manifest = bundle_module.build_bundle(
-            out_dir=out_dir,
-            artifacts=artifacts,
-            epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
-            epoch_sig=args.sig if args.sig and args.sig.exists() else None,
-            public_key=args.pub,
-        )
-        manifest_path = bundle_dir / "bundle_manifest.json"
-        manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
 
-        if not args.signing_key:
-            errors.append("signing_key required for agent-governance demo")
-        else:
-            sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
-            ok, sig_errors = bundle_module.verify_bundle_manifest_signature(
-                manifest_path,
-                sig_path,
-                args.pub,
-            )
-            if not ok:
-                errors.extend(sig_errors)
+def _default_evidence_path(out_path: Path, command: str) -> Path:
+    name = f"{command}_evidence.json"
+    return out_path.with_name(name)
 
-        ok = plan_ok and run_ok and not errors
-        constraint_witness = None
-        dual_proposal = None
-        if not ok:
-            constraint_witness = build_constraint_witness(
-                stage="agent_governance_refusal",
-                refusal_reasons=errors,
-                artifact_digests={"plan": _digest_text(_canonical_json(plan_dict))},
-                observer_id="papas",
-                timestamp=None,
-            )
-            dual_proposal = invert_constraints(constraint_witness)
-            _write_json(work_dir / "constraint_witness.json", constraint_witness)
-            _write_json(work_dir / "dual_proposal.json", dual_proposal)
 
-            artifacts.append(bundle_module._artifact("constraint_witness", work_dir / "constraint_witness.json"))
-            artifacts.append(bundle_module._artifact("dual_proposal", work_dir / "dual_proposal.json"))
-
-            bundle_dir, manifest = bundle_module.build_bundle(
-                out_dir=out_dir,
-                artifacts=artifacts,
-                epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
-                epoch_sig=args.sig if args.sig and args.sig.exists() else None,
-                public_key=args.pub,
-            )
-            manifest_path = bundle_dir / "bundle_manifest.json"
-            manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
-            if args.signing_key:
-                sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
-                ok_sig, sig_errors = bundle_module.verify_bundle_manifest_signature(
-                    manifest_path,
-                    sig_path,
-                    args.pub,
-                )
-                if not ok_sig:
-                    errors.extend(sig_errors)
-
-        summary = {
-            "ok": ok,
-            "bundle_path": str(bundle_dir),
-            "bundle_id": manifest.get("bundle_id"),
-            "errors": list(errors),
-            "denied_reason": None if ok else "refusal",
-        }
-        print(_canonical_json(summary))
-        return 0
-    except HplError as exc:
-        summary = {"ok": False, "errors": [str(exc)], "bundle_path": None, "bundle_id": None}
-        print(_canonical_json(summary))
-        return 0
-
-
-def _cmd_demo_trading_paper(args: argparse.Namespace) -> int:
-    out_dir = args.out_dir
-    work_dir = out_dir / "work"
-    if work_dir.exists():
-        shutil.rmtree(work_dir)
-    work_dir.mkdir(parents=True, exist_ok=True)
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    program_ir_path = work_dir / "program.ir.json"
-    plan_path = work_dir / "plan.json"
-    runtime_path = work_dir / "runtime.json"
-    report_json_path = work_dir / "trade_report.json"
-    report_md_path = work_dir / "trade_report.md"
-
-    bundle_module = _load_bundle_module()
-    errors: List[str] = []
-
-    try:
-        program = parse_file(str(args.input))
-        expanded = expand_program(program)
-        validate_program(expanded)
-        program_ir = emit_program_ir(expanded, program_id=args.input.stem)
-        _write_json(program_ir_path, program_ir)
-
-        fixture_path = _relative_to_root(args.market_fixture)
-        policy_path = _relative_to_root(args.policy)
-
-        ctx = SchedulerContext(
-            require_epoch_verification=args.require_epoch,
-            anchor_path=args.anchor,
-            signature_path=args.sig,
-            public_key_path=args.pub,
-            allowed_backends=_parse_backends(args.allowed_backends),
-            budget_steps=args.budget_steps,
-            emit_effect_steps=True,
-            track="trading_paper_mode",
-            trading_fixture_path=fixture_path,
-            trading_policy_path=policy_path,
-            trading_report_json_path=Path("trade_report.json"),
-            trading_report_md_path=Path("trade_report.md"),
-        )
-        plan_obj = plan_program(program_ir, ctx)
-        plan_dict = plan_obj.to_dict()
-        _write_json(plan_path, plan_dict)
-
-        plan_ok = plan_obj.status == "planned"
-        if not plan_ok:
-            errors.extend(plan_obj.reasons)
-
-        token_dict = plan_dict.get("execution_token")
-        execution_token = ExecutionToken.from_dict(token_dict) if isinstance(token_dict, dict) else None
-        runtime_ctx = RuntimeContext(
-            epoch_anchor_path=args.anchor,
-            epoch_sig_path=args.sig,
-            ci_pubkey_path=args.pub,
-            execution_token=execution_token,
-            io_enabled=getattr(args, "enable_io", False),
-            net_enabled=getattr(args, "enable_net", False),
-            trace_sink=work_dir,
-        )
-        allowed_steps = {
-            str(step.get("step_id"))
-            for step in plan_dict.get("steps", [])
-            if isinstance(step, dict) and step.get("step_id")
-        }
-        contract = ExecutionContract(allowed_steps=allowed_steps)
-        runtime_result = RuntimeEngine().run(plan_dict, runtime_ctx, contract)
-        runtime_dict = runtime_result.to_dict()
-        _write_json(runtime_path, runtime_dict)
-
-        run_ok = runtime_result.status == "completed"
-        if runtime_result.reasons:
-            errors.extend(runtime_result.reasons)
-
-        artifacts = [
-            bundle_module._artifact("program_ir", program_ir_path),
-            bundle_module._artifact("plan", plan_path),
-            bundle_module._artifact("runtime_result", runtime_path),
-            bundle_module._artifact("market_fixture", args.market_fixture),
-            bundle_module._artifact("trade_policy", args.policy),
-        ]
-        if report_json_path.exists():
-            artifacts.append(bundle_module._artifact("trade_report", report_json_path))
-        if report_md_path.exists():
-            artifacts.append(bundle_module._artifact("trade_report_md", report_md_path))
-        if token_dict:
-            token_path = work_dir / "execution_token.json"
-            _write_json(token_path, token_dict)
-            artifacts.append(bundle_module._artifact("execution_token", token_path))
-
-        bundle_dir, manifest = bundle_module.build_bundle(
-            out_dir=out_dir,
-            artifacts=artifacts,
-            epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
-            epoch_sig=args.sig if args.sig and args.sig.exists() else None,
-            public_key=args.pub,
-            constraint_inversion_v1=args.constraint_inversion_v1,
-        )
-        manifest_path = bundle_dir / "bundle_manifest.json"
-        manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
-
-        if not args.signing_key:
-            errors.append("signing_key required for trading-paper demo")
-        else:
-            sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
-            ok, sig_errors = bundle_module.verify_bundle_manifest_signature(
-                manifest_path,
-                sig_path,
-                args.pub,
-            )
-            if not ok:
-                errors.extend(sig_errors)
-
-        ok = plan_ok and run_ok and not errors
-        constraint_witness = None
-        dual_proposal = None
-        if not ok:
-            constraint_witness = build_constraint_witness(
-                stage="trading_paper_refusal",
-                refusal_reasons=errors,
-                artifact_digests={"plan": _digest_text(_canonical_json(plan_dict))},
-                observer_id="papas",
-                timestamp=None,
-            )
-            dual_proposal = invert_constraints(constraint_witness)
-            _write_json(work_dir / "constraint_witness.json", constraint_witness)
-            _write_json(work_dir / "dual_proposal.json", dual_proposal)
-
-            artifacts.append(bundle_module._artifact("constraint_witness", work_dir / "constraint_witness.json"))
-            artifacts.append(bundle_module._artifact("dual_proposal", work_dir / "dual_proposal.json"))
-
-            bundle_dir, manifest = bundle_module.build_bundle(
-                out_dir=out_dir,
-                artifacts=artifacts,
-                epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
-                epoch_sig=args.sig if args.sig and args.sig.exists() else None,
-                public_key=args.pub,
-                constraint_inversion_v1=args.constraint_inversion_v1,
-            )
-            manifest_path = bundle_dir / "bundle_manifest.json"
-            manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
-            if args.signing_key:
-                sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
-                ok_sig, sig_errors = bundle_module.verify_bundle_manifest_signature(
-                    manifest_path,
-                    sig_path,
-                    args.pub,
-                )
-                if not ok_sig:
-                    errors.extend(sig_errors)
-
-        summary = {
-            "ok": ok,
-            "bundle_path": str(bundle_dir),
-            "bundle_id": manifest.get("bundle_id"),
-            "errors": list(errors),
-            "denied_reason": None if ok else "refusal",
-        }
-        print(_canonical_json(summary))
-        return 0
-    except HplError as exc:
-        summary = {"ok": False, "errors": [str(exc)], "bundle_path": None, "bundle_id": None}
-        print(_canonical_json(summary))
-        return 0
-
-
-def _cmd_demo_trading_shadow(args: argparse.Namespace) -> int:
-    out_dir = args.out_dir
-    work_dir = out_dir / "work"
-    if work_dir.exists():
-        shutil.rmtree(work_dir)
-    work_dir.mkdir(parents=True, exist_ok=True)
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    program_ir_path = work_dir / "program.ir.json"
-    plan_path = work_dir / "plan.json"
-    runtime_path = work_dir / "runtime.json"
-    report_json_path = work_dir / "trade_report.json"
-    report_md_path = work_dir / "trade_report.md"
-    shadow_model_path = work_dir / "shadow_model.json"
-    shadow_seed_path = work_dir / "shadow_seed.json"
-    shadow_log_path = work_dir / "shadow_execution_log.json"
-    shadow_ledger_path = work_dir / "shadow_trade_ledger.json"
-
-    bundle_module = _load_bundle_module()
-    errors: List[str] = []
-
-    try:
-        program = parse_file(str(args.input))
-        expanded = expand_program(program)
-        validate_program(expanded)
-        program_ir = emit_program_ir(expanded, program_id=args.input.stem)
-        _write_json(program_ir_path, program_ir)
-
-        fixture_path = _relative_to_root(args.market_fixture)
-        policy_path = _relative_to_root(args.policy)
-        model_path = _relative_to_root(args.shadow_model)
-
-        ctx = SchedulerContext(
-            require_epoch_verification=args.require_epoch,
-            anchor_path=args.anchor,
-            signature_path=args.sig,
-            public_key_path=args.pub,
-            allowed_backends=_parse_backends(args.allowed_backends),
-            budget_steps=args.budget_steps,
-            emit_effect_steps=True,
-            track="trading_shadow_mode",
-            trading_fixture_path=fixture_path,
-            trading_policy_path=policy_path,
-            trading_shadow_model_path=model_path,
-            trading_report_json_path=Path("trade_report.json"),
-            trading_report_md_path=Path("trade_report.md"),
-        )
-        plan_obj = plan_program(program_ir, ctx)
-        plan_dict = plan_obj.to_dict()
-        _write_json(plan_path, plan_dict)
-
-        plan_ok = plan_obj.status == "planned"
-        if not plan_ok:
-            errors.extend(plan_obj.reasons)
-
-        token_dict = plan_dict.get("execution_token")
-        execution_token = ExecutionToken.from_dict(token_dict) if isinstance(token_dict, dict) else None
-        runtime_ctx = RuntimeContext(
-            epoch_anchor_path=args.anchor,
-            epoch_sig_path=args.sig,
-            ci_pubkey_path=args.pub,
-            execution_token=execution_token,
-            io_enabled=getattr(args, "enable_io", False),
-            net_enabled=getattr(args, "enable_net", False),
-            trace_sink=work_dir,
-        )
-        allowed_steps = {
-            str(step.get("step_id"))
-            for step in plan_dict.get("steps", [])
-            if isinstance(step, dict) and step.get("step_id")
-        }
-        contract = ExecutionContract(allowed_steps=allowed_steps)
-        runtime_result = RuntimeEngine().run(plan_dict, runtime_ctx, contract)
-        runtime_dict = runtime_result.to_dict()
-        _write_json(runtime_path, runtime_dict)
-
-        run_ok = runtime_result.status == "completed"
-        if runtime_result.reasons:
-            errors.extend(runtime_result.reasons)
-
-        artifacts = [
-            bundle_module._artifact("program_ir", program_ir_path),
-            bundle_module._artifact("plan", plan_path),
-            bundle_module._artifact("runtime_result", runtime_path),
-            bundle_module._artifact("market_fixture", args.market_fixture),
-            bundle_module._artifact("trade_policy", args.policy),
-            bundle_module._artifact("shadow_model", args.shadow_model),
-        ]
-        if shadow_model_path.exists():
-            artifacts.append(bundle_module._artifact("shadow_model_output", shadow_model_path))
-        if shadow_seed_path.exists():
-            artifacts.append(bundle_module._artifact("shadow_seed", shadow_seed_path))
-        if shadow_log_path.exists():
-            artifacts.append(bundle_module._artifact("shadow_execution_log", shadow_log_path))
-        if shadow_ledger_path.exists():
-            artifacts.append(bundle_module._artifact("shadow_trade_ledger", shadow_ledger_path))
-        if report_json_path.exists():
-            artifacts.append(bundle_module._artifact("trade_report", report_json_path))
-        if report_md_path.exists():
-            artifacts.append(bundle_module._artifact("trade_report_md", report_md_path))
-        if token_dict:
-            token_path = work_dir / "execution_token.json"
-            _write_json(token_path, token_dict)
-            artifacts.append(bundle_module._artifact("execution_token", token_path))
-
-        bundle_dir, manifest = bundle_module.build_bundle(
-            out_dir=out_dir,
-            artifacts=artifacts,
-            epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
-            epoch_sig=args.sig if args.sig and args.sig.exists() else None,
-            public_key=args.pub,
-            constraint_inversion_v1=args.constraint_inversion_v1,
-        )
-        manifest_path = bundle_dir / "bundle_manifest.json"
-        manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
-
-        if not args.signing_key:
-            errors.append("signing_key required for trading-shadow demo")
-        else:
-            sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
-            ok, sig_errors = bundle_module.verify_bundle_manifest_signature(
-                manifest_path,
-                sig_path,
-                args.pub,
-            )
-            if not ok:
-                errors.extend(sig_errors)
-
-        ok = plan_ok and run_ok and not errors
-        constraint_witness = None
-        dual_proposal = None
-        if not ok:
-            constraint_witness = build_constraint_witness(
-                stage="trading_shadow_refusal",
-                refusal_reasons=errors,
-                artifact_digests={"plan": _digest_text(_canonical_json(plan_dict))},
-                observer_id="papas",
-                timestamp=None,
-            )
-            dual_proposal = invert_constraints(constraint_witness)
-            _write_json(work_dir / "constraint_witness.json", constraint_witness)
-            _write_json(work_dir / "dual_proposal.json", dual_proposal)
-
-            artifacts.append(bundle_module._artifact("constraint_witness", work_dir / "constraint_witness.json"))
-            artifacts.append(bundle_module._artifact("dual_proposal", work_dir / "dual_proposal.json"))
-
-            bundle_dir, manifest = bundle_module.build_bundle(
-                out_dir=out_dir,
-                artifacts=artifacts,
-                epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
-                epoch_sig=args.sig if args.sig and args.sig.exists() else None,
-                public_key=args.pub,
-                constraint_inversion_v1=args.constraint_inversion_v1,
-            )
-            manifest_path = bundle_dir / "bundle_manifest.json"
-            manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
-            if args.signing_key:
-                sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
-                ok_sig, sig_errors = bundle_module.verify_bundle_manifest_signature(
-                    manifest_path,
-                    sig_path,
-                    args.pub,
-                )
-                if not ok_sig:
-                    errors.extend(sig_errors)
-
-        summary = {
-            "ok": ok,
-            "bundle_path": str(bundle_dir),
-            "bundle_id": manifest.get("bundle_id"),
-            "errors": list(errors),
-            "denied_reason": None if ok else "refusal",
-        }
-        print(_canonical_json(summary))
-        return 0
-    except HplError as exc:
-        summary = {"ok": False, "errors": [str(exc)], "bundle_path": None, "bundle_id": None}
-        print(_canonical_json(summary))
-        return 0
-
-
-def _cmd_demo_trading_io_shadow(args: argparse.Namespace) -> int:
-    out_dir = args.out_dir
-    work_dir = out_dir / "work"
-    if work_dir.exists():
-        shutil.rmtree(work_dir)
-    work_dir.mkdir(parents=True, exist_ok=True)
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    program_ir_path = work_dir / "program.ir.json"
-    plan_path = work_dir / "plan.json"
-    runtime_path = work_dir / "runtime.json"
-
-    bundle_module = _load_bundle_module()
-    errors: List[str] = []
-
-    try:
-        program = parse_file(str(args.input))
-        expanded = expand_program(program)
-        validate_program(expanded)
-        program_ir = emit_program_ir(expanded, program_id=args.input.stem)
-        _write_json(program_ir_path, program_ir)
-
-        io_policy = {
-            "io_allowed": True,
-            "io_scopes": ["BROKER_CONNECT", "ORDER_QUERY", "RECONCILE"],
-            "io_endpoints_allowed": [args.endpoint],
-            "io_budget_calls": 5,
-            "io_requires_reconciliation": True,
-            "io_requires_delta_s": False,
-            "io_mode": "dry_run",
-            "io_timeout_ms": args.io_timeout_ms,
-            "io_nonce_policy": "HPL_DETERMINISTIC_NONCE_V1",
-            "io_redaction_policy_id": "R1",
-        }
-        ctx = SchedulerContext(
-            require_epoch_verification=args.require_epoch,
-            anchor_path=args.anchor,
-            signature_path=args.sig,
-            public_key_path=args.pub,
-            allowed_backends=_parse_backends(args.allowed_backends),
-            budget_steps=args.budget_steps,
-            emit_effect_steps=True,
-            track="trading_io_shadow",
-            io_policy=io_policy,
-            io_endpoint=args.endpoint,
-            io_query_params={"request": {"msg_type": "transaction"}},
-        )
-        plan_obj = plan_program(program_ir, ctx)
-        plan_dict = plan_obj.to_dict()
-        _write_json(plan_path, plan_dict)
-
-        plan_ok = plan_obj.status == "planned"
-        if not plan_ok:
-            errors.extend(plan_obj.reasons)
-
-        token_dict = plan_dict.get("execution_token")
-        execution_token = ExecutionToken.from_dict(token_dict) if isinstance(token_dict, dict) else None
-        runtime_ctx = RuntimeContext(
-            epoch_anchor_path=args.anchor,
-            epoch_sig_path=args.sig,
-            ci_pubkey_path=args.pub,
-            execution_token=execution_token,
-            io_enabled=getattr(args, "enable_io", False),
-            net_enabled=getattr(args, "enable_net", False),
-            trace_sink=work_dir,
-        )
-        allowed_steps = {
-            str(step.get("step_id"))
-            for step in plan_dict.get("steps", [])
-            if isinstance(step, dict) and step.get("step_id")
-        }
-        contract = ExecutionContract(allowed_steps=allowed_steps)
-
-        old_hpl_io_enabled = os.environ.get("HPL_IO_ENABLED")
-        if getattr(args, "enable_io", False):
-            os.environ["HPL_IO_ENABLED"] = "1"
-
-        try:
-            runtime_result = RuntimeEngine().run(plan_dict, runtime_ctx, contract)
-        finally:
-            if old_hpl_io_enabled is None:
-                os.environ.pop("HPL_IO_ENABLED", None)
-            else:
-                os.environ["HPL_IO_ENABLED"] = old_hpl_io_enabled
-
-        runtime_dict = runtime_result.to_dict()
-        _write_json(runtime_path, runtime_dict)
-
-        run_ok = runtime_result.status == "completed"
-        if runtime_result.reasons:
-            errors.extend(runtime_result.reasons)
-
-        artifacts = [
-            bundle_module._artifact("program_ir", program_ir_path),
-            bundle_module._artifact("plan", plan_path),
-            bundle_module._artifact("runtime_result", runtime_path),
-        ]
-
-        io_role_paths = [
-            ("io_request_log", work_dir / "io_connect_request.json"),
-            ("io_response_log", work_dir / "io_connect_response.json"),
-            ("io_event_log", work_dir / "io_connect_event.json"),
-            ("io_request_log", work_dir / "io_query_request.json"),
-            ("io_response_log", work_dir / "io_query_response.json"),
-            ("io_event_log", work_dir / "io_query_event.json"),
-            ("io_outcome", work_dir / "io_outcome.json"),
-            ("reconciliation_report", work_dir / "reconciliation_report.json"),
-            ("remediation_plan", work_dir / "remediation_plan.json"),
-        ]
-        for role, path in io_role_paths:
-            if path.exists():
-                artifacts.append(bundle_module._artifact(role, path))
-
-        if token_dict:
-            token_path = work_dir / "execution_token.json"
-            _write_json(token_path, token_dict)
-            artifacts.append(bundle_module._artifact("execution_token", token_path))
-
-        from .runtime.redaction import scan_artifacts
-
-        redaction_report = scan_artifacts([artifact.source for artifact in artifacts])
-        redaction_path = work_dir / "redaction_report.json"
-        redaction_path.write_text(_canonical_json(redaction_report), encoding="utf-8")
-        artifacts.append(bundle_module._artifact("redaction_report", redaction_path))
-
-        bundle_dir, manifest = bundle_module.build_bundle(
-            out_dir=out_dir,
-            artifacts=artifacts,
-            epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
-            epoch_sig=args.sig if args.sig and args.sig.exists() else None,
-            public_key=args.pub,
-            constraint_inversion_v1=args.constraint_inversion_v1,
-        )
-        manifest_path = bundle_dir / "bundle_manifest.json"
-        manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
-
-        if not args.signing_key:
-            errors.append("signing_key required for trading-io-shadow demo")
-        else:
-            sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
-            ok, sig_errors = bundle_module.verify_bundle_manifest_signature(
-                manifest_path,
-                sig_path,
-                args.pub,
-            )
-            if not ok:
-                errors.extend(sig_errors)
-
-        ok = plan_ok and run_ok and not errors
-        if not ok:
-            constraint_witness = build_constraint_witness(
-                stage="trading_io_shadow_refusal",
-                refusal_reasons=errors,
-                artifact_digests={"plan": _digest_text(_canonical_json(plan_dict))},
-                observer_id="papas",
-                timestamp=None,
-            )
-            dual_proposal = invert_constraints(constraint_witness)
-            _write_json(work_dir / "constraint_witness.json", constraint_witness)
-            _write_json(work_dir / "dual_proposal.json", dual_proposal)
-            artifacts.append(bundle_module._artifact("constraint_witness", work_dir / "constraint_witness.json"))
-            artifacts.append(bundle_module._artifact("dual_proposal", work_dir / "dual_proposal.json"))
-
-            bundle_dir, manifest = bundle_module.build_bundle(
-                out_dir=out_dir,
-                artifacts=artifacts,
-                epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
-                epoch_sig=args.sig if args.sig and args.sig.exists() else None,
-                public_key=args.pub,
-                constraint_inversion_v1=args.constraint_inversion_v1,
-            )
-            manifest_path = bundle_dir / "bundle_manifest.json"
-            manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
-            if args.signing_key:
-                sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
-                ok_sig, sig_errors = bundle_module.verify_bundle_manifest_signature(
-                    manifest_path,
-                    sig_path,
-                    args.pub,
-                )
-                if not ok_sig:
-                    errors.extend(sig_errors)
-
-        summary = {
-            "ok": ok,
-            "bundle_path": str(bundle_dir),
-            "bundle_id": manifest.get("bundle_id"),
-            "errors": list(errors),
-            "denied_reason": None if ok else "refusal",
-        }
-        print(_canonical_json(summary))
-        return 0
-    except HplError as exc:
-        summary = {"ok": False, "errors": [str(exc)], "bundle_path": None, "bundle_id": None}
-        print(_canonical_json(summary))
-        return 0
-
-
-def _cmd_demo_trading_io_live_min(args: argparse.Namespace) -> int:
-    out_dir = args.out_dir
-    work_dir = out_dir / "work"
-    if work_dir.exists():
-        shutil.rmtree(work_dir)
-    work_dir.mkdir(parents=True, exist_ok=True)
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    program_ir_path = work_dir / "program.ir.json"
-    plan_path = work_dir / "plan.json"
-    runtime_path = work_dir / "runtime.json"
-
-    bundle_module = _load_bundle_module()
-    errors: List[str] = []
-
-    try:
-        program = parse_file(str(args.input))
-        expanded = expand_program(program)
-        validate_program(expanded)
-        program_ir = emit_program_ir(expanded, program_id=args.input.stem)
-        _write_json(program_ir_path, program_ir)
-
-        order_payload = None
-        if args.order:
-            order_payload = json.loads(args.order.read_text(encoding="utf-8"))
-        if order_payload is None:
-            order_payload = {"order_id": "live-min-order", "symbol": "DEMO", "side": "buy", "qty": 1}
-
-        io_policy = {
-            "io_allowed": True,
-            "io_scopes": ["BROKER_CONNECT", "ORDER_SUBMIT", "RECONCILE", "ROLLBACK"],
-            "io_endpoints_allowed": [args.endpoint],
-            "io_budget_calls": 5,
-            "io_requires_reconciliation": True,
-            "io_requires_delta_s": False,
-            "io_mode": args.io_mode,
-            "io_timeout_ms": args.io_timeout_ms,
-            "io_nonce_policy": "HPL_DETERMINISTIC_NONCE_V1",
-            "io_redaction_policy_id": "R1",
-        }
-
-        if args.io_mode != "live":
-            errors.append(f"io_mode not live: {args.io_mode}")
-
-        ctx = SchedulerContext(
-            require_epoch_verification=args.require_epoch,
-            anchor_path=args.anchor,
-            signature_path=args.sig,
-            public_key_path=args.pub,
-            allowed_backends=_parse_backends(args.allowed_backends),
-            budget_steps=args.budget_steps,
-            emit_effect_steps=True,
-            track="trading_io_live_min",
-            io_policy=io_policy,
-            io_endpoint=args.endpoint,
-            io_order=order_payload,
-        )
-        plan_obj = plan_program(program_ir, ctx)
-        plan_dict = plan_obj.to_dict()
-        _write_json(plan_path, plan_dict)
-
-        plan_ok = plan_obj.status == "planned"
-        if not plan_ok:
-            errors.extend(plan_obj.reasons)
-
-        token_dict = plan_dict.get("execution_token")
-        execution_token = ExecutionToken.from_dict(token_dict) if isinstance(token_dict, dict) else None
-        runtime_ctx = RuntimeContext(
-            epoch_anchor_path=args.anchor,
-            epoch_sig_path=args.sig,
-            ci_pubkey_path=args.pub,
-            execution_token=execution_token,
-            io_enabled=getattr(args, "enable_io", False),
-            net_enabled=getattr(args, "enable_net", False),
-            trace_sink=work_dir,
-        )
-        allowed_steps = {
-            str(step.get("step_id"))
-            for step in plan_dict.get("steps", [])
-            if isinstance(step, dict) and step.get("step_id")
-        }
-        contract = ExecutionContract(allowed_steps=allowed_steps)
-
-        old_hpl_io_enabled = os.environ.get("HPL_IO_ENABLED")
-        if getattr(args, "enable_io", False):
-            os.environ["HPL_IO_ENABLED"] = "1"
-
-        try:
-            runtime_result = RuntimeEngine().run(plan_dict, runtime_ctx, contract)
-        finally:
-            if old_hpl_io_enabled is None:
-                os.environ.pop("HPL_IO_ENABLED", None)
-            else:
-                os.environ["HPL_IO_ENABLED"] = old_hpl_io_enabled
-
-        runtime_dict = runtime_result.to_dict()
-        _write_json(runtime_path, runtime_dict)
-
-        run_ok = runtime_result.status == "completed"
-        if runtime_result.reasons:
-            errors.extend(runtime_result.reasons)
-
-        artifacts = [
-            bundle_module._artifact("program_ir", program_ir_path),
-            bundle_module._artifact("plan", plan_path),
-            bundle_module._artifact("runtime_result", runtime_path),
-        ]
-
-        io_role_paths = [
-            ("io_request_log", work_dir / "io_connect_request.json"),
-            ("io_response_log", work_dir / "io_connect_response.json"),
-            ("io_event_log", work_dir / "io_connect_event.json"),
-            ("io_request_log", work_dir / "io_submit_request.json"),
-            ("io_response_log", work_dir / "io_submit_response.json"),
-            ("io_event_log", work_dir / "io_submit_event.json"),
-            ("io_outcome", work_dir / "io_outcome.json"),
-            ("reconciliation_report", work_dir / "reconciliation_report.json"),
-            ("remediation_plan", work_dir / "remediation_plan.json"),
-        ]
-        for role, path in io_role_paths:
-            if path.exists():
-                artifacts.append(bundle_module._artifact(role, path))
-
-        if token_dict:
-            token_path = work_dir / "execution_token.json"
-            _write_json(token_path, token_dict)
-            artifacts.append(bundle_module._artifact("execution_token", token_path))
-
-        from .runtime.redaction import scan_artifacts
-
-        redaction_report = scan_artifacts([artifact.source for artifact in artifacts])
-        redaction_path = work_dir / "redaction_report.json"
-        redaction_path.write_text(_canonical_json(redaction_report), encoding="utf-8")
-        artifacts.append(bundle_module._artifact("redaction_report", redaction_path))
-
-        bundle_dir, manifest = bundle_module.build_bundle(
-            out_dir=out_dir,
-            artifacts=artifacts,
-            epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
-            epoch_sig=args.sig if args.sig and args.sig.exists() else None,
-            public_key=args.pub,
-            constraint_inversion_v1=args.constraint_inversion_v1,
-        )
-        manifest_path = bundle_dir / "bundle_manifest.json"
-        manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
-
-        if not args.signing_key:
-            errors.append("signing_key required for trading-io-live-min demo")
-        else:
-            sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
-            ok, sig_errors = bundle_module.verify_bundle_manifest_signature(
-                manifest_path,
-                sig_path,
-                args.pub,
-            )
-            if not ok:
-                errors.extend(sig_errors)
-
-        ok = plan_ok and run_ok and not errors
-        if not ok:
-            constraint_witness = build_constraint_witness(
-                stage="trading_io_live_min_refusal",
-                refusal_reasons=errors,
-                artifact_digests={"plan": _digest_text(_canonical_json(plan_dict))},
-                observer_id="papas",
-                timestamp=None,
-            )
-            dual_proposal = invert_constraints(constraint_witness)
-            _write_json(work_dir / "constraint_witness.json", constraint_witness)
-            _write_json(work_dir / "dual_proposal.json", dual_proposal)
-            artifacts.append(bundle_module._artifact("constraint_witness", work_dir / "constraint_witness.json"))
-            artifacts.append(bundle_module._artifact("dual_proposal", work_dir / "dual_proposal.json"))
-
-            bundle_dir, manifest = bundle_module.build_bundle(
-                out_dir=out_dir,
-                artifacts=artifacts,
-                epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
-                epoch_sig=args.sig if args.sig and args.sig.exists() else None,
-                public_key=args.pub,
-                constraint_inversion_v1=args.constraint_inversion_v1,
-            )
-            manifest_path = bundle_dir / "bundle_manifest.json"
-            manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
-            if args.signing_key:
-                sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
-                ok_sig, sig_errors = bundle_module.verify_bundle_manifest_signature(
-                    manifest_path,
-                    sig_path,
-                    args.pub,
-                )
-                if not ok_sig:
-                    errors.extend(sig_errors)
-
-        summary = {
-            "ok": ok,
-            "bundle_path": str(bundle_dir),
-            "bundle_id": manifest.get("bundle_id"),
-            "errors": list(errors),
-            "denied_reason": None if ok else "refusal",
-        }
-        print(_canonical_json(summary))
-        return 0
-    except HplError as exc:
-        summary = {"ok": False, "errors": [str(exc)], "bundle_path": None, "bundle_id": None}
-        print(_canonical_json(summary))
-        return 0
-
-
-def _cmd_demo_navier_stokes(args: argparse.Namespace) -> int:
-    out_dir = args.out_dir
-    work_dir = out_dir / "work"
-    if work_dir.exists():
-        shutil.rmtree(work_dir)
-    work_dir.mkdir(parents=True, exist_ok=True)
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    program_ir_path = work_dir / "program.ir.json"
-    plan_path = work_dir / "plan.json"
-    runtime_path = work_dir / "runtime.json"
-    state_final_path = work_dir / "ns_state_final.json"
-    observables_path = work_dir / "ns_observables.json"
-    pressure_path = work_dir / "ns_pressure.json"
-    gate_path = work_dir / "ns_gate_certificate.json"
-
-    bundle_module = _load_bundle_module()
-    errors: List[str] = []
-
-    try:
-        program = parse_file(str(args.input))
-        expanded = expand_program(program)
-        validate_program(expanded)
-        program_ir = emit_program_ir(expanded, program_id=args.input.stem)
-        _write_json(program_ir_path, program_ir)
-
-        state_path = _relative_to_root(args.state)
-        policy_path = _relative_to_root(args.policy)
-
-        ctx = SchedulerContext(
-            require_epoch_verification=args.require_epoch,
-            anchor_path=args.anchor,
-            signature_path=args.sig,
-            public_key_path=args.pub,
-            allowed_backends=_parse_backends(args.allowed_backends),
-            budget_steps=args.budget_steps,
-            emit_effect_steps=True,
-            track="navier_stokes",
-            ns_state_path=state_path,
-            ns_policy_path=policy_path,
-            ns_state_final_path=Path("ns_state_final.json"),
-            ns_observables_path=Path("ns_observables.json"),
-            ns_pressure_path=Path("ns_pressure.json"),
-            ns_gate_certificate_path=Path("ns_gate_certificate.json"),
-        )
-        plan_obj = plan_program(program_ir, ctx)
-        plan_dict = plan_obj.to_dict()
-        _write_json(plan_path, plan_dict)
-
-        plan_ok = plan_obj.status == "planned"
-        if not plan_ok:
-            errors.extend(plan_obj.reasons)
-
-        token_dict = plan_dict.get("execution_token")
-        execution_token = ExecutionToken.from_dict(token_dict) if isinstance(token_dict, dict) else None
-        runtime_ctx = RuntimeContext(
-            epoch_anchor_path=args.anchor,
-            epoch_sig_path=args.sig,
-            ci_pubkey_path=args.pub,
-            execution_token=execution_token,
-            io_enabled=getattr(args, "enable_io", False),
-            net_enabled=getattr(args, "enable_net", False),
-            trace_sink=work_dir,
-        )
-        allowed_steps = {
-            str(step.get("step_id"))
-            for step in plan_dict.get("steps", [])
-            if isinstance(step, dict) and step.get("step_id")
-        }
-        contract = ExecutionContract(allowed_steps=allowed_steps)
-        runtime_result = RuntimeEngine().run(plan_dict, runtime_ctx, contract)
-        runtime_dict = runtime_result.to_dict()
-        _write_json(runtime_path, runtime_dict)
-
-        run_ok = runtime_result.status == "completed"
-        if runtime_result.reasons:
-            errors.extend(runtime_result.reasons)
-
-        artifacts = [
-            bundle_module._artifact("program_ir", program_ir_path),
-            bundle_module._artifact("plan", plan_path),
-            bundle_module._artifact("runtime_result", runtime_path),
-            bundle_module._artifact("pde_state", args.state),
-            bundle_module._artifact("pde_policy", args.policy),
-        ]
-        if state_final_path.exists():
-            artifacts.append(bundle_module._artifact("pde_state_final", state_final_path))
-        if observables_path.exists():
-            artifacts.append(bundle_module._artifact("pde_observables", observables_path))
-        if pressure_path.exists():
-            artifacts.append(bundle_module._artifact("pde_pressure", pressure_path))
-        if gate_path.exists():
-            artifacts.append(bundle_module._artifact("pde_gate_certificate", gate_path))
-        if token_dict:
-            token_path = work_dir / "execution_token.json"
-            _write_json(token_path, token_dict)
-            artifacts.append(bundle_module._artifact("execution_token", token_path))
-
-        bundle_dir, manifest = bundle_module.build_bundle(
-            out_dir=out_dir,
-            artifacts=artifacts,
-            epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
-            epoch_sig=args.sig if args.sig and args.sig.exists() else None,
-            public_key=args.pub,
-            constraint_inversion_v1=args.constraint_inversion_v1,
-        )
-        manifest_path = bundle_dir / "bundle_manifest.json"
-        manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
-
-        if not args.signing_key:
-            errors.append("signing_key required for navier-stokes demo")
-        else:
-            sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
-            ok, sig_errors = bundle_module.verify_bundle_manifest_signature(
-                manifest_path,
-                sig_path,
-                args.pub,
-            )
-            if not ok:
-                errors.extend(sig_errors)
-
-        ok = plan_ok and run_ok and not errors
-        constraint_witness = None
-        dual_proposal = None
-        if not ok:
-            constraint_witness = build_constraint_witness(
-                stage="navier_stokes_refusal",
-                refusal_reasons=errors,
-                artifact_digests={"plan": _digest_text(_canonical_json(plan_dict))},
-                observer_id="papas",
-                timestamp=None,
-            )
-            dual_proposal = invert_constraints(constraint_witness)
-            _write_json(work_dir / "constraint_witness.json", constraint_witness)
-            _write_json(work_dir / "dual_proposal.json", dual_proposal)
-
-            artifacts.append(bundle_module._artifact("constraint_witness", work_dir / "constraint_witness.json"))
-            artifacts.append(bundle_module._artifact("dual_proposal", work_dir / "dual_proposal.json"))
-
-            bundle_dir, manifest = bundle_module.build_bundle(
-                out_dir=out_dir,
-                artifacts=artifacts,
-                epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
-                epoch_sig=args.sig if args.sig and args.sig.exists() else None,
-                public_key=args.pub,
-                constraint_inversion_v1=args.constraint_inversion_v1,
-            )
-            manifest_path = bundle_dir / "bundle_manifest.json"
-            manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
-            if args.signing_key:
-                sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
-                ok_sig, sig_errors = bundle_module.verify_bundle_manifest_signature(
-                    manifest_path,
-                    sig_path,
-                    args.pub,
-                )
-                if not ok_sig:
-                    errors.extend(sig_errors)
-
-        summary = {
-            "ok": ok,
-            "bundle_path": str(bundle_dir),
-            "bundle_id": manifest.get("bundle_id"),
-            "errors": list(errors),
-            "denied_reason": None if ok else "refusal",
-        }
-        print(_canonical_json(summary))
-        return 0
-    except HplError as exc:
-        summary = {"ok": False, "errors": [str(exc)], "bundle_path": None, "bundle_id": None}
-        print(_canonical_json(summary))
-        return 0
-
-
-def _cmd_demo_net_shadow(args: argparse.Namespace) -> int:
-    out_dir = args.out_dir
-    work_dir = out_dir / "work"
-    if work_dir.exists():
-        shutil.rmtree(work_dir)
-    work_dir.mkdir(parents=True, exist_ok=True)
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    program_ir_path = work_dir / "program.ir.json"
-    plan_path = work_dir / "plan.json"
-    runtime_path = work_dir / "runtime.json"
-
-    bundle_module = _load_bundle_module()
-    errors: List[str] = []
-
-    try:
-        program = parse_file(str(args.input))
-        expanded = expand_program(program)
-        validate_program(expanded)
-        program_ir = emit_program_ir(expanded, program_id=args.input.stem)
-        _write_json(program_ir_path, program_ir)
-
-        net_policy = {
-            "net_mode": "dry_run",
-            "net_caps": [
-                "NET_CONNECT",
-                "NET_HANDSHAKE",
-                "NET_KEY_EXCHANGE",
-                "NET_SEND",
-                "NET_RECV",
-                "NET_CLOSE",
-            ],
-            "net_endpoints_allowlist": [args.endpoint],
-            "net_budget_calls": 8,
-            "net_timeout_ms": args.net_timeout_ms,
-            "net_nonce_policy": "HPL_DETERMINISTIC_NONCE_V1",
-            "net_redaction_policy_id": "R1",
-            "net_crypto_policy_id": "QKX1",
-        }
-        message = {"kind": "text", "payload": args.message}
-        ctx = SchedulerContext(
-            require_epoch_verification=args.require_epoch,
-            anchor_path=args.anchor,
-            signature_path=args.sig,
-            public_key_path=args.pub,
-            allowed_backends=_parse_backends(args.allowed_backends),
-            budget_steps=args.budget_steps,
-            emit_effect_steps=True,
-            track="net_shadow",
-            net_policy=net_policy,
-            net_endpoint=args.endpoint,
-            net_message=message,
-        )
-        plan_obj = plan_program(program_ir, ctx)
-        plan_dict = plan_obj.to_dict()
-        _write_json(plan_path, plan_dict)
-
-        plan_ok = plan_obj.status == "planned"
-        if not plan_ok:
-            errors.extend(plan_obj.reasons)
-
-        token_dict = plan_dict.get("execution_token")
-        execution_token = ExecutionToken.from_dict(token_dict) if isinstance(token_dict, dict) else None
-        runtime_ctx = RuntimeContext(
-            epoch_anchor_path=args.anchor,
-            epoch_sig_path=args.sig,
-            ci_pubkey_path=args.pub,
-            execution_token=execution_token,
-            io_enabled=getattr(args, "enable_io", False),
-            net_enabled=getattr(args, "enable_net", False),
-            trace_sink=work_dir,
-        )
-        allowed_steps = {
-            str(step.get("step_id"))
-            for step in plan_dict.get("steps", [])
-            if isinstance(step, dict) and step.get("step_id")
-        }
-        contract = ExecutionContract(allowed_steps=allowed_steps)
-        runtime_result = RuntimeEngine().run(plan_dict, runtime_ctx, contract)
-        runtime_dict = runtime_result.to_dict()
-        _write_json(runtime_path, runtime_dict)
-
-        run_ok = runtime_result.status == "completed"
-        if runtime_result.reasons:
-            errors.extend(runtime_result.reasons)
-
-        artifacts = [
-            bundle_module._artifact("program_ir", program_ir_path),
-            bundle_module._artifact("plan", plan_path),
-            bundle_module._artifact("runtime_result", runtime_path),
-        ]
-
-        net_role_paths = [
-            ("net_request_log", work_dir / "net_connect_request.json"),
-            ("net_response_log", work_dir / "net_connect_response.json"),
-            ("net_event_log", work_dir / "net_connect_event.json"),
-            ("net_request_log", work_dir / "net_handshake_request.json"),
-            ("net_response_log", work_dir / "net_handshake_response.json"),
-            ("net_event_log", work_dir / "net_handshake_event.json"),
-            ("net_request_log", work_dir / "net_key_exchange_request.json"),
-            ("net_response_log", work_dir / "net_key_exchange_response.json"),
-            ("net_event_log", work_dir / "net_key_exchange_event.json"),
-            ("net_request_log", work_dir / "net_send_request.json"),
-            ("net_response_log", work_dir / "net_send_response.json"),
-            ("net_event_log", work_dir / "net_send_event.json"),
-            ("net_request_log", work_dir / "net_recv_request.json"),
-            ("net_response_log", work_dir / "net_recv_response.json"),
-            ("net_event_log", work_dir / "net_recv_event.json"),
-            ("net_request_log", work_dir / "net_close_request.json"),
-            ("net_response_log", work_dir / "net_close_response.json"),
-            ("net_event_log", work_dir / "net_close_event.json"),
-            ("net_session_manifest", work_dir / "net_session_manifest.json"),
-        ]
-        for role, path in net_role_paths:
-            if path.exists():
-                artifacts.append(bundle_module._artifact(role, path))
-
-        if token_dict:
-            token_path = work_dir / "execution_token.json"
-            _write_json(token_path, token_dict)
-            artifacts.append(bundle_module._artifact("execution_token", token_path))
-
-        from .runtime.redaction import scan_artifacts
-
-        redaction_report = scan_artifacts([artifact.source for artifact in artifacts])
-        redaction_path = work_dir / "redaction_report.json"
-        redaction_path.write_text(_canonical_json(redaction_report), encoding="utf-8")
-        artifacts.append(bundle_module._artifact("redaction_report", redaction_path))
-
-        bundle_dir, manifest = bundle_module.build_bundle(
-            out_dir=out_dir,
-            artifacts=artifacts,
-            epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
-            epoch_sig=args.sig if args.sig and args.sig.exists() else None,
-            public_key=args.pub,
-            constraint_inversion_v1=args.constraint_inversion_v1,
-        )
-        manifest_path = bundle_dir / "bundle_manifest.json"
-        manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
-
-        if not args.signing_key:
-            errors.append("signing_key required for net-shadow demo")
-        else:
-            sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
-            ok_sig, sig_errors = bundle_module.verify_bundle_manifest_signature(
-                manifest_path,
-                sig_path,
-                args.pub,
-            )
-            if not ok_sig:
-                errors.extend(sig_errors)
-
-        ok = plan_ok and run_ok and not errors
-        constraint_witness = None
-        dual_proposal = None
-        if not ok:
-            constraint_witness = build_constraint_witness(
-                stage="net_shadow_refusal",
-                refusal_reasons=errors,
-                artifact_digests={"plan": _digest_text(_canonical_json(plan_dict))},
-                observer_id="papas",
-                timestamp=None,
-            )
-            dual_proposal = invert_constraints(constraint_witness)
-            _write_json(work_dir / "constraint_witness.json", constraint_witness)
-            _write_json(work_dir / "dual_proposal.json", dual_proposal)
-
-            artifacts.append(bundle_module._artifact("constraint_witness", work_dir / "constraint_witness.json"))
-            artifacts.append(bundle_module._artifact("dual_proposal", work_dir / "dual_proposal.json"))
-
-            bundle_dir, manifest = bundle_module.build_bundle(
-                out_dir=out_dir,
-                artifacts=artifacts,
-                epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
-                epoch_sig=args.sig if args.sig and args.sig.exists() else None,
-                public_key=args.pub,
-                constraint_inversion_v1=args.constraint_inversion_v1,
-            )
-            manifest_path = bundle_dir / "bundle_manifest.json"
-            manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
-            if args.signing_key:
-                sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
-                ok_sig, sig_errors = bundle_module.verify_bundle_manifest_signature(
-                    manifest_path,
-                    sig_path,
-                    args.pub,
-                )
-                if not ok_sig:
-                    errors.extend(sig_errors)
-
-        summary = {
-            "ok": ok,
-            "bundle_path": str(bundle_dir),
-            "bundle_id": manifest.get("bundle_id"),
-            "errors": list(errors),
-            "denied_reason": None if ok else "refusal",
-        }
-        print(_canonical_json(summary))
-        return 0
-    except HplError as exc:
-        summary = {"ok": False, "errors": [str(exc)], "bundle_path": None, "bundle_id": None}
-        print(_canonical_json(summary))
-        return 0
-
-
-def _load_contract(contract_path: Optional[Path], plan_dict: Dict[str, object]) -> ExecutionContract:
-    if contract_path and contract_path.exists():
-        data = json.loads(contract_path.read_text(encoding="utf-8"))
-        allowed_steps = set(map(str, data.get("allowed_steps", [])))
-        return ExecutionContract(
-            allowed_steps=allowed_steps,
-            require_epoch_verification=bool(data.get("require_epoch_verification", False)),
-            require_signature_verification=bool(data.get("require_signature_verification", False)),
-        )
-
-    plan_steps = plan_dict.get("steps", [])
-    allowed = {str(step.get("operator_id")) for step in plan_steps if isinstance(step, dict)}
-    return ExecutionContract(allowed_steps=allowed)
-
-
-def _load_bundle_module():
-    spec = importlib.util.spec_from_file_location("bundle_evidence", BUNDLE_EVIDENCE_PATH)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[spec.name] = module
-    spec.loader.exec_module(module)
-    return module
-
-
-def _load_tool_module(name: str, path: Path):
-    spec = importlib.util.spec_from_file_location(name, path)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[spec.name] = module
-    spec.loader.exec_module(module)
-    return module
-
-
-def _write_json(path: Path, payload: Dict[str, object]) -> None:
-    path.write_text(_canonical_json(payload), encoding="utf-8")
-
-
-def _write_refusal_evidence(
-    command: str,
-    inputs: Dict[str, str],
-    errors: List[str],
-    evidence_path: Optional[Path],
-) -> None:
-    if not evidence_path:
-        return
-    _write_evidence(
-        evidence_path,
-        command=command,
-        ok=False,
-        errors=errors,
-        inputs={key: {"path": Path(value).name, "digest": "unavailable"} for key, value in inputs.items()},
-        outputs={},
-    )
-
-
-def _write_evidence(
-    path: Path,
-    command: str,
-    ok: bool,
-    errors: List[str],
-    inputs: Dict[str, Dict[str, str]] | Dict[str, str],
-    outputs: Dict[str, Dict[str, str]] | Dict[str, str],
-) -> None:
-    def normalize(obj: Dict[str, Dict[str, str]] | Dict[str, str]) -> Dict[str, Dict[str, str]]:
-        if not obj:
-            return {}
-        sample = next(iter(obj.values()))
-        if isinstance(sample, dict):
-            return obj  # type: ignore[return-value]
-        return {key: {"path": key, "digest": value} for key, value in obj.items()}
-
-    evidence = {
-        "command": command,
-        "ok": ok,
-        "errors": list(errors),
-        "inputs": normalize(inputs),
-        "outputs": normalize(outputs),
-    }
-    path.write_text(_canonical_json(evidence), encoding="utf-8")
-
-
-def _default_evidence_path(out_path: Path, command: str) -> Path:
-    name = f"{command}_evidence.json"
-    return out_path.with_name(name)
-
-
-def _canonical_json(data: object) -> str:
-    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+def _canonical_json(data: object) -> str:
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
 
 
 def _digest_text_value(value: str) -> Dict[str, str]:
@@ -2525,17 +1276,6 @@ def _digest_text_value(value: str) -> Dict[str, str]:
     return {"path": "inline", "digest": f"sha256:{digest}"}
 
 
-def _parse_backends(value: str) -> List[str]:
-    parts = [item.strip() for item in value.split(",") if item.strip()]
-    return sorted({item.upper() for item in parts}) or ["PYTHON", "CLASSICAL", "QASM"]
-
-
-def _normalize_backend(value: Optional[str]) -> Optional[str]:
-    if not value:
-        return None
-    return value.upper()
-
-
 def _digest_text(value: str) -> str:
     digest = hashlib.sha256(value.encode("utf-8")).hexdigest()
     return f"sha256:{digest}"
@@ -0,0 +1,1500 @@
+"""``hpl demo`` commands, imported by the CLI only when a demo runs.
+
+The pipeline modules every demo drives (compiler, scheduler, runtime,
+constraint inversion and the tools package) are imported once here, so
+``import hpl.cli`` stays free of them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import List
+
+from .audit.constraint_inversion import invert_constraints
+from .audit.constraint_witness import build_constraint_witness
+from .cli import (
+    _canonical_json,
+    _digest_text,
+    _make_profiler,
+    _no_phase,
+    _relative_to_root,
+    _write_json,
+)
+from .compile_cache import compile_file
+from .errors import HplError
+from .execution_token import ExecutionToken, normalize_backend, parse_backends
+from .runtime.context import RuntimeContext
+from .runtime.contracts import ExecutionContract
+from .runtime.engine import RuntimeEngine
+from .scheduler import SchedulerContext, plan as plan_program
+from .tool_loader import load_tool
+
+
+def _cmd_demo_ci_governance(args: argparse.Namespace) -> int:
+    out_dir = args.out_dir
+    work_dir = out_dir / "work"
+    if work_dir.exists():
+        shutil.rmtree(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    repo_state_path = work_dir / "repo_state.json"
+    repo_state_path.write_text(_canonical_json({"clean": True}), encoding="utf-8")
+    repo_state_rel = Path("repo_state.json")
+
+    program_ir_path = work_dir / "program.ir.json"
+    plan_path = work_dir / "plan.json"
+    runtime_path = work_dir / "runtime.json"
+    backend_ir_path = work_dir / "backend.ir.json"
+
+    bundle_module = load_tool("bundle_evidence")
+    errors: List[str] = []
+
+    try:
+        program_ir = compile_file(args.input).program_ir
+        _write_json(program_ir_path, program_ir)
+
+        coupling_registry = _relative_to_root(args.coupling_registry)
+        ctx = SchedulerContext(
+            require_epoch_verification=args.require_epoch,
+            anchor_path=args.anchor,
+            signature_path=args.sig,
+            public_key_path=args.pub,
+            allowed_backends=parse_backends("PYTHON,CLASSICAL,QASM"),
+            budget_steps=100,
+            emit_effect_steps=True,
+            backend_target=args.backend,
+            artifact_paths={
+                "backend_ir": "backend.ir.json",
+            },
+            track="ci_governance",
+            ci_repo_state_path=repo_state_rel,
+            ci_coupling_registry_path=coupling_registry,
+        )
+        plan_obj = plan_program(program_ir, ctx)
+        plan_dict = plan_obj.to_dict()
+        _write_json(plan_path, plan_dict)
+
+        plan_ok = plan_obj.status == "planned"
+        if not plan_ok:
+            errors.extend(plan_obj.reasons)
+
+        token_dict = plan_dict.get("execution_token")
+        execution_token = ExecutionToken.from_dict(token_dict) if isinstance(token_dict, dict) else None
+        runtime_ctx = RuntimeContext(
+            epoch_anchor_path=args.anchor,
+            epoch_sig_path=args.sig,
+            ci_pubkey_path=args.pub,
+            execution_token=execution_token,
+            io_enabled=getattr(args, "enable_io", False),
+            net_enabled=getattr(args, "enable_net", False),
+            requested_backend=normalize_backend(args.backend),
+            trace_sink=work_dir,
+        )
+        allowed_steps = {str(step.get("step_id")) for step in plan_dict.get("steps", []) if isinstance(step, dict) and step.get("step_id")}
+        contract = ExecutionContract(allowed_steps=allowed_steps)
+        runtime_result = RuntimeEngine().run(plan_dict, runtime_ctx, contract)
+        runtime_dict = runtime_result.to_dict()
+        _write_json(runtime_path, runtime_dict)
+
+        run_ok = runtime_result.status == "completed"
+        if runtime_result.reasons:
+            errors.extend(runtime_result.reasons)
+
+        artifacts = [
+            bundle_module._artifact("program_ir", program_ir_path),
+            bundle_module._artifact("plan", plan_path),
+            bundle_module._artifact("runtime_result", runtime_path),
+        ]
+        if backend_ir_path.exists():
+            artifacts.append(bundle_module._artifact("backend_ir", backend_ir_path))
+        if token_dict:
+            token_path = work_dir / "execution_token.json"
+            _write_json(token_path, token_dict)
+            artifacts.append(bundle_module._artifact("execution_token", token_path))
+
+        bundle_dir, manifest = bundle_module.build_bundle(
+            out_dir=out_dir,
+            artifacts=artifacts,
+            epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
+            epoch_sig=args.sig if args.sig and args.sig.exists() else None,
+            public_key=args.pub,
+            quantum_semantics_v1=args.quantum_semantics_v1,
+        )
+        manifest_path = bundle_dir / "bundle_manifest.json"
+        manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
+
+        if not args.signing_key:
+            errors.append("signing_key required for ci-governance demo")
+        else:
+            sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
+            ok, sig_errors = bundle_module.verify_bundle_manifest_signature(
+                manifest_path,
+                sig_path,
+                args.pub,
+            )
+            if not ok:
+                errors.extend(sig_errors)
+
+        if args.quantum_semantics_v1:
+            quantum_module = load_tool("validate_quantum_execution_semantics")
+            quantum_result = quantum_module.validate_quantum_execution_semantics(
+                program_ir=program_ir_path,
+                plan=plan_path,
+                runtime_result=runtime_path,
+                backend_ir=backend_ir_path if backend_ir_path.exists() else None,
+                qasm=None,
+                bundle_manifest=manifest_path,
+            )
+            if not quantum_result.get("ok", False):
+                errors.extend(quantum_result.get("errors", []))
+
+        ok = plan_ok and run_ok and not errors
+        constraint_witness = None
+        dual_proposal = None
+        if not ok:
+            constraint_witness = build_constraint_witness(
+                stage="ci_governance_refusal",
+                refusal_reasons=errors,
+                artifact_digests={"plan": _digest_text(_canonical_json(plan_dict))},
+                observer_id="papas",
+                timestamp=None,
+            )
+            dual_proposal = invert_constraints(constraint_witness)
+            _write_json(work_dir / "constraint_witness.json", constraint_witness)
+            _write_json(work_dir / "dual_proposal.json", dual_proposal)
+
+            artifacts.append(bundle_module._artifact("constraint_witness", work_dir / "constraint_witness.json"))
+            artifacts.append(bundle_module._artifact("dual_proposal", work_dir / "dual_proposal.json"))
+
+            bundle_dir, manifest = bundle_module.build_bundle(
+                out_dir=out_dir,
+                artifacts=artifacts,
+                epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
+                epoch_sig=args.sig if args.sig and args.sig.exists() else None,
+                public_key=args.pub,
+                quantum_semantics_v1=args.quantum_semantics_v1,
+            )
+            manifest_path = bundle_dir / "bundle_manifest.json"
+            manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
+            if args.signing_key:
+                sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
+                ok_sig, sig_errors = bundle_module.verify_bundle_manifest_signature(
+                    manifest_path,
+                    sig_path,
+                    args.pub,
+                )
+                if not ok_sig:
+                    errors.extend(sig_errors)
+
+        summary = {
+            "ok": ok,
+            "bundle_path": str(bundle_dir),
+            "bundle_id": manifest.get("bundle_id"),
+            "errors": list(errors),
+            "denied_reason": None if ok else "refusal",
+        }
+        print(_canonical_json(summary))
+        return 0
+    except HplError as exc:
+        summary = {"ok": False, "errors": [str(exc)], "bundle_path": None, "bundle_id": None}
+        print(_canonical_json(summary))
+        return 0
+
+
+def _cmd_demo_agent_governance(args: argparse.Namespace) -> int:
+    out_dir = args.out_dir
+    work_dir = out_dir / "work"
+    if work_dir.exists():
+        shutil.rmtree(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    proposal_path = work_dir / "agent_proposal.json"
+    policy_path = work_dir / "agent_policy.json"
+    decision_path = work_dir / "agent_decision.json"
+
+    program_ir_path = work_dir / "program.ir.json"
+    plan_path = work_dir / "plan.json"
+    runtime_path = work_dir / "runtime.json"
+
+    bundle_module = load_tool("bundle_evidence")
+    errors: List[str] = []
+
+    try:
+        program_ir = compile_file(args.input).program_ir
+        _write_json(program_ir_path, program_ir)
+
+        try:
+            proposal = json.loads(args.proposal.read_text(encoding="utf-8"))
+        except json.JSONDecodeError as exc:
+            raise HplError(f"proposal invalid json: {args.proposal}") from exc
+        try:
+            policy = json.loads(args.policy.read_text(encoding="utf-8"))
+        except json.JSONDecodeError as exc:
+            raise HplError(f"policy invalid json: {args.policy}") from exc
+        proposal_path.write_text(_canonical_json(proposal), encoding="utf-8")
+        policy_path.write_text(_canonical_json(policy), encoding="utf-8")
+
+        ctx = SchedulerContext(
+            require_epoch_verification=args.require_epoch,
+            anchor_path=args.anchor,
+            signature_path=args.sig,
+            public_key_path=args.pub,
+            allowed_backends=parse_backends("PYTHON,CLASSICAL,QASM"),
+            budget_steps=100,
+            emit_effect_steps=True,
+            track="agent_governance",
+            agent_proposal_path=Path("agent_proposal.json"),
+            agent_policy_path=Path("agent_policy.json"),
+            agent_decision_path=Path("agent_decision.json"),
+        )
+        plan_obj = plan_program(program_ir, ctx)
+        plan_dict = plan_obj.to_dict()
+        _write_json(plan_path, plan_dict)
+
+        plan_ok = plan_obj.status == "planned"
+        if not plan_ok:
+            errors.extend(plan_obj.reasons)
+
+        token_dict = plan_dict.get("execution_token")
+        execution_token = ExecutionToken.from_dict(token_dict) if isinstance(token_dict, dict) else None
+        runtime_ctx = RuntimeContext(
+            epoch_anchor_path=args.anchor,
+            epoch_sig_path=args.sig,
+            ci_pubkey_path=args.pub,
+            execution_token=execution_token,
+            io_enabled=getattr(args, "enable_io", False),
+            net_enabled=getattr(args, "enable_net", False),
+            trace_sink=work_dir,
+        )
+        allowed_steps = {
+            str(step.get("step_id"))
+            for step in plan_dict.get("steps", [])
+            if isinstance(step, dict) and step.get("step_id")
+        }
+        contract = ExecutionContract(allowed_steps=allowed_steps)
+        runtime_result = RuntimeEngine().run(plan_dict, runtime_ctx, contract)
+        runtime_dict = runtime_result.to_dict()
+        _write_json(runtime_path, runtime_dict)
+
+        run_ok = runtime_result.status == "completed"
+        if runtime_result.reasons:
+            errors.extend(runtime_result.reasons)
+
+        artifacts = [
+            bundle_module._artifact("program_ir", program_ir_path),
+            bundle_module._artifact("plan", plan_path),
+            bundle_module._artifact("runtime_result", runtime_path),
+            bundle_module._artifact("agent_proposal", proposal_path),
+            bundle_module._artifact("agent_policy", policy_path),
+        ]
+        if decision_path.exists():
+            artifacts.append(bundle_module._artifact("agent_decision", decision_path))
+        if token_dict:
+            token_path = work_dir / "execution_token.json"
+            _write_json(token_path, token_dict)
+            artifacts.append(bundle_module._artifact("execution_token", token_path))
+
+        bundle_dir, manifest = bundle_module.build_bundle(
+            out_dir=out_dir,
+            artifacts=artifacts,
+            epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
+            epoch_sig=args.sig if args.sig and args.sig.exists() else None,
+            public_key=args.pub,
+        )
+        manifest_path = bundle_dir / "bundle_manifest.json"
+        manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
+
+        if not args.signing_key:
+            errors.append("signing_key required for agent-governance demo")
+        else:
+            sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
+            ok, sig_errors = bundle_module.verify_bundle_manifest_signature(
+                manifest_path,
+                sig_path,
+                args.pub,
+            )
+            if not ok:
+                errors.extend(sig_errors)
+
+        ok = plan_ok and run_ok and not errors
+        constraint_witness = None
+        dual_proposal = None
+        if not ok:
+            constraint_witness = build_constraint_witness(
+                stage="agent_governance_refusal",
+                refusal_reasons=errors,
+                artifact_digests={"plan": _digest_text(_canonical_json(plan_dict))},
+                observer_id="papas",
+                timestamp=None,
+            )
+            dual_proposal = invert_constraints(constraint_witness)
+            _write_json(work_dir / "constraint_witness.json", constraint_witness)
+            _write_json(work_dir / "dual_proposal.json", dual_proposal)
+
+            artifacts.append(bundle_module._artifact("constraint_witness", work_dir / "constraint_witness.json"))
+            artifacts.append(bundle_module._artifact("dual_proposal", work_dir / "dual_proposal.json"))
+
+            bundle_dir, manifest = bundle_module.build_bundle(
+                out_dir=out_dir,
+                artifacts=artifacts,
+                epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
+                epoch_sig=args.sig if args.sig and args.sig.exists() else None,
+                public_key=args.pub,
+            )
+            manifest_path = bundle_dir / "bundle_manifest.json"
+            manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
+            if args.signing_key:
+                sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
+                ok_sig, sig_errors = bundle_module.verify_bundle_manifest_signature(
+                    manifest_path,
+                    sig_path,
+                    args.pub,
+                )
+                if not ok_sig:
+                    errors.extend(sig_errors)
+
+        summary = {
+            "ok": ok,
+            "bundle_path": str(bundle_dir),
+            "bundle_id": manifest.get("bundle_id"),
+            "errors": list(errors),
+            "denied_reason": None if ok else "refusal",
+        }
+        print(_canonical_json(summary))
+        return 0
+    except HplError as exc:
+        summary = {"ok": False, "errors": [str(exc)], "bundle_path": None, "bundle_id": None}
+        print(_canonical_json(summary))
+        return 0
+
+
+def _cmd_demo_trading_paper(args: argparse.Namespace) -> int:
+    out_dir = args.out_dir
+    work_dir = out_dir / "work"
+    if work_dir.exists():
+        shutil.rmtree(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    program_ir_path = work_dir / "program.ir.json"
+    plan_path = work_dir / "plan.json"
+    runtime_path = work_dir / "runtime.json"
+    report_json_path = work_dir / "trade_report.json"
+    report_md_path = work_dir / "trade_report.md"
+
+    bundle_module = load_tool("bundle_evidence")
+    errors: List[str] = []
+
+    try:
+        program_ir = compile_file(args.input).program_ir
+        _write_json(program_ir_path, program_ir)
+
+        fixture_path = _relative_to_root(args.market_fixture)
+        policy_path = _relative_to_root(args.policy)
+
+        ctx = SchedulerContext(
+            require_epoch_verification=args.require_epoch,
+            anchor_path=args.anchor,
+            signature_path=args.sig,
+            public_key_path=args.pub,
+            allowed_backends=parse_backends(args.allowed_backends),
+            budget_steps=args.budget_steps,
+            emit_effect_steps=True,
+            track="trading_paper_mode",
+            trading_fixture_path=fixture_path,
+            trading_policy_path=policy_path,
+            trading_report_json_path=Path("trade_report.json"),
+            trading_report_md_path=Path("trade_report.md"),
+        )
+        plan_obj = plan_program(program_ir, ctx)
+        plan_dict = plan_obj.to_dict()
+        _write_json(plan_path, plan_dict)
+
+        plan_ok = plan_obj.status == "planned"
+        if not plan_ok:
+            errors.extend(plan_obj.reasons)
+
+        token_dict = plan_dict.get("execution_token")
+        execution_token = ExecutionToken.from_dict(token_dict) if isinstance(token_dict, dict) else None
+        runtime_ctx = RuntimeContext(
+            epoch_anchor_path=args.anchor,
+            epoch_sig_path=args.sig,
+            ci_pubkey_path=args.pub,
+            execution_token=execution_token,
+            io_enabled=getattr(args, "enable_io", False),
+            net_enabled=getattr(args, "enable_net", False),
+            trace_sink=work_dir,
+        )
+        allowed_steps = {
+            str(step.get("step_id"))
+            for step in plan_dict.get("steps", [])
+            if isinstance(step, dict) and step.get("step_id")
+        }
+        contract = ExecutionContract(allowed_steps=allowed_steps)
+        runtime_result = RuntimeEngine().run(plan_dict, runtime_ctx, contract)
+        runtime_dict = runtime_result.to_dict()
+        _write_json(runtime_path, runtime_dict)
+
+        run_ok = runtime_result.status == "completed"
+        if runtime_result.reasons:
+            errors.extend(runtime_result.reasons)
+
+        artifacts = [
+            bundle_module._artifact("program_ir", program_ir_path),
+            bundle_module._artifact("plan", plan_path),
+            bundle_module._artifact("runtime_result", runtime_path),
+            bundle_module._artifact("market_fixture", args.market_fixture),
+            bundle_module._artifact("trade_policy", args.policy),
+        ]
+        if report_json_path.exists():
+            artifacts.append(bundle_module._artifact("trade_report", report_json_path))
+        if report_md_path.exists():
+            artifacts.append(bundle_module._artifact("trade_report_md", report_md_path))
+        if token_dict:
+            token_path = work_dir / "execution_token.json"
+            _write_json(token_path, token_dict)
+            artifacts.append(bundle_module._artifact("execution_token", token_path))
+
+        bundle_dir, manifest = bundle_module.build_bundle(
+            out_dir=out_dir,
+            artifacts=artifacts,
+            epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
+            epoch_sig=args.sig if args.sig and args.sig.exists() else None,
+            public_key=args.pub,
+            constraint_inversion_v1=args.constraint_inversion_v1,
+        )
+        manifest_path = bundle_dir / "bundle_manifest.json"
+        manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
+
+        if not args.signing_key:
+            errors.append("signing_key required for trading-paper demo")
+        else:
+            sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
+            ok, sig_errors = bundle_module.verify_bundle_manifest_signature(
+                manifest_path,
+                sig_path,
+                args.pub,
+            )
+            if not ok:
+                errors.extend(sig_errors)
+
+        ok = plan_ok and run_ok and not errors
+        constraint_witness = None
+        dual_proposal = None
+        if not ok:
+            constraint_witness = build_constraint_witness(
+                stage="trading_paper_refusal",
+                refusal_reasons=errors,
+                artifact_digests={"plan": _digest_text(_canonical_json(plan_dict))},
+                observer_id="papas",
+                timestamp=None,
+            )
+            dual_proposal = invert_constraints(constraint_witness)
+            _write_json(work_dir / "constraint_witness.json", constraint_witness)
+            _write_json(work_dir / "dual_proposal.json", dual_proposal)
+
+            artifacts.append(bundle_module._artifact("constraint_witness", work_dir / "constraint_witness.json"))
+            artifacts.append(bundle_module._artifact("dual_proposal", work_dir / "dual_proposal.json"))
+
+            bundle_dir, manifest = bundle_module.build_bundle(
+                out_dir=out_dir,
+                artifacts=artifacts,
+                epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
+                epoch_sig=args.sig if args.sig and args.sig.exists() else None,
+                public_key=args.pub,
+                constraint_inversion_v1=args.constraint_inversion_v1,
+            )
+            manifest_path = bundle_dir / "bundle_manifest.json"
+            manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
+            if args.signing_key:
+                sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
+                ok_sig, sig_errors = bundle_module.verify_bundle_manifest_signature(
+                    manifest_path,
+                    sig_path,
+                    args.pub,
+                )
+                if not ok_sig:
+                    errors.extend(sig_errors)
+
+        summary = {
+            "ok": ok,
+            "bundle_path": str(bundle_dir),
+            "bundle_id": manifest.get("bundle_id"),
+            "errors": list(errors),
+            "denied_reason": None if ok else "refusal",
+        }
+        print(_canonical_json(summary))
+        return 0
+    except HplError as exc:
+        summary = {"ok": False, "errors": [str(exc)], "bundle_path": None, "bundle_id": None}
+        print(_canonical_json(summary))
+        return 0
+
+
+def _cmd_demo_trading_shadow(args: argparse.Namespace) -> int:
+    out_dir = args.out_dir
+    work_dir = out_dir / "work"
+    if work_dir.exists():
+        shutil.rmtree(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    program_ir_path = work_dir / "program.ir.json"
+    plan_path = work_dir / "plan.json"
+    runtime_path = work_dir / "runtime.json"
+    report_json_path = work_dir / "trade_report.json"
+    report_md_path = work_dir / "trade_report.md"
+    shadow_model_path = work_dir / "shadow_model.json"
+    shadow_seed_path = work_dir / "shadow_seed.json"
+    shadow_log_path = work_dir / "shadow_execution_log.json"
+    shadow_ledger_path = work_dir / "shadow_trade_ledger.json"
+
+    bundle_module = load_tool("bundle_evidence")
+    errors: List[str] = []
+
+    try:
+        program_ir = compile_file(args.input).program_ir
+        _write_json(program_ir_path, program_ir)
+
+        fixture_path = _relative_to_root(args.market_fixture)
+        policy_path = _relative_to_root(args.policy)
+        model_path = _relative_to_root(args.shadow_model)
+
+        ctx = SchedulerContext(
+            require_epoch_verification=args.require_epoch,
+            anchor_path=args.anchor,
+            signature_path=args.sig,
+            public_key_path=args.pub,
+            allowed_backends=parse_backends(args.allowed_backends),
+            budget_steps=args.budget_steps,
+            emit_effect_steps=True,
+            track="trading_shadow_mode",
+            trading_fixture_path=fixture_path,
+            trading_policy_path=policy_path,
+            trading_shadow_model_path=model_path,
+            trading_report_json_path=Path("trade_report.json"),
+            trading_report_md_path=Path("trade_report.md"),
+        )
+        plan_obj = plan_program(program_ir, ctx)
+        plan_dict = plan_obj.to_dict()
+        _write_json(plan_path, plan_dict)
+
+        plan_ok = plan_obj.status == "planned"
+        if not plan_ok:
+            errors.extend(plan_obj.reasons)
+
+        token_dict = plan_dict.get("execution_token")
+        execution_token = ExecutionToken.from_dict(token_dict) if isinstance(token_dict, dict) else None
+        runtime_ctx = RuntimeContext(
+            epoch_anchor_path=args.anchor,
+            epoch_sig_path=args.sig,
+            ci_pubkey_path=args.pub,
+            execution_token=execution_token,
+            io_enabled=getattr(args, "enable_io", False),
+            net_enabled=getattr(args, "enable_net", False),
+            trace_sink=work_dir,
+        )
+        allowed_steps = {
+            str(step.get("step_id"))
+            for step in plan_dict.get("steps", [])
+            if isinstance(step, dict) and step.get("step_id")
+        }
+        contract = ExecutionContract(allowed_steps=allowed_steps)
+        runtime_result = RuntimeEngine().run(plan_dict, runtime_ctx, contract)
+        runtime_dict = runtime_result.to_dict()
+        _write_json(runtime_path, runtime_dict)
+
+        run_ok = runtime_result.status == "completed"
+        if runtime_result.reasons:
+            errors.extend(runtime_result.reasons)
+
+        artifacts = [
+            bundle_module._artifact("program_ir", program_ir_path),
+            bundle_module._artifact("plan", plan_path),
+            bundle_module._artifact("runtime_result", runtime_path),
+            bundle_module._artifact("market_fixture", args.market_fixture),
+            bundle_module._artifact("trade_policy", args.policy),
+            bundle_module._artifact("shadow_model", args.shadow_model),
+        ]
+        if shadow_model_path.exists():
+            artifacts.append(bundle_module._artifact("shadow_model_output", shadow_model_path))
+        if shadow_seed_path.exists():
+            artifacts.append(bundle_module._artifact("shadow_seed", shadow_seed_path))
+        if shadow_log_path.exists():
+            artifacts.append(bundle_module._artifact("shadow_execution_log", shadow_log_path))
+        if shadow_ledger_path.exists():
+            artifacts.append(bundle_module._artifact("shadow_trade_ledger", shadow_ledger_path))
+        if report_json_path.exists():
+            artifacts.append(bundle_module._artifact("trade_report", report_json_path))
+        if report_md_path.exists():
+            artifacts.append(bundle_module._artifact("trade_report_md", report_md_path))
+        if token_dict:
+            token_path = work_dir / "execution_token.json"
+            _write_json(token_path, token_dict)
+            artifacts.append(bundle_module._artifact("execution_token", token_path))
+
+        bundle_dir, manifest = bundle_module.build_bundle(
+            out_dir=out_dir,
+            artifacts=artifacts,
+            epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
+            epoch_sig=args.sig if args.sig and args.sig.exists() else None,
+            public_key=args.pub,
+            constraint_inversion_v1=args.constraint_inversion_v1,
+        )
+        manifest_path = bundle_dir / "bundle_manifest.json"
+        manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
+
+        if not args.signing_key:
+            errors.append("signing_key required for trading-shadow demo")
+        else:
+            sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
+            ok, sig_errors = bundle_module.verify_bundle_manifest_signature(
+                manifest_path,
+                sig_path,
+                args.pub,
+            )
+            if not ok:
+                errors.extend(sig_errors)
+
+        ok = plan_ok and run_ok and not errors
+        constraint_witness = None
+        dual_proposal = None
+        if not ok:
+            constraint_witness = build_constraint_witness(
+                stage="trading_shadow_refusal",
+                refusal_reasons=errors,
+                artifact_digests={"plan": _digest_text(_canonical_json(plan_dict))},
+                observer_id="papas",
+                timestamp=None,
+            )
+            dual_proposal = invert_constraints(constraint_witness)
+            _write_json(work_dir / "constraint_witness.json", constraint_witness)
+            _write_json(work_dir / "dual_proposal.json", dual_proposal)
+
+            artifacts.append(bundle_module._artifact("constraint_witness", work_dir / "constraint_witness.json"))
+            artifacts.append(bundle_module._artifact("dual_proposal", work_dir / "dual_proposal.json"))
+
+            bundle_dir, manifest = bundle_module.build_bundle(
+                out_dir=out_dir,
+                artifacts=artifacts,
+                epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
+                epoch_sig=args.sig if args.sig and args.sig.exists() else None,
+                public_key=args.pub,
+                constraint_inversion_v1=args.constraint_inversion_v1,
+            )
+            manifest_path = bundle_dir / "bundle_manifest.json"
+            manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
+            if args.signing_key:
+                sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
+                ok_sig, sig_errors = bundle_module.verify_bundle_manifest_signature(
+                    manifest_path,
+                    sig_path,
+                    args.pub,
+                )
+                if not ok_sig:
+                    errors.extend(sig_errors)
+
+        summary = {
+            "ok": ok,
+            "bundle_path": str(bundle_dir),
+            "bundle_id": manifest.get("bundle_id"),
+            "errors": list(errors),
+            "denied_reason": None if ok else "refusal",
+        }
+        print(_canonical_json(summary))
+        return 0
+    except HplError as exc:
+        summary = {"ok": False, "errors": [str(exc)], "bundle_path": None, "bundle_id": None}
+        print(_canonical_json(summary))
+        return 0
+
+
+def _cmd_demo_trading_io_shadow(args: argparse.Namespace) -> int:
+    out_dir = args.out_dir
+    work_dir = out_dir / "work"
+    if work_dir.exists():
+        shutil.rmtree(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    program_ir_path = work_dir / "program.ir.json"
+    plan_path = work_dir / "plan.json"
+    runtime_path = work_dir / "runtime.json"
+
+    bundle_module = load_tool("bundle_evidence")
+    errors: List[str] = []
+    profiler = _make_profiler(args)
+    phase = profiler.phase if profiler is not None else _no_phase
+
+    try:
+        with phase("compile"):
+            program_ir = compile_file(args.input).program_ir
+            _write_json(program_ir_path, program_ir)
+
+        io_policy = {
+            "io_allowed": True,
+            "io_scopes": ["BROKER_CONNECT", "ORDER_QUERY", "RECONCILE"],
+            "io_endpoints_allowed": [args.endpoint],
+            "io_budget_calls": 5,
+            "io_requires_reconciliation": True,
+            "io_requires_delta_s": False,
+            "io_mode": "dry_run",
+            "io_timeout_ms": args.io_timeout_ms,
+            "io_nonce_policy": "HPL_DETERMINISTIC_NONCE_V1",
+            "io_redaction_policy_id": "R1",
+        }
+        ctx = SchedulerContext(
+            require_epoch_verification=args.require_epoch,
+            anchor_path=args.anchor,
+            signature_path=args.sig,
+            public_key_path=args.pub,
+            allowed_backends=parse_backends(args.allowed_backends),
+            budget_steps=args.budget_steps,
+            emit_effect_steps=True,
+            track="trading_io_shadow",
+            io_policy=io_policy,
+            io_endpoint=args.endpoint,
+            io_query_params={"request": {"msg_type": "transaction"}},
+        )
+        with phase("plan"):
+            plan_obj = plan_program(program_ir, ctx)
+            plan_dict = plan_obj.to_dict()
+            _write_json(plan_path, plan_dict)
+
+        plan_ok = plan_obj.status == "planned"
+        if not plan_ok:
+            errors.extend(plan_obj.reasons)
+
+        token_dict = plan_dict.get("execution_token")
+        execution_token = ExecutionToken.from_dict(token_dict) if isinstance(token_dict, dict) else None
+        runtime_ctx = RuntimeContext(
+            epoch_anchor_path=args.anchor,
+            epoch_sig_path=args.sig,
+            ci_pubkey_path=args.pub,
+            execution_token=execution_token,
+            io_enabled=getattr(args, "enable_io", False),
+            net_enabled=getattr(args, "enable_net", False),
+            trace_sink=work_dir,
+        )
+        allowed_steps = {
+            str(step.get("step_id"))
+            for step in plan_dict.get("steps", [])
+            if isinstance(step, dict) and step.get("step_id")
+        }
+        contract = ExecutionContract(allowed_steps=allowed_steps)
+
+        old_hpl_io_enabled = os.environ.get("HPL_IO_ENABLED")
+        if getattr(args, "enable_io", False):
+            os.environ["HPL_IO_ENABLED"] = "1"
+
+        try:
+            with phase("run"):
+                runtime_result = RuntimeEngine(profiler=profiler).run(plan_dict, runtime_ctx, contract)
+        finally:
+            if old_hpl_io_enabled is None:
+                os.environ.pop("HPL_IO_ENABLED", None)
+            else:
+                os.environ["HPL_IO_ENABLED"] = old_hpl_io_enabled
+
+        runtime_dict = runtime_result.to_dict()
+        _write_json(runtime_path, runtime_dict)
+
+        run_ok = runtime_result.status == "completed"
+        if runtime_result.reasons:
+            errors.extend(runtime_result.reasons)
+
+        artifacts = [
+            bundle_module._artifact("program_ir", program_ir_path),
+            bundle_module._artifact("plan", plan_path),
+            bundle_module._artifact("runtime_result", runtime_path),
+        ]
+
+        io_role_paths = [
+            ("io_request_log", work_dir / "io_connect_request.json"),
+            ("io_response_log", work_dir / "io_connect_response.json"),
+            ("io_event_log", work_dir / "io_connect_event.json"),
+            ("io_request_log", work_dir / "io_query_request.json"),
+            ("io_response_log", work_dir / "io_query_response.json"),
+            ("io_event_log", work_dir / "io_query_event.json"),
+            ("io_outcome", work_dir / "io_outcome.json"),
+            ("reconciliation_report", work_dir / "reconciliation_report.json"),
+            ("remediation_plan", work_dir / "remediation_plan.json"),
+        ]
+        for role, path in io_role_paths:
+            if path.exists():
+                artifacts.append(bundle_module._artifact(role, path))
+
+        if token_dict:
+            token_path = work_dir / "execution_token.json"
+            _write_json(token_path, token_dict)
+            artifacts.append(bundle_module._artifact("execution_token", token_path))
+
+        from .runtime.redaction import scan_artifacts
+
+        with phase("redaction"):
+            redaction_report = scan_artifacts([artifact.source for artifact in artifacts])
+            redaction_path = work_dir / "redaction_report.json"
+            redaction_path.write_text(_canonical_json(redaction_report), encoding="utf-8")
+            artifacts.append(bundle_module._artifact("redaction_report", redaction_path))
+
+        with phase("bundle"):
+            bundle_dir, manifest = bundle_module.build_bundle(
+                out_dir=out_dir,
+                artifacts=artifacts,
+                epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
+                epoch_sig=args.sig if args.sig and args.sig.exists() else None,
+                public_key=args.pub,
+                constraint_inversion_v1=args.constraint_inversion_v1,
+            )
+            manifest_path = bundle_dir / "bundle_manifest.json"
+            manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
+
+        if not args.signing_key:
+            errors.append("signing_key required for trading-io-shadow demo")
+        else:
+            with phase("sign"):
+                sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
+                ok, sig_errors = bundle_module.verify_bundle_manifest_signature(
+                    manifest_path,
+                    sig_path,
+                    args.pub,
+                )
+            if not ok:
+                errors.extend(sig_errors)
+
+        ok = plan_ok and run_ok and not errors
+        if not ok:
+            constraint_witness = build_constraint_witness(
+                stage="trading_io_shadow_refusal",
+                refusal_reasons=errors,
+                artifact_digests={"plan": _digest_text(_canonical_json(plan_dict))},
+                observer_id="papas",
+                timestamp=None,
+            )
+            dual_proposal = invert_constraints(constraint_witness)
+            _write_json(work_dir / "constraint_witness.json", constraint_witness)
+            _write_json(work_dir / "dual_proposal.json", dual_proposal)
+            artifacts.append(bundle_module._artifact("constraint_witness", work_dir / "constraint_witness.json"))
+            artifacts.append(bundle_module._artifact("dual_proposal", work_dir / "dual_proposal.json"))
+
+            bundle_dir, manifest = bundle_module.build_bundle(
+                out_dir=out_dir,
+                artifacts=artifacts,
+                epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
+                epoch_sig=args.sig if args.sig and args.sig.exists() else None,
+                public_key=args.pub,
+                constraint_inversion_v1=args.constraint_inversion_v1,
+            )
+            manifest_path = bundle_dir / "bundle_manifest.json"
+            manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
+            if args.signing_key:
+                sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
+                ok_sig, sig_errors = bundle_module.verify_bundle_manifest_signature(
+                    manifest_path,
+                    sig_path,
+                    args.pub,
+                )
+                if not ok_sig:
+                    errors.extend(sig_errors)
+
+        summary = {
+            "ok": ok,
+            "bundle_path": str(bundle_dir),
+            "bundle_id": manifest.get("bundle_id"),
+            "errors": list(errors),
+            "denied_reason": None if ok else "refusal",
+        }
+        if profiler is not None:
+            from .runtime.profiling import PROFILE_FILENAME
+
+            profiler.write_json(out_dir / PROFILE_FILENAME)
+        print(_canonical_json(summary))
+        return 0
+    except HplError as exc:
+        summary = {"ok": False, "errors": [str(exc)], "bundle_path": None, "bundle_id": None}
+        print(_canonical_json(summary))
+        return 0
+
+
+def _cmd_demo_trading_io_live_min(args: argparse.Namespace) -> int:
+    out_dir = args.out_dir
+    work_dir = out_dir / "work"
+    if work_dir.exists():
+        shutil.rmtree(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    program_ir_path = work_dir / "program.ir.json"
+    plan_path = work_dir / "plan.json"
+    runtime_path = work_dir / "runtime.json"
+
+    bundle_module = load_tool("bundle_evidence")
+    errors: List[str] = []
+
+    try:
+        program_ir = compile_file(args.input).program_ir
+        _write_json(program_ir_path, program_ir)
+
+        order_payload = None
+        if args.order:
+            order_payload = json.loads(args.order.read_text(encoding="utf-8"))
+        if order_payload is None:
+            order_payload = {"order_id": "live-min-order", "symbol": "DEMO", "side": "buy", "qty": 1}
+
+        io_policy = {
+            "io_allowed": True,
+            "io_scopes": ["BROKER_CONNECT", "ORDER_SUBMIT", "RECONCILE", "ROLLBACK"],
+            "io_endpoints_allowed": [args.endpoint],
+            "io_budget_calls": 5,
+            "io_requires_reconciliation": True,
+            "io_requires_delta_s": False,
+            "io_mode": args.io_mode,
+            "io_timeout_ms": args.io_timeout_ms,
+            "io_nonce_policy": "HPL_DETERMINISTIC_NONCE_V1",
+            "io_redaction_policy_id": "R1",
+        }
+
+        if args.io_mode != "live":
+            errors.append(f"io_mode not live: {args.io_mode}")
+
+        ctx = SchedulerContext(
+            require_epoch_verification=args.require_epoch,
+            anchor_path=args.anchor,
+            signature_path=args.sig,
+            public_key_path=args.pub,
+            allowed_backends=parse_backends(args.allowed_backends),
+            budget_steps=args.budget_steps,
+            emit_effect_steps=True,
+            track="trading_io_live_min",
+            io_policy=io_policy,
+            io_endpoint=args.endpoint,
+            io_order=order_payload,
+        )
+        plan_obj = plan_program(program_ir, ctx)
+        plan_dict = plan_obj.to_dict()
+        _write_json(plan_path, plan_dict)
+
+        plan_ok = plan_obj.status == "planned"
+        if not plan_ok:
+            errors.extend(plan_obj.reasons)
+
+        token_dict = plan_dict.get("execution_token")
+        execution_token = ExecutionToken.from_dict(token_dict) if isinstance(token_dict, dict) else None
+        runtime_ctx = RuntimeContext(
+            epoch_anchor_path=args.anchor,
+            epoch_sig_path=args.sig,
+            ci_pubkey_path=args.pub,
+            execution_token=execution_token,
+            io_enabled=getattr(args, "enable_io", False),
+            net_enabled=getattr(args, "enable_net", False),
+            trace_sink=work_dir,
+        )
+        allowed_steps = {
+            str(step.get("step_id"))
+            for step in plan_dict.get("steps", [])
+            if isinstance(step, dict) and step.get("step_id")
+        }
+        contract = ExecutionContract(allowed_steps=allowed_steps)
+
+        old_hpl_io_enabled = os.environ.get("HPL_IO_ENABLED")
+        if getattr(args, "enable_io", False):
+            os.environ["HPL_IO_ENABLED"] = "1"
+
+        try:
+            runtime_result = RuntimeEngine().run(plan_dict, runtime_ctx, contract)
+        finally:
+            if old_hpl_io_enabled is None:
+                os.environ.pop("HPL_IO_ENABLED", None)
+            else:
+                os.environ["HPL_IO_ENABLED"] = old_hpl_io_enabled
+
+        runtime_dict = runtime_result.to_dict()
+        _write_json(runtime_path, runtime_dict)
+
+        run_ok = runtime_result.status == "completed"
+        if runtime_result.reasons:
+            errors.extend(runtime_result.reasons)
+
+        artifacts = [
+            bundle_module._artifact("program_ir", program_ir_path),
+            bundle_module._artifact("plan", plan_path),
+            bundle_module._artifact("runtime_result", runtime_path),
+        ]
+
+        io_role_paths = [
+            ("io_request_log", work_dir / "io_connect_request.json"),
+            ("io_response_log", work_dir / "io_connect_response.json"),
+            ("io_event_log", work_dir / "io_connect_event.json"),
+            ("io_request_log", work_dir / "io_submit_request.json"),
+            ("io_response_log", work_dir / "io_submit_response.json"),
+            ("io_event_log", work_dir / "io_submit_event.json"),
+            ("io_outcome", work_dir / "io_outcome.json"),
+            ("reconciliation_report", work_dir / "reconciliation_report.json"),
+            ("remediation_plan", work_dir / "remediation_plan.json"),
+        ]
+        for role, path in io_role_paths:
+            if path.exists():
+                artifacts.append(bundle_module._artifact(role, path))
+
+        if token_dict:
+            token_path = work_dir / "execution_token.json"
+            _write_json(token_path, token_dict)
+            artifacts.append(bundle_module._artifact("execution_token", token_path))
+
+        from .runtime.redaction import scan_artifacts
+
+        redaction_report = scan_artifacts([artifact.source for artifact in artifacts])
+        redaction_path = work_dir / "redaction_report.json"
+        redaction_path.write_text(_canonical_json(redaction_report), encoding="utf-8")
+        artifacts.append(bundle_module._artifact("redaction_report", redaction_path))
+
+        bundle_dir, manifest = bundle_module.build_bundle(
+            out_dir=out_dir,
+            artifacts=artifacts,
+            epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
+            epoch_sig=args.sig if args.sig and args.sig.exists() else None,
+            public_key=args.pub,
+            constraint_inversion_v1=args.constraint_inversion_v1,
+        )
+        manifest_path = bundle_dir / "bundle_manifest.json"
+        manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
+
+        if not args.signing_key:
+            errors.append("signing_key required for trading-io-live-min demo")
+        else:
+            sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
+            ok, sig_errors = bundle_module.verify_bundle_manifest_signature(
+                manifest_path,
+                sig_path,
+                args.pub,
+            )
+            if not ok:
+                errors.extend(sig_errors)
+
+        ok = plan_ok and run_ok and not errors
+        if not ok:
+            constraint_witness = build_constraint_witness(
+                stage="trading_io_live_min_refusal",
+                refusal_reasons=errors,
+                artifact_digests={"plan": _digest_text(_canonical_json(plan_dict))},
+                observer_id="papas",
+                timestamp=None,
+            )
+            dual_proposal = invert_constraints(constraint_witness)
+            _write_json(work_dir / "constraint_witness.json", constraint_witness)
+            _write_json(work_dir / "dual_proposal.json", dual_proposal)
+            artifacts.append(bundle_module._artifact("constraint_witness", work_dir / "constraint_witness.json"))
+            artifacts.append(bundle_module._artifact("dual_proposal", work_dir / "dual_proposal.json"))
+
+            bundle_dir, manifest = bundle_module.build_bundle(
+                out_dir=out_dir,
+                artifacts=artifacts,
+                epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
+                epoch_sig=args.sig if args.sig and args.sig.exists() else None,
+                public_key=args.pub,
+                constraint_inversion_v1=args.constraint_inversion_v1,
+            )
+            manifest_path = bundle_dir / "bundle_manifest.json"
+            manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
+            if args.signing_key:
+                sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
+                ok_sig, sig_errors = bundle_module.verify_bundle_manifest_signature(
+                    manifest_path,
+                    sig_path,
+                    args.pub,
+                )
+                if not ok_sig:
+                    errors.extend(sig_errors)
+
+        summary = {
+            "ok": ok,
+            "bundle_path": str(bundle_dir),
+            "bundle_id": manifest.get("bundle_id"),
+            "errors": list(errors),
+            "denied_reason": None if ok else "refusal",
+        }
+        print(_canonical_json(summary))
+        return 0
+    except HplError as exc:
+        summary = {"ok": False, "errors": [str(exc)], "bundle_path": None, "bundle_id": None}
+        print(_canonical_json(summary))
+        return 0
+
+
+def _cmd_demo_navier_stokes(args: argparse.Namespace) -> int:
+    out_dir = args.out_dir
+    work_dir = out_dir / "work"
+    if work_dir.exists():
+        shutil.rmtree(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    program_ir_path = work_dir / "program.ir.json"
+    plan_path = work_dir / "plan.json"
+    runtime_path = work_dir / "runtime.json"
+    state_final_path = work_dir / "ns_state_final.json"
+    observables_path = work_dir / "ns_observables.json"
+    pressure_path = work_dir / "ns_pressure.json"
+    gate_path = work_dir / "ns_gate_certificate.json"
+
+    bundle_module = load_tool("bundle_evidence")
+    errors: List[str] = []
+
+    try:
+        program_ir = compile_file(args.input).program_ir
+        _write_json(program_ir_path, program_ir)
+
+        state_path = _relative_to_root(args.state)
+        policy_path = _relative_to_root(args.policy)
+
+        ctx = SchedulerContext(
+            require_epoch_verification=args.require_epoch,
+            anchor_path=args.anchor,
+            signature_path=args.sig,
+            public_key_path=args.pub,
+            allowed_backends=parse_backends(args.allowed_backends),
+            budget_steps=args.budget_steps,
+            emit_effect_steps=True,
+            track="navier_stokes",
+            ns_state_path=state_path,
+            ns_policy_path=policy_path,
+            ns_state_final_path=Path("ns_state_final.json"),
+            ns_observables_path=Path("ns_observables.json"),
+            ns_pressure_path=Path("ns_pressure.json"),
+            ns_gate_certificate_path=Path("ns_gate_certificate.json"),
+        )
+        plan_obj = plan_program(program_ir, ctx)
+        plan_dict = plan_obj.to_dict()
+        _write_json(plan_path, plan_dict)
+
+        plan_ok = plan_obj.status == "planned"
+        if not plan_ok:
+            errors.extend(plan_obj.reasons)
+
+        token_dict = plan_dict.get("execution_token")
+        execution_token = ExecutionToken.from_dict(token_dict) if isinstance(token_dict, dict) else None
+        runtime_ctx = RuntimeContext(
+            epoch_anchor_path=args.anchor,
+            epoch_sig_path=args.sig,
+            ci_pubkey_path=args.pub,
+            execution_token=execution_token,
+            io_enabled=getattr(args, "enable_io", False),
+            net_enabled=getattr(args, "enable_net", False),
+            trace_sink=work_dir,
+        )
+        allowed_steps = {
+            str(step.get("step_id"))
+            for step in plan_dict.get("steps", [])
+            if isinstance(step, dict) and step.get("step_id")
+        }
+        contract = ExecutionContract(allowed_steps=allowed_steps)
+        runtime_result = RuntimeEngine().run(plan_dict, runtime_ctx, contract)
+        runtime_dict = runtime_result.to_dict()
+        _write_json(runtime_path, runtime_dict)
+
+        run_ok = runtime_result.status == "completed"
+        if runtime_result.reasons:
+            errors.extend(runtime_result.reasons)
+
+        artifacts = [
+            bundle_module._artifact("program_ir", program_ir_path),
+            bundle_module._artifact("plan", plan_path),
+            bundle_module._artifact("runtime_result", runtime_path),
+            bundle_module._artifact("pde_state", args.state),
+            bundle_module._artifact("pde_policy", args.policy),
+        ]
+        if state_final_path.exists():
+            artifacts.append(bundle_module._artifact("pde_state_final", state_final_path))
+        if observables_path.exists():
+            artifacts.append(bundle_module._artifact("pde_observables", observables_path))
+        if pressure_path.exists():
+            artifacts.append(bundle_module._artifact("pde_pressure", pressure_path))
+        if gate_path.exists():
+            artifacts.append(bundle_module._artifact("pde_gate_certificate", gate_path))
+        if token_dict:
+            token_path = work_dir / "execution_token.json"
+            _write_json(token_path, token_dict)
+            artifacts.append(bundle_module._artifact("execution_token", token_path))
+
+        bundle_dir, manifest = bundle_module.build_bundle(
+            out_dir=out_dir,
+            artifacts=artifacts,
+            epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
+            epoch_sig=args.sig if args.sig and args.sig.exists() else None,
+            public_key=args.pub,
+            constraint_inversion_v1=args.constraint_inversion_v1,
+        )
+        manifest_path = bundle_dir / "bundle_manifest.json"
+        manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
+
+        if not args.signing_key:
+            errors.append("signing_key required for navier-stokes demo")
+        else:
+            sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
+            ok, sig_errors = bundle_module.verify_bundle_manifest_signature(
+                manifest_path,
+                sig_path,
+                args.pub,
+            )
+            if not ok:
+                errors.extend(sig_errors)
+
+        ok = plan_ok and run_ok and not errors
+        constraint_witness = None
+        dual_proposal = None
+        if not ok:
+            constraint_witness = build_constraint_witness(
+                stage="navier_stokes_refusal",
+                refusal_reasons=errors,
+                artifact_digests={"plan": _digest_text(_canonical_json(plan_dict))},
+                observer_id="papas",
+                timestamp=None,
+            )
+            dual_proposal = invert_constraints(constraint_witness)
+            _write_json(work_dir / "constraint_witness.json", constraint_witness)
+            _write_json(work_dir / "dual_proposal.json", dual_proposal)
+
+            artifacts.append(bundle_module._artifact("constraint_witness", work_dir / "constraint_witness.json"))
+            artifacts.append(bundle_module._artifact("dual_proposal", work_dir / "dual_proposal.json"))
+
+            bundle_dir, manifest = bundle_module.build_bundle(
+                out_dir=out_dir,
+                artifacts=artifacts,
+                epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
+                epoch_sig=args.sig if args.sig and args.sig.exists() else None,
+                public_key=args.pub,
+                constraint_inversion_v1=args.constraint_inversion_v1,
+            )
+            manifest_path = bundle_dir / "bundle_manifest.json"
+            manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
+            if args.signing_key:
+                sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
+                ok_sig, sig_errors = bundle_module.verify_bundle_manifest_signature(
+                    manifest_path,
+                    sig_path,
+                    args.pub,
+                )
+                if not ok_sig:
+                    errors.extend(sig_errors)
+
+        summary = {
+            "ok": ok,
+            "bundle_path": str(bundle_dir),
+            "bundle_id": manifest.get("bundle_id"),
+            "errors": list(errors),
+            "denied_reason": None if ok else "refusal",
+        }
+        print(_canonical_json(summary))
+        return 0
+    except HplError as exc:
+        summary = {"ok": False, "errors": [str(exc)], "bundle_path": None, "bundle_id": None}
+        print(_canonical_json(summary))
+        return 0
+
+
+def _cmd_demo_net_shadow(args: argparse.Namespace) -> int:
+    out_dir = args.out_dir
+    work_dir = out_dir / "work"
+    if work_dir.exists():
+        shutil.rmtree(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    program_ir_path = work_dir / "program.ir.json"
+    plan_path = work_dir / "plan.json"
+    runtime_path = work_dir / "runtime.json"
+
+    bundle_module = load_tool("bundle_evidence")
+    errors: List[str] = []
+
+    try:
+        program_ir = compile_file(args.input).program_ir
+        _write_json(program_ir_path, program_ir)
+
+        net_policy = {
+            "net_mode": "dry_run",
+            "net_caps": [
+                "NET_CONNECT",
+                "NET_HANDSHAKE",
+                "NET_KEY_EXCHANGE",
+                "NET_SEND",
+                "NET_RECV",
+                "NET_CLOSE",
+            ],
+            "net_endpoints_allowlist": [args.endpoint],
+            "net_budget_calls": 8,
+            "net_timeout_ms": args.net_timeout_ms,
+            "net_nonce_policy": "HPL_DETERMINISTIC_NONCE_V1",
+            "net_redaction_policy_id": "R1",
+            "net_crypto_policy_id": "QKX1",
+        }
+        message = {"kind": "text", "payload": args.message}
+        ctx = SchedulerContext(
+            require_epoch_verification=args.require_epoch,
+            anchor_path=args.anchor,
+            signature_path=args.sig,
+            public_key_path=args.pub,
+            allowed_backends=parse_backends(args.allowed_backends),
+            budget_steps=args.budget_steps,
+            emit_effect_steps=True,
+            track="net_shadow",
+            net_policy=net_policy,
+            net_endpoint=args.endpoint,
+            net_message=message,
+        )
+        plan_obj = plan_program(program_ir, ctx)
+        plan_dict = plan_obj.to_dict()
+        _write_json(plan_path, plan_dict)
+
+        plan_ok = plan_obj.status == "planned"
+        if not plan_ok:
+            errors.extend(plan_obj.reasons)
+
+        token_dict = plan_dict.get("execution_token")
+        execution_token = ExecutionToken.from_dict(token_dict) if isinstance(token_dict, dict) else None
+        runtime_ctx = RuntimeContext(
+            epoch_anchor_path=args.anchor,
+            epoch_sig_path=args.sig,
+            ci_pubkey_path=args.pub,
+            execution_token=execution_token,
+            io_enabled=getattr(args, "enable_io", False),
+            net_enabled=getattr(args, "enable_net", False),
+            trace_sink=work_dir,
+        )
+        allowed_steps = {
+            str(step.get("step_id"))
+            for step in plan_dict.get("steps", [])
+            if isinstance(step, dict) and step.get("step_id")
+        }
+        contract = ExecutionContract(allowed_steps=allowed_steps)
+        runtime_result = RuntimeEngine().run(plan_dict, runtime_ctx, contract)
+        runtime_dict = runtime_result.to_dict()
+        _write_json(runtime_path, runtime_dict)
+
+        run_ok = runtime_result.status == "completed"
+        if runtime_result.reasons:
+            errors.extend(runtime_result.reasons)
+
+        artifacts = [
+            bundle_module._artifact("program_ir", program_ir_path),
+            bundle_module._artifact("plan", plan_path),
+            bundle_module._artifact("runtime_result", runtime_path),
+        ]
+
+        net_role_paths = [
+            ("net_request_log", work_dir / "net_connect_request.json"),
+            ("net_response_log", work_dir / "net_connect_response.json"),
+            ("net_event_log", work_dir / "net_connect_event.json"),
+            ("net_request_log", work_dir / "net_handshake_request.json"),
+            ("net_response_log", work_dir / "net_handshake_response.json"),
+            ("net_event_log", work_dir / "net_handshake_event.json"),
+            ("net_request_log", work_dir / "net_key_exchange_request.json"),
+            ("net_response_log", work_dir / "net_key_exchange_response.json"),
+            ("net_event_log", work_dir / "net_key_exchange_event.json"),
+            ("net_request_log", work_dir / "net_send_request.json"),
+            ("net_response_log", work_dir / "net_send_response.json"),
+            ("net_event_log", work_dir / "net_send_event.json"),
+            ("net_request_log", work_dir / "net_recv_request.json"),
+            ("net_response_log", work_dir / "net_recv_response.json"),
+            ("net_event_log", work_dir / "net_recv_event.json"),
+            ("net_request_log", work_dir / "net_close_request.json"),
+            ("net_response_log", work_dir / "net_close_response.json"),
+            ("net_event_log", work_dir / "net_close_event.json"),
+            ("net_session_manifest", work_dir / "net_session_manifest.json"),
+        ]
+        for role, path in net_role_paths:
+            if path.exists():
+                artifacts.append(bundle_module._artifact(role, path))
+
+        if token_dict:
+            token_path = work_dir / "execution_token.json"
+            _write_json(token_path, token_dict)
+            artifacts.append(bundle_module._artifact("execution_token", token_path))
+
+        from .runtime.redaction import scan_artifacts
+
+        redaction_report = scan_artifacts([artifact.source for artifact in artifacts])
+        redaction_path = work_dir / "redaction_report.json"
+        redaction_path.write_text(_canonical_json(redaction_report), encoding="utf-8")
+        artifacts.append(bundle_module._artifact("redaction_report", redaction_path))
+
+        bundle_dir, manifest = bundle_module.build_bundle(
+            out_dir=out_dir,
+            artifacts=artifacts,
+            epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
+            epoch_sig=args.sig if args.sig and args.sig.exists() else None,
+            public_key=args.pub,
+            constraint_inversion_v1=args.constraint_inversion_v1,
+        )
+        manifest_path = bundle_dir / "bundle_manifest.json"
+        manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
+
+        if not args.signing_key:
+            errors.append("signing_key required for net-shadow demo")
+        else:
+            sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
+            ok_sig, sig_errors = bundle_module.verify_bundle_manifest_signature(
+                manifest_path,
+                sig_path,
+                args.pub,
+            )
+            if not ok_sig:
+                errors.extend(sig_errors)
+
+        ok = plan_ok and run_ok and not errors
+        constraint_witness = None
+        dual_proposal = None
+        if not ok:
+            constraint_witness = build_constraint_witness(
+                stage="net_shadow_refusal",
+                refusal_reasons=errors,
+                artifact_digests={"plan": _digest_text(_canonical_json(plan_dict))},
+                observer_id="papas",
+                timestamp=None,
+            )
+            dual_proposal = invert_constraints(constraint_witness)
+            _write_json(work_dir / "constraint_witness.json", constraint_witness)
+            _write_json(work_dir / "dual_proposal.json", dual_proposal)
+
+            artifacts.append(bundle_module._artifact("constraint_witness", work_dir / "constraint_witness.json"))
+            artifacts.append(bundle_module._artifact("dual_proposal", work_dir / "dual_proposal.json"))
+
+            bundle_dir, manifest = bundle_module.build_bundle(
+                out_dir=out_dir,
+                artifacts=artifacts,
+                epoch_anchor=args.anchor if args.anchor and args.anchor.exists() else None,
+                epoch_sig=args.sig if args.sig and args.sig.exists() else None,
+                public_key=args.pub,
+                constraint_inversion_v1=args.constraint_inversion_v1,
+            )
+            manifest_path = bundle_dir / "bundle_manifest.json"
+            manifest_path.write_text(bundle_module._canonical_json(manifest), encoding="utf-8")
+            if args.signing_key:
+                sig_path = bundle_module.sign_bundle_manifest(manifest_path, args.signing_key)
+                ok_sig, sig_errors = bundle_module.verify_bundle_manifest_signature(
+                    manifest_path,
+                    sig_path,
+                    args.pub,
+                )
+                if not ok_sig:
+                    errors.extend(sig_errors)
+
+        summary = {
+            "ok": ok,
+            "bundle_path": str(bundle_dir),
+            "bundle_id": manifest.get("bundle_id"),
+            "errors": list(errors),
+            "denied_reason": None if ok else "refusal",
+        }
+        print(_canonical_json(summary))
+        return 0
+    except HplError as exc:
+        summary = {"ok": False, "errors": [str(exc)], "bundle_path": None, "bundle_id": None}
+        print(_canonical_json(summary))
+        return 0
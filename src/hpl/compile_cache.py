@@ -0,0 +1,113 @@
+"""Compile cache from source digest to ProgramIR (tooling-only)."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from . import __version__, tracing
+from .axioms.validator import validate_and_collect_terms
+from .cache import JsonCache, cache_key
+from .dynamics.ir_emitter import emit_program_ir, schema_digest
+from .emergence.dsl.parser import parse_program
+from .emergence.macros.expander import expand_program
+from .trace import TraceCollector, trace_from_columns
+
+
+PACKAGE_ROOT = Path(__file__).resolve().parent
+COMPILER_SOURCES = [
+    Path("ast.py"),
+    Path("errors.py"),
+    Path("trace.py"),
+    Path("emergence/dsl/parser.py"),
+    Path("emergence/macros/expander.py"),
+    Path("axioms/validator.py"),
+    Path("dynamics/ir_emitter.py"),
+]
+
+_COMPILE_CACHE = JsonCache("compile")
+_COMPILER_FINGERPRINT: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class CompiledProgram:
+    program_ir: Dict[str, object]
+    trace: Optional[Dict[str, object]]
+    cache_hit: bool
+
+
+def compile_file(
+    path: Path,
+    program_id: Optional[str] = None,
+    with_trace: bool = False,
+) -> CompiledProgram:
+    path = Path(path)
+    text = path.read_text(encoding="utf-8")
+    return compile_source(text, program_id=program_id or path.stem, with_trace=with_trace)
+
+
+@tracing.traced("compile")
+def compile_source(
+    text: str,
+    program_id: str = "unknown",
+    with_trace: bool = False,
+) -> CompiledProgram:
+    """Run parse -> expand -> validate -> emit, reusing a stored result.
+
+    Results are keyed by the source digest, program id, compiler fingerprint
+    and IR schema digest. Compile errors are raised as before and never cached.
+    """
+    key = cache_key(
+        compiler_fingerprint(),
+        schema_digest(),
+        _digest_text(text),
+        program_id,
+        "trace" if with_trace else "ir",
+    )
+    cached = _COMPILE_CACHE.get(key)
+    if isinstance(cached, dict) and "program_ir" in cached:
+        trace_columns = cached.get("trace_columns")
+        return CompiledProgram(
+            program_ir=copy.deepcopy(cached["program_ir"]),
+            trace=trace_from_columns(trace_columns) if trace_columns is not None else None,
+            cache_hit=True,
+        )
+
+    trace = TraceCollector(program_id=program_id) if with_trace else None
+    with tracing.span("parse"):
+        program = parse_program(text)
+    with tracing.span("expand"):
+        expanded = expand_program(program, trace=trace)
+    with tracing.span("validate"):
+        terms = validate_and_collect_terms(expanded, trace=trace)
+    with tracing.span("emit_ir"):
+        program_ir = emit_program_ir(expanded, program_id=program_id, trace=trace, terms=terms)
+    # Traces are stored in their compact columnar form and rebuilt on a hit.
+    trace_columns = trace.to_columns() if trace is not None else None
+
+    _COMPILE_CACHE.put(key, {"program_ir": program_ir, "trace_columns": trace_columns})
+    return CompiledProgram(
+        program_ir=copy.deepcopy(program_ir),
+        trace=trace.to_dict() if trace is not None else None,
+        cache_hit=False,
+    )
+
+
+def compiler_fingerprint() -> str:
+    """Digest of the package version and the compiler pipeline sources."""
+    global _COMPILER_FINGERPRINT
+    if _COMPILER_FINGERPRINT is None:
+        hasher = hashlib.sha256(__version__.encode("utf-8"))
+        for relative in COMPILER_SOURCES:
+            hasher.update(relative.as_posix().encode("utf-8"))
+            hasher.update((PACKAGE_ROOT / relative).read_bytes())
+        _COMPILER_FINGERPRINT = f"sha256:{hasher.hexdigest()}"
+    return _COMPILER_FINGERPRINT
+
+
+def _digest_text(value: str) -> str:
+    digest = hashlib.sha256(value.encode("utf-8")).hexdigest()
+    return f"sha256:{digest}"
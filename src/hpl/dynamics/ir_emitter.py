@@ -2,21 +2,29 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from ..ast import Node
 from ..errors import ValidationError
 from ..trace import TraceCollector
 
 
+SCHEMA_PATH = Path(__file__).resolve().parents[3] / "docs" / "spec" / "04_ir_schema.json"
+_SCHEMA_ENTRY: Optional[Tuple[Dict, str]] = None
+
+
 def emit_program_ir(
     program: List[Node],
     program_id: str = "unknown",
     trace: TraceCollector | None = None,
+    terms: List[Tuple[str, float, Node]] | None = None,
 ) -> Dict:
-    terms = _collect_terms(program)
+    """Emit ProgramIR; ``terms`` may come from ``validate_and_collect_terms``."""
+    if terms is None:
+        terms = _collect_terms(program)
     operator_ids = [term[0] for term in terms]
 
     ir = {
@@ -61,28 +69,25 @@ def validate_program_ir(ir: Dict) -> None:
 
 def _collect_terms(program: List[Node]) -> List[Tuple[str, float, Node]]:
     terms: List[Tuple[str, float, Node]] = []
-    for form in program:
-        _collect_terms_from_node(form, terms)
+    stack = list(reversed(program))
+    while stack:
+        node = stack.pop()
+        if node.is_atom:
+            continue
+        items = node.as_list()
+        if not items:
+            continue
+        head = items[0]
+        if head.is_atom and head.value == "hamiltonian":
+            for item in items[1:]:
+                term = _term_from_node(item)
+                if term is not None:
+                    terms.append(term)
+            continue
+        stack.extend(reversed(items))
     return terms
 
 
-def _collect_terms_from_node(node: Node, terms: List[Tuple[str, float, Node]]) -> None:
-    if node.is_atom:
-        return
-    items = node.as_list()
-    if not items:
-        return
-    head = items[0]
-    if head.is_atom and head.value == "hamiltonian":
-        for item in items[1:]:
-            term = _term_from_node(item)
-            if term is not None:
-                terms.append(term)
-        return
-    for item in items:
-        _collect_terms_from_node(item, terms)
-
-
 def _term_from_node(node: Node) -> Tuple[str, float, Node] | None:
     if node.is_atom:
         return None
@@ -99,11 +104,23 @@ def _term_from_node(node: Node) -> Tuple[str, float, Node] | None:
     return None
 
 
+def schema_digest() -> str:
+    """Digest of the ProgramIR schema bytes the emitter validates against."""
+    return _schema_entry()[1]
+
+
 def _load_schema() -> Dict:
-    root = Path(__file__).resolve().parents[3]
-    schema_path = root / "docs" / "spec" / "04_ir_schema.json"
-    with schema_path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return _schema_entry()[0]
+
+
+def _schema_entry() -> Tuple[Dict, str]:
+    # The schema is read and parsed once per process; validation only reads it.
+    global _SCHEMA_ENTRY
+    if _SCHEMA_ENTRY is None:
+        data = SCHEMA_PATH.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        _SCHEMA_ENTRY = (json.loads(data.decode("utf-8")), f"sha256:{digest}")
+    return _SCHEMA_ENTRY
 
 
 def _validate_program_ir_schema(ir: Dict, schema: Dict) -> None:
@@ -2,112 +2,162 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 import re
-from typing import Iterable, List, Optional
+from typing import IO, Iterator, List, Tuple
 
 from ...ast import Node, SourceLocation
 from ...errors import ParseError
 
 
-@dataclass(frozen=True)
-class Token:
-    kind: str
-    value: Optional[str]
-    location: SourceLocation
-
-
-TOKEN_RE = re.compile(
-    r"""
-    (?P<WS>\s+)
-  | (?P<COMMENT>;[^\n]*)
-  | (?P<LPAREN>\()
-  | (?P<RPAREN>\))
-  | (?P<ATOM>[^\s();]+)
-    """,
-    re.VERBOSE,
-)
-
-
-def _tokenize(text: str) -> Iterable[Token]:
-    line = 1
-    col = 1
-    pos = 0
-
-    for match in TOKEN_RE.finditer(text):
-        if match.start() != pos:
-            raise ParseError("Unexpected character", SourceLocation(line, col))
-
-        value = match.group(0)
-        kind = match.lastgroup or "ATOM"
-        location = SourceLocation(line, col)
-
-        if kind == "LPAREN":
-            yield Token("LPAREN", value, location)
-        elif kind == "RPAREN":
-            yield Token("RPAREN", value, location)
-        elif kind == "ATOM":
-            yield Token("ATOM", value, location)
-
-        newline_count = value.count("\n")
-        if newline_count:
-            line += newline_count
-            col = len(value.rsplit("\n", 1)[-1]) + 1
-        else:
-            col += len(value)
-
-        pos = match.end()
-
-    if pos != len(text):
-        raise ParseError("Unexpected character", SourceLocation(line, col))
-
+LPAREN = 1
+RPAREN = 2
+ATOM = 3
+
+# One match per significant token: leading whitespace and comments are
+# consumed possessively (no backtracking), then a paren or an atom follows.
+TOKEN_RE = re.compile(r"(?:\s+|;[^\n]*)*+(?:(\()|(\))|([^\s();]+))")
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+Token = Tuple[int, str, SourceLocation]
+
+
+class _Scanner:
+    """Single-pass tokenizer that can be fed a source in chunks.
+
+    Line and column are tracked by counting newlines between consecutive
+    tokens, so every character is examined once. An atom touching the end of
+    the buffered text is held back until the next chunk (or ``close``), since
+    it may continue across the boundary.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._mark = 0
+        self._line = 1
+        self._line_start = 0
+        self._base = 0
+
+    def feed(self, chunk: str) -> Iterator[Token]:
+        self._buffer += chunk
+        return self._scan(final=False)
+
+    def close(self) -> Iterator[Token]:
+        return self._scan(final=True)
+
+    def _scan(self, final: bool) -> Iterator[Token]:
+        buffer = self._buffer
+        size = len(buffer)
+        match_token = TOKEN_RE.match
+        count = buffer.count
+        base = self._base
+        line = self._line
+        line_start = self._line_start
+        mark = self._mark
+        consumed = 0
+        while True:
+            match = match_token(buffer, consumed)
+            if match is None:
+                # Only whitespace and comments follow ``consumed``.
+                consumed = size if final else self._trivia_end(buffer, consumed)
+                break
+            kind = match.lastindex
+            end = match.end()
+            if kind == ATOM and end == size and not final:
+                break
+            start = match.start(kind)
+            newlines = count("\n", mark, start)
+            if newlines:
+                line += newlines
+                line_start = base + buffer.rfind("\n", mark, start) + 1
+            mark = start
+            yield kind, match.group(kind), SourceLocation(line, base + start - line_start + 1)
+            consumed = end
+
+        if consumed > mark:
+            newlines = count("\n", mark, consumed)
+            if newlines:
+                line += newlines
+                line_start = base + buffer.rfind("\n", mark, consumed) + 1
+            mark = consumed
+        self._buffer = buffer[consumed:]
+        self._base = base + consumed
+        self._mark = mark - consumed
+        self._line = line
+        self._line_start = line_start
+
+    def _trivia_end(self, buffer: str, consumed: int) -> int:
+        # Trailing whitespace is complete; a trailing comment may continue.
+        comment = buffer.rfind(";", consumed)
+        if comment != -1 and buffer.find("\n", comment) == -1:
+            return comment
+        return len(buffer)
+
+
+def _parse_atom(raw: str, location: SourceLocation) -> Node:
+    first = raw[0]
+    if first.isdigit() or first in "+-.":
+        try:
+            if "." in raw:
+                return Node(float(raw), location)
+            return Node(int(raw), location)
+        except ValueError:
+            pass
+    return Node(raw, location)
+
+
+class _Builder:
+    def __init__(self) -> None:
+        self.items: List[Node] = []
+        self._stack: List[List[Node]] = []
+        self._locations: List[SourceLocation] = []
+
+    def consume(self, tokens: Iterator[Token]) -> None:
+        items = self.items
+        stack = self._stack
+        locations = self._locations
+        target = stack[-1] if stack else items
+        for kind, value, location in tokens:
+            if kind == ATOM:
+                target.append(_parse_atom(value, location))
+            elif kind == LPAREN:
+                target = []
+                stack.append(target)
+                locations.append(location)
+            else:
+                if not stack:
+                    raise ParseError("Unexpected ')'", location)
+                node = Node(stack.pop(), locations.pop())
+                target = stack[-1] if stack else items
+                target.append(node)
 
-def _parse_atom(token: Token) -> Node:
-    raw = token.value or ""
-    try:
-        if "." in raw:
-            return Node(float(raw), token.location)
-        return Node(int(raw), token.location)
-    except ValueError:
-        return Node(raw, token.location)
+    def finish(self) -> List[Node]:
+        if self._stack:
+            raise ParseError("Unclosed '('", self._locations[-1])
+        return self.items
 
 
 def parse_program(text: str) -> List[Node]:
-    items: List[Node] = []
-    stack: List[List[Node]] = []
-    locations: List[SourceLocation] = []
-
-    for token in _tokenize(text):
-        if token.kind == "LPAREN":
-            stack.append([])
-            locations.append(token.location)
-            continue
-        if token.kind == "RPAREN":
-            if not stack:
-                raise ParseError("Unexpected ')'", token.location)
-            content = stack.pop()
-            start_location = locations.pop()
-            node = Node(content, start_location)
-            if stack:
-                stack[-1].append(node)
-            else:
-                items.append(node)
-            continue
-        if token.kind == "ATOM":
-            node = _parse_atom(token)
-            if stack:
-                stack[-1].append(node)
-            else:
-                items.append(node)
-            continue
-
-        raise ParseError(f"Unexpected token {token.kind}", token.location)
-
-    if stack:
-        raise ParseError("Unclosed '('", locations[-1])
-    return items
+    scanner = _Scanner()
+    builder = _Builder()
+    builder.consume(scanner.feed(text))
+    builder.consume(scanner.close())
+    return builder.finish()
+
+
+def parse_stream(handle: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> List[Node]:
+    """Parse from a text stream chunk by chunk, without reading it whole."""
+    scanner = _Scanner()
+    builder = _Builder()
+    while True:
+        chunk = handle.read(chunk_size)
+        if not chunk:
+            break
+        builder.consume(scanner.feed(chunk))
+    builder.consume(scanner.close())
+    return builder.finish()
 
 
 def parse_file(path: str) -> List[Node]:
     with open(path, "r", encoding="utf-8") as handle:
-        return parse_program(handle.read())
+        return parse_stream(handle)
@@ -3,7 +3,7 @@
 import hashlib
 import json
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 
 DEFAULT_BACKENDS = ["PYTHON", "CLASSICAL", "QASM"]
@@ -23,6 +23,18 @@ def _normalize_backends(backends: List[str]) -> List[str]:
     return normalized
 
 
+def parse_backends(value: Union[str, Sequence[str]]) -> List[str]:
+    """Backend names from a comma-separated string or a list, upper-cased and sorted."""
+    parts = value.split(",") if isinstance(value, str) else list(value)
+    return _normalize_backends([str(item).strip() for item in parts]) or list(DEFAULT_BACKENDS)
+
+
+def normalize_backend(value: Optional[str]) -> Optional[str]:
+    if not value:
+        return None
+    return value.upper()
+
+
 def _normalize_modes(modes: List[str]) -> List[str]:
     normalized = sorted({str(item).upper() for item in modes if str(item).strip()})
     return normalized
@@ -223,3 +235,88 @@ class ExecutionToken:
             collapse_requires_delta_s=collapse_requires_delta_s,
             notes=notes if isinstance(notes, str) else None,
         )
+
+
+class TokenMinter:
+    """Mints ``ExecutionToken``s that differ only in ``budget_steps``.
+
+    Backends, modes and the IO/NET policies are normalized once. The token id
+    preimage is split around ``budget_steps`` and the prefix is hashed up
+    front, so each mint hashes only the budget and the suffix. Minted tokens
+    share the normalized policy dicts; ``to_dict()`` still returns copies.
+    """
+
+    def __init__(
+        self,
+        allowed_backends: Optional[List[str]] = None,
+        preferred_backend: Optional[str] = None,
+        determinism_mode: str = "deterministic",
+        io_policy: Optional[Dict[str, object]] = None,
+        net_policy: Optional[Dict[str, object]] = None,
+        delta_s_policy: Optional[Dict[str, object]] = None,
+        delta_s_budget: int = 0,
+        measurement_modes_allowed: Optional[List[str]] = None,
+        collapse_requires_delta_s: bool = False,
+        notes: Optional[str] = None,
+    ) -> None:
+        self._allowed = _normalize_backends(allowed_backends or DEFAULT_BACKENDS)
+        self._preferred = preferred_backend.upper() if preferred_backend else None
+        modes = _normalize_modes(measurement_modes_allowed or [])
+        self._io_policy = _normalize_io_policy(io_policy)
+        self._net_policy = _normalize_net_policy(net_policy)
+        self._determinism_mode = determinism_mode
+        self._delta_s_policy = dict(delta_s_policy) if isinstance(delta_s_policy, dict) else None
+        self._delta_s_budget = int(delta_s_budget)
+        self._modes = modes if modes else None
+        self._collapse_requires_delta_s = bool(collapse_requires_delta_s)
+        self._notes = notes
+        core = {
+            "allowed_backends": self._allowed,
+            "preferred_backend": self._preferred,
+            "determinism_mode": determinism_mode,
+            "io_policy": self._io_policy,
+            "net_policy": self._net_policy,
+            "delta_s_policy": delta_s_policy or {},
+            "delta_s_budget": self._delta_s_budget,
+            "measurement_modes_allowed": modes,
+            "collapse_requires_delta_s": self._collapse_requires_delta_s,
+        }
+        # Canonical JSON sorts keys, so "budget_steps" falls between the
+        # entries that sort before and after it.
+        head = _canonical_json({key: value for key, value in core.items() if key < "budget_steps"})
+        tail = _canonical_json({key: value for key, value in core.items() if key > "budget_steps"})
+        self._prefix = hashlib.sha256(f'{head[:-1]},"budget_steps":'.encode("utf-8"))
+        self._suffix = f",{tail[1:]}"
+        # The same split for ``to_dict()``, whose keys run from
+        # "allowed_backends" through "budget_steps" to "token_id" last.
+        data = self.mint(0).to_dict()
+        head = _canonical_json({key: value for key, value in data.items() if key < "budget_steps"})
+        middle = _canonical_json({key: value for key, value in data.items() if "budget_steps" < key < "token_id"})
+        self._dict_head = f'{head[:-1]},"budget_steps":'
+        self._dict_middle = f',{middle[1:-1]},"token_id":"'
+
+    def token_id(self, budget_steps: int) -> str:
+        hasher = self._prefix.copy()
+        hasher.update(f"{int(budget_steps)}{self._suffix}".encode("utf-8"))
+        return f"sha256:{hasher.hexdigest()}"
+
+    def render(self, budget_steps: int = 100) -> Tuple[ExecutionToken, str]:
+        """Mint a token and return it with the canonical JSON of ``to_dict()``."""
+        token = self.mint(budget_steps)
+        return token, f'{self._dict_head}{token.budget_steps}{self._dict_middle}{token.token_id}"}}'
+
+    def mint(self, budget_steps: int = 100) -> ExecutionToken:
+        return ExecutionToken(
+            token_id=self.token_id(budget_steps),
+            allowed_backends=self._allowed,
+            preferred_backend=self._preferred,
+            budget_steps=int(budget_steps),
+            determinism_mode=self._determinism_mode,
+            io_policy=self._io_policy,
+            net_policy=self._net_policy,
+            delta_s_policy=self._delta_s_policy,
+            delta_s_budget=self._delta_s_budget,
+            measurement_modes_allowed=self._modes,
+            collapse_requires_delta_s=self._collapse_requires_delta_s,
+            notes=self._notes,
+        )
@@ -1,21 +1,42 @@
 from __future__ import annotations
 
+import hashlib
 import json
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
 
-from tools import validate_operator_registries
+from ..cache import JsonCache, cache_key
+from ..tool_loader import load_tool
 
 
 ROOT = Path(__file__).resolve().parents[3]
+INDEX_FORMAT = "hpl.operator_registry_index.v1"
+
+_LOCK = threading.Lock()
+_SNAPSHOTS: Dict[str, "OperatorRegistry"] = {}
+_INDEX_CACHE = JsonCache("operator_registry")
 
 
 @dataclass(frozen=True)
 class OperatorRegistry:
-    operators: Dict[str, Dict[str, object]]
+    """Immutable snapshot of the loaded registries and their validation result.
+
+    ``operators`` is a read-only id -> entry map. ``digest`` identifies the
+    snapshot by the schema, the validator source and the registry file
+    contents.
+    """
+
+    operators: Mapping[str, Mapping[str, object]]
     sources: List[Path]
     errors: List[str]
+    digest: str = ""
+    operator_ids: FrozenSet[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "operator_ids", frozenset(self.operators))
 
 
 def resolve_registry_paths(
@@ -36,27 +57,79 @@ def resolve_registry_paths(
 def load_operator_registries(
     root: Path = ROOT, registry_paths: Optional[Sequence[Path]] = None
 ) -> OperatorRegistry:
+    """Return the registry snapshot for the resolved registry files.
+
+    Snapshots are keyed by the schema digest, the validator's source digest
+    and every registry file's content digest, so the scheduler and runtime
+    share one snapshot per process. The parsed index is also persisted in the
+    tooling cache, which skips schema validation on a cold start with
+    unchanged files.
+    """
     sources = resolve_registry_paths(root, registry_paths)
+    if not sources:
+        return OperatorRegistry(
+            operators=MappingProxyType({}),
+            sources=sources,
+            errors=["operator registries not found"],
+        )
+
+    validator = load_tool("validate_operator_registries")
+    schema_bytes = validator.SCHEMA_PATH.read_bytes()
+    contents = [(path, path.read_bytes()) for path in sources]
+    # A persisted index skips validation, so the validator's rules are part
+    # of the key as well as the schema.
+    digest = cache_key(
+        INDEX_FORMAT,
+        _digest_bytes(schema_bytes),
+        _digest_bytes(Path(validator.__file__).read_bytes()),
+        *(f"{path}={_digest_bytes(data)}" for path, data in contents),
+    )
+    with _LOCK:
+        cached = _SNAPSHOTS.get(digest)
+    if cached is not None:
+        return cached
+
+    index = _INDEX_CACHE.get(digest)
+    if not (isinstance(index, dict) and index.get("format") == INDEX_FORMAT):
+        index = _build_index(validator, json.loads(schema_bytes), contents)
+        _INDEX_CACHE.put(digest, index)
+
+    snapshot = OperatorRegistry(
+        operators=MappingProxyType(
+            {operator_id: MappingProxyType(entry) for operator_id, entry in index["operators"].items()}
+        ),
+        sources=sources,
+        errors=list(index["errors"]),
+        digest=digest,
+    )
+    with _LOCK:
+        snapshot = _SNAPSHOTS.setdefault(digest, snapshot)
+    return snapshot
+
+
+def clear_registry_cache() -> None:
+    with _LOCK:
+        _SNAPSHOTS.clear()
+
+
+def _build_index(
+    validator: object, schema: Dict, contents: Sequence[Tuple[Path, bytes]]
+) -> Dict[str, object]:
     errors: List[str] = []
     operators: Dict[str, Dict[str, object]] = {}
 
-    if not sources:
-        errors.append("operator registries not found")
-        return OperatorRegistry(operators=operators, sources=sources, errors=errors)
-
-    schema = validate_operator_registries._load_schema()
-    for path in sources:
-        validation_errors = validate_operator_registries.validate_registry_file(path, schema)
-        if validation_errors:
-            errors.extend([f"{path}: {err}" for err in validation_errors])
-
+    for path, data in contents:
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
+            payload = json.loads(data.decode("utf-8"))
         except json.JSONDecodeError as exc:
+            errors.append(f"{path}: Invalid JSON: {exc}")
             errors.append(f"{path}: invalid JSON ({exc})")
             continue
 
-        entries = payload.get("operators", [])
+        validation_errors = validator.validate_registry_data(payload, schema)  # type: ignore[attr-defined]
+        errors.extend([f"{path}: {err}" for err in validation_errors])
+
+        entries = payload.get("operators", []) if isinstance(payload, dict) else []
         if not isinstance(entries, list):
             errors.append(f"{path}: operators must be a list")
             continue
@@ -73,7 +146,12 @@ def load_operator_registries(
                 continue
             operators[operator_id] = dict(entry)
 
-    return OperatorRegistry(operators=operators, sources=sources, errors=errors)
+    return {"format": INDEX_FORMAT, "operators": operators, "errors": errors}
+
+
+def _digest_bytes(value: bytes) -> str:
+    digest = hashlib.sha256(value).hexdigest()
+    return f"sha256:{digest}"
 
 
 def extract_operator_ids(program_ir: Dict[str, object]) -> List[str]:
@@ -99,7 +177,7 @@ def validate_program_operators(
         return True, []
     errors = list(registry.errors)
     operator_ids = extract_operator_ids(program_ir)
-    missing = sorted(set(operator_ids) - set(registry.operators.keys()))
+    missing = sorted(set(operator_ids) - registry.operator_ids)
     if missing:
         errors.append(f"operator registry missing: {', '.join(missing)}")
     return not errors, errors
@@ -116,7 +194,7 @@ def validate_plan_operators(
         operator_id = step.get("operator_id")
         if operator_id:
             operator_ids.append(str(operator_id))
-    missing = sorted(set(operator_ids) - set(registry.operators.keys()))
+    missing = sorted(set(operator_ids) - registry.operator_ids)
     if missing:
         errors.append(f"operator registry missing: {', '.join(missing)}")
     return not errors, errors
@@ -0,0 +1,174 @@
+"""Declarative scheduler plan templates.
+
+A template is a fixed sequence of step shapes whose argument values are
+either literals or named parameters. Templates are compiled once into
+prototype dicts plus parameter slots; instantiating one copies the prototypes,
+fills the slots from a parameter dict and numbers the emitted steps. The
+canonical JSON of the emitted steps, which the scheduler hashes into
+``plan_id``, is memoized per template for scalar parameter sets.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+
+STEPS_JSON_CACHE_SIZE = 1024
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class Param:
+    """A template value bound from the parameter dict at instantiation.
+
+    ``optional`` parameters drop their key from the step when bound to None.
+    """
+
+    name: str
+    optional: bool = False
+
+
+@dataclass(frozen=True)
+class StepTemplate:
+    name: str
+    effect_type: str
+    args: Mapping[str, object] = field(default_factory=dict)
+    requires: Mapping[str, object] = field(default_factory=dict)
+    when: Optional[str] = None
+    indexed: bool = True
+
+
+class _CompiledStep(NamedTuple):
+    """A step shape with literals pre-filled and parameter slots listed.
+
+    ``args`` and ``requires`` are prototype dicts in template key order; each
+    slot is ``(key, param name, optional)`` and overwrites its key in place,
+    so bound steps keep the template's key order. A tuple so the
+    instantiation loop can unpack it directly.
+    """
+
+    name: str
+    effect_type: str
+    args: Dict[str, object]
+    arg_slots: Tuple[Tuple[str, str, bool], ...]
+    requires: Dict[str, object]
+    require_slots: Tuple[Tuple[str, str, bool], ...]
+    when: Optional[str]
+    indexed: bool
+
+
+class PlanTemplate:
+    def __init__(self, template_id: str, steps: Sequence[StepTemplate]) -> None:
+        self.template_id = template_id
+        self._steps = tuple(_compile_step(step) for step in steps)
+        self._steps_json: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def instantiate(self, params: Mapping[str, object]) -> List[Dict[str, object]]:
+        steps: List[Dict[str, object]] = []
+        for name, effect_type, args, arg_slots, requires, require_slots, when, indexed in self._steps:
+            if when is not None and not params[when]:
+                continue
+            if arg_slots:
+                args = _bind(args, arg_slots, params)
+            else:
+                args = args.copy()
+            if require_slots:
+                requires = _bind(requires, require_slots, params)
+            else:
+                requires = requires.copy()
+            steps.append(
+                {
+                    "step_id": f"{name}_{len(steps)}" if indexed else name,
+                    "effect_type": effect_type,
+                    "args": args,
+                    "requires": requires,
+                }
+            )
+        return steps
+
+    def render(self, params: Mapping[str, object]) -> Tuple[List[Dict[str, object]], str]:
+        """Instantiate the template and return the steps with their canonical JSON."""
+        steps = self.instantiate(params)
+        key = _params_key(params)
+        if key is None:
+            return steps, _canonical_json(steps)
+        with self._lock:
+            steps_json = self._steps_json.get(key)
+            if steps_json is not None:
+                self._steps_json.move_to_end(key)
+                return steps, steps_json
+        steps_json = _canonical_json(steps)
+        with self._lock:
+            self._steps_json[key] = steps_json
+            if len(self._steps_json) > STEPS_JSON_CACHE_SIZE:
+                self._steps_json.popitem(last=False)
+        return steps, steps_json
+
+
+def _compile_step(step: StepTemplate) -> _CompiledStep:
+    args, arg_slots = _compile_values(step.args)
+    requires, require_slots = _compile_values(step.requires)
+    return _CompiledStep(
+        name=step.name,
+        effect_type=step.effect_type,
+        args=args,
+        arg_slots=arg_slots,
+        requires=requires,
+        require_slots=require_slots,
+        when=step.when,
+        indexed=step.indexed,
+    )
+
+
+def _compile_values(
+    values: Mapping[str, object],
+) -> Tuple[Dict[str, object], Tuple[Tuple[str, str, bool], ...]]:
+    prototype: Dict[str, object] = {}
+    slots: List[Tuple[str, str, bool]] = []
+    for key, value in values.items():
+        if isinstance(value, Param):
+            prototype[key] = _MISSING
+            slots.append((key, value.name, value.optional))
+        elif value is None or isinstance(value, (str, int, float, bool)):
+            prototype[key] = value
+        else:
+            raise TypeError(f"template literal for '{key}' must be a scalar, got {type(value).__name__}")
+    return prototype, tuple(slots)
+
+
+def _bind(
+    prototype: Dict[str, object],
+    slots: Tuple[Tuple[str, str, bool], ...],
+    params: Mapping[str, object],
+) -> Dict[str, object]:
+    bound = prototype.copy()
+    for key, name, optional in slots:
+        value = params[name]
+        if value is None and optional:
+            del bound[key]
+        else:
+            bound[key] = value
+    return bound
+
+
+def _params_key(params: Mapping[str, object]) -> Optional[Hashable]:
+    # Keyed by value, with types so True and 1 stay apart. Parameter sets that
+    # carry containers (the program IR) are not memoized: encoding them for a
+    # key costs as much as encoding the steps they produce.
+    items = tuple((name, type(value), value) for name, value in sorted(params.items()))
+    try:
+        hash(items)
+    except TypeError:
+        return None
+    return items
+
+
+def _canonical_json(data: object) -> str:
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
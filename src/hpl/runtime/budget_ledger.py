@@ -0,0 +1,324 @@
+"""Hierarchical budget ledger shared across concurrent runtime runs.
+
+Accounts form a tree under a parent authority. Each account caps spend per
+budget kind (steps, delta_s, io_calls, net_calls), and a child's caps are
+intersected with its parent's, as ``TokenTree.mint_child`` does for scopes.
+A debit charges the account and every ancestor in one SQLite transaction
+and is refused, with no change, if any of them would exceed its cap.
+
+The ledger lives in SQLite. A file-backed ledger runs in WAL mode with
+``BEGIN IMMEDIATE`` transactions, so separate processes can share it; within
+a process one connection is serialized by a lock. ``LedgerAccount`` handles
+lease units in batches and hand them out locally, so a run touches the
+database once per batch instead of once per step. ``release()`` returns
+unused leases, and ``refund()`` gives back units for work that never ran.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional
+
+
+LEDGER_FORMAT = "hpl.budget_ledger.v1"
+BUDGET_KINDS = ("steps", "delta_s", "io_calls", "net_calls")
+DEFAULT_TIMEOUT_S = 30.0
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS accounts (
+        account_id TEXT PRIMARY KEY,
+        parent_id TEXT REFERENCES accounts(account_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS balances (
+        account_id TEXT NOT NULL REFERENCES accounts(account_id),
+        kind TEXT NOT NULL,
+        cap INTEGER,
+        spent INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (account_id, kind)
+    )
+    """,
+)
+
+
+class BudgetLedger:
+    """SQLite-backed budget tree; ``path=None`` keeps it in memory."""
+
+    def __init__(self, path: Optional[Path] = None, timeout: float = DEFAULT_TIMEOUT_S) -> None:
+        self.path = Path(path) if path is not None else None
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(self.path) if self.path is not None else ":memory:",
+            timeout=timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        if self.path is not None:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._transaction() as cursor:
+            for statement in _SCHEMA:
+                cursor.execute(statement)
+
+    def __enter__(self) -> "BudgetLedger":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def open_account(
+        self,
+        account_id: str,
+        caps: Optional[Mapping[str, int]] = None,
+        parent_id: Optional[str] = None,
+    ) -> "LedgerAccount":
+        """Create ``account_id`` (or return the existing one) and a handle to it.
+
+        Kinds missing from ``caps`` are uncapped at this level but still
+        bounded by the ancestors. Reopening with a different parent is an error.
+        """
+        requested = _check_amounts(caps or {})
+        with self._transaction() as cursor:
+            row = cursor.execute("SELECT parent_id FROM accounts WHERE account_id = ?", (account_id,)).fetchone()
+            if row is not None:
+                if row[0] != parent_id:
+                    raise ValueError(f"account {account_id!r} already exists under parent {row[0]!r}")
+            else:
+                parent_caps: Dict[str, Optional[int]] = {}
+                if parent_id is not None:
+                    parent_caps = self._caps(cursor, parent_id)
+                cursor.execute("INSERT INTO accounts (account_id, parent_id) VALUES (?, ?)", (account_id, parent_id))
+                for kind in BUDGET_KINDS:
+                    cap = _intersect(requested.get(kind), parent_caps.get(kind))
+                    cursor.execute(
+                        "INSERT INTO balances (account_id, kind, cap) VALUES (?, ?, ?)",
+                        (account_id, kind, cap),
+                    )
+        return LedgerAccount(self, account_id)
+
+    def account(self, account_id: str, batch_size: int = 1) -> "LedgerAccount":
+        """Handle to an existing account; ``KeyError`` if it does not exist."""
+        with self._transaction() as cursor:
+            self._chain(cursor, account_id)
+        return LedgerAccount(self, account_id, batch_size=batch_size)
+
+    def debit(self, account_id: str, amounts: Mapping[str, int]) -> Optional[str]:
+        """Charge ``amounts`` to the account and its ancestors, all or nothing.
+
+        Returns None on success, or the first kind whose cap would be exceeded.
+        """
+        amounts = {kind: amount for kind, amount in _check_amounts(amounts).items() if amount}
+        if not amounts:
+            return None
+        with self._transaction() as cursor:
+            chain = self._chain(cursor, account_id)
+            for kind in BUDGET_KINDS:
+                amount = amounts.get(kind)
+                if amount is None:
+                    continue
+                for owner in chain:
+                    cap, spent = cursor.execute(
+                        "SELECT cap, spent FROM balances WHERE account_id = ? AND kind = ?",
+                        (owner, kind),
+                    ).fetchone()
+                    if cap is not None and spent + amount > cap:
+                        return kind
+            self._apply(cursor, chain, amounts, 1)
+        return None
+
+    def credit(self, account_id: str, amounts: Mapping[str, int]) -> None:
+        """Return previously debited units to the account and its ancestors."""
+        amounts = {kind: amount for kind, amount in _check_amounts(amounts).items() if amount}
+        if not amounts:
+            return
+        with self._transaction() as cursor:
+            self._apply(cursor, self._chain(cursor, account_id), amounts, -1)
+
+    def snapshot(self, account_id: Optional[str] = None) -> Dict[str, object]:
+        """Balances for ``account_id`` and its ancestors, or the whole ledger."""
+        with self._transaction() as cursor:
+            if account_id is None:
+                owners = [row[0] for row in cursor.execute("SELECT account_id FROM accounts")]
+            else:
+                owners = self._chain(cursor, account_id)
+            accounts: List[Dict[str, object]] = []
+            for owner in sorted(owners):
+                parent_id = cursor.execute(
+                    "SELECT parent_id FROM accounts WHERE account_id = ?", (owner,)
+                ).fetchone()[0]
+                balances: Dict[str, Dict[str, Optional[int]]] = {}
+                for kind, cap, spent in cursor.execute(
+                    "SELECT kind, cap, spent FROM balances WHERE account_id = ? ORDER BY kind", (owner,)
+                ):
+                    balances[kind] = {
+                        "cap": cap,
+                        "spent": spent,
+                        "remaining": cap - spent if cap is not None else None,
+                    }
+                accounts.append({"account_id": owner, "parent_id": parent_id, "balances": balances})
+        return {"format": LEDGER_FORMAT, "accounts": accounts}
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            else:
+                cursor.execute("COMMIT")
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _chain(cursor: sqlite3.Cursor, account_id: str) -> List[str]:
+        chain: List[str] = []
+        current: Optional[str] = account_id
+        while current is not None:
+            row = cursor.execute("SELECT parent_id FROM accounts WHERE account_id = ?", (current,)).fetchone()
+            if row is None:
+                raise KeyError(f"unknown budget account: {current}")
+            chain.append(current)
+            current = row[0]
+        return chain
+
+    @staticmethod
+    def _caps(cursor: sqlite3.Cursor, account_id: str) -> Dict[str, Optional[int]]:
+        # Effective caps are already intersected down the tree, so the
+        # parent's own row is the bound for a new child.
+        BudgetLedger._chain(cursor, account_id)
+        rows = cursor.execute("SELECT kind, cap FROM balances WHERE account_id = ?", (account_id,))
+        return {kind: cap for kind, cap in rows}
+
+    @staticmethod
+    def _apply(cursor: sqlite3.Cursor, chain: List[str], amounts: Mapping[str, int], sign: int) -> None:
+        cursor.executemany(
+            "UPDATE balances SET spent = spent + ? WHERE account_id = ? AND kind = ?",
+            [(sign * amount, owner, kind) for owner in chain for kind, amount in amounts.items()],
+        )
+
+
+class LedgerAccount:
+    """Per-run handle that debits one ledger account.
+
+    With ``batch_size`` above one, units are leased from the ledger in
+    batches and debited locally; when a full batch is no longer available it
+    falls back to leasing exactly what the step needs. Call ``release()``
+    when the run ends to return unused leases.
+    """
+
+    def __init__(self, ledger: BudgetLedger, account_id: str, batch_size: int = 1) -> None:
+        self.ledger = ledger
+        self.account_id = account_id
+        self.batch_size = max(1, int(batch_size))
+        self._leased: Dict[str, int] = {}
+        self._debited: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def child(
+        self,
+        account_id: str,
+        caps: Optional[Mapping[str, int]] = None,
+        batch_size: int = 1,
+    ) -> "LedgerAccount":
+        handle = self.ledger.open_account(account_id, caps, parent_id=self.account_id)
+        handle.batch_size = max(1, int(batch_size))
+        return handle
+
+    @property
+    def debited(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._debited)
+
+    def debit(self, amounts: Mapping[str, int]) -> Optional[str]:
+        """Debit ``amounts`` atomically; returns the exceeded kind or None."""
+        amounts = {kind: amount for kind, amount in _check_amounts(amounts).items() if amount}
+        with self._lock:
+            if self.batch_size == 1:
+                exceeded = self.ledger.debit(self.account_id, amounts)
+            else:
+                exceeded = self._debit_leased(amounts)
+            if exceeded is None:
+                for kind, amount in amounts.items():
+                    self._debited[kind] = self._debited.get(kind, 0) + amount
+            return exceeded
+
+    def refund(self, amounts: Mapping[str, int]) -> None:
+        """Give back a successful ``debit`` for work that never completed."""
+        amounts = {kind: amount for kind, amount in _check_amounts(amounts).items() if amount}
+        with self._lock:
+            for kind, amount in amounts.items():
+                remaining = self._debited.get(kind, 0) - amount
+                if remaining > 0:
+                    self._debited[kind] = remaining
+                else:
+                    self._debited.pop(kind, None)
+            if self.batch_size > 1:
+                # Leased units go back to the lease; release() returns them.
+                for kind, amount in amounts.items():
+                    self._leased[kind] = self._leased.get(kind, 0) + amount
+                return
+        if amounts:
+            self.ledger.credit(self.account_id, amounts)
+
+    def release(self) -> None:
+        with self._lock:
+            leased = {kind: amount for kind, amount in self._leased.items() if amount}
+            self._leased.clear()
+        if leased:
+            self.ledger.credit(self.account_id, leased)
+
+    def snapshot(self) -> Dict[str, object]:
+        """Ledger balances for this account's chain plus this handle's debits."""
+        snapshot = self.ledger.snapshot(self.account_id)
+        snapshot["account_id"] = self.account_id
+        snapshot["debited"] = {kind: amount for kind, amount in sorted(self.debited.items())}
+        return snapshot
+
+    def _debit_leased(self, amounts: Mapping[str, int]) -> Optional[str]:
+        for kind, amount in amounts.items():
+            shortfall = amount - self._leased.get(kind, 0)
+            if shortfall <= 0:
+                continue
+            lease = max(shortfall, self.batch_size)
+            if lease > shortfall and self.ledger.debit(self.account_id, {kind: lease}) is None:
+                self._leased[kind] = self._leased.get(kind, 0) + lease
+            elif self.ledger.debit(self.account_id, {kind: shortfall}) is None:
+                self._leased[kind] = self._leased.get(kind, 0) + shortfall
+            else:
+                return kind
+        for kind, amount in amounts.items():
+            self._leased[kind] -= amount
+        return None
+
+
+def _check_amounts(amounts: Mapping[str, int]) -> Dict[str, int]:
+    checked: Dict[str, int] = {}
+    for kind, amount in amounts.items():
+        if kind not in BUDGET_KINDS:
+            raise ValueError(f"unknown budget kind: {kind}")
+        value = int(amount)
+        if value < 0:
+            raise ValueError(f"budget amount for {kind} must be non-negative")
+        checked[kind] = value
+    return checked
+
+
+def _intersect(requested: Optional[int], parent: Optional[int]) -> Optional[int]:
+    if requested is None:
+        return parent
+    if parent is None:
+        return requested
+    return min(requested, parent)
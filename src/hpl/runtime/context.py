@@ -4,10 +4,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from ..execution_token import ExecutionToken
 
+if TYPE_CHECKING:
+    from .budget_ledger import LedgerAccount
+
 
 ROOT = Path(__file__).resolve().parents[3]
 DEFAULT_PUBLIC_KEY = ROOT / "config" / "keys" / "ci_ed25519.pub"
@@ -28,3 +31,4 @@ class RuntimeContext:
     io_enabled: bool = False
     constraint_inversion_v1: bool = False
     net_enabled: bool = False
+    budget_account: Optional["LedgerAccount"] = None
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
 from .context import RuntimeContext
@@ -99,3 +101,32 @@ class ExecutionContract:
 
     def postconditions(self, step: Dict[str, object], ctx: RuntimeContext) -> Tuple[bool, List[str]]:
         return True, []
+
+
+def contract_from_dict(data: Dict[str, object], required_backend: Optional[str] = None) -> ExecutionContract:
+    """Contract from its JSON form (``allowed_steps`` and verification flags)."""
+    return ExecutionContract(
+        allowed_steps=set(map(str, data.get("allowed_steps", []))),
+        require_epoch_verification=bool(data.get("require_epoch_verification", False)),
+        require_signature_verification=bool(data.get("require_signature_verification", False)),
+        required_backend=required_backend,
+    )
+
+
+def default_contract(plan: Dict[str, object], required_backend: Optional[str] = None) -> ExecutionContract:
+    """Contract for a run given none: the plan's steps, allowed by ``operator_id``."""
+    plan_steps = plan.get("steps", [])
+    allowed = {str(step.get("operator_id")) for step in plan_steps if isinstance(step, dict)}
+    return ExecutionContract(allowed_steps=allowed, required_backend=required_backend)
+
+
+def load_contract(
+    contract_path: Optional[Path],
+    plan: Dict[str, object],
+    required_backend: Optional[str] = None,
+) -> ExecutionContract:
+    """Contract for ``hpl run``: the contract file if it exists, else ``default_contract``."""
+    if contract_path and contract_path.exists():
+        data = json.loads(contract_path.read_text(encoding="utf-8"))
+        return contract_from_dict(data, required_backend=required_backend)
+    return default_contract(plan, required_backend=required_backend)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Callable, Dict
+import importlib
+from typing import Callable, Dict, Mapping, Tuple
 
 from ..context import RuntimeContext
 from .effect_step import EffectResult, EffectStep
@@ -10,13 +11,28 @@ Handler = Callable[[EffectStep, RuntimeContext], EffectResult]
 
 
 _REGISTRY: Dict[str, Handler] = {}
+_DEFERRED: Dict[str, Tuple[str, str]] = {}
 
 
 def register_handler(effect_type: str, handler: Handler) -> None:
+    _DEFERRED.pop(effect_type, None)
     _REGISTRY[effect_type] = handler
 
 
+def register_deferred_handlers(module_name: str, handlers: Mapping[str, str]) -> None:
+    """Register handlers by attribute name, importing ``module_name`` on first use."""
+    for effect_type, attribute in handlers.items():
+        if effect_type not in _REGISTRY:
+            _DEFERRED[effect_type] = (module_name, attribute)
+
+
 def get_handler(effect_type: str) -> Handler:
     if effect_type in _REGISTRY:
         return _REGISTRY[effect_type]
-    return _REGISTRY["NOOP"]
+    if effect_type in _DEFERRED:
+        module_name, attribute = _DEFERRED[effect_type]
+        handler = getattr(importlib.import_module(module_name), attribute)
+        _REGISTRY[effect_type] = handler
+        _DEFERRED.pop(effect_type, None)
+        return handler
+    return get_handler("NOOP")
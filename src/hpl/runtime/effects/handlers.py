@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import importlib.util
 import json
 import os
 from pathlib import Path
@@ -9,6 +8,8 @@ from typing import Dict, List, Optional
 from ...audit.constraint_inversion import invert_constraints
 from ...backends.classical_lowering import lower_program_ir_to_backend_ir
 from ...backends.qasm_lowering import lower_backend_ir_to_qasm
+from ... import tracing, verification_cache
+from ...tool_loader import load_tool
 from ..context import RuntimeContext
 from ..io.adapter import load_adapter
 from ..net.adapter import load_adapter as load_net_adapter
@@ -19,12 +20,6 @@ from .measurement_selection import build_measurement_selection
 
 
 ROOT = Path(__file__).resolve().parents[4]
-VERIFY_EPOCH_PATH = ROOT / "tools" / "verify_epoch.py"
-VERIFY_SIGNATURE_PATH = ROOT / "tools" / "verify_anchor_signature.py"
-BUNDLE_EVIDENCE_PATH = ROOT / "tools" / "bundle_evidence.py"
-VALIDATE_REGISTRIES_PATH = ROOT / "tools" / "validate_operator_registries.py"
-VALIDATE_COUPLING_PATH = ROOT / "tools" / "validate_coupling_topology.py"
-VALIDATE_QUANTUM_PATH = ROOT / "tools" / "validate_quantum_execution_semantics.py"
 
 
 def handle_noop(step: EffectStep, ctx: RuntimeContext) -> EffectResult:
@@ -64,8 +59,8 @@ def handle_verify_epoch(step: EffectStep, ctx: RuntimeContext) -> EffectResult:
     if anchor_path is None or not anchor_path.exists():
         return _refuse(step, "AnchorMissing", ["anchor not found"])
     anchor = json.loads(anchor_path.read_text(encoding="utf-8"))
-    verify_epoch = _load_tool("verify_epoch", VERIFY_EPOCH_PATH)
-    ok, errors = verify_epoch.verify_epoch_anchor(anchor, root=ROOT, git_commit_override=None)
+    outcome = verification_cache.verify_epoch_anchor(anchor, root=ROOT, git_commit_override=None)
+    ok, errors = outcome.ok, outcome.errors
     digest = _digest_bytes(anchor_path.read_bytes())
     if ok:
         return _ok(step, {anchor_path.name: digest})
@@ -80,9 +75,8 @@ def handle_verify_signature(step: EffectStep, ctx: RuntimeContext) -> EffectResu
         return _refuse(step, "SignatureInputsMissing", ["missing signature inputs"])
     if not anchor_path.exists() or not sig_path.exists() or not pub_path.exists():
         return _refuse(step, "SignatureInputsMissing", ["missing signature inputs"])
-    verify_sig = _load_tool("verify_anchor_signature", VERIFY_SIGNATURE_PATH)
-    verify_key = verify_sig._load_verify_key(pub_path, "UNUSED")
-    ok, errors = verify_sig.verify_anchor_signature(anchor_path, sig_path, verify_key)
+    outcome = verification_cache.verify_anchor_signature(anchor_path, sig_path, pub_path)
+    ok, errors = outcome.ok, outcome.errors
     digests = {
         anchor_path.name: _digest_bytes(anchor_path.read_bytes()),
         sig_path.name: _digest_bytes(sig_path.read_bytes()),
@@ -260,7 +254,7 @@ def handle_check_repo_state(step: EffectStep, ctx: RuntimeContext) -> EffectResu
 
 
 def handle_validate_registries(step: EffectStep, ctx: RuntimeContext) -> EffectResult:
-    module = _load_tool("validate_operator_registries", VALIDATE_REGISTRIES_PATH)
+    module = load_tool("validate_operator_registries")
     schema = module._load_schema()
     registry_paths = module._resolve_registry_paths([])
     errors: List[str] = []
@@ -277,7 +271,7 @@ def handle_validate_coupling_topology(step: EffectStep, ctx: RuntimeContext) ->
     registry_path = _resolve_output_path(ctx, step.args, key="registry_path")
     if registry_path is None or not registry_path.exists():
         return _refuse(step, "CouplingRegistryMissing", ["coupling registry missing"])
-    module = _load_tool("validate_coupling_topology", VALIDATE_COUPLING_PATH)
+    module = load_tool("validate_coupling_topology")
     errors = module.validate_coupling_registry_file(registry_path)
     digest = _digest_bytes(registry_path.read_bytes())
     if errors:
@@ -286,7 +280,7 @@ def handle_validate_coupling_topology(step: EffectStep, ctx: RuntimeContext) ->
 
 
 def handle_validate_quantum_semantics(step: EffectStep, ctx: RuntimeContext) -> EffectResult:
-    module = _load_tool("validate_quantum_execution_semantics", VALIDATE_QUANTUM_PATH)
+    module = load_tool("validate_quantum_execution_semantics")
     program_ir = _resolve_output_path(ctx, step.args, key="program_ir")
     plan = _resolve_output_path(ctx, step.args, key="plan")
     runtime_result = _resolve_output_path(ctx, step.args, key="runtime_result")
@@ -1098,7 +1092,7 @@ def handle_sign_bundle(step: EffectStep, ctx: RuntimeContext) -> EffectResult:
         return _refuse(step, "BundleSigningInputsMissing", ["bundle signing inputs missing"])
     if not manifest_path.exists() or not signing_key.exists():
         return _refuse(step, "BundleSigningInputsMissing", ["bundle signing inputs missing"])
-    bundle_module = _load_tool("bundle_evidence", BUNDLE_EVIDENCE_PATH)
+    bundle_module = load_tool("bundle_evidence")
     signature_path = bundle_module.sign_bundle_manifest(manifest_path, signing_key)
     digests = {
         manifest_path.name: _digest_bytes(manifest_path.read_bytes()),
@@ -1115,7 +1109,7 @@ def handle_verify_bundle(step: EffectStep, ctx: RuntimeContext) -> EffectResult:
         return _refuse(step, "BundleVerificationInputsMissing", ["bundle verification inputs missing"])
     if not manifest_path.exists() or not signature_path.exists() or not public_key.exists():
         return _refuse(step, "BundleVerificationInputsMissing", ["bundle verification inputs missing"])
-    bundle_module = _load_tool("bundle_evidence", BUNDLE_EVIDENCE_PATH)
+    bundle_module = load_tool("bundle_evidence")
     ok, errors = bundle_module.verify_bundle_manifest_signature(
         manifest_path,
         signature_path,
@@ -1876,7 +1870,7 @@ def _resolve_io_adapter(step: EffectStep, ctx: RuntimeContext) -> object:
     if os.getenv("HPL_IO_ENABLED") != "1":
         return _refuse(step, "IOGuardNotEnabled", ["HPL_IO_ENABLED not set"])
     try:
-        return load_adapter()
+        return tracing.trace_adapter(load_adapter(), "io.adapter")
     except Exception as exc:
         return _refuse(step, "IOAdapterUnavailable", [str(exc)])
 
@@ -1892,7 +1886,7 @@ def _resolve_net_adapter(step: EffectStep, ctx: RuntimeContext) -> object:
     if os.getenv("HPL_NET_ENABLED") != "1":
         return _refuse(step, "NetGuardNotEnabled", ["HPL_NET_ENABLED not set"])
     try:
-        return load_net_adapter()
+        return tracing.trace_adapter(load_net_adapter(), "net.adapter")
     except Exception as exc:
         return _refuse(step, "NetAdapterUnavailable", [str(exc)])
 
@@ -1950,7 +1944,7 @@ def handle_bundle_evidence(step: EffectStep, ctx: RuntimeContext) -> EffectResul
     artifacts_spec = step.args.get("artifacts", [])
     if not isinstance(artifacts_spec, list):
         return _refuse(step, "BundleArtifactsMissing", ["artifacts missing"])
-    bundle_module = _load_tool("bundle_evidence", BUNDLE_EVIDENCE_PATH)
+    bundle_module = load_tool("bundle_evidence")
     artifacts = []
     errors: List[str] = []
     for entry in artifacts_spec:
@@ -2077,16 +2071,6 @@ def _resolve_input_path(ctx: RuntimeContext, value: object) -> Optional[Path]:
     return path
 
 
-def _load_tool(name: str, path: Path):
-    import sys
-
-    spec = importlib.util.spec_from_file_location(name, path)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[name] = module
-    spec.loader.exec_module(module)
-    return module
-
-
 def _canonical_json(data: object) -> str:
     return json.dumps(data, sort_keys=True, separators=(",", ":"))
 
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import hashlib
-import importlib.util
 import json
 from dataclasses import dataclass
 from pathlib import Path
@@ -13,16 +12,17 @@ from ..trace import emit_witness_record
 from ..audit.constraint_witness import build_constraint_witness
 from ..execution_token import ExecutionToken
 from ..operators import registry as operator_registry
+from .. import tracing, verification_cache
 from ..observers import papas
 from .context import RuntimeContext
 from .contracts import ExecutionContract
 from .effects import EffectStep, EffectResult, EffectType, get_handler
+from .profiling import RuntimeProfiler
 
 
 ROOT = Path(__file__).resolve().parents[3]
-VERIFY_EPOCH_PATH = ROOT / "tools" / "verify_epoch.py"
-VERIFY_SIGNATURE_PATH = ROOT / "tools" / "verify_anchor_signature.py"
 DEFAULT_TIMESTAMP = "1970-01-01T00:00:00Z"
+VERIFICATION_CACHE_HIT_NOTE = "verification_cache_hit"
 
 
 @dataclass(frozen=True)
@@ -36,9 +36,10 @@ class RuntimeResult:
     constraint_witnesses: List[Dict[str, object]]
     transcript: List[Dict[str, object]]
     observer_reports: List[Dict[str, object]]
+    budget_ledger: Optional[Dict[str, object]] = None
 
     def to_dict(self) -> Dict[str, object]:
-        return {
+        data: Dict[str, object] = {
             "result_id": self.result_id,
             "status": self.status,
             "reasons": list(self.reasons),
@@ -49,9 +50,18 @@ class RuntimeResult:
             "transcript": list(self.transcript),
             "observer_reports": list(self.observer_reports),
         }
+        # budget_ledger is left out: it reflects other runs' spend on the
+        # shared ledger, so callers write it as separate evidence instead.
+        return data
 
 
 class RuntimeEngine:
+    def __init__(self, profiler: Optional[RuntimeProfiler] = None) -> None:
+        # Opt-in; the profile is kept apart from the result so digests and
+        # evidence are the same with or without it.
+        self.profiler = profiler
+
+    @tracing.traced("run")
     def run(
         self,
         plan: object,
@@ -83,6 +93,7 @@ class RuntimeEngine:
                 io_enabled=ctx.io_enabled,
                 constraint_inversion_v1=ctx.constraint_inversion_v1,
                 net_enabled=ctx.net_enabled,
+                budget_account=ctx.budget_account,
             )
         remaining_steps = None
         remaining_delta_s = None
@@ -116,6 +127,7 @@ class RuntimeEngine:
         if contract.require_epoch_verification or contract.require_signature_verification:
             verification, verify_errors = _verify_epoch_and_signature(ctx, contract)
             reasons.extend(verify_errors)
+            cache_hit = bool(verification.pop("cache_hit", False))
 
             witness_records.append(
                 _build_witness(
@@ -125,6 +137,7 @@ class RuntimeEngine:
                     },
                     timestamp=ctx.timestamp,
                     attestation="epoch_verification_witness",
+                    notes=VERIFICATION_CACHE_HIT_NOTE if cache_hit else None,
                 )
             )
 
@@ -157,129 +170,170 @@ class RuntimeEngine:
         if reasons:
             steps = []
 
-        for step in steps:
-            effect_type = str(step.get("effect_type", ""))
-            if remaining_steps is not None and remaining_steps <= 0:
-                reasons.append("budget_steps_exceeded")
-                witness_records.append(
-                    _build_witness(
-                        stage="budget_denied",
-                        artifact_digests={"step": _digest_text(_canonical_json(step))},
-                        timestamp=ctx.timestamp,
-                        attestation="budget_denied_witness",
-                    )
-                )
-                break
-            if remaining_delta_s is not None and _is_measurement_effect(effect_type):
-                if remaining_delta_s <= 0:
-                    reasons.append("delta_s_budget_exceeded")
+        # Units debited for a step whose handler has not returned yet.
+        in_flight: Optional[Dict[str, int]] = None
+        try:
+            for step in steps:
+                effect_type = str(step.get("effect_type", ""))
+                if remaining_steps is not None and remaining_steps <= 0:
+                    reasons.append("budget_steps_exceeded")
                     witness_records.append(
                         _build_witness(
-                            stage="delta_s_budget_denied",
+                            stage="budget_denied",
                             artifact_digests={"step": _digest_text(_canonical_json(step))},
                             timestamp=ctx.timestamp,
-                            attestation="delta_s_budget_denied_witness",
+                            attestation="budget_denied_witness",
                         )
                     )
                     break
-                remaining_delta_s -= 1
-            if remaining_io_calls is not None and _requires_io(step):
-                if remaining_io_calls <= 0:
-                    reasons.append("IOBudgetExceeded")
-                    witness_records.append(
-                        _build_witness(
-                            stage="io_budget_denied",
-                            artifact_digests={"step": _digest_text(_canonical_json(step))},
-                            timestamp=ctx.timestamp,
-                            attestation="io_budget_denied_witness",
+                if remaining_delta_s is not None and _is_measurement_effect(effect_type):
+                    if remaining_delta_s <= 0:
+                        reasons.append("delta_s_budget_exceeded")
+                        witness_records.append(
+                            _build_witness(
+                                stage="delta_s_budget_denied",
+                                artifact_digests={"step": _digest_text(_canonical_json(step))},
+                                timestamp=ctx.timestamp,
+                                attestation="delta_s_budget_denied_witness",
+                            )
                         )
-                    )
-                    break
-                remaining_io_calls -= 1
-            if remaining_net_calls is not None and _requires_net(step):
-                if remaining_net_calls <= 0:
-                    reasons.append("NETBudgetExceeded")
+                        break
+                    remaining_delta_s -= 1
+                if remaining_io_calls is not None and _requires_io(step):
+                    if remaining_io_calls <= 0:
+                        reasons.append("IOBudgetExceeded")
+                        witness_records.append(
+                            _build_witness(
+                                stage="io_budget_denied",
+                                artifact_digests={"step": _digest_text(_canonical_json(step))},
+                                timestamp=ctx.timestamp,
+                                attestation="io_budget_denied_witness",
+                            )
+                        )
+                        break
+                    remaining_io_calls -= 1
+                if remaining_net_calls is not None and _requires_net(step):
+                    if remaining_net_calls <= 0:
+                        reasons.append("NETBudgetExceeded")
+                        witness_records.append(
+                            _build_witness(
+                                stage="net_budget_denied",
+                                artifact_digests={"step": _digest_text(_canonical_json(step))},
+                                timestamp=ctx.timestamp,
+                                attestation="net_budget_denied_witness",
+                            )
+                        )
+                        break
+                    remaining_net_calls -= 1
+
+                if _requires_delta_s(step, ctx.execution_token):
+                    required_roles = _required_delta_s_roles(step)
+                    missing = sorted(required_roles - evidence_roles)
+                    if missing:
+                        reasons.append(f"delta_s_evidence_missing:{','.join(missing)}")
+                        witness_records.append(
+                            _build_witness(
+                                stage="delta_s_gate_denied",
+                                artifact_digests={"step": _digest_text(_canonical_json(step))},
+                                timestamp=ctx.timestamp,
+                                attestation="delta_s_gate_denied_witness",
+                            )
+                        )
+                        break
+                ok, errors = contract.preconditions(step, ctx)
+                if not ok:
+                    reasons.extend(errors)
                     witness_records.append(
                         _build_witness(
-                            stage="net_budget_denied",
+                            stage="step_denied",
                             artifact_digests={"step": _digest_text(_canonical_json(step))},
                             timestamp=ctx.timestamp,
-                            attestation="net_budget_denied_witness",
+                            attestation="step_denied_witness",
                         )
                     )
                     break
-                remaining_net_calls -= 1
-
-            if _requires_delta_s(step, ctx.execution_token):
-                required_roles = _required_delta_s_roles(step)
-                missing = sorted(required_roles - evidence_roles)
-                if missing:
-                    reasons.append(f"delta_s_evidence_missing:{','.join(missing)}")
+                if ctx.budget_account is not None:
+                    in_flight = _ledger_debits(step, effect_type)
+                    exceeded = ctx.budget_account.debit(in_flight)
+                    if exceeded is not None:
+                        in_flight = None
+                        reasons.append(f"ledger_budget_exceeded:{exceeded}")
+                        witness_records.append(
+                            _build_witness(
+                                stage="ledger_budget_denied",
+                                artifact_digests={"step": _digest_text(_canonical_json(step))},
+                                timestamp=ctx.timestamp,
+                                attestation="ledger_budget_denied_witness",
+                            )
+                        )
+                        break
+
+                effect_step = _normalize_effect_step(step)
+                with tracing.span("run.step", step_id=effect_step.step_id, effect_type=str(effect_step.effect_type)):
+                    if self.profiler is not None:
+                        started = self.profiler.start()
+                        effect_result = _execute_effect_with_context(effect_step, ctx)
+                        self.profiler.record_step(
+                            effect_step.step_id,
+                            str(effect_step.effect_type),
+                            started,
+                            artifact_count=len(effect_result.artifact_digests),
+                            ok=effect_result.ok,
+                        )
+                    else:
+                        effect_result = _execute_effect_with_context(effect_step, ctx)
+                in_flight = None
+                if not effect_result.ok:
+                    reasons.extend(effect_result.refusal_reasons)
                     witness_records.append(
                         _build_witness(
-                            stage="delta_s_gate_denied",
+                            stage="step_denied",
                             artifact_digests={"step": _digest_text(_canonical_json(step))},
                             timestamp=ctx.timestamp,
-                            attestation="delta_s_gate_denied_witness",
+                            attestation="step_denied_witness",
                         )
                     )
-                    break
-            ok, errors = contract.preconditions(step, ctx)
-            if not ok:
-                reasons.extend(errors)
-                witness_records.append(
-                    _build_witness(
-                        stage="step_denied",
-                        artifact_digests={"step": _digest_text(_canonical_json(step))},
-                        timestamp=ctx.timestamp,
-                        attestation="step_denied_witness",
-                    )
-                )
-                break
+                else:
+                    post_ok, post_errors = contract.postconditions(step, ctx)
+                    if not post_ok:
+                        reasons.extend(post_errors)
+                        witness_records.append(
+                            _build_witness(
+                                stage="step_denied",
+                                artifact_digests={"step": _digest_text(_canonical_json(step))},
+                                timestamp=ctx.timestamp,
+                                attestation="step_denied_witness",
+                            )
+                        )
 
-            effect_step = _normalize_effect_step(step)
-            effect_result = _execute_effect_with_context(effect_step, ctx)
-            if not effect_result.ok:
-                reasons.extend(effect_result.refusal_reasons)
-                witness_records.append(
-                    _build_witness(
-                        stage="step_denied",
-                        artifact_digests={"step": _digest_text(_canonical_json(step))},
-                        timestamp=ctx.timestamp,
-                        attestation="step_denied_witness",
-                    )
-                )
-            else:
-                post_ok, post_errors = contract.postconditions(step, ctx)
-                if not post_ok:
-                    reasons.extend(post_errors)
+                if effect_result.ok and not reasons:
                     witness_records.append(
                         _build_witness(
-                            stage="step_denied",
+                            stage="step_ok",
                             artifact_digests={"step": _digest_text(_canonical_json(step))},
                             timestamp=ctx.timestamp,
-                            attestation="step_denied_witness",
+                            attestation="step_ok_witness",
                         )
                     )
-
-            if effect_result.ok and not reasons:
-                witness_records.append(
-                    _build_witness(
-                        stage="step_ok",
-                        artifact_digests={"step": _digest_text(_canonical_json(step))},
-                        timestamp=ctx.timestamp,
-                        attestation="step_ok_witness",
-                    )
-                )
-            if effect_result.ok:
-                _update_evidence_roles(evidence_roles, effect_result.artifact_digests)
-            transcript.append(_build_transcript_entry(effect_step, effect_result, plan_dict, len(transcript)))
-            if reasons:
-                break
-            if remaining_steps is not None:
-                remaining_steps -= 1
+                if effect_result.ok:
+                    _update_evidence_roles(evidence_roles, effect_result.artifact_digests)
+                transcript.append(_build_transcript_entry(effect_step, effect_result, plan_dict, len(transcript)))
+                if reasons:
+                    break
+                if remaining_steps is not None:
+                    remaining_steps -= 1
+        finally:
+            if ctx.budget_account is not None:
+                # A handler that raised leaves its step unfinished: hand back that
+                # step's units along with the unused leases before propagating.
+                if in_flight is not None:
+                    ctx.budget_account.refund(in_flight)
+                ctx.budget_account.release()
 
         status = "completed" if not reasons else "denied"
+        budget_ledger: Optional[Dict[str, object]] = None
+        if ctx.budget_account is not None:
+            budget_ledger = ctx.budget_account.snapshot()
 
         if status == "denied":
             witness = build_constraint_witness(
@@ -327,6 +381,7 @@ class RuntimeEngine:
             constraint_witnesses=constraint_witnesses,
             transcript=transcript,
             observer_reports=observer_reports,
+            budget_ledger=budget_ledger,
         )
 
 
@@ -418,17 +473,17 @@ def _verify_epoch_and_signature(
         ]
 
     anchor = json.loads(ctx.epoch_anchor_path.read_text(encoding="utf-8"))
-    verify_epoch = _load_verify_epoch()
-    anchor_ok, anchor_errors = verify_epoch.verify_epoch_anchor(
+    epoch_outcome = verification_cache.verify_epoch_anchor(
         anchor,
         root=ctx.epoch_anchor_path.parents[2],
         git_commit_override=None,
     )
+    anchor_ok = epoch_outcome.ok
+    cache_hit = epoch_outcome.cache_hit
     if not anchor_ok:
-        errors.extend(["epoch verification failed"] + anchor_errors)
+        errors.extend(["epoch verification failed"] + epoch_outcome.errors)
 
     signature_ok = True
-    signature_errors: List[str] = []
     if contract.require_signature_verification:
         if not ctx.epoch_sig_path:
             signature_ok = False
@@ -437,44 +492,32 @@ def _verify_epoch_and_signature(
             signature_ok = False
             errors.append(f"epoch signature not found: {ctx.epoch_sig_path}")
         else:
-            verify_sig = _load_verify_signature()
-            verify_key = verify_sig._load_verify_key(ctx.ci_pubkey_path, "UNUSED")
-            signature_ok, signature_errors = verify_sig.verify_anchor_signature(
+            signature_outcome = verification_cache.verify_anchor_signature(
                 ctx.epoch_anchor_path,
                 ctx.epoch_sig_path,
-                verify_key,
+                ctx.ci_pubkey_path,
             )
+            signature_ok = signature_outcome.ok
+            cache_hit = cache_hit and signature_outcome.cache_hit
             if not signature_ok:
-                errors.extend(["signature verification failed"] + signature_errors)
+                errors.extend(["signature verification failed"] + signature_outcome.errors)
 
+    # ``cache_hit`` is popped by ``run`` before the verification record is
+    # digested, so result ids do not depend on cache state.
     return {
         "anchor_ok": anchor_ok,
         "signature_ok": signature_ok,
         "errors": list(errors),
+        "cache_hit": cache_hit,
     }, errors
 
 
-def _load_verify_epoch():
-    spec = importlib.util.spec_from_file_location("verify_epoch", VERIFY_EPOCH_PATH)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
-
-def _load_verify_signature():
-    spec = importlib.util.spec_from_file_location(
-        "verify_anchor_signature", VERIFY_SIGNATURE_PATH
-    )
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
-
 def _build_witness(
     stage: str,
     artifact_digests: Dict[str, str],
     timestamp: str,
     attestation: str,
+    notes: Optional[str] = None,
 ) -> Dict[str, object]:
     return emit_witness_record(
         observer_id="papas",
@@ -482,6 +525,7 @@ def _build_witness(
         artifact_digests=artifact_digests,
         timestamp=timestamp or DEFAULT_TIMESTAMP,
         attestation=attestation,
+        notes=notes,
     )
 
 
@@ -533,6 +577,15 @@ def _update_evidence_roles(roles: set[str], digests: Dict[str, str]) -> None:
             roles.add("measurement_trace")
 
 
+def _ledger_debits(step: Dict[str, object], effect_type: str) -> Dict[str, int]:
+    return {
+        "steps": 1,
+        "delta_s": 1 if _is_measurement_effect(effect_type) else 0,
+        "io_calls": 1 if _requires_io(step) else 0,
+        "net_calls": 1 if _requires_net(step) else 0,
+    }
+
+
 def _requires_io(step: Dict[str, object]) -> bool:
     requires = step.get("requires")
     if not isinstance(requires, dict):
@@ -0,0 +1,154 @@
+"""Opt-in cost profiling for runtime steps (tooling-only, not evidence).
+
+A ``RuntimeProfiler`` handed to ``RuntimeEngine`` records, for each executed
+step, wall and CPU time, bytes read and written by the process, the number
+of artifacts produced and the growth of peak RSS, and aggregates them per
+effect type. Callers can time surrounding phases (redaction, bundling) with
+``phase()``. The profile is written to its own ``runtime_profile.json`` and
+never enters results, transcripts or bundles, so digests are unaffected.
+
+Byte counters come from ``/proc/self/io`` and peak RSS from ``resource``;
+where either is unavailable the fields are None.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+
+PROFILE_FORMAT = "hpl.runtime_profile.v1"
+PROFILE_FILENAME = "runtime_profile.json"
+_PROC_IO = Path("/proc/self/io")
+_COST_FIELDS = ("wall_s", "cpu_s", "bytes_read", "bytes_written", "artifact_count", "peak_rss_delta_bytes")
+
+
+@dataclass(frozen=True)
+class _Sample:
+    wall: float
+    cpu: float
+    io: Optional[Tuple[int, int]]
+    io_probe_bytes: int
+    max_rss: Optional[int]
+
+
+class RuntimeProfiler:
+    def __init__(self) -> None:
+        self.steps: List[Dict[str, object]] = []
+        self.phases: List[Dict[str, object]] = []
+
+    def start(self) -> _Sample:
+        return _sample()
+
+    def record_step(
+        self,
+        step_id: str,
+        effect_type: str,
+        start: _Sample,
+        artifact_count: int,
+        ok: bool,
+    ) -> None:
+        record: Dict[str, object] = {"step_id": step_id, "effect_type": effect_type, "ok": ok}
+        record.update(_costs(start, _sample()))
+        record["artifact_count"] = artifact_count
+        self.steps.append(record)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = _sample()
+        try:
+            yield
+        finally:
+            record: Dict[str, object] = {"phase": name}
+            record.update(_costs(start, _sample()))
+            self.phases.append(record)
+
+    def to_dict(self) -> Dict[str, object]:
+        by_effect_type: Dict[str, Dict[str, object]] = {}
+        for step in self.steps:
+            bucket = by_effect_type.setdefault(str(step["effect_type"]), {"count": 0})
+            bucket["count"] = int(bucket["count"]) + 1  # type: ignore[arg-type]
+            for name in _COST_FIELDS:
+                value = step.get(name)
+                if value is None:
+                    bucket.setdefault(name, None)
+                elif name == "peak_rss_delta_bytes":
+                    bucket[name] = max(int(bucket.get(name) or 0), int(value))  # type: ignore[arg-type]
+                else:
+                    bucket[name] = (bucket.get(name) or 0) + value  # type: ignore[operator]
+        for bucket in by_effect_type.values():
+            for name in ("wall_s", "cpu_s"):
+                if isinstance(bucket.get(name), float):
+                    bucket[name] = round(bucket[name], 9)  # type: ignore[arg-type]
+        return {
+            "format": PROFILE_FORMAT,
+            "steps": list(self.steps),
+            "by_effect_type": {name: by_effect_type[name] for name in sorted(by_effect_type)},
+            "phases": list(self.phases),
+        }
+
+    def write_json(self, path: Path) -> None:
+        path.write_text(json.dumps(self.to_dict(), indent=2, sort_keys=True), encoding="utf-8")
+
+
+def _sample() -> _Sample:
+    io, probe_bytes = _read_io_counters()
+    return _Sample(
+        wall=time.perf_counter(),
+        cpu=time.process_time(),
+        io=io,
+        io_probe_bytes=probe_bytes,
+        max_rss=_max_rss_bytes(),
+    )
+
+
+def _costs(start: _Sample, end: _Sample) -> Dict[str, object]:
+    bytes_read: Optional[int] = None
+    bytes_written: Optional[int] = None
+    if start.io is not None and end.io is not None:
+        # The read of /proc/self/io for ``start`` is itself counted in ``end``.
+        bytes_read = max(0, end.io[0] - start.io[0] - start.io_probe_bytes)
+        bytes_written = end.io[1] - start.io[1]
+    peak_rss_delta: Optional[int] = None
+    if start.max_rss is not None and end.max_rss is not None:
+        peak_rss_delta = end.max_rss - start.max_rss
+    return {
+        "wall_s": round(end.wall - start.wall, 9),
+        "cpu_s": round(end.cpu - start.cpu, 9),
+        "bytes_read": bytes_read,
+        "bytes_written": bytes_written,
+        "peak_rss_delta_bytes": peak_rss_delta,
+    }
+
+
+def _read_io_counters() -> Tuple[Optional[Tuple[int, int]], int]:
+    try:
+        raw = _PROC_IO.read_bytes()
+    except OSError:
+        return None, 0
+    counters: Dict[str, int] = {}
+    for line in raw.decode("ascii", "replace").splitlines():
+        name, _, value = line.partition(":")
+        if value.strip().isdigit():
+            counters[name.strip()] = int(value)
+    if "rchar" not in counters or "wchar" not in counters:
+        return None, 0
+    return (counters["rchar"], counters["wchar"]), len(raw)
+
+
+def _max_rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+    return int(max_rss) if sys.platform == "darwin" else int(max_rss) * 1024
@@ -2,9 +2,13 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from ..cache import JsonCache, cache_key
 
 
 ROOT = Path(__file__).resolve().parents[3]
@@ -28,18 +32,48 @@ _SECRET_PATTERNS: List[Tuple[str, re.Pattern[str]]] = [
 ]
 
 
-def scan_artifacts(paths: List[Path]) -> Dict[str, object]:
+# Literal anchors (lowercase) that must occur case-insensitively for a pattern
+# to match. One anchor sweep selects which full patterns need to run; files
+# without any anchor skip the per-pattern passes and the JSON re-parse.
+_PATTERN_ANCHORS: Dict[str, Tuple[str, ...]] = {
+    "private_key_block": ("-----begin ",),
+    "openssh_key": ("-----begin ",),
+    "aws_access_key": ("akia",),
+    "aws_secret_key": ("aws_secret_access_key",),
+    "github_token": ("ghp_",),
+    "slack_token": ("xox",),
+    "stripe_secret": ("sk_",),
+    "bearer_token": ("bearer",),
+    "secret_field": ("api_key", "apikey", "secret", "password"),
+}
+_SECRET_KEY_ANCHORS: Tuple[str, ...] = ("secret", "password", "api_key", "apikey")
+_ANCHORS: Tuple[str, ...] = tuple(
+    sorted({anchor for anchors in _PATTERN_ANCHORS.values() for anchor in anchors} | set(_SECRET_KEY_ANCHORS))
+)
+# Non-ASCII characters that re.IGNORECASE treats as equal to an ASCII anchor
+# letter; folding them keeps the anchor sweep a superset of the regex matches.
+_FOLD_TABLE = str.maketrans({"\u212a": "k", "\u017f": "s", "\u0130": "i", "\u0131": "i"})
+_JSON_WHITESPACE = " \t\n\r"
+DEFAULT_MAX_WORKERS = 8
+POLICY_VERSION = "v1"
+# Cached findings are keyed by file digest and by this fingerprint. It hashes
+# this module's source, as compile_cache does for the compiler, so editing a
+# pattern, the anchors or the secret-key JSON check invalidates earlier results.
+_POLICY_FINGERPRINT = cache_key(POLICY_VERSION, hashlib.sha256(Path(__file__).read_bytes()).hexdigest())
+_SCAN_CACHE = JsonCache("redaction")
+
+
+def scan_artifacts(paths: List[Path], max_workers: Optional[int] = None) -> Dict[str, object]:
     findings: List[Dict[str, object]] = []
     scanned: List[Dict[str, object]] = []
 
-    for path in sorted(paths, key=lambda item: str(item)):
-        try:
-            data = path.read_bytes()
-        except OSError:
+    ordered = sorted(paths, key=lambda item: str(item))
+    for entry in _map_files(ordered, max_workers):
+        if entry is None:
             continue
-        display_path = _display_path(path)
-        scanned.append({"path": display_path, "digest": _digest_bytes(data)})
-        findings.extend(_scan_bytes(data, display_path))
+        scanned_entry, file_findings = entry
+        scanned.append(scanned_entry)
+        findings.extend(file_findings)
 
     findings = sorted(findings, key=lambda item: (item["path"], item["pattern"]))
     errors = [f"secret pattern {item['pattern']} in {item['path']}" for item in findings]
@@ -47,7 +81,7 @@ def scan_artifacts(paths: List[Path]) -> Dict[str, object]:
     return {
         "ok": not findings,
         "policy": {
-            "version": "v1",
+            "version": POLICY_VERSION,
             "pattern_ids": [pattern_id for pattern_id, _ in _SECRET_PATTERNS],
         },
         "findings": findings,
@@ -56,11 +90,45 @@ def scan_artifacts(paths: List[Path]) -> Dict[str, object]:
     }
 
 
+def _map_files(
+    paths: List[Path], max_workers: Optional[int]
+) -> List[Optional[Tuple[Dict[str, object], List[Dict[str, object]]]]]:
+    workers = max_workers if max_workers is not None else min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+    workers = min(workers, len(paths))
+    if workers <= 1:
+        return [_scan_file(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_scan_file, paths))
+
+
+def _scan_file(path: Path) -> Optional[Tuple[Dict[str, object], List[Dict[str, object]]]]:
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    display_path = _display_path(path)
+    digest = _digest_bytes(data)
+    key = cache_key(_POLICY_FINGERPRINT, digest)
+    cached = _SCAN_CACHE.get(key)
+    if isinstance(cached, list):
+        findings = [{"path": display_path, **item} for item in cached]
+    else:
+        findings = _scan_bytes(data, display_path)
+        _SCAN_CACHE.put(
+            key,
+            [{"pattern": item["pattern"], "match_digest": item["match_digest"]} for item in findings],
+        )
+    return {"path": display_path, "digest": digest}, findings
+
+
 def _scan_bytes(data: bytes, display_path: str) -> List[Dict[str, object]]:
     text = data.decode("utf-8", errors="ignore")
+    anchors = _find_anchors(text)
     matches: List[Dict[str, object]] = []
 
     for pattern_id, regex in _SECRET_PATTERNS:
+        if anchors.isdisjoint(_PATTERN_ANCHORS[pattern_id]):
+            continue
         for match in regex.finditer(text):
             value = match.group(0)
             if _looks_like_safe_hash(value):
@@ -72,11 +140,23 @@ def _scan_bytes(data: bytes, display_path: str) -> List[Dict[str, object]]:
                     "match_digest": _digest_text(value),
                 }
             )
-    if not matches:
+    if not matches and _may_contain_secret_key(text, anchors):
         matches.extend(_scan_json(text, display_path))
     return matches
 
 
+def _find_anchors(text: str) -> FrozenSet[str]:
+    folded = text.lower() if text.isascii() else text.translate(_FOLD_TABLE).lower()
+    return frozenset(anchor for anchor in _ANCHORS if anchor in folded)
+
+
+def _may_contain_secret_key(text: str, anchors: FrozenSet[str]) -> bool:
+    if not text.lstrip(_JSON_WHITESPACE).startswith("{"):
+        return False
+    # Escaped keys ("\u0073ecret") only reveal their anchor after decoding.
+    return not anchors.isdisjoint(_SECRET_KEY_ANCHORS) or "\\u" in text
+
+
 def _scan_json(text: str, display_path: str) -> List[Dict[str, object]]:
     try:
         payload = json.loads(text)
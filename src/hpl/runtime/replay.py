@@ -0,0 +1,287 @@
+"""Bulk replay of archived plans against the current runtime (tooling-only).
+
+An archive is a set of (plan, result) pairs: each ``plan.json`` run
+earlier, and the ``runtime.json`` it produced. ``replay`` re-executes every
+plan with ``RuntimeEngine`` and compares the new result with the stored one.
+It checks ``result_id`` and the transcript digest, and for a divergent
+plan it reports the first transcript step that differs.
+
+Plans are spread over a process pool. The workers import the engine and
+effect handlers once and are reused for every plan they take, so the
+per-plan cost is the run itself. Reports are yielded as plans finish, so
+callers can stream them. A pair that fails, even by crashing its worker, is
+reported as an error and the other pairs carry on.
+
+Each replay runs in its own scratch directory seeded with a copy of the
+files archived next to the plan, so the archive itself is never written.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from ..execution_token import normalize_backend
+from .contracts import load_contract
+
+
+REPLAY_FORMAT = "hpl.replay.v1"
+MANIFEST_FORMAT = "hpl.replay_manifest.v1"
+PLAN_FILENAME = "plan.json"
+RESULT_FILENAME = "runtime.json"
+CONTRACT_FILENAME = "contract.json"
+
+
+@dataclass(frozen=True)
+class ReplayPair:
+    pair_id: str
+    plan_path: Path
+    result_path: Path
+    contract_path: Optional[Path] = None
+
+
+@dataclass(frozen=True)
+class ReplayOptions:
+    contract_path: Optional[Path] = None
+    anchor_path: Optional[Path] = None
+    sig_path: Optional[Path] = None
+    pub_path: Optional[Path] = None
+    io_enabled: bool = False
+    net_enabled: bool = False
+    work_root: Optional[Path] = None
+    # The backend the archived runs requested, as given to `hpl run --backend`.
+    backend: Optional[str] = None
+
+
+def load_pairs(source: Path) -> List[ReplayPair]:
+    """Pairs from a manifest file, or every plan/result pair under a directory.
+
+    In a directory, each ``plan.json`` with a sibling ``runtime.json`` is a
+    pair, identified by its directory relative to ``source``. A sibling
+    ``contract.json`` is used as its contract.
+    """
+    source = Path(source)
+    if source.is_file():
+        return _load_manifest(source)
+    if not source.is_dir():
+        raise ValueError(f"replay source not found: {source}")
+    pairs: List[ReplayPair] = []
+    for plan_path in sorted(source.rglob(PLAN_FILENAME)):
+        result_path = plan_path.with_name(RESULT_FILENAME)
+        if not result_path.is_file():
+            continue
+        contract_path = plan_path.with_name(CONTRACT_FILENAME)
+        relative = plan_path.parent.relative_to(source).as_posix()
+        pairs.append(
+            ReplayPair(
+                pair_id=relative if relative != "." else source.name,
+                plan_path=plan_path,
+                result_path=result_path,
+                contract_path=contract_path if contract_path.is_file() else None,
+            )
+        )
+    return pairs
+
+
+def replay(pairs: Sequence[ReplayPair], options: ReplayOptions, jobs: int = 1) -> Iterator[Dict[str, object]]:
+    """Replay ``pairs`` and yield one report per pair in completion order."""
+    if jobs <= 1 or len(pairs) <= 1:
+        for pair in pairs:
+            yield replay_pair(pair, options)
+        return
+    with ProcessPoolExecutor(max_workers=min(jobs, len(pairs)), initializer=_warm_runtime) as pool:
+        futures = {pool.submit(replay_pair, pair, options): pair for pair in pairs}
+        for future in as_completed(futures):
+            try:
+                report = future.result()
+            except Exception as exc:
+                # A worker that died (BrokenProcessPool) fails its pairs, not the stream.
+                report = _error_report(futures[future], exc)
+            yield report
+
+
+def replay_pair(pair: ReplayPair, options: ReplayOptions) -> Dict[str, object]:
+    report = _base_report(pair)
+    try:
+        plan = _read_json(pair.plan_path)
+        archived = _read_json(pair.result_path)
+        if options.work_root is not None:
+            work_dir = options.work_root / _safe_name(pair.pair_id)
+            replayed = _run(plan, pair, options, _stage(pair, work_dir))
+        else:
+            with tempfile.TemporaryDirectory(prefix="hpl_replay_") as tmp_dir:
+                replayed = _run(plan, pair, options, _stage(pair, Path(tmp_dir)))
+    except Exception as exc:
+        # A malformed pair is reported on its own and never stops the replay.
+        return _error_report(pair, exc)
+    report.update(diff_results(archived, replayed))
+    return report
+
+
+def diff_results(archived: Dict[str, object], replayed: Dict[str, object]) -> Dict[str, object]:
+    """Compare two runtime results by result id, status and transcript."""
+    archived_transcript = _transcript(archived)
+    replayed_transcript = _transcript(replayed)
+    archived_digest = _digest_json(archived_transcript)
+    replayed_digest = _digest_json(replayed_transcript)
+    match = archived.get("result_id") == replayed.get("result_id") and archived_digest == replayed_digest
+    return {
+        "match": match,
+        "result_id": {"archived": archived.get("result_id"), "replayed": replayed.get("result_id")},
+        "status": {"archived": archived.get("status"), "replayed": replayed.get("status")},
+        "transcript_digest": {"archived": archived_digest, "replayed": replayed_digest},
+        "first_divergence": None if match else first_divergence(archived_transcript, replayed_transcript),
+        "differing_fields": []
+        if match
+        else sorted(key for key in set(archived) | set(replayed) if archived.get(key) != replayed.get(key)),
+    }
+
+
+def first_divergence(
+    archived: Sequence[Dict[str, object]],
+    replayed: Sequence[Dict[str, object]],
+) -> Optional[Dict[str, object]]:
+    """First transcript index whose entries differ, with the fields that do."""
+    for index in range(max(len(archived), len(replayed))):
+        before = archived[index] if index < len(archived) else None
+        after = replayed[index] if index < len(replayed) else None
+        if before == after:
+            continue
+        if before is None or after is None:
+            fields = ["missing_in_archive" if before is None else "missing_in_replay"]
+        else:
+            fields = sorted(key for key in set(before) | set(after) if before.get(key) != after.get(key))
+        return {
+            "index": index,
+            "step_id": (after or before or {}).get("step_id"),
+            "fields": fields,
+            "archived": before,
+            "replayed": after,
+        }
+    return None
+
+
+def summarize(reports: Sequence[Dict[str, object]]) -> Dict[str, object]:
+    errors = sum(1 for report in reports if "error" in report)
+    matched = sum(1 for report in reports if report.get("match"))
+    return {
+        "format": REPLAY_FORMAT,
+        "summary": {
+            "plans": len(reports),
+            "matched": matched,
+            "diverged": len(reports) - matched - errors,
+            "errors": errors,
+        },
+        "ok": matched == len(reports),
+    }
+
+
+def default_jobs() -> int:
+    return max(1, os.cpu_count() or 1)
+
+
+def _run(plan: Dict[str, object], pair: ReplayPair, options: ReplayOptions, work_dir: Path) -> Dict[str, object]:
+    from ..execution_token import ExecutionToken
+    from .context import RuntimeContext
+    from .engine import RuntimeEngine
+
+    token_dict = plan.get("execution_token")
+    backend = normalize_backend(options.backend)
+    ctx = RuntimeContext(
+        epoch_anchor_path=options.anchor_path,
+        epoch_sig_path=options.sig_path,
+        ci_pubkey_path=options.pub_path,
+        execution_token=ExecutionToken.from_dict(token_dict) if isinstance(token_dict, dict) else None,
+        requested_backend=backend,
+        io_enabled=options.io_enabled,
+        net_enabled=options.net_enabled,
+        trace_sink=work_dir,
+    )
+    # Gate steps exactly as `hpl run` did: the archived contract, else the plan's steps.
+    contract = load_contract(pair.contract_path or options.contract_path, plan, required_backend=backend)
+    return RuntimeEngine().run(plan, ctx, contract).to_dict()
+
+
+def _base_report(pair: ReplayPair) -> Dict[str, object]:
+    return {
+        "format": REPLAY_FORMAT,
+        "pair_id": pair.pair_id,
+        "plan": str(pair.plan_path),
+        "result": str(pair.result_path),
+    }
+
+
+def _error_report(pair: ReplayPair, exc: BaseException) -> Dict[str, object]:
+    report = _base_report(pair)
+    report.update({"match": False, "error": str(exc) or type(exc).__name__})
+    return report
+
+
+def _stage(pair: ReplayPair, work_dir: Path) -> Path:
+    # Plan steps name their inputs relative to the run's work directory, so
+    # the replay runs on a copy of the files archived next to the plan.
+    work_dir.mkdir(parents=True, exist_ok=True)
+    for path in pair.plan_path.parent.iterdir():
+        if path.is_file():
+            shutil.copy2(path, work_dir / path.name)
+    return work_dir
+
+
+def _load_manifest(path: Path) -> List[ReplayPair]:
+    manifest = _read_json(path)
+    if manifest.get("format") != MANIFEST_FORMAT:
+        raise ValueError(f"unsupported replay manifest format: {manifest.get('format')}")
+    base = path.parent
+    pairs: List[ReplayPair] = []
+    entries = manifest.get("pairs", [])
+    for index, entry in enumerate(entries if isinstance(entries, list) else []):
+        if not isinstance(entry, dict) or "plan" not in entry or "result" not in entry:
+            raise ValueError(f"replay manifest entry {index} needs plan and result")
+        contract = entry.get("contract")
+        pairs.append(
+            ReplayPair(
+                pair_id=str(entry.get("id", index)),
+                plan_path=base / str(entry["plan"]),
+                result_path=base / str(entry["result"]),
+                contract_path=base / str(contract) if contract else None,
+            )
+        )
+    return pairs
+
+
+def _warm_runtime() -> None:
+    # Import the engine and every effect handler once per worker process.
+    from . import engine  # noqa: F401
+    from .effects import handlers  # noqa: F401
+    from ..operators import registry  # noqa: F401
+
+
+def _transcript(result: Dict[str, object]) -> List[Dict[str, object]]:
+    transcript = result.get("transcript")
+    return [entry for entry in transcript if isinstance(entry, dict)] if isinstance(transcript, list) else []
+
+
+def _read_json(path: Path) -> Dict[str, object]:
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"invalid json in {path}: {exc}") from exc
+    if not isinstance(data, dict):
+        raise ValueError(f"expected a JSON object in {path}")
+    return data
+
+
+def _digest_json(data: object) -> str:
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return f"sha256:{hashlib.sha256(canonical.encode('utf-8')).hexdigest()}"
+
+
+def _safe_name(pair_id: str) -> str:
+    return "".join(char if char.isalnum() or char in "-_." else "_" for char in pair_id) or "pair"
@@ -2,24 +2,25 @@
 
 from __future__ import annotations
 
+import copy
 import hashlib
-import importlib.util
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .trace import emit_witness_record
-from .execution_token import ExecutionToken
+from .execution_token import ExecutionToken, TokenMinter
 from .operators import registry as operator_registry
+from .plan_templates import Param, PlanTemplate, StepTemplate
+from . import tracing, verification_cache
 
 
 ROOT = Path(__file__).resolve().parents[2]
-VERIFY_EPOCH_PATH = ROOT / "tools" / "verify_epoch.py"
-VERIFY_SIGNATURE_PATH = ROOT / "tools" / "verify_anchor_signature.py"
 DEFAULT_PUBLIC_KEY = ROOT / "config" / "keys" / "ci_ed25519.pub"
 DEFAULT_TIMESTAMP = "1970-01-01T00:00:00Z"
 DEFAULT_ALLOWED_BACKENDS = ["PYTHON", "CLASSICAL", "QASM"]
+VERIFICATION_CACHE_HIT_NOTE = "verification_cache_hit"
 
 
 @dataclass(frozen=True)
@@ -101,6 +102,7 @@ class ExecutionPlan:
         }
 
 
+@tracing.traced("plan")
 def plan(program_ir: Dict[str, object], ctx: SchedulerContext) -> ExecutionPlan:
     program_id = str(program_ir.get("program_id", "unknown"))
     reasons: List[str] = []
@@ -119,37 +121,17 @@ def plan(program_ir: Dict[str, object], ctx: SchedulerContext) -> ExecutionPlan:
         collapse_requires_delta_s=ctx.collapse_requires_delta_s,
     )
 
-    registry_sources: List[str] = []
-    if ctx.operator_registry_enforced:
-        registry = operator_registry.load_operator_registries(
-            root=ctx.root, registry_paths=ctx.operator_registry_paths
-        )
-        registry_sources = [str(path.relative_to(ctx.root)) for path in registry.sources]
-        ok, registry_errors = operator_registry.validate_program_operators(
-            program_ir, registry, enforce=True
-        )
-        if not ok:
-            reasons.extend(registry_errors)
+    registry_sources, registry_errors = _check_operator_registry(program_ir, ctx)
+    reasons.extend(registry_errors)
 
     if ctx.require_epoch_verification:
-        verification, verification_errors = _verify_epoch_and_signature(ctx)
+        verification, verification_errors, witness = _verify_for_plan(ctx)
         reasons.extend(verification_errors)
+        witness_records.append(witness)
 
-        witness_records.append(
-            _build_witness(
-                stage="epoch_verification",
-                artifact_digests={
-                    "anchor_verification": _digest_text(
-                        _canonical_json(verification)
-                    )
-                },
-                timestamp=ctx.timestamp,
-                attestation="epoch_verification_witness",
-            )
-        )
-
+    steps_json: Optional[str] = None
     if ctx.emit_effect_steps:
-        steps = _build_effect_steps(program_ir, ctx)
+        steps, steps_json = _render_effect_steps(program_ir, ctx)
     else:
         steps = _build_steps(program_ir)
     status = "planned" if not reasons else "denied"
@@ -164,7 +146,7 @@ def plan(program_ir: Dict[str, object], ctx: SchedulerContext) -> ExecutionPlan:
         "operator_registry_enforced": ctx.operator_registry_enforced,
         "operator_registry_paths": registry_sources,
     }
-    plan_id = _digest_text(_canonical_json(plan_core))
+    plan_id = _digest_text(_canonical_json_with(plan_core, "steps", steps_json))
 
     witness_records.append(
         _build_witness(
@@ -189,619 +171,486 @@ def plan(program_ir: Dict[str, object], ctx: SchedulerContext) -> ExecutionPlan:
     )
 
 
-def _build_steps(program_ir: Dict[str, object]) -> List[Dict[str, object]]:
-    hamiltonian = program_ir.get("hamiltonian", {})
-    terms = hamiltonian.get("terms", []) if isinstance(hamiltonian, dict) else []
-    steps: List[Dict[str, object]] = []
-    if not isinstance(terms, list):
-        return steps
-    for idx, term in enumerate(terms):
-        if not isinstance(term, dict):
-            continue
-        steps.append(
-            {
-                "index": idx,
-                "operator_id": str(term.get("operator_id", "unknown")),
-                "cls": str(term.get("cls", "unknown")),
-                "coefficient": term.get("coefficient", 0.0),
-            }
-        )
-    return steps
-
-
-def _build_effect_steps(program_ir: Dict[str, object], ctx: SchedulerContext) -> List[Dict[str, object]]:
-    steps: List[Dict[str, object]] = []
-    index = 0
-
-    def add_step(step: Dict[str, object]) -> None:
-        nonlocal index
-        steps.append(step)
-        index += 1
-
-    if ctx.track == "ci_governance":
-        return _build_ci_governance_steps(program_ir, ctx)
-    if ctx.track == "agent_governance":
-        return _build_agent_governance_steps(program_ir, ctx)
-    if ctx.track == "trading_paper_mode":
-        return _build_trading_paper_steps(program_ir, ctx)
-    if ctx.track == "trading_shadow_mode":
-        return _build_trading_shadow_steps(program_ir, ctx)
-    if ctx.track == "trading_io_shadow":
-        return _build_trading_io_shadow_steps(program_ir, ctx)
-    if ctx.track == "trading_io_live_min":
-        return _build_trading_io_live_min_steps(program_ir, ctx)
-    if ctx.track == "navier_stokes":
-        return _build_navier_stokes_steps(program_ir, ctx)
-    if ctx.track == "net_shadow":
-        return _build_net_shadow_steps(program_ir, ctx)
-
-    if ctx.ecmo_input_path:
-        selection_args: Dict[str, object] = {"input_path": str(ctx.ecmo_input_path)}
-        if ctx.measurement_selection_path:
-            selection_args["out_path"] = str(ctx.measurement_selection_path)
-        add_step(
-            {
-                "step_id": f"select_measurement_track_{index}",
-                "effect_type": "SELECT_MEASUREMENT_TRACK",
-                "args": selection_args,
-                "requires": {},
-            }
-        )
-
-    if ctx.require_epoch_verification and ctx.anchor_path:
-        add_step(
-            {
-                "step_id": f"verify_epoch_{index}",
-                "effect_type": "VERIFY_EPOCH",
-                "args": {"anchor_path": str(ctx.anchor_path)},
-                "requires": {},
-            }
-        )
-        if ctx.signature_path:
-            add_step(
-                {
-                    "step_id": f"verify_signature_{index}",
-                    "effect_type": "VERIFY_SIGNATURE",
-                    "args": {
-                        "anchor_path": str(ctx.anchor_path),
-                        "sig_path": str(ctx.signature_path),
-                        "pub_path": str(ctx.public_key_path),
-                    },
-                    "requires": {},
-                }
-            )
-
-    backend_target = (ctx.backend_target or "classical").upper()
-    artifact_paths = ctx.artifact_paths or {}
-    backend_ir_path = artifact_paths.get("backend_ir")
-    qasm_path = artifact_paths.get("qasm")
-
-    backend_args: Dict[str, object] = {
-        "program_ir": program_ir,
-        "backend_target": backend_target,
+# Fields a PlanSession fixes when it opens; all other SchedulerContext fields
+# (budget, timestamp, artifact paths, IO/NET arguments) can be bound per plan.
+SESSION_FIXED_FIELDS = frozenset(
+    {
+        "require_epoch_verification",
+        "anchor_path",
+        "signature_path",
+        "public_key_path",
+        "root",
+        "git_commit_override",
+        "allowed_backends",
+        "determinism_mode",
+        "io_policy",
+        "net_policy",
+        "delta_s_policy",
+        "delta_s_budget",
+        "measurement_modes_allowed",
+        "collapse_requires_delta_s",
+        "emit_effect_steps",
+        "track",
+        "operator_registry_enforced",
+        "operator_registry_paths",
     }
-    if backend_ir_path:
-        backend_args["out_path"] = backend_ir_path
-    add_step(
-        {
-            "step_id": f"lower_backend_ir_{index}",
-            "effect_type": "LOWER_BACKEND_IR",
-            "args": backend_args,
-            "requires": {"backend": backend_target},
-        }
-    )
-
-    if backend_target == "QASM":
-        qasm_args: Dict[str, object] = {"program_ir": program_ir}
-        if qasm_path:
-            qasm_args["out_path"] = qasm_path
-        add_step(
-            {
-                "step_id": f"lower_qasm_{index}",
-                "effect_type": "LOWER_QASM",
-                "args": qasm_args,
-                "requires": {"backend": backend_target},
-            }
+)
+
+
+_CONTEXT_FIELDS = frozenset(field.name for field in fields(SchedulerContext))
+
+
+class PlanSession:
+    """Issues plans for one program under one static scheduler context.
+
+    Opening a session does once what ``plan()`` repeats per call: IO/NET
+    policy normalization, operator-registry validation, epoch verification,
+    and encoding the plan fields that cannot change. Each ``plan()`` then
+    binds per-event context fields, mints a token, renders the steps and
+    hashes the spliced ``plan_id`` preimage. The result equals
+    ``scheduler.plan(program_ir, replace(ctx, **bindings))`` while the
+    program IR and the files behind the fixed fields stay unchanged.
+    """
+
+    def __init__(self, program_ir: Dict[str, object], ctx: SchedulerContext) -> None:
+        self.program_ir = program_ir
+        self.ctx = ctx
+        self.program_id = str(program_ir.get("program_id", "unknown"))
+        self._minter = TokenMinter(
+            allowed_backends=ctx.allowed_backends or list(DEFAULT_ALLOWED_BACKENDS),
+            determinism_mode=ctx.determinism_mode,
+            io_policy=ctx.io_policy,
+            net_policy=ctx.net_policy,
+            delta_s_policy=ctx.delta_s_policy,
+            delta_s_budget=ctx.delta_s_budget,
+            measurement_modes_allowed=ctx.measurement_modes_allowed,
+            collapse_requires_delta_s=ctx.collapse_requires_delta_s,
         )
-
-    return steps
-
-
-def _build_ci_governance_steps(program_ir: Dict[str, object], ctx: SchedulerContext) -> List[Dict[str, object]]:
-    steps: List[Dict[str, object]] = []
-    index = 0
-
-    def add_step(step: Dict[str, object]) -> None:
-        nonlocal index
-        steps.append(step)
-        index += 1
-
-    if ctx.ci_repo_state_path:
-        add_step(
-            {
-                "step_id": f"check_repo_state_{index}",
-                "effect_type": "CHECK_REPO_STATE",
-                "args": {"state_path": str(ctx.ci_repo_state_path)},
-                "requires": {},
-            }
+        self._registry_sources, reasons = _check_operator_registry(program_ir, ctx)
+        self._verification: Optional[Dict[str, object]] = None
+        self._epoch_witness: Optional[Dict[str, object]] = None
+        if ctx.require_epoch_verification:
+            self._verification, verification_errors, self._epoch_witness = _verify_for_plan(ctx)
+            reasons.extend(verification_errors)
+        self._reasons = reasons
+        self.status = "planned" if not reasons else "denied"
+        self._template, self._bind_params = _EFFECT_TEMPLATES.get(
+            ctx.track or "", (DEFAULT_EFFECT_TEMPLATE, _default_params)
         )
-
-    add_step(
-        {
-            "step_id": f"validate_registries_{index}",
-            "effect_type": "VALIDATE_REGISTRIES",
-            "args": {},
-            "requires": {},
-        }
-    )
-
-    if ctx.ci_coupling_registry_path:
-        add_step(
+        self._steps_json = None if ctx.emit_effect_steps else _canonical_json(_build_steps(program_ir))
+        self._frame = _json_frame(
             {
-                "step_id": f"validate_coupling_{index}",
-                "effect_type": "VALIDATE_COUPLING_TOPOLOGY",
-                "args": {"registry_path": str(ctx.ci_coupling_registry_path)},
-                "requires": {},
-            }
+                "program_id": self.program_id,
+                "status": self.status,
+                "reasons": reasons,
+                "verification": self._verification,
+                "operator_registry_enforced": ctx.operator_registry_enforced,
+                "operator_registry_paths": self._registry_sources,
+            },
+            ("execution_token", "steps"),
         )
 
-    if ctx.require_epoch_verification and ctx.anchor_path:
-        add_step(
-            {
-                "step_id": f"verify_epoch_{index}",
-                "effect_type": "VERIFY_EPOCH",
-                "args": {"anchor_path": str(ctx.anchor_path)},
-                "requires": {},
-            }
-        )
-        if ctx.signature_path:
-            add_step(
-                {
-                    "step_id": f"verify_signature_{index}",
-                    "effect_type": "VERIFY_SIGNATURE",
-                    "args": {
-                        "anchor_path": str(ctx.anchor_path),
-                        "sig_path": str(ctx.signature_path),
-                        "pub_path": str(ctx.public_key_path),
-                    },
-                    "requires": {},
-                }
+    @tracing.traced("plan")
+    def plan(self, **bindings: object) -> ExecutionPlan:
+        ctx = _bind_context(self.ctx, bindings) if bindings else self.ctx
+        token, token_json = self._minter.render(ctx.budget_steps)
+        if ctx.emit_effect_steps:
+            steps, steps_json = self._template.render(self._bind_params(self.program_ir, ctx))
+        else:
+            steps, steps_json = _build_steps(self.program_ir), self._steps_json
+        head, middle, tail = self._frame
+        plan_id = _digest_text(f"{head}{token_json}{middle}{steps_json}{tail}")
+
+        witness_records: List[Dict[str, object]] = []
+        if self._epoch_witness is not None:
+            # Verified once, but stamped per plan like plan() stamps it.
+            epoch_witness = copy.deepcopy(self._epoch_witness)
+            epoch_witness["timestamp"] = ctx.timestamp
+            witness_records.append(epoch_witness)
+        witness_records.append(
+            _build_witness(
+                stage="scheduler_plan",
+                artifact_digests={"plan_id": plan_id},
+                timestamp=ctx.timestamp,
+                attestation="scheduler_plan_witness",
             )
+        )
+        return ExecutionPlan(
+            plan_id=plan_id,
+            program_id=self.program_id,
+            status=self.status,
+            steps=steps,
+            reasons=list(self._reasons),
+            verification=copy.deepcopy(self._verification),
+            witness_records=witness_records,
+            execution_token=token.to_dict(),
+            operator_registry_enforced=self.ctx.operator_registry_enforced,
+            operator_registry_paths=list(self._registry_sources),
+        )
 
-    backend_target = (ctx.backend_target or "classical").upper()
-    artifact_paths = ctx.artifact_paths or {}
-    backend_ir_path = artifact_paths.get("backend_ir")
-    backend_args: Dict[str, object] = {
-        "program_ir": program_ir,
-        "backend_target": backend_target,
-    }
-    if backend_ir_path:
-        backend_args["out_path"] = backend_ir_path
-    add_step(
-        {
-            "step_id": f"lower_backend_ir_{index}",
-            "effect_type": "LOWER_BACKEND_IR",
-            "args": backend_args,
-            "requires": {"backend": backend_target},
-        }
-    )
-
-    return steps
 
+def _bind_context(ctx: SchedulerContext, bindings: Dict[str, object]) -> SchedulerContext:
+    # Equivalent to dataclasses.replace() for a context without __post_init__,
+    # at a fraction of the cost of re-running the generated __init__.
+    unknown = bindings.keys() - _CONTEXT_FIELDS
+    if unknown:
+        raise TypeError(f"unknown scheduler context fields: {', '.join(sorted(unknown))}")
+    fixed = SESSION_FIXED_FIELDS.intersection(bindings)
+    if fixed:
+        raise ValueError(f"fixed for the plan session: {', '.join(sorted(fixed))}")
+    bound = object.__new__(SchedulerContext)
+    bound.__dict__.update(ctx.__dict__)
+    bound.__dict__.update(bindings)
+    return bound
 
-def _build_agent_governance_steps(program_ir: Dict[str, object], ctx: SchedulerContext) -> List[Dict[str, object]]:
-    steps: List[Dict[str, object]] = []
-    index = 0
 
-    def add_step(step: Dict[str, object]) -> None:
-        nonlocal index
-        steps.append(step)
-        index += 1
+def _check_operator_registry(program_ir: Dict[str, object], ctx: SchedulerContext) -> Tuple[List[str], List[str]]:
+    if not ctx.operator_registry_enforced:
+        return [], []
+    registry = operator_registry.load_operator_registries(root=ctx.root, registry_paths=ctx.operator_registry_paths)
+    registry_sources = [str(path.relative_to(ctx.root)) for path in registry.sources]
+    ok, registry_errors = operator_registry.validate_program_operators(program_ir, registry, enforce=True)
+    return registry_sources, [] if ok else list(registry_errors)
 
-    if ctx.require_epoch_verification and ctx.anchor_path:
-        add_step(
-            {
-                "step_id": f"verify_epoch_{index}",
-                "effect_type": "VERIFY_EPOCH",
-                "args": {"anchor_path": str(ctx.anchor_path)},
-                "requires": {},
-            }
-        )
-        if ctx.signature_path:
-            add_step(
-                {
-                    "step_id": f"verify_signature_{index}",
-                    "effect_type": "VERIFY_SIGNATURE",
-                    "args": {
-                        "anchor_path": str(ctx.anchor_path),
-                        "sig_path": str(ctx.signature_path),
-                        "pub_path": str(ctx.public_key_path),
-                    },
-                    "requires": {},
-                }
-            )
 
-    proposal_path = str(ctx.agent_proposal_path) if ctx.agent_proposal_path else None
-    policy_path = str(ctx.agent_policy_path) if ctx.agent_policy_path else None
-    decision_path = str(ctx.agent_decision_path) if ctx.agent_decision_path else None
-    args: Dict[str, object] = {}
-    if proposal_path:
-        args["proposal_path"] = proposal_path
-    if policy_path:
-        args["policy_path"] = policy_path
-    if decision_path:
-        args["decision_path"] = decision_path
-    add_step(
-        {
-            "step_id": f"evaluate_agent_proposal_{index}",
-            "effect_type": "EVALUATE_AGENT_PROPOSAL",
-            "args": args,
-            "requires": {},
-        }
+def _verify_for_plan(ctx: SchedulerContext) -> Tuple[Dict[str, object], List[str], Dict[str, object]]:
+    verification, errors = _verify_epoch_and_signature(ctx)
+    cache_hit = bool(verification.pop("cache_hit", False))
+    witness = _build_witness(
+        stage="epoch_verification",
+        artifact_digests={"anchor_verification": _digest_text(_canonical_json(verification))},
+        timestamp=ctx.timestamp,
+        attestation="epoch_verification_witness",
+        notes=VERIFICATION_CACHE_HIT_NOTE if cache_hit else None,
     )
-
-    return steps
+    return verification, errors, witness
 
 
-def _build_trading_paper_steps(program_ir: Dict[str, object], ctx: SchedulerContext) -> List[Dict[str, object]]:
+def _build_steps(program_ir: Dict[str, object]) -> List[Dict[str, object]]:
+    hamiltonian = program_ir.get("hamiltonian", {})
+    terms = hamiltonian.get("terms", []) if isinstance(hamiltonian, dict) else []
     steps: List[Dict[str, object]] = []
-    index = 0
-
-    def add_step(step: Dict[str, object]) -> None:
-        nonlocal index
-        steps.append(step)
-        index += 1
-
-    if ctx.require_epoch_verification and ctx.anchor_path:
-        add_step(
+    if not isinstance(terms, list):
+        return steps
+    for idx, term in enumerate(terms):
+        if not isinstance(term, dict):
+            continue
+        steps.append(
             {
-                "step_id": f"verify_epoch_{index}",
-                "effect_type": "VERIFY_EPOCH",
-                "args": {"anchor_path": str(ctx.anchor_path)},
-                "requires": {},
+                "index": idx,
+                "operator_id": str(term.get("operator_id", "unknown")),
+                "cls": str(term.get("cls", "unknown")),
+                "coefficient": term.get("coefficient", 0.0),
             }
         )
-        if ctx.signature_path:
-            add_step(
-                {
-                    "step_id": f"verify_signature_{index}",
-                    "effect_type": "VERIFY_SIGNATURE",
-                    "args": {
-                        "anchor_path": str(ctx.anchor_path),
-                        "sig_path": str(ctx.signature_path),
-                        "pub_path": str(ctx.public_key_path),
-                    },
-                    "requires": {},
-                }
-            )
+    return steps
 
-    fixture_path = str(ctx.trading_fixture_path) if ctx.trading_fixture_path else None
-    policy_path = str(ctx.trading_policy_path) if ctx.trading_policy_path else None
-    report_json = str(ctx.trading_report_json_path) if ctx.trading_report_json_path else "trade_report.json"
-    report_md = str(ctx.trading_report_md_path) if ctx.trading_report_md_path else "trade_report.md"
 
-    add_step(
-        {
-            "step_id": f"ingest_market_{index}",
-            "effect_type": "INGEST_MARKET_FIXTURE",
-            "args": {
-                "fixture_path": fixture_path,
-                "out_path": "market_snapshot.json",
+_EPOCH_STEPS = (
+    StepTemplate(
+        "verify_epoch",
+        "VERIFY_EPOCH",
+        args={"anchor_path": Param("anchor_path")},
+        when="verify_epoch",
+    ),
+    StepTemplate(
+        "verify_signature",
+        "VERIFY_SIGNATURE",
+        args={
+            "anchor_path": Param("anchor_path"),
+            "sig_path": Param("sig_path"),
+            "pub_path": Param("pub_path"),
+        },
+        when="verify_signature",
+    ),
+)
+
+_LOWER_BACKEND_IR_STEP = StepTemplate(
+    "lower_backend_ir",
+    "LOWER_BACKEND_IR",
+    args={
+        "program_ir": Param("program_ir"),
+        "backend_target": Param("backend_target"),
+        "out_path": Param("backend_ir_path", optional=True),
+    },
+    requires={"backend": Param("backend_target")},
+)
+
+_CLASSICAL = {"backend": "CLASSICAL"}
+
+DEFAULT_EFFECT_TEMPLATE = PlanTemplate(
+    "default",
+    [
+        StepTemplate(
+            "select_measurement_track",
+            "SELECT_MEASUREMENT_TRACK",
+            args={
+                "input_path": Param("ecmo_input_path"),
+                "out_path": Param("measurement_selection_path", optional=True),
             },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"compute_signal_{index}",
-            "effect_type": "COMPUTE_SIGNAL",
-            "args": {
+            when="select_measurement_track",
+        ),
+        *_EPOCH_STEPS,
+        _LOWER_BACKEND_IR_STEP,
+        StepTemplate(
+            "lower_qasm",
+            "LOWER_QASM",
+            args={"program_ir": Param("program_ir"), "out_path": Param("qasm_path", optional=True)},
+            requires={"backend": Param("backend_target")},
+            when="lower_qasm",
+        ),
+    ],
+)
+
+CI_GOVERNANCE_TEMPLATE = PlanTemplate(
+    "ci_governance",
+    [
+        StepTemplate(
+            "check_repo_state",
+            "CHECK_REPO_STATE",
+            args={"state_path": Param("repo_state_path")},
+            when="repo_state_path",
+        ),
+        StepTemplate("validate_registries", "VALIDATE_REGISTRIES"),
+        StepTemplate(
+            "validate_coupling",
+            "VALIDATE_COUPLING_TOPOLOGY",
+            args={"registry_path": Param("coupling_registry_path")},
+            when="coupling_registry_path",
+        ),
+        *_EPOCH_STEPS,
+        _LOWER_BACKEND_IR_STEP,
+    ],
+)
+
+AGENT_GOVERNANCE_TEMPLATE = PlanTemplate(
+    "agent_governance",
+    [
+        *_EPOCH_STEPS,
+        StepTemplate(
+            "evaluate_agent_proposal",
+            "EVALUATE_AGENT_PROPOSAL",
+            args={
+                "proposal_path": Param("proposal_path", optional=True),
+                "policy_path": Param("policy_path", optional=True),
+                "decision_path": Param("decision_path", optional=True),
+            },
+        ),
+    ],
+)
+
+TRADING_PAPER_TEMPLATE = PlanTemplate(
+    "trading_paper_mode",
+    [
+        *_EPOCH_STEPS,
+        StepTemplate(
+            "ingest_market",
+            "INGEST_MARKET_FIXTURE",
+            args={"fixture_path": Param("fixture_path"), "out_path": "market_snapshot.json"},
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "compute_signal",
+            "COMPUTE_SIGNAL",
+            args={
                 "market_snapshot_path": "market_snapshot.json",
-                "policy_path": policy_path,
+                "policy_path": Param("policy_path"),
                 "out_path": "signal.json",
             },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"simulate_order_{index}",
-            "effect_type": "SIMULATE_ORDER",
-            "args": {
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "simulate_order",
+            "SIMULATE_ORDER",
+            args={
                 "market_snapshot_path": "market_snapshot.json",
                 "signal_path": "signal.json",
-                "policy_path": policy_path,
+                "policy_path": Param("policy_path"),
                 "out_path": "trade_fill.json",
             },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"update_risk_{index}",
-            "effect_type": "UPDATE_RISK_ENVELOPE",
-            "args": {
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "update_risk",
+            "UPDATE_RISK_ENVELOPE",
+            args={
                 "trade_fill_path": "trade_fill.json",
-                "policy_path": policy_path,
+                "policy_path": Param("policy_path"),
                 "out_path": "risk_envelope.json",
             },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"emit_trade_report_{index}",
-            "effect_type": "EMIT_TRADE_REPORT",
-            "args": {
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "emit_trade_report",
+            "EMIT_TRADE_REPORT",
+            args={
                 "market_snapshot_path": "market_snapshot.json",
                 "signal_path": "signal.json",
                 "trade_fill_path": "trade_fill.json",
                 "risk_envelope_path": "risk_envelope.json",
-                "report_json_path": report_json,
-                "report_md_path": report_md,
+                "report_json_path": Param("report_json"),
+                "report_md_path": Param("report_md"),
             },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-
-    return steps
-
-
-def _build_trading_shadow_steps(program_ir: Dict[str, object], ctx: SchedulerContext) -> List[Dict[str, object]]:
-    steps: List[Dict[str, object]] = []
-    index = 0
-
-    def add_step(step: Dict[str, object]) -> None:
-        nonlocal index
-        steps.append(step)
-        index += 1
-
-    if ctx.require_epoch_verification and ctx.anchor_path:
-        add_step(
-            {
-                "step_id": f"verify_epoch_{index}",
-                "effect_type": "VERIFY_EPOCH",
-                "args": {"anchor_path": str(ctx.anchor_path)},
-                "requires": {},
-            }
-        )
-        if ctx.signature_path:
-            add_step(
-                {
-                    "step_id": f"verify_signature_{index}",
-                    "effect_type": "VERIFY_SIGNATURE",
-                    "args": {
-                        "anchor_path": str(ctx.anchor_path),
-                        "sig_path": str(ctx.signature_path),
-                        "pub_path": str(ctx.public_key_path),
-                    },
-                    "requires": {},
-                }
-            )
-
-    fixture_path = str(ctx.trading_fixture_path) if ctx.trading_fixture_path else None
-    policy_path = str(ctx.trading_policy_path) if ctx.trading_policy_path else None
-    model_path = str(ctx.trading_shadow_model_path) if ctx.trading_shadow_model_path else None
-    report_json = str(ctx.trading_report_json_path) if ctx.trading_report_json_path else "trade_report.json"
-    report_md = str(ctx.trading_report_md_path) if ctx.trading_report_md_path else "trade_report.md"
-
-    add_step(
-        {
-            "step_id": f"load_shadow_model_{index}",
-            "effect_type": "SIM_MARKET_MODEL_LOAD",
-            "args": {
-                "model_path": model_path,
+            requires=_CLASSICAL,
+        ),
+    ],
+)
+
+TRADING_SHADOW_TEMPLATE = PlanTemplate(
+    "trading_shadow_mode",
+    [
+        *_EPOCH_STEPS,
+        StepTemplate(
+            "load_shadow_model",
+            "SIM_MARKET_MODEL_LOAD",
+            args={
+                "model_path": Param("model_path"),
                 "out_path": "shadow_model.json",
                 "seed_out_path": "shadow_seed.json",
             },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"ingest_market_{index}",
-            "effect_type": "INGEST_MARKET_FIXTURE",
-            "args": {
-                "fixture_path": fixture_path,
-                "out_path": "market_snapshot.json",
-            },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"regime_shift_{index}",
-            "effect_type": "SIM_REGIME_SHIFT_STEP",
-            "args": {
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "ingest_market",
+            "INGEST_MARKET_FIXTURE",
+            args={"fixture_path": Param("fixture_path"), "out_path": "market_snapshot.json"},
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "regime_shift",
+            "SIM_REGIME_SHIFT_STEP",
+            args={
                 "market_snapshot_path": "market_snapshot.json",
-                "model_path": model_path,
+                "model_path": Param("model_path"),
                 "out_path": "regime_snapshot.json",
             },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"apply_latency_{index}",
-            "effect_type": "SIM_LATENCY_APPLY",
-            "args": {
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "apply_latency",
+            "SIM_LATENCY_APPLY",
+            args={
                 "market_snapshot_path": "regime_snapshot.json",
-                "model_path": model_path,
-                "policy_path": policy_path,
+                "model_path": Param("model_path"),
+                "policy_path": Param("policy_path"),
                 "out_path": "latency_snapshot.json",
             },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"compute_signal_{index}",
-            "effect_type": "COMPUTE_SIGNAL",
-            "args": {
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "compute_signal",
+            "COMPUTE_SIGNAL",
+            args={
                 "market_snapshot_path": "latency_snapshot.json",
-                "policy_path": policy_path,
+                "policy_path": Param("policy_path"),
                 "out_path": "signal.json",
             },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"simulate_order_{index}",
-            "effect_type": "SIMULATE_ORDER",
-            "args": {
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "simulate_order",
+            "SIMULATE_ORDER",
+            args={
                 "market_snapshot_path": "latency_snapshot.json",
                 "signal_path": "signal.json",
-                "policy_path": policy_path,
-                "model_path": model_path,
+                "policy_path": Param("policy_path"),
+                "model_path": Param("model_path"),
                 "out_path": "trade_fill.json",
             },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"apply_partial_fill_{index}",
-            "effect_type": "SIM_PARTIAL_FILL_MODEL",
-            "args": {
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "apply_partial_fill",
+            "SIM_PARTIAL_FILL_MODEL",
+            args={
                 "trade_fill_path": "trade_fill.json",
-                "policy_path": policy_path,
-                "model_path": model_path,
+                "policy_path": Param("policy_path"),
+                "model_path": Param("model_path"),
                 "out_path": "shadow_fill.json",
             },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"update_risk_{index}",
-            "effect_type": "UPDATE_RISK_ENVELOPE",
-            "args": {
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "update_risk",
+            "UPDATE_RISK_ENVELOPE",
+            args={
                 "trade_fill_path": "shadow_fill.json",
-                "policy_path": policy_path,
+                "policy_path": Param("policy_path"),
                 "out_path": "risk_envelope.json",
             },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"order_lifecycle_{index}",
-            "effect_type": "SIM_ORDER_LIFECYCLE",
-            "args": {
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "order_lifecycle",
+            "SIM_ORDER_LIFECYCLE",
+            args={
                 "shadow_fill_path": "shadow_fill.json",
-                "model_path": model_path,
+                "model_path": Param("model_path"),
                 "out_path": "shadow_execution_log.json",
             },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"emit_ledger_{index}",
-            "effect_type": "SIM_EMIT_TRADE_LEDGER",
-            "args": {
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "emit_ledger",
+            "SIM_EMIT_TRADE_LEDGER",
+            args={
                 "shadow_fill_path": "shadow_fill.json",
                 "risk_envelope_path": "risk_envelope.json",
                 "signal_path": "signal.json",
                 "out_path": "shadow_trade_ledger.json",
             },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"emit_trade_report_{index}",
-            "effect_type": "EMIT_TRADE_REPORT",
-            "args": {
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "emit_trade_report",
+            "EMIT_TRADE_REPORT",
+            args={
                 "market_snapshot_path": "latency_snapshot.json",
                 "signal_path": "signal.json",
                 "trade_fill_path": "shadow_fill.json",
                 "risk_envelope_path": "risk_envelope.json",
-                "report_json_path": report_json,
-                "report_md_path": report_md,
-            },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-
-    return steps
-
-
-def _build_trading_io_shadow_steps(program_ir: Dict[str, object], ctx: SchedulerContext) -> List[Dict[str, object]]:
-    steps: List[Dict[str, object]] = []
-    index = 0
-
-    def add_step(step: Dict[str, object]) -> None:
-        nonlocal index
-        steps.append(step)
-        index += 1
-
-    if ctx.require_epoch_verification and ctx.anchor_path:
-        add_step(
-            {
-                "step_id": f"verify_epoch_{index}",
-                "effect_type": "VERIFY_EPOCH",
-                "args": {"anchor_path": str(ctx.anchor_path)},
-                "requires": {},
-            }
-        )
-        if ctx.signature_path:
-            add_step(
-                {
-                    "step_id": f"verify_signature_{index}",
-                    "effect_type": "VERIFY_SIGNATURE",
-                    "args": {
-                        "anchor_path": str(ctx.anchor_path),
-                        "sig_path": str(ctx.signature_path),
-                        "pub_path": str(ctx.public_key_path),
-                    },
-                    "requires": {},
-                }
-            )
-
-    endpoint = ctx.io_endpoint or "broker://demo"
-    query_params = ctx.io_query_params or {"request": {"msg_type": "transaction"}}
-
-    add_step(
-        {
-            "step_id": f"io_connect_{index}",
-            "effect_type": "IO_CONNECT",
-            "args": {
-                "endpoint": endpoint,
-                "request_path": "io_connect_request.json",
-                "response_path": "io_connect_response.json",
-                "event_path": "io_connect_event.json",
+                "report_json_path": Param("report_json"),
+                "report_md_path": Param("report_md"),
             },
-            "requires": {
-                "io_scope": "BROKER_CONNECT",
-                "io_endpoint": endpoint,
-            },
-        }
-    )
-    add_step(
-        {
-            "step_id": f"io_query_fills_{index}",
-            "effect_type": "IO_QUERY_FILLS",
-            "args": {
-                "endpoint": endpoint,
+            requires=_CLASSICAL,
+        ),
+    ],
+)
+
+_IO_CONNECT_STEP = StepTemplate(
+    "io_connect",
+    "IO_CONNECT",
+    args={
+        "endpoint": Param("endpoint"),
+        "request_path": "io_connect_request.json",
+        "response_path": "io_connect_response.json",
+        "event_path": "io_connect_event.json",
+    },
+    requires={"io_scope": "BROKER_CONNECT", "io_endpoint": Param("endpoint")},
+)
+
+TRADING_IO_SHADOW_TEMPLATE = PlanTemplate(
+    "trading_io_shadow",
+    [
+        *_EPOCH_STEPS,
+        _IO_CONNECT_STEP,
+        StepTemplate(
+            "io_query_fills",
+            "IO_QUERY_FILLS",
+            args={
+                "endpoint": Param("endpoint"),
                 "order_id": "shadow-order",
-                "params": query_params,
+                "params": Param("query_params"),
                 "request_path": "io_query_request.json",
                 "response_path": "io_query_response.json",
                 "event_path": "io_query_event.json",
             },
-            "requires": {
-                "io_scope": "ORDER_QUERY",
-                "io_endpoint": endpoint,
-            },
-        }
-    )
-    add_step(
-        {
-            "step_id": f"io_reconcile_{index}",
-            "effect_type": "IO_RECONCILE",
-            "args": {
+            requires={"io_scope": "ORDER_QUERY", "io_endpoint": Param("endpoint")},
+        ),
+        StepTemplate(
+            "io_reconcile",
+            "IO_RECONCILE",
+            args={
                 "request_path": "io_query_request.json",
                 "response_path": "io_query_response.json",
                 "expected_status": "ok",
@@ -809,94 +658,32 @@ def _build_trading_io_shadow_steps(program_ir: Dict[str, object], ctx: Scheduler
                 "reconciliation_path": "reconciliation_report.json",
                 "remediation_path": "remediation_plan.json",
             },
-            "requires": {
-                "io_scope": "RECONCILE",
-                "io_endpoint": endpoint,
-            },
-        }
-    )
-
-    return steps
-
-
-def _build_trading_io_live_min_steps(program_ir: Dict[str, object], ctx: SchedulerContext) -> List[Dict[str, object]]:
-    steps: List[Dict[str, object]] = []
-    index = 0
-
-    def add_step(step: Dict[str, object]) -> None:
-        nonlocal index
-        steps.append(step)
-        index += 1
-
-    if ctx.require_epoch_verification and ctx.anchor_path:
-        add_step(
-            {
-                "step_id": f"verify_epoch_{index}",
-                "effect_type": "VERIFY_EPOCH",
-                "args": {"anchor_path": str(ctx.anchor_path)},
-                "requires": {},
-            }
-        )
-        if ctx.signature_path:
-            add_step(
-                {
-                    "step_id": f"verify_signature_{index}",
-                    "effect_type": "VERIFY_SIGNATURE",
-                    "args": {
-                        "anchor_path": str(ctx.anchor_path),
-                        "sig_path": str(ctx.signature_path),
-                        "pub_path": str(ctx.public_key_path),
-                    },
-                    "requires": {},
-                }
-            )
-
-    endpoint = ctx.io_endpoint or "broker://demo"
-    order_payload = ctx.io_order or {
-        "order_id": "live-min-order",
-        "symbol": "DEMO",
-        "side": "buy",
-        "qty": 1,
-    }
-
-    add_step(
-        {
-            "step_id": f"io_connect_{index}",
-            "effect_type": "IO_CONNECT",
-            "args": {
-                "endpoint": endpoint,
-                "request_path": "io_connect_request.json",
-                "response_path": "io_connect_response.json",
-                "event_path": "io_connect_event.json",
-            },
-            "requires": {
-                "io_scope": "BROKER_CONNECT",
-                "io_endpoint": endpoint,
-            },
-        }
-    )
-    add_step(
-        {
-            "step_id": f"io_submit_order_{index}",
-            "effect_type": "IO_SUBMIT_ORDER",
-            "args": {
-                "endpoint": endpoint,
-                "order": order_payload,
+            requires={"io_scope": "RECONCILE", "io_endpoint": Param("endpoint")},
+        ),
+    ],
+)
+
+TRADING_IO_LIVE_MIN_TEMPLATE = PlanTemplate(
+    "trading_io_live_min",
+    [
+        *_EPOCH_STEPS,
+        _IO_CONNECT_STEP,
+        StepTemplate(
+            "io_submit_order",
+            "IO_SUBMIT_ORDER",
+            args={
+                "endpoint": Param("endpoint"),
+                "order": Param("order"),
                 "request_path": "io_submit_request.json",
                 "response_path": "io_submit_response.json",
                 "event_path": "io_submit_event.json",
             },
-            "requires": {
-                "io_scope": "ORDER_SUBMIT",
-                "io_endpoint": endpoint,
-            },
-        }
-    )
-    add_step(
-        {
-            "step_id": f"io_reconcile_{index}",
-            "effect_type": "IO_RECONCILE",
-            "args": {
+            requires={"io_scope": "ORDER_SUBMIT", "io_endpoint": Param("endpoint")},
+        ),
+        StepTemplate(
+            "io_reconcile",
+            "IO_RECONCILE",
+            args={
                 "request_path": "io_submit_request.json",
                 "response_path": "io_submit_response.json",
                 "expected_status": "accepted",
@@ -904,180 +691,217 @@ def _build_trading_io_live_min_steps(program_ir: Dict[str, object], ctx: Schedul
                 "reconciliation_path": "reconciliation_report.json",
                 "remediation_path": "remediation_plan.json",
             },
-            "requires": {
-                "io_scope": "RECONCILE",
-                "io_endpoint": endpoint,
+            requires={"io_scope": "RECONCILE", "io_endpoint": Param("endpoint")},
+        ),
+    ],
+)
+
+NET_SHADOW_TEMPLATE = PlanTemplate(
+    "net_shadow",
+    [
+        StepTemplate(
+            f"net_{name}",
+            f"NET_{name.upper()}",
+            args={"endpoint": Param("endpoint"), **({"payload": Param("message")} if name == "send" else {})},
+            requires={"net_cap": f"NET_{name.upper()}", "net_endpoint": Param("endpoint")},
+            indexed=False,
+        )
+        for name in ("connect", "handshake", "key_exchange", "send", "recv", "close")
+    ],
+)
+
+NAVIER_STOKES_TEMPLATE = PlanTemplate(
+    "navier_stokes",
+    [
+        *_EPOCH_STEPS,
+        StepTemplate(
+            "ns_evolve_linear",
+            "NS_EVOLVE_LINEAR",
+            args={"state_path": Param("state_path"), "out_path": "ns_state_linear.json"},
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "ns_apply_duhamel",
+            "NS_APPLY_DUHAMEL",
+            args={
+                "state_path": "ns_state_linear.json",
+                "policy_path": Param("policy_path"),
+                "out_path": "ns_state_nonlinear.json",
             },
-        }
-    )
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "ns_project_leray",
+            "NS_PROJECT_LERAY",
+            args={"state_path": "ns_state_nonlinear.json", "out_path": "ns_state_projected.json"},
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "ns_pressure_recover",
+            "NS_PRESSURE_RECOVER",
+            args={"state_path": "ns_state_projected.json", "out_path": Param("pressure_path")},
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "ns_measure_obs",
+            "NS_MEASURE_OBSERVABLES",
+            args={
+                "state_path": "ns_state_projected.json",
+                "policy_path": Param("policy_path"),
+                "out_path": Param("observables_path"),
+            },
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "ns_check_barrier",
+            "NS_CHECK_BARRIER",
+            args={
+                "observables_path": Param("observables_path"),
+                "policy_path": Param("policy_path"),
+                "out_path": Param("gate_path"),
+            },
+            requires=_CLASSICAL,
+        ),
+        StepTemplate(
+            "ns_emit_state",
+            "NS_EMIT_STATE",
+            args={"state_path": "ns_state_projected.json", "out_path": Param("state_final")},
+            requires=_CLASSICAL,
+        ),
+    ],
+)
 
-    return steps
 
+def _build_effect_steps(program_ir: Dict[str, object], ctx: SchedulerContext) -> List[Dict[str, object]]:
+    return _render_effect_steps(program_ir, ctx)[0]
 
-def _build_net_shadow_steps(program_ir: Dict[str, object], ctx: SchedulerContext) -> List[Dict[str, object]]:
-    endpoint = ctx.net_endpoint or "net://demo"
-    message = ctx.net_message or {"kind": "ping", "payload": "hello"}
-    steps: List[Dict[str, object]] = []
-    steps.append(
-        {
-            "step_id": "net_connect",
-            "effect_type": "NET_CONNECT",
-            "args": {"endpoint": endpoint},
-            "requires": {"net_cap": "NET_CONNECT", "net_endpoint": endpoint},
-        }
-    )
-    steps.append(
-        {
-            "step_id": "net_handshake",
-            "effect_type": "NET_HANDSHAKE",
-            "args": {"endpoint": endpoint},
-            "requires": {"net_cap": "NET_HANDSHAKE", "net_endpoint": endpoint},
-        }
-    )
-    steps.append(
-        {
-            "step_id": "net_key_exchange",
-            "effect_type": "NET_KEY_EXCHANGE",
-            "args": {"endpoint": endpoint},
-            "requires": {"net_cap": "NET_KEY_EXCHANGE", "net_endpoint": endpoint},
-        }
-    )
-    steps.append(
-        {
-            "step_id": "net_send",
-            "effect_type": "NET_SEND",
-            "args": {"endpoint": endpoint, "payload": message},
-            "requires": {"net_cap": "NET_SEND", "net_endpoint": endpoint},
-        }
-    )
-    steps.append(
-        {
-            "step_id": "net_recv",
-            "effect_type": "NET_RECV",
-            "args": {"endpoint": endpoint},
-            "requires": {"net_cap": "NET_RECV", "net_endpoint": endpoint},
-        }
-    )
-    steps.append(
-        {
-            "step_id": "net_close",
-            "effect_type": "NET_CLOSE",
-            "args": {"endpoint": endpoint},
-            "requires": {"net_cap": "NET_CLOSE", "net_endpoint": endpoint},
-        }
-    )
-    return steps
 
+def _render_effect_steps(program_ir: Dict[str, object], ctx: SchedulerContext) -> Tuple[List[Dict[str, object]], str]:
+    template, bind_params = _EFFECT_TEMPLATES.get(ctx.track or "", (DEFAULT_EFFECT_TEMPLATE, _default_params))
+    return template.render(bind_params(program_ir, ctx))
 
-def _build_navier_stokes_steps(program_ir: Dict[str, object], ctx: SchedulerContext) -> List[Dict[str, object]]:
-    steps: List[Dict[str, object]] = []
-    index = 0
 
-    def add_step(step: Dict[str, object]) -> None:
-        nonlocal index
-        steps.append(step)
-        index += 1
+def _epoch_params(ctx: SchedulerContext) -> Dict[str, object]:
+    verify_epoch = bool(ctx.require_epoch_verification and ctx.anchor_path)
+    verify_signature = verify_epoch and bool(ctx.signature_path)
+    return {
+        "verify_epoch": verify_epoch,
+        "verify_signature": verify_signature,
+        "anchor_path": str(ctx.anchor_path) if verify_epoch else None,
+        "sig_path": str(ctx.signature_path) if verify_signature else None,
+        "pub_path": str(ctx.public_key_path) if verify_signature else None,
+    }
 
-    if ctx.require_epoch_verification and ctx.anchor_path:
-        add_step(
-            {
-                "step_id": f"verify_epoch_{index}",
-                "effect_type": "VERIFY_EPOCH",
-                "args": {"anchor_path": str(ctx.anchor_path)},
-                "requires": {},
-            }
-        )
-        if ctx.signature_path:
-            add_step(
-                {
-                    "step_id": f"verify_signature_{index}",
-                    "effect_type": "VERIFY_SIGNATURE",
-                    "args": {
-                        "anchor_path": str(ctx.anchor_path),
-                        "sig_path": str(ctx.signature_path),
-                        "pub_path": str(ctx.public_key_path),
-                    },
-                    "requires": {},
-                }
-            )
 
-    state_path = str(ctx.ns_state_path) if ctx.ns_state_path else None
-    policy_path = str(ctx.ns_policy_path) if ctx.ns_policy_path else None
-    state_final = str(ctx.ns_state_final_path) if ctx.ns_state_final_path else "ns_state_final.json"
-    observables_path = str(ctx.ns_observables_path) if ctx.ns_observables_path else "ns_observables.json"
-    pressure_path = str(ctx.ns_pressure_path) if ctx.ns_pressure_path else "ns_pressure.json"
-    gate_path = str(ctx.ns_gate_certificate_path) if ctx.ns_gate_certificate_path else "ns_gate_certificate.json"
+def _backend_params(program_ir: Dict[str, object], ctx: SchedulerContext) -> Dict[str, object]:
+    artifact_paths = ctx.artifact_paths or {}
+    return {
+        "program_ir": program_ir,
+        "backend_target": (ctx.backend_target or "classical").upper(),
+        "backend_ir_path": artifact_paths.get("backend_ir"),
+    }
 
-    add_step(
-        {
-            "step_id": f"ns_evolve_linear_{index}",
-            "effect_type": "NS_EVOLVE_LINEAR",
-            "args": {"state_path": state_path, "out_path": "ns_state_linear.json"},
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"ns_apply_duhamel_{index}",
-            "effect_type": "NS_APPLY_DUHAMEL",
-            "args": {
-                "state_path": "ns_state_linear.json",
-                "policy_path": policy_path,
-                "out_path": "ns_state_nonlinear.json",
-            },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"ns_project_leray_{index}",
-            "effect_type": "NS_PROJECT_LERAY",
-            "args": {"state_path": "ns_state_nonlinear.json", "out_path": "ns_state_projected.json"},
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"ns_pressure_recover_{index}",
-            "effect_type": "NS_PRESSURE_RECOVER",
-            "args": {"state_path": "ns_state_projected.json", "out_path": pressure_path},
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"ns_measure_obs_{index}",
-            "effect_type": "NS_MEASURE_OBSERVABLES",
-            "args": {
-                "state_path": "ns_state_projected.json",
-                "policy_path": policy_path,
-                "out_path": observables_path,
-            },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
-        {
-            "step_id": f"ns_check_barrier_{index}",
-            "effect_type": "NS_CHECK_BARRIER",
-            "args": {
-                "observables_path": observables_path,
-                "policy_path": policy_path,
-                "out_path": gate_path,
-            },
-            "requires": {"backend": "CLASSICAL"},
-        }
-    )
-    add_step(
+
+def _optional_str(value: Optional[object], default: Optional[str] = None) -> Optional[str]:
+    return str(value) if value else default
+
+
+def _default_params(program_ir: Dict[str, object], ctx: SchedulerContext) -> Dict[str, object]:
+    params = {**_epoch_params(ctx), **_backend_params(program_ir, ctx)}
+    params.update(
         {
-            "step_id": f"ns_emit_state_{index}",
-            "effect_type": "NS_EMIT_STATE",
-            "args": {"state_path": "ns_state_projected.json", "out_path": state_final},
-            "requires": {"backend": "CLASSICAL"},
+            "select_measurement_track": bool(ctx.ecmo_input_path),
+            "ecmo_input_path": _optional_str(ctx.ecmo_input_path),
+            "measurement_selection_path": _optional_str(ctx.measurement_selection_path),
+            "lower_qasm": params["backend_target"] == "QASM",
+            "qasm_path": (ctx.artifact_paths or {}).get("qasm"),
         }
     )
+    return params
+
+
+def _ci_governance_params(program_ir: Dict[str, object], ctx: SchedulerContext) -> Dict[str, object]:
+    return {
+        **_epoch_params(ctx),
+        **_backend_params(program_ir, ctx),
+        "repo_state_path": _optional_str(ctx.ci_repo_state_path),
+        "coupling_registry_path": _optional_str(ctx.ci_coupling_registry_path),
+    }
+
+
+def _agent_governance_params(program_ir: Dict[str, object], ctx: SchedulerContext) -> Dict[str, object]:
+    return {
+        **_epoch_params(ctx),
+        "proposal_path": _optional_str(ctx.agent_proposal_path),
+        "policy_path": _optional_str(ctx.agent_policy_path),
+        "decision_path": _optional_str(ctx.agent_decision_path),
+    }
+
+
+def _trading_params(program_ir: Dict[str, object], ctx: SchedulerContext) -> Dict[str, object]:
+    return {
+        **_epoch_params(ctx),
+        "fixture_path": _optional_str(ctx.trading_fixture_path),
+        "policy_path": _optional_str(ctx.trading_policy_path),
+        "model_path": _optional_str(ctx.trading_shadow_model_path),
+        "report_json": _optional_str(ctx.trading_report_json_path, "trade_report.json"),
+        "report_md": _optional_str(ctx.trading_report_md_path, "trade_report.md"),
+    }
+
+
+def _trading_io_shadow_params(program_ir: Dict[str, object], ctx: SchedulerContext) -> Dict[str, object]:
+    return {
+        **_epoch_params(ctx),
+        "endpoint": ctx.io_endpoint or "broker://demo",
+        "query_params": ctx.io_query_params or {"request": {"msg_type": "transaction"}},
+    }
+
+
+def _trading_io_live_min_params(program_ir: Dict[str, object], ctx: SchedulerContext) -> Dict[str, object]:
+    return {
+        **_epoch_params(ctx),
+        "endpoint": ctx.io_endpoint or "broker://demo",
+        "order": ctx.io_order
+        or {
+            "order_id": "live-min-order",
+            "symbol": "DEMO",
+            "side": "buy",
+            "qty": 1,
+        },
+    }
+
+
+def _net_shadow_params(program_ir: Dict[str, object], ctx: SchedulerContext) -> Dict[str, object]:
+    return {
+        "endpoint": ctx.net_endpoint or "net://demo",
+        "message": ctx.net_message or {"kind": "ping", "payload": "hello"},
+    }
+
+
+def _navier_stokes_params(program_ir: Dict[str, object], ctx: SchedulerContext) -> Dict[str, object]:
+    return {
+        **_epoch_params(ctx),
+        "state_path": _optional_str(ctx.ns_state_path),
+        "policy_path": _optional_str(ctx.ns_policy_path),
+        "state_final": _optional_str(ctx.ns_state_final_path, "ns_state_final.json"),
+        "observables_path": _optional_str(ctx.ns_observables_path, "ns_observables.json"),
+        "pressure_path": _optional_str(ctx.ns_pressure_path, "ns_pressure.json"),
+        "gate_path": _optional_str(ctx.ns_gate_certificate_path, "ns_gate_certificate.json"),
+    }
 
-    return steps
+
+ParamBinder = Callable[[Dict[str, object], SchedulerContext], Dict[str, object]]
+
+_EFFECT_TEMPLATES: Dict[str, Tuple[PlanTemplate, ParamBinder]] = {
+    "ci_governance": (CI_GOVERNANCE_TEMPLATE, _ci_governance_params),
+    "agent_governance": (AGENT_GOVERNANCE_TEMPLATE, _agent_governance_params),
+    "trading_paper_mode": (TRADING_PAPER_TEMPLATE, _trading_params),
+    "trading_shadow_mode": (TRADING_SHADOW_TEMPLATE, _trading_params),
+    "trading_io_shadow": (TRADING_IO_SHADOW_TEMPLATE, _trading_io_shadow_params),
+    "trading_io_live_min": (TRADING_IO_LIVE_MIN_TEMPLATE, _trading_io_live_min_params),
+    "navier_stokes": (NAVIER_STOKES_TEMPLATE, _navier_stokes_params),
+    "net_shadow": (NET_SHADOW_TEMPLATE, _net_shadow_params),
+}
 
 
 def _verify_epoch_and_signature(ctx: SchedulerContext) -> Tuple[Dict[str, object], List[str]]:
@@ -1094,28 +918,28 @@ def _verify_epoch_and_signature(ctx: SchedulerContext) -> Tuple[Dict[str, object
         ]
 
     anchor = json.loads(ctx.anchor_path.read_text(encoding="utf-8"))
-    verify_epoch = _load_verify_epoch()
-    ok, epoch_errors = verify_epoch.verify_epoch_anchor(
+    epoch_outcome = verification_cache.verify_epoch_anchor(
         anchor,
         root=ctx.root,
         git_commit_override=ctx.git_commit_override,
     )
+    ok = epoch_outcome.ok
+    cache_hit = epoch_outcome.cache_hit
     if not ok:
-        errors.extend(["epoch verification failed"] + epoch_errors)
+        errors.extend(["epoch verification failed"] + epoch_outcome.errors)
 
     sig_ok = True
-    sig_errors: List[str] = []
     if ctx.signature_path:
         if ctx.signature_path.exists():
-            verify_sig = _load_verify_signature()
-            verify_key = verify_sig._load_verify_key(ctx.public_key_path, "UNUSED")
-            sig_ok, sig_errors = verify_sig.verify_anchor_signature(
+            sig_outcome = verification_cache.verify_anchor_signature(
                 ctx.anchor_path,
                 ctx.signature_path,
-                verify_key,
+                ctx.public_key_path,
             )
+            sig_ok = sig_outcome.ok
+            cache_hit = cache_hit and sig_outcome.cache_hit
             if not sig_ok:
-                errors.extend(["signature verification failed"] + sig_errors)
+                errors.extend(["signature verification failed"] + sig_outcome.errors)
         else:
             sig_ok = False
             errors.append(f"signature not found: {ctx.signature_path}")
@@ -1123,34 +947,22 @@ def _verify_epoch_and_signature(ctx: SchedulerContext) -> Tuple[Dict[str, object
         sig_ok = False
         errors.append("signature verification required but signature_path missing")
 
+    # ``cache_hit`` is popped by the caller before the verification record is
+    # digested, so plan ids do not depend on cache state.
     return {
         "anchor_ok": ok,
         "signature_ok": sig_ok,
         "errors": list(errors),
+        "cache_hit": cache_hit,
     }, errors
 
 
-def _load_verify_epoch():
-    spec = importlib.util.spec_from_file_location("verify_epoch", VERIFY_EPOCH_PATH)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
-
-def _load_verify_signature():
-    spec = importlib.util.spec_from_file_location(
-        "verify_anchor_signature", VERIFY_SIGNATURE_PATH
-    )
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
-
 def _build_witness(
     stage: str,
     artifact_digests: Dict[str, str],
     timestamp: str,
     attestation: str,
+    notes: Optional[str] = None,
 ) -> Dict[str, object]:
     return emit_witness_record(
         observer_id="papas",
@@ -1158,6 +970,7 @@ def _build_witness(
         artifact_digests=artifact_digests,
         timestamp=timestamp,
         attestation=attestation,
+        notes=notes,
     )
 
 
@@ -1165,6 +978,36 @@ def _canonical_json(data: object) -> str:
     return json.dumps(data, sort_keys=True, separators=(",", ":"))
 
 
+def _canonical_json_with(data: Dict[str, object], key: str, fragment: Optional[str]) -> str:
+    """``_canonical_json(data)`` with ``data[key]`` taken from precomputed JSON."""
+    if fragment is None:
+        return _canonical_json(data)
+    # Keys sort the same way json.dumps sorts them, so the entries before and
+    # after ``key`` can each be encoded in one pass and spliced around it.
+    head = _canonical_json({name: value for name, value in data.items() if name < key})
+    tail = _canonical_json({name: value for name, value in data.items() if name > key})
+    entry = f"{json.dumps(key)}:{fragment}"
+    return "{" + ",".join(part for part in (head[1:-1], entry, tail[1:-1]) if part) + "}"
+
+
+def _json_frame(data: Dict[str, object], slots: Tuple[str, ...]) -> List[str]:
+    """Literal pieces of ``_canonical_json`` around the values of ``slots``.
+
+    Interleaving the pieces with the slots' JSON, in sorted key order, gives
+    the canonical JSON of ``data`` with those keys filled in.
+    """
+    pieces = ["{"]
+    for index, name in enumerate(sorted(set(data) | set(slots))):
+        separator = "," if index else ""
+        if name in slots:
+            pieces[-1] += f"{separator}{json.dumps(name)}:"
+            pieces.append("")
+        else:
+            pieces[-1] += f"{separator}{json.dumps(name)}:{_canonical_json(data[name])}"
+    pieces[-1] += "}"
+    return pieces
+
+
 def _digest_text(value: str) -> str:
     digest = hashlib.sha256(value.encode("utf-8")).hexdigest()
     return f"sha256:{digest}"
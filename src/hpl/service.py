@@ -0,0 +1,307 @@
+"""Long-lived compile/plan/run service with a JSON-RPC front end (tooling-only).
+
+The service keeps the pipeline warm in one process (parsed schema, compile and
+verification caches, effect handlers) and answers JSON-RPC 2.0 requests, one
+JSON document per line, over stdin/stdout or a Unix socket. Batches (JSON-RPC
+arrays) can be fanned out over a process pool whose workers are warmed once.
+Results are the same IR/plan/result dicts the CLI writes, without temp files.
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+import socketserver
+import sys
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, TextIO, Union
+
+from .errors import HplError
+
+
+JSONRPC_VERSION = "2.0"
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+HPL_ERROR = -32000
+
+Request = Dict[str, object]
+Response = Dict[str, object]
+
+
+def compile_program(source: str, program_id: str = "unknown") -> Dict[str, object]:
+    """Compile HPL surface source to ProgramIR."""
+    from .compile_cache import compile_source
+
+    return compile_source(source, program_id=program_id).program_ir
+
+
+def plan_program(
+    program_ir: Dict[str, object],
+    require_epoch: bool = False,
+    anchor: Optional[str] = None,
+    sig: Optional[str] = None,
+    pub: Optional[str] = None,
+    allowed_backends: Union[str, List[str]] = "PYTHON,CLASSICAL,QASM",
+    budget_steps: int = 100,
+    enforce_operator_registry: bool = False,
+    operator_registry: Optional[List[str]] = None,
+) -> Dict[str, object]:
+    """Plan ``program_ir`` with the same options as ``hpl plan``."""
+    from .execution_token import parse_backends
+    from .scheduler import SchedulerContext, plan
+
+    options: Dict[str, object] = {}
+    if pub:
+        options["public_key_path"] = Path(pub)
+    ctx = SchedulerContext(
+        require_epoch_verification=require_epoch,
+        anchor_path=_optional_path(anchor),
+        signature_path=_optional_path(sig),
+        allowed_backends=parse_backends(allowed_backends),
+        budget_steps=int(budget_steps),
+        operator_registry_enforced=enforce_operator_registry,
+        operator_registry_paths=[Path(item) for item in operator_registry] if operator_registry else None,
+        **options,
+    )
+    return plan(program_ir, ctx).to_dict()
+
+
+def run_plan(
+    plan: Dict[str, object],
+    contract: Optional[Dict[str, object]] = None,
+    anchor: Optional[str] = None,
+    sig: Optional[str] = None,
+    pub: Optional[str] = None,
+    backend: Optional[str] = None,
+    enable_io: bool = False,
+    enable_net: bool = False,
+) -> Dict[str, object]:
+    """Run a plan dict with the same options as ``hpl run``."""
+    from .execution_token import ExecutionToken, normalize_backend
+    from .runtime.context import RuntimeContext
+    from .runtime.contracts import contract_from_dict, default_contract
+    from .runtime.engine import RuntimeEngine
+
+    token_dict = plan.get("execution_token")
+    execution_token = ExecutionToken.from_dict(token_dict) if isinstance(token_dict, dict) else None
+    requested_backend = normalize_backend(backend)
+    options: Dict[str, object] = {}
+    if pub:
+        options["ci_pubkey_path"] = Path(pub)
+    ctx = RuntimeContext(
+        epoch_anchor_path=_optional_path(anchor),
+        epoch_sig_path=_optional_path(sig),
+        execution_token=execution_token,
+        requested_backend=requested_backend,
+        io_enabled=enable_io,
+        net_enabled=enable_net,
+        **options,
+    )
+    if contract is not None:
+        execution_contract = contract_from_dict(contract, required_backend=requested_backend)
+    else:
+        execution_contract = default_contract(plan, required_backend=requested_backend)
+    return RuntimeEngine().run(plan, ctx, execution_contract).to_dict()
+
+
+def compile_and_plan(source: str, program_id: str = "unknown", **plan_options: object) -> Dict[str, object]:
+    program_ir = compile_program(source, program_id=program_id)
+    return {"program_ir": program_ir, "plan": plan_program(program_ir, **plan_options)}
+
+
+METHODS: Dict[str, Callable[..., object]] = {
+    "compile": compile_program,
+    "plan": plan_program,
+    "run": run_plan,
+    "compile_and_plan": compile_and_plan,
+    "ping": lambda: "pong",
+}
+
+
+def dispatch(request: object) -> Optional[Response]:
+    """Answer one JSON-RPC request; notifications (no ``id``) return None."""
+    if not isinstance(request, dict) or request.get("jsonrpc") != JSONRPC_VERSION:
+        return _error(None, INVALID_REQUEST, "invalid JSON-RPC request")
+    request_id = request.get("id")
+    is_notification = "id" not in request
+    method = METHODS.get(str(request.get("method")))
+    params = request.get("params", {})
+    if method is None:
+        response = _error(request_id, METHOD_NOT_FOUND, f"unknown method: {request.get('method')}")
+    elif not isinstance(params, (dict, list)):
+        response = _error(request_id, INVALID_PARAMS, "params must be an object or array")
+    else:
+        response = _invoke(method, params, request_id)
+    return None if is_notification else response
+
+
+class CompileService:
+    """Dispatches single and batch JSON-RPC requests, optionally over a pool.
+
+    With ``max_workers`` above one, batch entries run in a process pool whose
+    workers import and warm the pipeline once; responses keep request order.
+    """
+
+    def __init__(self, max_workers: int = 1) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "CompileService":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def handle(self, payload: object) -> Optional[Union[Response, List[Response]]]:
+        if not isinstance(payload, list):
+            return dispatch(payload)
+        if not payload:
+            return _error(None, INVALID_REQUEST, "empty batch")
+        responses = self.run_batch(payload)
+        answered = [response for response in responses if response is not None]
+        return answered or None
+
+    def handle_line(self, line: str) -> Optional[str]:
+        try:
+            payload = json.loads(line)
+        except ValueError as exc:
+            return _encode(_error(None, PARSE_ERROR, f"parse error: {exc}"))
+        response = self.handle(payload)
+        return _encode(response) if response is not None else None
+
+    def run_batch(self, requests: List[object]) -> List[Optional[Response]]:
+        if self.max_workers == 1 or len(requests) == 1:
+            return [dispatch(request) for request in requests]
+        return list(self._executor().map(dispatch, requests))
+
+    def serve_stream(self, reader: TextIO, writer: TextIO) -> None:
+        """Serve newline-delimited JSON-RPC until ``reader`` is exhausted."""
+        for line in reader:
+            if not line.strip():
+                continue
+            reply = self.handle_line(line)
+            if reply is not None:
+                writer.write(reply + "\n")
+                writer.flush()
+
+    def serve_unix_socket(self, path: Path) -> None:
+        """Serve newline-delimited JSON-RPC on a Unix socket, one thread per client."""
+        path = Path(path)
+        if path.exists():
+            path.unlink()
+        service = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                reader = (line.decode("utf-8") for line in self.rfile)
+                service.serve_stream(reader, _SocketWriter(self.wfile))  # type: ignore[arg-type]
+
+        with socketserver.ThreadingUnixStreamServer(str(path), _Handler) as server:
+            try:
+                server.serve_forever()
+            finally:
+                path.unlink(missing_ok=True)
+
+    def _executor(self) -> Executor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers, initializer=warm_pipeline)
+            return self._pool
+
+
+def run_batch(requests: List[object], max_workers: int = 1) -> List[Optional[Response]]:
+    """Dispatch a list of JSON-RPC requests, in order, on a throwaway service."""
+    with CompileService(max_workers=max_workers) as service:
+        return service.run_batch(requests)
+
+
+def warm_pipeline() -> None:
+    """Import the pipeline and load shared tables ahead of the first request."""
+    from .compile_cache import compile_source  # noqa: F401
+    from .dynamics.ir_emitter import schema_digest
+    from .runtime.engine import RuntimeEngine  # noqa: F401
+    from .scheduler import plan  # noqa: F401
+
+    schema_digest()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="hpl-serve")
+    parser.add_argument("--socket", type=Path)
+    parser.add_argument("--workers", type=int, default=1)
+    return serve(parser.parse_args(argv))
+
+
+def serve(args: object) -> int:
+    warm_pipeline()
+    with CompileService(max_workers=getattr(args, "workers", 1)) as service:
+        socket_path = getattr(args, "socket", None)
+        if socket_path:
+            service.serve_unix_socket(Path(socket_path))
+        else:
+            service.serve_stream(sys.stdin, sys.stdout)
+    return 0
+
+
+class _SocketWriter:
+    def __init__(self, handle: object) -> None:
+        self._handle = handle
+
+    def write(self, text: str) -> None:
+        self._handle.write(text.encode("utf-8"))  # type: ignore[attr-defined]
+
+    def flush(self) -> None:
+        self._handle.flush()  # type: ignore[attr-defined]
+
+
+def _invoke(method: Callable[..., object], params: object, request_id: object) -> Response:
+    signature = inspect.signature(method)
+    try:
+        bound = signature.bind(*params) if isinstance(params, list) else signature.bind(**params)  # type: ignore[arg-type]
+    except TypeError as exc:
+        return _error(request_id, INVALID_PARAMS, str(exc))
+    try:
+        result = method(*bound.args, **bound.kwargs)
+    except HplError as exc:
+        return _error(request_id, HPL_ERROR, str(exc), {"type": exc.__class__.__name__})
+    except Exception as exc:  # programming errors stay inside the response
+        return _error(request_id, INTERNAL_ERROR, str(exc), {"type": exc.__class__.__name__})
+    return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "result": result}
+
+
+def _error(
+    request_id: object,
+    code: int,
+    message: str,
+    data: Optional[Dict[str, object]] = None,
+) -> Response:
+    error: Dict[str, object] = {"code": code, "message": message}
+    if data:
+        error["data"] = data
+    return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "error": error}
+
+
+def _encode(payload: object) -> str:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+
+def _optional_path(value: Optional[str]) -> Optional[Path]:
+    return Path(value) if value else None
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
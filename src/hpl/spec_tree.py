@@ -0,0 +1,219 @@
+"""One listing of the repository tree for CI gates and epoch anchors (tooling-only).
+
+Gate A scans the ``_H`` folders, and ``anchor_epoch`` / ``verify_epoch`` hash
+the spec, registry and tooling files. ``snapshot`` lists the tree once for
+all of them. In a git checkout it reads blob ids from the index with
+``git ls-files`` and asks ``git diff-files`` which tracked files differ on
+disk. Outside git it walks the directory instead. Gate A asks for ignored
+files too, since a gitignored script in an ``_H`` folder is still a
+violation.
+
+``SpecTree.digests`` maps a clean file's blob id to its SHA-256 through a
+persistent cache, so a file is read only the first time its content is
+seen, in any checkout that shares the cache directory. Modified, untracked
+and walked files have no trusted blob id and go through ``FileHashCache``,
+as do files whose checkout rewrites the blob's bytes (smudge filters,
+``ident``, a working-tree encoding or CRLF conversion): ``git diff-files``
+calls those clean even though their bytes differ from another checkout's.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from .cache import FileHashCache, JsonCache, cache_key
+
+
+REGULAR_FILE_MODES = {"100644", "100755"}
+# Skipped by the filesystem walk: dot-directories at the top of the tree
+# (.git, caches, virtualenvs) and bytecode caches anywhere.
+SKIPPED_DIRS = {"__pycache__"}
+# Attributes that decide whether checkout writes different bytes than the blob.
+CONVERSION_ATTRS = ("filter", "ident", "working-tree-encoding", "text", "eol")
+
+_BLOB_DIGESTS = JsonCache("spec_blobs")
+
+
+@dataclass(frozen=True)
+class SpecTree:
+    root: Path
+    # Relative POSIX path -> index blob id, or None when the file on disk is
+    # not known to match a blob (modified, untracked, or listed by a walk).
+    entries: Mapping[str, Optional[str]]
+    source: str
+
+    def paths(self) -> List[str]:
+        return sorted(self.entries)
+
+    def blob_id(self, path: Path) -> Optional[str]:
+        rel = self._relative(path)
+        return self.entries.get(rel) if rel is not None else None
+
+    def digests(self, paths: Iterable[Path], file_hashes: FileHashCache) -> Dict[Path, str]:
+        """SHA-256 digest (``sha256:<hex>``) of each path's content on disk.
+
+        In verify mode every file goes through ``file_hashes``, which
+        re-reads it.
+        """
+        results: Dict[Path, str] = {}
+        candidates: List[Tuple[Path, str, str]] = []
+        by_blob: List[Tuple[Path, str]] = []
+        by_stat: List[Path] = []
+        for path in paths:
+            rel = self._relative(path)
+            blob = None if file_hashes.verify or rel is None else self.entries.get(rel)
+            if blob is None:
+                by_stat.append(path)
+            else:
+                candidates.append((path, rel, blob))
+        converted = _converted_paths(self.root, [rel for _, rel, _ in candidates]) if candidates else set()
+        for path, rel, blob in candidates:
+            if rel in converted:
+                by_stat.append(path)
+                continue
+            cached = _BLOB_DIGESTS.get(cache_key("blob", blob))
+            if isinstance(cached, str):
+                results[path] = cached
+            else:
+                by_blob.append((path, blob))
+
+        if by_blob:
+            with ThreadPoolExecutor(max_workers=max(1, min(8, os.cpu_count() or 1, len(by_blob)))) as pool:
+                hashed = list(pool.map(lambda item: _hash_blob_file(item[0]), by_blob))
+            for (path, blob), (actual_blob, digest) in zip(by_blob, hashed):
+                results[path] = digest
+                # The file may have changed since the index was read; only a
+                # content match proves the digest belongs to the blob.
+                if actual_blob == blob:
+                    _BLOB_DIGESTS.put(cache_key("blob", blob), digest)
+        if by_stat:
+            results.update(file_hashes.digests(by_stat))
+        return results
+
+    def _relative(self, path: Path) -> Optional[str]:
+        try:
+            return Path(path).relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+
+
+def snapshot(root: Path, include_ignored: bool = False) -> SpecTree:
+    """List ``root`` from the git index, or by walking it outside a checkout.
+
+    Untracked files are listed unless gitignored; ``include_ignored`` lists
+    those as well. The walk never applies ignore rules.
+    """
+    root = Path(root)
+    entries = _git_entries(root, include_ignored)
+    if entries is not None:
+        return SpecTree(root=root, entries=entries, source="git")
+    return SpecTree(root=root, entries=_walk_entries(root), source="walk")
+
+
+def _git_entries(root: Path, include_ignored: bool = False) -> Optional[Dict[str, Optional[str]]]:
+    toplevel = _git(root, "rev-parse", "--show-toplevel")
+    if toplevel is None or Path(toplevel.strip()).resolve() != root.resolve():
+        return None
+    staged = _git(root, "ls-files", "--stage", "-z")
+    modified = _git(root, "diff-files", "--name-only", "-z")
+    others = ["--others", "-z"] if include_ignored else ["--others", "--exclude-standard", "-z"]
+    untracked = _git(root, "ls-files", *others)
+    if staged is None or modified is None or untracked is None:
+        return None
+
+    entries: Dict[str, Optional[str]] = {}
+    for record in filter(None, staged.split("\0")):
+        meta, path = record.split("\t", 1)
+        mode, blob, stage = meta.split()
+        if mode == "160000":
+            continue
+        # Conflicted and non-regular entries (symlinks) have no usable blob.
+        trusted = mode in REGULAR_FILE_MODES and stage == "0" and path not in entries
+        entries[path] = blob if trusted else None
+    for path in filter(None, modified.split("\0")):
+        if (root / path).is_file():
+            entries[path] = None
+        else:
+            entries.pop(path, None)
+    for path in filter(None, untracked.split("\0")):
+        entries[path] = None
+    return entries
+
+
+def _walk_entries(root: Path) -> Dict[str, Optional[str]]:
+    entries: Dict[str, Optional[str]] = {}
+    for current, dirnames, filenames in os.walk(root):
+        top = Path(current) == root
+        dirnames[:] = [
+            name for name in dirnames if name not in SKIPPED_DIRS and not (top and name.startswith("."))
+        ]
+        for name in filenames:
+            path = Path(current) / name
+            if path.is_file():
+                entries[path.relative_to(root).as_posix()] = None
+    return entries
+
+
+def _converted_paths(root: Path, rels: Sequence[str]) -> Set[str]:
+    """Paths whose checkout may not reproduce the blob's bytes exactly."""
+    output = _git(root, "check-attr", "-z", "--stdin", *CONVERSION_ATTRS, input="".join(f"{rel}\0" for rel in rels))
+    if output is None:
+        return set(rels)
+    autocrlf = (_git(root, "config", "--get", "core.autocrlf") or "false").strip()
+    core_eol = (_git(root, "config", "--get", "core.eol") or "native").strip()
+    # Where the attributes leave eol open: autocrlf=true converts every text
+    # file, core.eol only files marked text, and autocrlf=input never on checkout.
+    crlf_for_text = autocrlf == "true" or (
+        autocrlf != "input" and (core_eol == "crlf" or (core_eol == "native" and os.linesep == "\r\n"))
+    )
+    attrs: Dict[str, Dict[str, str]] = {}
+    fields = output.split("\0")
+    for index in range(0, len(fields) - 2, 3):
+        attrs.setdefault(fields[index], {})[fields[index + 1]] = fields[index + 2]
+
+    converted: Set[str] = set()
+    for rel in rels:
+        values = attrs.get(rel, {})
+        if any(values.get(name, "unspecified") not in ("unspecified", "unset") for name in CONVERSION_ATTRS[:3]):
+            converted.add(rel)
+            continue
+        text, eol = values.get("text", "unspecified"), values.get("eol", "unspecified")
+        if text == "unset" or eol == "lf":
+            continue
+        if eol == "crlf" or (text == "unspecified" and autocrlf == "true") or (text != "unspecified" and crlf_for_text):
+            converted.add(rel)
+    return converted
+
+
+def _git(root: Path, *args: str, input: Optional[str] = None) -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            check=False,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            cwd=root,
+            input=input,
+        )
+    except OSError:
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _hash_blob_file(path: Path) -> Tuple[str, str]:
+    # Git blob id and SHA-256 from one read of the file.
+    with path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        blob = hashlib.sha1(f"blob {size}\0".encode("ascii"))
+        content = hashlib.sha256()
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            blob.update(block)
+            content.update(block)
+    return blob.hexdigest(), f"sha256:{content.hexdigest()}"
@@ -0,0 +1,158 @@
+"""Stage graph for multi-step CLI commands (tooling-only, never evidence).
+
+A command such as ``hpl lifecycle`` is described as stages with explicit
+dependencies. A stage runs once every stage it depends on has finished. Up
+to ``max_workers`` independent stages run at the same time on a thread
+pool, and ``max_workers=1`` runs them one by one in declaration order.
+
+A stage may give a cache key, built from the digests of everything it
+reads. On a hit, the stored output files are written back and the stored
+value is returned without running the stage. A stage that reads state
+outside its key, such as the runtime or epoch verification, must not
+return a key. Stage values and output files must be JSON values and UTF-8
+text, and both must be fully determined by the key.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+from . import __version__, tracing
+from .cache import JsonCache, cache_key
+
+
+PACKAGE_ROOT = Path(__file__).resolve().parent
+Results = Mapping[str, object]
+
+_FINGERPRINT_LOCK = threading.Lock()
+_PACKAGE_FINGERPRINT: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    run: Callable[[Results], object]
+    deps: Tuple[str, ...] = ()
+    key: Optional[Callable[[Results], Optional[str]]] = None
+    outputs: Tuple[Path, ...] = ()
+
+
+@dataclass
+class StageRun:
+    name: str
+    value: object = None
+    cache_hit: bool = False
+    seconds: float = 0.0
+
+
+@dataclass
+class StageGraph:
+    stages: Sequence[Stage]
+    max_workers: int = 1
+    cache: Optional[JsonCache] = None
+    runs: Dict[str, StageRun] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        names = [stage.name for stage in self.stages]
+        if len(set(names)) != len(names):
+            raise ValueError("duplicate stage names")
+        declared = set()
+        for stage in self.stages:
+            missing = [dep for dep in stage.deps if dep not in declared]
+            if missing:
+                # Dependencies must be declared first, which also rules out cycles.
+                raise ValueError(f"stage {stage.name} depends on undeclared stages: {missing}")
+            declared.add(stage.name)
+
+    def run(self) -> Dict[str, object]:
+        """Run every stage and return their values by name.
+
+        The first stage to raise stops the graph: nothing new is started,
+        running stages are awaited, and the exception is re-raised.
+        """
+        results: Dict[str, object] = {}
+        if self.max_workers <= 1:
+            for stage in self.stages:
+                results[stage.name] = self._execute(stage, results)
+            return results
+
+        pending = list(self.stages)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="hpl-stage") as pool:
+            running: Dict[Future, Stage] = {}
+            while pending or running:
+                for stage in list(pending):
+                    if len(running) >= self.max_workers:
+                        break
+                    if all(dep in results for dep in stage.deps):
+                        pending.remove(stage)
+                        running[pool.submit(self._execute, stage, dict(results))] = stage
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        wait(running)
+                        raise error
+                    results[stage.name] = future.result()
+        return results
+
+    def _execute(self, stage: Stage, results: Results) -> object:
+        started = time.perf_counter()
+        with tracing.span("stage", stage=stage.name) as span:
+            key = self._cache_key(stage, results)
+            cached = self.cache.get(key) if key is not None and self.cache is not None else None
+            if isinstance(cached, dict) and _restore_outputs(stage, cached):
+                value = cached.get("value")
+                hit = True
+            else:
+                value = stage.run(results)
+                hit = False
+                if key is not None and self.cache is not None:
+                    self.cache.put(key, {"value": value, "outputs": _read_outputs(stage)})
+            if span is not None:
+                span.set_attribute("cache_hit", hit)
+        self.runs[stage.name] = StageRun(stage.name, value, hit, time.perf_counter() - started)
+        return value
+
+    @staticmethod
+    def _cache_key(stage: Stage, results: Results) -> Optional[str]:
+        if stage.key is None:
+            return None
+        key = stage.key(results)
+        return cache_key(stage.name, key) if key is not None else None
+
+
+def package_fingerprint() -> str:
+    """Digest of every module in the package, for stage keys that depend on code."""
+    global _PACKAGE_FINGERPRINT
+    with _FINGERPRINT_LOCK:
+        if _PACKAGE_FINGERPRINT is None:
+            hasher = hashlib.sha256(__version__.encode("utf-8"))
+            for path in sorted(PACKAGE_ROOT.rglob("*.py")):
+                hasher.update(path.relative_to(PACKAGE_ROOT).as_posix().encode("utf-8") + b"\0")
+                hasher.update(hashlib.sha256(path.read_bytes()).digest())
+            _PACKAGE_FINGERPRINT = hasher.hexdigest()
+        return _PACKAGE_FINGERPRINT
+
+
+def _read_outputs(stage: Stage) -> Dict[str, str]:
+    return {path.name: path.read_text(encoding="utf-8") for path in stage.outputs if path.exists()}
+
+
+def _restore_outputs(stage: Stage, cached: Dict[str, object]) -> bool:
+    outputs = cached.get("outputs")
+    if not isinstance(outputs, dict) or "value" not in cached:
+        return False
+    by_name = {path.name: path for path in stage.outputs}
+    if not set(outputs) <= set(by_name):
+        return False
+    for name, text in outputs.items():
+        by_name[name].write_text(str(text), encoding="utf-8")
+    return True
+
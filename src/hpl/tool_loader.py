@@ -0,0 +1,56 @@
+"""Process-wide loader for the repository ``tools`` package."""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+import threading
+from pathlib import Path
+from types import ModuleType
+
+
+ROOT = Path(__file__).resolve().parents[2]
+TOOLS_DIR = ROOT / "tools"
+
+_LOCK = threading.Lock()
+
+
+def load_tool(name: str) -> ModuleType:
+    """Return ``tools.<name>``, importing it on first use only.
+
+    Tools are imported as regular package modules, so repeated calls reuse the
+    ``sys.modules`` entry and the source is compiled through the bytecode cache
+    instead of being re-executed on every call. The ``tools`` package is bound
+    from its file location, so ``sys.path`` is left untouched and a
+    same-named installed package is never shadowed.
+    """
+    module = sys.modules.get(f"tools.{name}")
+    if module is not None:
+        return module
+    with _LOCK:
+        _bind_tools_package()
+        return importlib.import_module(f"tools.{name}")
+
+
+def _bind_tools_package() -> None:
+    package = sys.modules.get("tools")
+    if package is not None:
+        location = getattr(package, "__file__", None)
+        if location is None or Path(location).resolve().parent != TOOLS_DIR:
+            raise ImportError(f"a different 'tools' package is already imported: {location}")
+        return
+    spec = importlib.util.spec_from_file_location(
+        "tools",
+        TOOLS_DIR / "__init__.py",
+        submodule_search_locations=[str(TOOLS_DIR)],
+    )
+    if spec is None or spec.loader is None:
+        raise ImportError(f"unable to load the tools package from {TOOLS_DIR}")
+    package = importlib.util.module_from_spec(spec)
+    sys.modules["tools"] = package
+    try:
+        spec.loader.exec_module(package)
+    except BaseException:
+        sys.modules.pop("tools", None)
+        raise
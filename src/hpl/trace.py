@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 import json
+from array import array
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 from .ast import Node
 
+TRACE_VERSION = "1.0"
+COLUMNS_FORMAT = "hpl.trace.columns.v1"
+KIND_ATOM = 0
+KIND_LIST = 1
+_KIND_NAMES = ("atom", "list")
+_NONE = -1
+
 
 @dataclass
 class TraceNode:
@@ -21,99 +29,296 @@ class TraceNode:
 
 
 class TraceCollector:
+    """Columnar trace store.
+
+    Each recorded node is one row across parallel arrays (phase, parent,
+    child index, kind, value, line, column); strings are interned in a single
+    table. Node ids, paths and the ``to_dict()`` shape are rebuilt on demand.
+    A phase is recorded once, so its rows are contiguous and a node's ordinal
+    within its phase is its offset from the phase's first row.
+    """
+
     def __init__(self, program_id: str = "unknown") -> None:
         self.program_id = program_id
-        self.nodes: List[TraceNode] = []
-        self.mappings: List[Dict[str, str]] = []
-        self.ir_terms: List[Dict[str, object]] = []
-        self._phase_nodes: Dict[str, Dict[int, str]] = {}
-        self._phase_paths: Dict[str, Dict[Tuple[int, ...], str]] = {}
-        self._phase_counts: Dict[str, int] = {}
-        self._recorded_phases: set[str] = set()
+        self._strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self._phase = array("i")
+        self._parent = array("i")
+        self._index = array("i")
+        self._kind = bytearray()
+        self._value = array("i")
+        self._line = array("i")
+        self._column = array("i")
+        self._phase_rows: Dict[str, range] = {}
+        self._phase_nodes: Dict[str, Dict[int, int]] = {}
+        self._map_from = array("i")
+        self._map_to = array("i")
+        self._map_step = array("i")
+        self._term_index = array("i")
+        self._term_source = array("i")
+        self._term_operator = array("i")
+
+    @property
+    def nodes(self) -> List[TraceNode]:
+        return [TraceNode(**node) for node in self._records()[0]]
+
+    @property
+    def mappings(self) -> List[Dict[str, str]]:
+        return list(self._records()[1])
+
+    @property
+    def ir_terms(self) -> List[Dict[str, object]]:
+        return list(self._records()[2])
 
     def record_phase(self, program: List[Node], phase: str) -> None:
-        if phase in self._recorded_phases:
+        if phase in self._phase_rows:
             return
-        self._recorded_phases.add(phase)
-        self._phase_nodes.setdefault(phase, {})
-        self._phase_paths.setdefault(phase, {})
-        self._phase_counts.setdefault(phase, 0)
+        start = len(self._kind)
+        identities = self._phase_nodes[phase] = {}
+        phase_id = self._intern(phase)
 
-        for idx, form in enumerate(program):
-            for node, path in _iter_with_path(form, [idx]):
-                self._assign_node(node, phase, path)
+        # Explicit-stack pre-order walk; paths are implied by (parent, index).
+        stack: List[Tuple[Node, int, int]] = [
+            (form, _NONE, idx) for idx, form in reversed(list(enumerate(program)))
+        ]
+        while stack:
+            node, parent, index = stack.pop()
+            row = len(self._kind)
+            # Every occurrence gets its own row, even when one Node object
+            # appears at several paths; identity lookups resolve to the first.
+            identities.setdefault(id(node), row)
+            self._phase.append(phase_id)
+            self._parent.append(parent)
+            self._index.append(index)
+            value = node.value
+            if isinstance(value, list):
+                self._kind.append(KIND_LIST)
+                self._value.append(_NONE)
+                stack.extend((child, row, idx) for idx, child in reversed(list(enumerate(value))))
+            else:
+                self._kind.append(KIND_ATOM)
+                self._value.append(self._intern(value) if isinstance(value, str) else _NONE)
+            location = node.location
+            if location:
+                self._line.append(location.line)
+                self._column.append(location.column)
+            else:
+                self._line.append(_NONE)
+                self._column.append(_NONE)
+        self._phase_rows[phase] = range(start, len(self._kind))
 
     def map_nodes(self, source: Node, source_phase: str, target: Node, target_phase: str, step: str) -> None:
-        source_id = self._phase_nodes.get(source_phase, {}).get(id(source))
-        target_id = self._phase_nodes.get(target_phase, {}).get(id(target))
-        if not source_id or not target_id:
+        source_row = self._phase_nodes.get(source_phase, {}).get(id(source))
+        target_row = self._phase_nodes.get(target_phase, {}).get(id(target))
+        if source_row is None or target_row is None:
             return
-        self.mappings.append({"from": source_id, "to": target_id, "step": step})
+        self._add_mapping(source_row, target_row, step)
 
     def map_by_path(self, source_phase: str, target_phase: str, step: str) -> None:
-        source_paths = self._phase_paths.get(source_phase, {})
-        target_paths = self._phase_paths.get(target_phase, {})
-        if not source_paths or not target_paths:
+        source_rows = self._phase_rows.get(source_phase, range(0))
+        target_rows = self._phase_rows.get(target_phase, range(0))
+        if not source_rows or not target_rows:
             return
-        for path, target_id in target_paths.items():
-            source_id = source_paths.get(path)
-            if source_id:
-                self.mappings.append({"from": source_id, "to": target_id, "step": step})
+        parent, index = self._parent, self._index
+        source_children = {(parent[row], index[row]): row for row in source_rows}
+        # Rows are in pre-order, so a target's parent is matched before it.
+        matched: Dict[int, int] = {}
+        step_id = self._intern(step)
+        for row in target_rows:
+            target_parent = parent[row]
+            if target_parent == _NONE:
+                source_parent = _NONE
+            else:
+                source_parent = matched.get(target_parent)
+                if source_parent is None:
+                    continue
+            source_row = source_children.get((source_parent, index[row]))
+            if source_row is None:
+                continue
+            matched[row] = source_row
+            self._map_from.append(source_row)
+            self._map_to.append(row)
+            self._map_step.append(step_id)
 
     def record_ir_term(self, term_index: int, source_node: Node, source_phase: str, operator_id: str) -> None:
-        source_id = self._phase_nodes.get(source_phase, {}).get(id(source_node))
-        if not source_id:
+        source_row = self._phase_nodes.get(source_phase, {}).get(id(source_node))
+        if source_row is None:
             return
-        self.ir_terms.append(
-            {
-                "term_index": term_index,
-                "source_node": source_id,
-                "operator_id": operator_id,
-            }
-        )
+        self._term_index.append(term_index)
+        self._term_source.append(source_row)
+        self._term_operator.append(self._intern(operator_id))
 
     def to_dict(self) -> Dict[str, object]:
+        nodes, mappings, ir_terms = self._records()
         return {
-            "version": "1.0",
+            "version": TRACE_VERSION,
             "program_id": self.program_id,
-            "nodes": [node.__dict__ for node in self.nodes],
-            "mappings": list(self.mappings),
-            "ir_terms": list(self.ir_terms),
+            "nodes": list(nodes),
+            "mappings": list(mappings),
+            "ir_terms": list(ir_terms),
         }
 
-    def write_json(self, path: Path) -> None:
-        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+    def to_columns(self) -> Dict[str, object]:
+        """Compact columnar form; ``trace_from_columns`` rebuilds ``to_dict()``."""
+        return {
+            "format": COLUMNS_FORMAT,
+            "version": TRACE_VERSION,
+            "program_id": self.program_id,
+            "strings": list(self._strings),
+            "nodes": {
+                "phase": self._phase.tolist(),
+                "parent": self._parent.tolist(),
+                "index": self._index.tolist(),
+                "kind": list(self._kind),
+                "value": self._value.tolist(),
+                "line": self._line.tolist(),
+                "column": self._column.tolist(),
+            },
+            "mappings": {
+                "from": self._map_from.tolist(),
+                "to": self._map_to.tolist(),
+                "step": self._map_step.tolist(),
+            },
+            "ir_terms": {
+                "term_index": self._term_index.tolist(),
+                "source_node": self._term_source.tolist(),
+                "operator_id": self._term_operator.tolist(),
+            },
+        }
 
-    def _assign_node(self, node: Node, phase: str, path: List[int]) -> None:
-        node_key = id(node)
-        if node_key in self._phase_nodes[phase]:
-            return
-        self._phase_counts[phase] += 1
-        node_id = f"{phase}:{self._phase_counts[phase]}"
-        self._phase_nodes[phase][node_key] = node_id
-        self._phase_paths[phase][tuple(path)] = node_id
-        location = None
-        if node.location:
-            location = {"line": node.location.line, "column": node.location.column}
-        kind = "list" if node.is_list else "atom"
-        value = node.value if isinstance(node.value, str) else None
-        self.nodes.append(
-            TraceNode(
-                node_id=node_id,
-                phase=phase,
-                path=list(path),
-                kind=kind,
-                value=value,
-                location=location,
-            )
+    def write_json(self, path: Path, compact: bool = False) -> None:
+        if compact:
+            text = json.dumps(self.to_columns(), separators=(",", ":"))
+        else:
+            text = json.dumps(self.to_dict(), indent=2)
+        path.write_text(text, encoding="utf-8")
+
+    def write_ndjson(self, path: Path) -> None:
+        """Stream the trace as one JSON record per line (see ``read_ndjson``)."""
+        dumps = json.JSONEncoder(separators=(",", ":")).encode
+        with path.open("w", encoding="utf-8") as handle:
+            handle.write(dumps({"record": "header", "version": TRACE_VERSION, "program_id": self.program_id}))
+            handle.write("\n")
+            for kind, records in zip(("node", "mapping", "ir_term"), self._records()):
+                for record in records:
+                    handle.write(dumps({"record": kind, **record}))
+                    handle.write("\n")
+
+    def _intern(self, value: str) -> int:
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = self._string_ids[value] = len(self._strings)
+            self._strings.append(value)
+        return string_id
+
+    def _add_mapping(self, source_row: int, target_row: int, step: str) -> None:
+        self._map_from.append(source_row)
+        self._map_to.append(target_row)
+        self._map_step.append(self._intern(step))
+
+    def _records(
+        self,
+    ) -> Tuple[Iterator[Dict[str, object]], Iterator[Dict[str, str]], Iterator[Dict[str, object]]]:
+        return _iter_records(
+            self._strings,
+            (self._phase, self._parent, self._index, self._kind, self._value, self._line, self._column),
+            (self._map_from, self._map_to, self._map_step),
+            (self._term_index, self._term_source, self._term_operator),
         )
 
 
-def _iter_with_path(node: Node, path: List[int]) -> Iterable[Tuple[Node, List[int]]]:
-    yield node, list(path)
-    if node.is_list:
-        for idx, child in enumerate(node.as_list()):
-            yield from _iter_with_path(child, path + [idx])
+def trace_from_columns(data: Dict[str, object]) -> Dict[str, object]:
+    """Rebuild the ``TraceCollector.to_dict()`` shape from ``to_columns()``."""
+    if data.get("format") != COLUMNS_FORMAT:
+        raise ValueError(f"unsupported trace format: {data.get('format')!r}")
+    strings: List[str] = data["strings"]  # type: ignore[assignment]
+    nodes: Dict[str, List[int]] = data["nodes"]  # type: ignore[assignment]
+    mappings: Dict[str, List[int]] = data["mappings"]  # type: ignore[assignment]
+    ir_terms: Dict[str, List[int]] = data["ir_terms"]  # type: ignore[assignment]
+    node_records, mapping_records, ir_term_records = _iter_records(
+        strings,
+        tuple(nodes[name] for name in ("phase", "parent", "index", "kind", "value", "line", "column")),
+        (mappings["from"], mappings["to"], mappings["step"]),
+        (ir_terms["term_index"], ir_terms["source_node"], ir_terms["operator_id"]),
+    )
+    return {
+        "version": data["version"],
+        "program_id": data["program_id"],
+        "nodes": list(node_records),
+        "mappings": list(mapping_records),
+        "ir_terms": list(ir_term_records),
+    }
+
+
+def read_ndjson(path: Path) -> Dict[str, object]:
+    """Rebuild the ``TraceCollector.to_dict()`` shape from ``write_ndjson`` output."""
+    result: Dict[str, object] = {"version": TRACE_VERSION, "program_id": "unknown"}
+    sections: Dict[str, List[Dict[str, object]]] = {"node": [], "mapping": [], "ir_term": []}
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            kind = record.pop("record")
+            if kind == "header":
+                result["version"] = record["version"]
+                result["program_id"] = record["program_id"]
+            elif kind in sections:
+                sections[kind].append(record)
+            else:
+                raise ValueError(f"unknown trace record: {kind!r}")
+    result["nodes"] = sections["node"]
+    result["mappings"] = sections["mapping"]
+    result["ir_terms"] = sections["ir_term"]
+    return result
+
+
+def _iter_records(
+    strings: List[str],
+    node_columns: Tuple[Sequence[int], ...],
+    mapping_columns: Tuple[Sequence[int], ...],
+    ir_term_columns: Tuple[Sequence[int], ...],
+) -> Tuple[Iterator[Dict[str, object]], Iterator[Dict[str, str]], Iterator[Dict[str, object]]]:
+    node_ids = _node_ids(strings, node_columns[0])
+    mappings = (
+        {"from": node_ids[source], "to": node_ids[target], "step": strings[step]}
+        for source, target, step in zip(*mapping_columns)
+    )
+    ir_terms = (
+        {"term_index": term_index, "source_node": node_ids[source], "operator_id": strings[operator]}
+        for term_index, source, operator in zip(*ir_term_columns)
+    )
+    return _iter_node_dicts(strings, node_ids, node_columns), mappings, ir_terms
+
+
+def _node_ids(strings: List[str], phases: Sequence[int]) -> List[str]:
+    ordinals: Dict[int, int] = {}
+    node_ids: List[str] = []
+    for phase in phases:
+        ordinal = ordinals[phase] = ordinals.get(phase, 0) + 1
+        node_ids.append(f"{strings[phase]}:{ordinal}")
+    return node_ids
+
+
+def _iter_node_dicts(
+    strings: List[str],
+    node_ids: List[str],
+    node_columns: Tuple[Sequence[int], ...],
+) -> Iterator[Dict[str, object]]:
+    # Parents precede their children, so each path extends an earlier one.
+    paths: List[List[int]] = []
+    for node_id, phase, parent, index, kind, value, line, column in zip(node_ids, *node_columns):
+        path = [index] if parent == _NONE else paths[parent] + [index]
+        paths.append(path)
+        yield {
+            "node_id": node_id,
+            "phase": strings[phase],
+            "path": list(path),
+            "kind": _KIND_NAMES[kind],
+            "value": strings[value] if value != _NONE else None,
+            "location": {"line": line, "column": column} if line != _NONE else None,
+        }
+
 
 def emit_witness_record(
     observer_id: str,
@@ -0,0 +1,335 @@
+"""Pluggable span hooks for pipeline timing (tooling-only).
+
+Not to be confused with ``hpl.trace``, which records source-to-IR
+traceability. This module times work: pipeline stages (parse, expand,
+validate, emit, plan, run, bundle, anchor), each runtime step and each IO/NET
+adapter call open a span, and registered hooks get ``on_start``/``on_end``
+callbacks. Spans nest through a context variable and carry
+OpenTelemetry-style trace and span ids.
+
+With no hooks registered, ``span()`` returns one shared no-op context
+manager after a single tuple check, so instrumented hot paths cost
+effectively nothing. Two exporters ship here: ``JsonlExporter`` (one span per
+line) and ``OtlpFileExporter`` (OTLP/JSON ``resourceSpans`` written to a file
+for offline import). ``configure_from_env`` registers them from
+``HPL_TRACE_JSONL`` / ``HPL_TRACE_OTLP``.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextvars
+import functools
+import json
+import os
+import secrets
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Protocol, Tuple, TypeVar
+
+
+SERVICE_NAME = "hpl"
+TRACE_JSONL_ENV = "HPL_TRACE_JSONL"
+TRACE_OTLP_ENV = "HPL_TRACE_OTLP"
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+
+AttributeValue = object
+T = TypeVar("T")
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: Optional[str]
+    start_time_ns: int
+    attributes: Dict[str, AttributeValue] = field(default_factory=dict)
+    end_time_ns: Optional[int] = None
+    status: str = STATUS_OK
+    error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "start_time_unix_nano": self.start_time_ns,
+            "end_time_unix_nano": self.end_time_ns,
+            "duration_ns": (self.end_time_ns - self.start_time_ns) if self.end_time_ns is not None else None,
+            "attributes": dict(self.attributes),
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+class SpanHook(Protocol):
+    def on_start(self, span: Span) -> None: ...
+
+    def on_end(self, span: Span) -> None: ...
+
+
+_HOOKS: Tuple[SpanHook, ...] = ()
+_HOOKS_LOCK = threading.Lock()
+_CURRENT: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar("hpl_tracing_span", default=None)
+
+
+def register_hook(hook: SpanHook) -> SpanHook:
+    global _HOOKS
+    with _HOOKS_LOCK:
+        if hook not in _HOOKS:
+            _HOOKS = _HOOKS + (hook,)
+    return hook
+
+
+def unregister_hook(hook: SpanHook) -> None:
+    global _HOOKS
+    with _HOOKS_LOCK:
+        _HOOKS = tuple(item for item in _HOOKS if item is not hook)
+
+
+def clear_hooks() -> None:
+    global _HOOKS
+    with _HOOKS_LOCK:
+        _HOOKS = ()
+
+
+def enabled() -> bool:
+    return bool(_HOOKS)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: object) -> bool:
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _ActiveSpan:
+    __slots__ = ("_hooks", "_span", "_token")
+
+    def __init__(self, hooks: Tuple[SpanHook, ...], name: str, attributes: Dict[str, AttributeValue]) -> None:
+        parent = _CURRENT.get()
+        self._hooks = hooks
+        self._span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent is not None else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_span_id=parent.span_id if parent is not None else None,
+            start_time_ns=0,
+            attributes=attributes,
+        )
+        self._token: Optional[contextvars.Token] = None
+
+    def __enter__(self) -> Span:
+        span = self._span
+        span.start_time_ns = time.time_ns()
+        self._token = _CURRENT.set(span)
+        for hook in self._hooks:
+            hook.on_start(span)
+        return span
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> bool:
+        span = self._span
+        span.end_time_ns = time.time_ns()
+        if exc is not None:
+            span.status = STATUS_ERROR
+            span.error = f"{type(exc).__name__}: {exc}"
+        if self._token is not None:
+            _CURRENT.reset(self._token)
+        for hook in self._hooks:
+            hook.on_end(span)
+        return False
+
+
+def span(name: str, **attributes: AttributeValue) -> object:
+    """Context manager timing ``name``; a shared no-op when no hooks are set.
+
+    Entering an active span yields the ``Span`` so callers can attach
+    attributes; the no-op yields None.
+    """
+    hooks = _HOOKS
+    if not hooks:
+        return _NOOP_SPAN
+    return _ActiveSpan(hooks, name, attributes)
+
+
+def traced(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorator form of ``span`` for whole functions."""
+
+    def decorate(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args: object, **kwargs: object) -> T:
+            hooks = _HOOKS
+            if not hooks:
+                return func(*args, **kwargs)
+            with _ActiveSpan(hooks, name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+class TracedAdapter:
+    """Proxy that opens ``<prefix>.<method>`` spans around adapter calls."""
+
+    def __init__(self, adapter: object, prefix: str) -> None:
+        self._adapter = adapter
+        self._prefix = prefix
+
+    def __getattr__(self, name: str) -> object:
+        attribute = getattr(self._adapter, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+        span_name = f"{self._prefix}.{name}"
+        adapter_name = type(self._adapter).__name__
+
+        def call(*args: object, **kwargs: object) -> object:
+            with span(span_name, adapter=adapter_name):
+                return attribute(*args, **kwargs)
+
+        return call
+
+
+def trace_adapter(adapter: T, prefix: str) -> T:
+    """Wrap ``adapter`` for call spans, or return it untouched when disabled."""
+    if not _HOOKS:
+        return adapter
+    return TracedAdapter(adapter, prefix)  # type: ignore[return-value]
+
+
+class JsonlExporter:
+    """Appends each finished span to ``path`` as one JSON object per line."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._handle = self.path.open("a", encoding="utf-8")
+
+    def on_start(self, span: Span) -> None:
+        return None
+
+    def on_end(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), sort_keys=True, separators=(",", ":"), default=str)
+        with self._lock:
+            self._handle.write(line + "\n")
+            self._handle.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._handle.closed:
+                self._handle.close()
+
+
+class OtlpFileExporter:
+    """Collects spans and writes them as an OTLP/JSON ``ExportTraceServiceRequest``.
+
+    The file can be replayed into a collector offline (for example with the
+    OpenTelemetry Collector's ``otlpjsonfile`` receiver). No OpenTelemetry
+    packages are required.
+    """
+
+    def __init__(self, path: Path, service_name: str = SERVICE_NAME) -> None:
+        self.path = Path(path)
+        self.service_name = service_name
+        self._lock = threading.Lock()
+        self._spans: List[Span] = []
+
+    def on_start(self, span: Span) -> None:
+        return None
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def to_dict(self) -> Dict[str, object]:
+        with self._lock:
+            spans = list(self._spans)
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [_otlp_span(item) for item in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def flush(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+    def close(self) -> None:
+        self.flush()
+
+
+def configure_from_env() -> List[SpanHook]:
+    """Register exporters named by ``HPL_TRACE_JSONL`` / ``HPL_TRACE_OTLP``.
+
+    Exporters are closed at interpreter exit. Returns the hooks registered.
+    """
+    hooks: List[SpanHook] = []
+    jsonl_path = os.getenv(TRACE_JSONL_ENV)
+    if jsonl_path:
+        hooks.append(JsonlExporter(Path(jsonl_path)))
+    otlp_path = os.getenv(TRACE_OTLP_ENV)
+    if otlp_path:
+        hooks.append(OtlpFileExporter(Path(otlp_path)))
+    for hook in hooks:
+        register_hook(hook)
+        atexit.register(hook.close)  # type: ignore[attr-defined]
+    return hooks
+
+
+_OTLP_STATUS_CODES = {STATUS_OK: 1, STATUS_ERROR: 2}
+_OTLP_SPAN_KIND_INTERNAL = 1
+
+
+def _otlp_span(span: Span) -> Dict[str, object]:
+    data: Dict[str, object] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": _OTLP_SPAN_KIND_INTERNAL,
+        "startTimeUnixNano": str(span.start_time_ns),
+        "endTimeUnixNano": str(span.end_time_ns if span.end_time_ns is not None else span.start_time_ns),
+        "attributes": [_otlp_attribute(key, value) for key, value in sorted(span.attributes.items())],
+        "status": {"code": _OTLP_STATUS_CODES[span.status]},
+    }
+    if span.parent_span_id is not None:
+        data["parentSpanId"] = span.parent_span_id
+    if span.error is not None:
+        data["status"]["message"] = span.error  # type: ignore[index]
+    return data
+
+
+def _otlp_attribute(key: str, value: AttributeValue) -> Dict[str, object]:
+    if isinstance(value, bool):
+        encoded: Dict[str, object] = {"boolValue": value}
+    elif isinstance(value, int):
+        # OTLP/JSON encodes 64-bit integers as strings.
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
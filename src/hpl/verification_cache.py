@@ -0,0 +1,114 @@
+"""Process-wide memo of epoch-anchor and anchor-signature verification."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .tool_loader import load_tool
+
+
+@dataclass(frozen=True)
+class VerificationOutcome:
+    ok: bool
+    errors: List[str]
+    cache_hit: bool
+
+
+_LOCK = threading.Lock()
+_EPOCH_RESULTS: Dict[Tuple[object, ...], Tuple[bool, Tuple[str, ...]]] = {}
+_SIGNATURE_RESULTS: Dict[Tuple[str, str, str], Tuple[bool, Tuple[str, ...]]] = {}
+
+
+def verify_epoch_anchor(
+    anchor: Dict[str, object],
+    root: Path,
+    git_commit_override: Optional[str] = None,
+) -> VerificationOutcome:
+    """Verify ``anchor`` against ``root``, reusing an earlier identical check.
+
+    The key covers the anchor content, the verification root and commit
+    override, and the stat fingerprint (path, size, mtime, inode) of every
+    file the anchor hashes, so any touched spec file forces a re-hash.
+    """
+    verify_epoch = load_tool("verify_epoch")
+    key = (
+        _digest_text(_canonical_json(anchor)),
+        str(Path(root).resolve()),
+        git_commit_override,
+        _required_files_fingerprint(verify_epoch, Path(root)),
+    )
+    with _LOCK:
+        cached = _EPOCH_RESULTS.get(key)
+    if cached is not None:
+        return VerificationOutcome(ok=cached[0], errors=list(cached[1]), cache_hit=True)
+
+    ok, errors = verify_epoch.verify_epoch_anchor(
+        anchor,
+        root=root,
+        git_commit_override=git_commit_override,
+    )
+    with _LOCK:
+        _EPOCH_RESULTS[key] = (ok, tuple(errors))
+    return VerificationOutcome(ok=ok, errors=list(errors), cache_hit=False)
+
+
+def verify_anchor_signature(
+    anchor_path: Path,
+    signature_path: Path,
+    public_key_path: Path,
+) -> VerificationOutcome:
+    """Verify an anchor signature keyed by anchor, signature and key digests."""
+    verify_sig = load_tool("verify_anchor_signature")
+    key = (
+        _digest_bytes(anchor_path.read_bytes()),
+        _digest_bytes(signature_path.read_bytes()),
+        _digest_bytes(public_key_path.read_bytes()),
+    )
+    with _LOCK:
+        cached = _SIGNATURE_RESULTS.get(key)
+    if cached is not None:
+        return VerificationOutcome(ok=cached[0], errors=list(cached[1]), cache_hit=True)
+
+    verify_key = verify_sig._load_verify_key(public_key_path, "UNUSED")
+    ok, errors = verify_sig.verify_anchor_signature(anchor_path, signature_path, verify_key)
+    with _LOCK:
+        _SIGNATURE_RESULTS[key] = (ok, tuple(errors))
+    return VerificationOutcome(ok=ok, errors=list(errors), cache_hit=False)
+
+
+def clear_verification_cache() -> None:
+    with _LOCK:
+        _EPOCH_RESULTS.clear()
+        _SIGNATURE_RESULTS.clear()
+
+
+def _required_files_fingerprint(verify_epoch: object, root: Path) -> Tuple[Tuple[object, ...], ...]:
+    required = verify_epoch.anchor_epoch.collect_required_paths(root)  # type: ignore[attr-defined]
+    entries: List[Tuple[object, ...]] = []
+    for paths in required.values():
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                entries.append((str(path), None))
+                continue
+            entries.append((str(path), stat.st_size, stat.st_mtime_ns, stat.st_ino))
+    return tuple(sorted(entries, key=lambda item: str(item[0])))
+
+
+def _canonical_json(data: object) -> str:
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+
+def _digest_text(value: str) -> str:
+    return _digest_bytes(value.encode("utf-8"))
+
+
+def _digest_bytes(value: bytes) -> str:
+    digest = hashlib.sha256(value).hexdigest()
+    return f"sha256:{digest}"
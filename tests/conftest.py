@@ -0,0 +1,9 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_hpl_cache(tmp_path, monkeypatch):
+    # Each test gets its own persistent cache, so entries left by earlier runs
+    # (or other tests) can never stand in for work the test means to exercise.
+    # Subprocesses inherit the variable.
+    monkeypatch.setenv("HPL_CACHE_DIR", str(tmp_path / "hpl_cache"))
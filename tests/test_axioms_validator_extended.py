@@ -15,6 +15,7 @@ from hpl.ast import Node, SourceLocation
 from hpl.errors import ValidationError
 from hpl.axioms.validator import (
     validate_program,
+    validate_and_collect_terms,
     _reject_surface_symbols,
     _validate_form,
     _validate_operator,
@@ -32,6 +33,7 @@ from hpl.axioms.validator import (
     LAMBDA_SYMBOL,
     SURFACE_SYMBOLS,
 )
+from hpl.dynamics.ir_emitter import _collect_terms
 from hpl.trace import TraceCollector
 
 
@@ -668,5 +670,45 @@ class TestIntegrationValidateProgram(unittest.TestCase):
         validate_program([form])
 
 
+
+# ============================================================================
+# Single-walk engine
+# ============================================================================
+
+class TestValidationWalk(unittest.TestCase):
+
+    def test_deeply_nested_expression_does_not_recurse(self):
+        expr = num(1)
+        for _ in range(sys.getrecursionlimit() * 3):
+            expr = lst(sym("neg"), expr)
+        validate_program([lst(sym("invariant"), sym("deep"), expr)])
+
+    def test_surface_symbol_wins_over_earlier_structural_error(self):
+        form = lst(sym("operator"), num(1), lst(sym("size")))
+        with self.assertRaises(ValidationError) as cm:
+            validate_program([form])
+        self.assertIn("Surface symbol", str(cm.exception))
+        self.assertEqual(cm.exception.path, [0, 2, 0])
+
+    def test_error_path_is_materialised(self):
+        bad_term = lst(sym("term"), sym("H"), sym("x"))
+        ham = lst(sym("hamiltonian"), lst(sym("term"), sym("G"), num(1)), bad_term)
+        form = lst(sym("invariant"), sym("inv"), lst(sym("evolve"), sym("psi"), ham))
+        with self.assertRaises(ValidationError) as cm:
+            validate_program([make_operator(), form])
+        self.assertIn("coefficient must be a number", str(cm.exception))
+        self.assertEqual(cm.exception.path, [1, 2, 2, 2, 2])
+
+    def test_collected_terms_match_ir_emitter(self):
+        program = [
+            make_operator(),
+            lst(sym("invariant"), sym("a"), make_hamiltonian()),
+            lst(sym("hamiltonian"), lst(sym("term"), sym("Z"), num(3))),
+        ]
+        terms = validate_and_collect_terms(program)
+        self.assertEqual(terms, _collect_terms(program))
+        self.assertEqual([term[0] for term in terms][-1], "Z")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,163 @@
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = str(ROOT / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks import generators, harness, run, scaling  # noqa: E402
+from hpl import scheduler  # noqa: E402
+from hpl.cache import CACHE_DISABLED_ENV  # noqa: E402
+from hpl.compile_cache import compile_source  # noqa: E402
+
+
+def _results(latencies):
+    return {
+        "format": harness.RESULTS_FORMAT,
+        "results": {key: {"latency_s": {"p50": value, "p90": value}} for key, value in latencies.items()},
+    }
+
+
+class BenchmarkHarnessTests(unittest.TestCase):
+    def test_percentiles_use_nearest_rank(self):
+        samples = [float(value) for value in range(1, 101)]
+        summary = harness.summarize(list(reversed(samples)))
+        self.assertEqual(summary["min"], 1.0)
+        self.assertEqual(summary["p50"], 50.0)
+        self.assertEqual(summary["p90"], 90.0)
+        self.assertEqual(summary["p99"], 99.0)
+        self.assertEqual(summary["max"], 100.0)
+        self.assertEqual(harness.percentile([3.0], 99), 3.0)
+
+    def test_compare_flags_regressions_beyond_tolerance(self):
+        baseline = _results({"plan/steps=10": 1.0, "run/steps=10": 1.0, "scan/bytes=1": 1.0, "old/x=1": 1.0})
+        current = _results({"plan/steps=10": 1.2, "run/steps=10": 1.5, "scan/bytes=1": 0.5, "new/x=1": 1.0})
+
+        report = harness.compare(current, baseline, tolerance=0.25)
+
+        self.assertFalse(report["ok"])
+        self.assertEqual([item["case"] for item in report["regressions"]], ["run/steps=10"])
+        self.assertEqual(report["regressions"][0]["ratio"], 1.5)
+        self.assertEqual([item["case"] for item in report["improvements"]], ["scan/bytes=1"])
+        self.assertEqual(report["missing_in_current"], ["old/x=1"])
+        self.assertEqual(report["missing_in_baseline"], ["new/x=1"])
+        self.assertTrue(harness.compare(current, baseline, tolerance=0.6)["ok"])
+        with self.assertRaises(ValueError):
+            harness.compare({"format": "other"}, baseline)
+
+    def test_generators_produce_the_requested_sizes(self):
+        plan = scheduler.plan(generators.program_ir(25), scheduler.SchedulerContext(budget_steps=25))
+        self.assertEqual(len(plan.steps), 25)
+        compiled = compile_source(generators.strategy_source(3), program_id="bench_generators")
+        self.assertTrue(compiled.program_ir["hamiltonian"]["terms"])
+        self.assertEqual(len(generators.ns_state(6)["field"]), 36)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = generators.write_files(Path(tmp_dir), 7, 10_001)
+            sizes = [path.stat().st_size for path in paths]
+        self.assertEqual(len(paths), 7)
+        self.assertEqual(sum(sizes), 10_001)
+
+    def test_streamed_fixtures_match_their_in_memory_form(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for grid in (1, 4):
+                streamed = generators.write_ns_state(Path(tmp_dir) / f"ns_{grid}.json", grid)
+                dumped = generators.write_json(Path(tmp_dir) / f"ns_{grid}_ref.json", generators.ns_state(grid))
+                self.assertEqual(streamed.read_bytes(), dumped.read_bytes())
+            for ticks in (1, 4096, 5000):
+                streamed = generators.write_price_series(Path(tmp_dir) / f"prices_{ticks}.json", ticks)
+                reference = Path(tmp_dir) / f"prices_{ticks}_ref.json"
+                dumped = generators.write_json(reference, generators.price_series(ticks))
+                self.assertEqual(streamed.read_bytes(), dumped.read_bytes())
+        self.assertEqual(generators.price_series(3)["prices"], [100.0, 100.077, 100.0872])
+
+
+class BenchmarkRunnerTests(unittest.TestCase):
+    def test_quick_profile_measures_each_size_with_caches_disabled(self):
+        previous = os.environ.get(CACHE_DISABLED_ENV)
+        results = run.run_suite("quick", cases=["plan", "verify_anchor"], repeat=2, warmup=0)
+
+        self.assertEqual(os.environ.get(CACHE_DISABLED_ENV), previous)
+        self.assertEqual(
+            sorted(results["results"]),
+            ["plan/steps=10", "plan/steps=200", "verify_anchor/files=10,bytes=65536"],
+        )
+        plan_result = results["results"]["plan/steps=200"]
+        self.assertEqual(plan_result["units_per_call"], 200)
+        self.assertEqual(plan_result["repeat"], 2)
+        self.assertLessEqual(plan_result["latency_s"]["min"], plan_result["latency_s"]["max"])
+        with self.assertRaises(ValueError):
+            run.run_suite("quick", cases=["missing"])
+
+    def test_compare_mode_exit_code_follows_the_baseline(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_path = Path(tmp_dir) / "results.json"
+            argv = ["--case", "plan", "--repeat", "1", "--out", str(out_path)]
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(run.main(argv), 0)
+            results = json.loads(out_path.read_text(encoding="utf-8"))
+
+            for scale, expected in ((1000.0, 0), (0.001, 1)):
+                baseline = json.loads(json.dumps(results))
+                for result in baseline["results"].values():
+                    result["latency_s"]["p50"] *= scale
+                baseline_path = Path(tmp_dir) / f"baseline_{expected}.json"
+                baseline_path.write_text(json.dumps(baseline), encoding="utf-8")
+                stdout = io.StringIO()
+                with contextlib.redirect_stdout(stdout):
+                    code = run.main(argv + ["--compare", str(baseline_path)])
+                self.assertEqual(code, expected)
+                self.assertEqual(json.loads(stdout.getvalue())["ok"], expected == 0)
+
+    def test_committed_baselines_cover_every_case(self):
+        for profile in ("quick", "full"):
+            baseline = json.loads(run.baseline_path(profile).read_text(encoding="utf-8"))
+            self.assertEqual(baseline["format"], harness.RESULTS_FORMAT)
+            self.assertEqual(baseline["profile"], profile)
+            expected = {key for case in run.CASES.values() for key, _ in case.keys(profile)}
+            self.assertEqual(set(baseline["results"]), expected)
+
+
+class ScalingBenchmarkTests(unittest.TestCase):
+    def test_smallest_classes_complete_and_match_reference_digests(self):
+        report = scaling.run_scaling(list(scaling.PACKS), max_grid=16, max_ticks=100, isolate=False)
+
+        self.assertTrue(report["ok"])
+        cases = {item["case"]: item for item in report["classes"]}
+        self.assertEqual(sorted(cases), ["ns/grid=16", "trading_paper/ticks=100", "trading_shadow/ticks=100"])
+        for item in cases.values():
+            self.assertEqual(item["status"], "completed")
+            self.assertEqual(item["digest_check"], "match")
+            self.assertEqual(item["artifact_bytes"], sum(entry["bytes"] for entry in item["artifacts"].values()))
+        ns_steps = [step["effect_type"] for step in cases["ns/grid=16"]["steps"]]
+        self.assertEqual(len(ns_steps), 7)
+        self.assertTrue(all(name.startswith("NS_") for name in ns_steps))
+        self.assertIn("ns_state_final.json", cases["ns/grid=16"]["artifacts"])
+
+    def test_digest_drift_fails_the_report(self):
+        report = scaling.run_scaling(
+            ["trading_paper"],
+            max_ticks=100,
+            reference={"trading_paper/ticks=100": "sha256:" + "0" * 64},
+        )
+        (record,) = report["classes"]
+        self.assertFalse(report["ok"])
+        self.assertEqual(record["digest_check"], "mismatch")
+        self.assertGreater(record["peak_rss_bytes"], 0)
+
+    def test_reference_digests_cover_every_size_class(self):
+        reference = scaling.load_reference_digests()
+        expected = {scaling.case_key(pack, size) for pack in scaling.PACKS.values() for size in pack.sizes}
+        self.assertEqual(set(reference), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
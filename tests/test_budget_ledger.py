@@ -0,0 +1,214 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = str(ROOT / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from hpl import scheduler
+from hpl.execution_token import ExecutionToken
+from hpl.runtime.budget_ledger import BudgetLedger
+from hpl.runtime.contracts import ExecutionContract
+from hpl.runtime.context import RuntimeContext
+from hpl.runtime.engine import RuntimeEngine
+
+
+FIXTURE = ROOT / "tests" / "fixtures" / "program_ir_minimal.json"
+
+
+def _debit_until_refused(path, account_id):
+    ledger = BudgetLedger(Path(path))
+    try:
+        account = ledger.account(account_id, batch_size=2)
+        granted = 0
+        while account.debit({"steps": 1}) is None:
+            granted += 1
+        account.release()
+        return granted
+    finally:
+        ledger.close()
+
+
+def _run(plan, budget_account):
+    token = ExecutionToken.from_dict(plan.execution_token or {})
+    contract = ExecutionContract(allowed_steps={step["operator_id"] for step in plan.steps})
+    return RuntimeEngine().run(plan, RuntimeContext(execution_token=token, budget_account=budget_account), contract)
+
+
+class BudgetLedgerTests(unittest.TestCase):
+    def test_child_caps_intersect_parent_and_debits_roll_up(self):
+        with BudgetLedger() as ledger:
+            parent = ledger.open_account("root", {"steps": 6, "io_calls": 1})
+            first = parent.child("run_a", {"steps": 5})
+            second = parent.child("run_b", {"steps": 10, "io_calls": 3})
+
+            self.assertIsNone(first.debit({"steps": 4}))
+            self.assertEqual(second.debit({"steps": 3}), "steps")
+            self.assertIsNone(second.debit({"steps": 2, "io_calls": 1}))
+            self.assertEqual(first.debit({"io_calls": 1}), "io_calls")
+
+            snapshot = ledger.snapshot()
+        balances = {item["account_id"]: item["balances"] for item in snapshot["accounts"]}
+        self.assertEqual(balances["root"]["steps"], {"cap": 6, "spent": 6, "remaining": 0})
+        self.assertEqual(balances["run_b"]["steps"]["cap"], 6)
+        self.assertEqual(balances["run_b"]["io_calls"]["cap"], 1)
+        self.assertEqual(balances["run_a"]["io_calls"]["spent"], 0)
+
+    def test_concurrent_batched_debits_respect_the_parent_cap(self):
+        with BudgetLedger() as ledger:
+            parent = ledger.open_account("root", {"steps": 50})
+            children = [parent.child(f"run_{idx}", batch_size=4) for idx in range(6)]
+            granted = [0] * len(children)
+
+            def spend(idx):
+                while children[idx].debit({"steps": 1}) is None:
+                    granted[idx] += 1
+                children[idx].release()
+
+            threads = [threading.Thread(target=spend, args=(idx,)) for idx in range(len(children))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            root = ledger.snapshot("root")["accounts"][0]["balances"]["steps"]
+            spent_by_child = {
+                item["account_id"]: item["balances"]["steps"]["spent"] for item in ledger.snapshot()["accounts"]
+            }
+        self.assertEqual(sum(granted), 50)
+        self.assertEqual(root["spent"], 50)
+        for idx, child in enumerate(children):
+            self.assertEqual(spent_by_child[child.account_id], granted[idx])
+            self.assertEqual(child.debited, {"steps": granted[idx]} if granted[idx] else {})
+
+    def test_file_ledger_is_shared_across_processes(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "ledger.sqlite"
+            with BudgetLedger(path) as ledger:
+                ledger.open_account("root", {"steps": 40})
+            with ProcessPoolExecutor(max_workers=3) as pool:
+                granted = list(pool.map(_debit_until_refused, [str(path)] * 3, ["root"] * 3))
+            with BudgetLedger(path) as ledger:
+                balance = ledger.snapshot("root")["accounts"][0]["balances"]["steps"]
+
+        self.assertEqual(sum(granted), 40)
+        self.assertEqual(balance["spent"], 40)
+
+    def test_unknown_kind_and_account_are_rejected(self):
+        with BudgetLedger() as ledger:
+            account = ledger.open_account("root")
+            with self.assertRaises(ValueError):
+                account.debit({"gas": 1})
+            with self.assertRaises(KeyError):
+                ledger.account("missing")
+            with self.assertRaises(ValueError):
+                ledger.open_account("root", parent_id="other")
+
+
+class RuntimeLedgerTests(unittest.TestCase):
+    def setUp(self):
+        program_ir = json.loads(FIXTURE.read_text(encoding="utf-8"))
+        self.plan = scheduler.plan(program_ir, scheduler.SchedulerContext())
+
+    def test_engine_debits_each_step_and_snapshots_the_ledger(self):
+        with BudgetLedger() as ledger:
+            parent = ledger.open_account("authority", {"steps": 3})
+            completed = _run(self.plan, parent.child("run_1", batch_size=8))
+            denied = _run(self.plan, parent.child("run_2"))
+
+        self.assertEqual(completed.status, "completed")
+        self.assertEqual(completed.budget_ledger["debited"], {"steps": 2})
+        self.assertEqual(denied.status, "denied")
+        self.assertIn("ledger_budget_exceeded:steps", denied.reasons)
+        self.assertIn("ledger_budget_denied", [record["stage"] for record in denied.witness_records])
+        authority = [item for item in denied.budget_ledger["accounts"] if item["account_id"] == "authority"]
+        self.assertEqual(authority[0]["balances"]["steps"]["spent"], 3)
+
+    def test_a_raising_handler_returns_every_leased_unit(self):
+        def explode(step, ctx):
+            raise RuntimeError("handler crashed")
+
+        for batch_size in (1, 8):
+            with self.subTest(batch_size=batch_size), BudgetLedger() as ledger:
+                ledger.open_account("authority", {"steps": 10})
+                account = ledger.account("authority", batch_size=batch_size)
+                with mock.patch("hpl.runtime.engine.get_handler", return_value=explode):
+                    with self.assertRaisesRegex(RuntimeError, "handler crashed"):
+                        _run(self.plan, account)
+                balances = ledger.snapshot("authority")["accounts"][0]["balances"]
+
+                self.assertEqual(balances["steps"]["spent"], 0)
+                self.assertEqual(account.debited, {})
+
+    def test_results_without_a_ledger_keep_their_shape(self):
+        result = _run(self.plan, None)
+        self.assertNotIn("budget_ledger", result.to_dict())
+
+    def test_cli_run_writes_ledger_snapshot_evidence(self):
+        env = os.environ.copy()
+        env["PYTHONPATH"] = SRC_PATH + os.pathsep + env.get("PYTHONPATH", "")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            ledger_path = tmp / "ledger.sqlite"
+            opened = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "hpl.cli",
+                    "ledger",
+                    "open",
+                    str(ledger_path),
+                    "--account",
+                    "authority",
+                    "--cap",
+                    "steps=10",
+                ],
+                cwd=ROOT,
+                env=env,
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            plan_path = tmp / "plan.json"
+            plan_path.write_text(json.dumps(self.plan.to_dict()), encoding="utf-8")
+            out_path = tmp / "run.json"
+            subprocess.check_call(
+                [
+                    sys.executable,
+                    "-m",
+                    "hpl.cli",
+                    "run",
+                    str(plan_path),
+                    "--out",
+                    str(out_path),
+                    "--budget-ledger",
+                    str(ledger_path),
+                    "--budget-account",
+                    "authority",
+                ],
+                cwd=ROOT,
+                env=env,
+            )
+            snapshot = json.loads((tmp / "budget_ledger.json").read_text(encoding="utf-8"))
+            evidence = json.loads((tmp / "run_evidence.json").read_text(encoding="utf-8"))
+            runtime = json.loads(out_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(json.loads(opened.stdout)["accounts"][0]["balances"]["steps"]["cap"], 10)
+        self.assertEqual(snapshot["debited"], {"steps": 2})
+        self.assertEqual(snapshot["accounts"][0]["balances"]["steps"]["spent"], 2)
+        self.assertIn("budget_ledger", evidence["outputs"])
+        # The snapshot is evidence on its own; the runtime result stays per-run.
+        self.assertNotIn("budget_ledger", runtime)
+
+
+if __name__ == "__main__":
+    unittest.main()
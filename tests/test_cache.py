@@ -0,0 +1,144 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = str(ROOT / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from hpl.cache import CACHE_DISABLED_ENV, FileHashCache, JsonCache, cache_key
+
+
+class JsonCacheTests(unittest.TestCase):
+    def test_round_trip_persists_across_instances(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            key = cache_key("policy", "sha256:abc")
+            JsonCache("demo", root=Path(tmp_dir)).put(key, {"value": [1, 2]})
+            self.assertEqual(JsonCache("demo", root=Path(tmp_dir)).get(key), {"value": [1, 2]})
+            self.assertIsNone(JsonCache("other", root=Path(tmp_dir)).get(key))
+
+    def test_corrupt_entry_is_a_miss(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = JsonCache("demo", root=Path(tmp_dir))
+            key = cache_key("entry")
+            cache.put(key, {"ok": True})
+            cache.clear_memory()
+            cache._entry_path(key).write_text("{not json", encoding="utf-8")
+            self.assertIsNone(cache.get(key))
+
+    def test_disabled_cache_never_hits(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = JsonCache("demo", root=Path(tmp_dir))
+            key = cache_key("entry")
+            cache.put(key, {"ok": True})
+            with mock.patch.dict(os.environ, {CACHE_DISABLED_ENV: "1"}):
+                self.assertIsNone(cache.get(key))
+
+
+class FileHashCacheTests(unittest.TestCase):
+    def _write(self, path, payload, age_seconds=60):
+        path.write_bytes(payload)
+        stamp = path.stat().st_mtime - age_seconds
+        os.utime(path, (stamp, stamp))
+
+    def test_unchanged_files_are_not_reread(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            paths = [tmp / f"spec_{idx}.json" for idx in range(4)]
+            for idx, path in enumerate(paths):
+                self._write(path, f"payload {idx}".encode("utf-8"))
+            first = FileHashCache(root=tmp / "cache").digests(paths, max_workers=2)
+
+            cache = FileHashCache(root=tmp / "cache")
+            with mock.patch("hpl.cache._hash_file", side_effect=AssertionError("file re-hashed")):
+                second = cache.digests(paths)
+
+        self.assertEqual(first, second)
+        self.assertEqual((cache.hits, cache.misses), (4, 0))
+        self.assertTrue(first[paths[0]].startswith("sha256:"))
+
+    def test_touched_file_is_rehashed_alone(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            stable, touched = tmp / "stable.md", tmp / "touched.md"
+            self._write(stable, b"stable")
+            self._write(touched, b"before")
+            FileHashCache(root=tmp / "cache").digests([stable, touched])
+            self._write(touched, b"after!", age_seconds=30)
+
+            cache = FileHashCache(root=tmp / "cache")
+            digests = cache.digests([stable, touched])
+
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+            rehashed = FileHashCache(root=tmp / "other", verify=True).digests([touched])
+            self.assertEqual(digests[touched], rehashed[touched])
+
+    def test_verify_mode_rehashes_and_counts_stale_entries(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            path = tmp / "spec.md"
+            self._write(path, b"original")
+            cache = FileHashCache(root=tmp / "cache")
+            actual = cache.digests([path])[path]
+            index = json.loads(cache.index_path.read_text(encoding="utf-8"))
+            for entry in index["entries"].values():
+                entry[-1] = "sha256:" + "0" * 64
+            cache.index_path.write_text(json.dumps(index), encoding="utf-8")
+
+            trusted = FileHashCache(root=tmp / "cache").digests([path])[path]
+            verifier = FileHashCache(root=tmp / "cache", verify=True)
+            verified = verifier.digests([path])[path]
+
+        self.assertEqual(trusted, "sha256:" + "0" * 64)
+        self.assertEqual(verified, actual)
+        self.assertEqual(verifier.stale, 1)
+
+    def test_entries_for_deleted_files_are_dropped_on_save(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            kept, deleted, added = tmp / "kept.md", tmp / "deleted.md", tmp / "added.md"
+            for path in (kept, deleted, added):
+                self._write(path, path.name.encode("utf-8"))
+            cache = FileHashCache(root=tmp / "cache")
+            cache.digests([kept, deleted])
+            deleted.unlink()
+            FileHashCache(root=tmp / "cache").digests([added])
+
+            index = json.loads(cache.index_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(sorted(index["entries"]), sorted(str(path.resolve()) for path in (added, kept)))
+
+    def test_shared_instance_follows_the_cache_directory(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            path = tmp / "spec.md"
+            self._write(path, b"spec")
+            cache = FileHashCache()
+            with mock.patch.dict(os.environ, {"HPL_CACHE_DIR": str(tmp / "one")}):
+                cache.digests([path])
+            with mock.patch.dict(os.environ, {"HPL_CACHE_DIR": str(tmp / "two")}):
+                cache.digests([path])
+
+            self.assertTrue((tmp / "one" / "file_hashes.json").is_file())
+            self.assertEqual(cache.misses, 2)
+
+    def test_recently_modified_files_are_not_recorded(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            path = tmp / "fresh.md"
+            path.write_bytes(b"fresh")
+            FileHashCache(root=tmp / "cache").digests([path])
+
+            cache = FileHashCache(root=tmp / "cache")
+            cache.digests([path])
+
+        self.assertEqual(cache.misses, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -648,29 +648,29 @@ class TestInternalHelpers(unittest.TestCase):
         self.assertNotIn(" ", result)
 
     def test_parse_backends_normalizes(self):
-        from hpl.cli import _parse_backends
-        result = _parse_backends("classical,qasm")
+        from hpl.execution_token import parse_backends
+        result = parse_backends("classical,qasm")
         self.assertIn("CLASSICAL", result)
         self.assertIn("QASM", result)
 
     def test_parse_backends_deduplicates(self):
-        from hpl.cli import _parse_backends
-        result = _parse_backends("PYTHON,python,PYTHON")
+        from hpl.execution_token import parse_backends
+        result = parse_backends("PYTHON,python,PYTHON")
         self.assertEqual(result.count("PYTHON"), 1)
 
     def test_parse_backends_empty_falls_back(self):
-        from hpl.cli import _parse_backends
-        result = _parse_backends("")
+        from hpl.execution_token import parse_backends
+        result = parse_backends("")
         self.assertIn("PYTHON", result)
 
     def test_normalize_backend_upper(self):
-        from hpl.cli import _normalize_backend
-        self.assertEqual(_normalize_backend("classical"), "CLASSICAL")
-        self.assertEqual(_normalize_backend("QASM"), "QASM")
+        from hpl.execution_token import normalize_backend
+        self.assertEqual(normalize_backend("classical"), "CLASSICAL")
+        self.assertEqual(normalize_backend("QASM"), "QASM")
 
     def test_normalize_backend_none(self):
-        from hpl.cli import _normalize_backend
-        self.assertIsNone(_normalize_backend(None))
+        from hpl.execution_token import normalize_backend
+        self.assertIsNone(normalize_backend(None))
 
     def test_digest_text(self):
         from hpl.cli import _digest_text
@@ -773,19 +773,19 @@ class TestWriteRefusalEvidence(unittest.TestCase):
 
 
 # ---------------------------------------------------------------------------
-# _load_contract helper
+# load_contract helper
 # ---------------------------------------------------------------------------
 
 class TestLoadContract(unittest.TestCase):
     def test_load_contract_none_path(self):
-        from hpl.cli import _load_contract
+        from hpl.runtime.contracts import load_contract
         plan_dict = {"steps": [{"operator_id": "op1"}, {"operator_id": "op2"}]}
-        contract = _load_contract(None, plan_dict)
+        contract = load_contract(None, plan_dict)
         self.assertIn("op1", contract.allowed_steps)
         self.assertIn("op2", contract.allowed_steps)
 
     def test_load_contract_from_file(self):
-        from hpl.cli import _load_contract
+        from hpl.runtime.contracts import load_contract
         with tempfile.TemporaryDirectory() as td:
             contract_path = Path(td) / "contract.json"
             contract_path.write_text(json.dumps({
@@ -793,14 +793,14 @@ class TestLoadContract(unittest.TestCase):
                 "require_epoch_verification": True,
                 "require_signature_verification": False,
             }), encoding="utf-8")
-            contract = _load_contract(contract_path, {})
+            contract = load_contract(contract_path, {})
             self.assertIn("step_a", contract.allowed_steps)
             self.assertTrue(contract.require_epoch_verification)
 
     def test_load_contract_missing_file_uses_plan(self):
-        from hpl.cli import _load_contract
+        from hpl.runtime.contracts import load_contract
         plan_dict = {"steps": [{"operator_id": "op_x"}]}
-        contract = _load_contract(Path("/nonexistent/contract.json"), plan_dict)
+        contract = load_contract(Path("/nonexistent/contract.json"), plan_dict)
         self.assertIn("op_x", contract.allowed_steps)
 
 
@@ -860,23 +860,23 @@ class TestFullPipeline(CliTestBase):
 
 
 # ---------------------------------------------------------------------------
-# _parse_backends edge cases
+# parse_backends edge cases
 # ---------------------------------------------------------------------------
 
 class TestParseBackends(unittest.TestCase):
     def test_single_backend(self):
-        from hpl.cli import _parse_backends
-        result = _parse_backends("CLASSICAL")
+        from hpl.execution_token import parse_backends
+        result = parse_backends("CLASSICAL")
         self.assertEqual(result, ["CLASSICAL"])
 
     def test_multiple_backends_sorted(self):
-        from hpl.cli import _parse_backends
-        result = _parse_backends("QASM,PYTHON,CLASSICAL")
+        from hpl.execution_token import parse_backends
+        result = parse_backends("QASM,PYTHON,CLASSICAL")
         self.assertEqual(sorted(result), result)
 
     def test_whitespace_stripped(self):
-        from hpl.cli import _parse_backends
-        result = _parse_backends("  CLASSICAL , PYTHON  ")
+        from hpl.execution_token import parse_backends
+        result = parse_backends("  CLASSICAL , PYTHON  ")
         self.assertIn("CLASSICAL", result)
         self.assertIn("PYTHON", result)
 
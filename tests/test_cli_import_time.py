@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+IMPORT_BUDGET_ENV = "HPL_CLI_IMPORT_BUDGET_MS"
+DEFAULT_IMPORT_BUDGET_MS = 300
+DEFERRED_MODULES = [
+    "hpl.cli_demos",
+    "hpl.scheduler",
+    "hpl.runtime.engine",
+    "hpl.runtime.effects",
+    "hpl.runtime.effects.handlers",
+    "hpl.emergence.dsl.parser",
+    "hpl.axioms.validator",
+    "hpl.backends.qasm_lowering",
+    "tools.bundle_evidence",
+    "nacl",
+]
+
+
+def _env():
+    env = os.environ.copy()
+    src_path = str(ROOT / "src")
+    env["PYTHONPATH"] = src_path + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def _import_profile(statement):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        try:
+            cumulative[name.strip()] = int(cumulative_us)
+        except ValueError:
+            continue
+    return cumulative
+
+
+class CliImportTimeTests(unittest.TestCase):
+    def test_cli_import_defers_pipeline_modules(self):
+        profile = _import_profile("import hpl.cli")
+        self.assertIn("hpl.cli", profile)
+        for module in DEFERRED_MODULES:
+            self.assertNotIn(module, profile)
+
+    def test_effects_package_defers_handler_module(self):
+        profile = _import_profile("import hpl.runtime.effects")
+        self.assertNotIn("hpl.runtime.effects.handlers", profile)
+
+    def test_cli_import_within_budget(self):
+        budget_ms = int(os.environ.get(IMPORT_BUDGET_ENV, DEFAULT_IMPORT_BUDGET_MS))
+        best_us = min(_import_profile("import hpl.cli")["hpl.cli"] for _ in range(3))
+        self.assertLessEqual(best_us / 1000.0, budget_ms)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import importlib.util
 import json
 import sys
@@ -202,3 +203,70 @@ def test_git_commit_too_short_is_strict(tmp_path: Path, capsys, monkeypatch) ->
     assert code == 1
     assert payload["CONTRACT_MATCH"] is False
     assert payload["MERKLE_MATCH"] is False
+
+
+def _leaf(path: str, content: str) -> dict[str, object]:
+    file_hash = "sha256:" + hashlib.sha256(content.encode("utf-8")).hexdigest()
+    leaf_hash = "sha256:" + hashlib.sha256(f"{path}:{file_hash}".encode("utf-8")).hexdigest()
+    return {"path": path, "sha256": file_hash, "leaf_hash": leaf_hash}
+
+
+def test_leaf_diff_matches_by_path_across_shifted_indices() -> None:
+    module = _load_tool()
+    a_leaves = [_leaf(f"f{idx:03d}.json", str(idx)) for idx in range(1, 6)]
+    b_leaves = [_leaf("f000.json", "new")] + a_leaves[:2] + [_leaf("f003.json", "edited")] + a_leaves[4:]
+
+    diff = module.diff_leaves(a_leaves, b_leaves)
+
+    assert module._first_divergent_leaf(a_leaves, b_leaves)["index"] == 0
+    assert diff["added"] == ["f000.json"]
+    assert diff["removed"] == ["f004.json"]
+    assert [item["relpath"] for item in diff["changed"]] == ["f003.json"]
+    assert diff["unchanged_count"] == 3
+
+
+def test_merkle_localization_descends_only_into_divergent_subtrees() -> None:
+    module = _load_tool()
+    a_leaves = [_leaf(f"f{idx:04d}.json", str(idx)) for idx in range(1000)]
+    b_leaves = list(a_leaves)
+    for idx in (3, 998, 999):
+        b_leaves[idx] = _leaf(a_leaves[idx]["path"], "changed")
+    a_levels = module.merkle_levels([leaf["leaf_hash"] for leaf in a_leaves])
+    b_levels = module.merkle_levels([leaf["leaf_hash"] for leaf in b_leaves])
+
+    indices, compared = module.localize_divergence(a_levels, b_levels)
+
+    assert indices == [3, 998, 999]
+    assert compared <= 3 * 2 * len(a_levels)
+    assert module.localize_divergence(a_levels, a_levels) == ([], 1)
+    assert module.merkle_levels(["sha256:not-hex"]) is None
+
+
+def test_leaf_mismatch_reports_diff_and_localization(tmp_path: Path, capsys, monkeypatch) -> None:
+    module = _load_tool()
+    a_leaves = [_leaf(f"f{idx}.json", str(idx)) for idx in range(4)]
+    b_leaves = list(a_leaves)
+    b_leaves[2] = _leaf("f2.json", "changed")
+    a_levels = module.merkle_levels([leaf["leaf_hash"] for leaf in a_leaves])
+    b_levels = module.merkle_levels([leaf["leaf_hash"] for leaf in b_leaves])
+    a_manifest = dict(_make_manifest("2436f81"), leaf_count=4, merkle_root=f"sha256:{a_levels[-1][0]}")
+    b_manifest = dict(a_manifest, merkle_root=f"sha256:{b_levels[-1][0]}")
+    paths = [tmp_path / name for name in ("a_manifest.json", "a_leaves.json", "b_manifest.json", "b_leaves.json")]
+    for path, data in zip(paths, (a_manifest, {"inputs": a_leaves}, b_manifest, {"inputs": b_leaves})):
+        _write_json(path, data)
+
+    code, payload = _run_payload(module, capsys, monkeypatch, *paths)
+
+    assert code == 1
+    assert payload["MERKLE_MATCH"] is False
+    assert payload["first_divergent_leaf"]["index"] == 2
+    assert [item["relpath"] for item in payload["leaf_diff"]["changed"]] == ["f2.json"]
+    localization = payload["merkle_localization"]
+    assert localization["root_rebuilt"] == {"machine_a": True, "machine_b": True}
+    assert localization["divergent_leaves"] == [{"index": 2, "machine_a": "f2.json", "machine_b": "f2.json"}]
+
+    _write_json(paths[2], dict(b_manifest, leaves_digest="sha256:other"))
+    code, payload = _run_payload(module, capsys, monkeypatch, *paths)
+    assert code == 1
+    assert payload["CONTRACT_MATCH"] is False
+    assert [item["relpath"] for item in payload["leaf_diff"]["changed"]] == ["f2.json"]
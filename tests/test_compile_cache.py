@@ -0,0 +1,77 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = str(ROOT / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from hpl import compile_cache
+from hpl.axioms import validator
+from hpl.cache import JsonCache
+from hpl.dynamics import ir_emitter
+from hpl.emergence.dsl import parser
+from hpl.emergence.macros import expander
+from hpl.errors import HplError
+from hpl.trace import TraceCollector
+
+
+EXAMPLE_PATH = ROOT / "examples" / "momentum_trade.hpl"
+
+
+def _uncached_pipeline(program_id):
+    program = parser.parse_file(str(EXAMPLE_PATH))
+    trace = TraceCollector(program_id=program_id)
+    expanded = expander.expand_program(program, trace=trace)
+    validator.validate_program(expanded, trace=trace)
+    ir = ir_emitter.emit_program_ir(expanded, program_id=program_id, trace=trace)
+    return ir, trace.to_dict()
+
+
+class CompileCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = JsonCache("compile", root=Path(self._tmp.name))
+        patcher = mock.patch.object(compile_cache, "_COMPILE_CACHE", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+    def test_cached_compile_matches_uncached_pipeline(self):
+        expected_ir, expected_trace = _uncached_pipeline("momentum_trade")
+
+        first = compile_cache.compile_file(EXAMPLE_PATH, with_trace=True)
+        self.cache.clear_memory()
+        with mock.patch.object(
+            compile_cache, "parse_program", side_effect=AssertionError("recompiled")
+        ):
+            second = compile_cache.compile_file(EXAMPLE_PATH, with_trace=True)
+
+        self.assertFalse(first.cache_hit)
+        self.assertTrue(second.cache_hit)
+        self.assertEqual(first.program_ir, expected_ir)
+        self.assertEqual(second.program_ir, expected_ir)
+        self.assertEqual(second.trace, expected_trace)
+
+    def test_source_change_and_program_id_miss(self):
+        source = EXAMPLE_PATH.read_text(encoding="utf-8")
+        compile_cache.compile_source(source, program_id="a")
+        self.assertFalse(compile_cache.compile_source(source, program_id="b").cache_hit)
+        self.assertFalse(compile_cache.compile_source(source + "\n", program_id="a").cache_hit)
+        self.assertTrue(compile_cache.compile_source(source, program_id="a").cache_hit)
+
+    def test_compile_errors_are_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(HplError):
+                compile_cache.compile_source("(hamiltonian", program_id="broken")
+
+    def test_schema_loaded_once_per_process(self):
+        self.assertIs(ir_emitter._load_schema(), ir_emitter._load_schema())
+        self.assertTrue(ir_emitter.schema_digest().startswith("sha256:"))
+
+
+if __name__ == "__main__":
+    unittest.main()
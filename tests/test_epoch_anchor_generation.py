@@ -1,7 +1,10 @@
 import importlib.util
+import os
 import sys
+import tempfile
 from pathlib import Path
 import unittest
+from unittest import mock
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = str(ROOT / "src")
@@ -15,6 +18,14 @@ SPEC.loader.exec_module(anchor_epoch)
 
 
 class EpochAnchorGenerationTests(unittest.TestCase):
+    def setUp(self):
+        # Keep anchors built from temporary roots out of the developer's cache.
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patcher = mock.patch.dict(os.environ, {"HPL_CACHE_DIR": cache_dir.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_anchor_deterministic(self):
         anchor1 = anchor_epoch.build_epoch_anchor(
             epoch_id="epoch-1",
@@ -33,6 +44,15 @@ class EpochAnchorGenerationTests(unittest.TestCase):
         self.assertEqual(anchor1, anchor2)
         self.assertIn("papas_witness_digest", anchor1)
 
+    def test_cached_digests_match_a_full_rehash(self):
+        with tempfile.TemporaryDirectory() as tmp_dir, mock.patch.dict(os.environ, {"HPL_CACHE_DIR": tmp_dir}):
+            kwargs = {"epoch_id": "epoch-1", "timestamp": None, "git_commit": "deadbeef", "root": ROOT}
+            cold = anchor_epoch.build_epoch_anchor(**kwargs)
+            warm = anchor_epoch.build_epoch_anchor(**kwargs)
+            verified = anchor_epoch.build_epoch_anchor(verify_hashes=True, **kwargs)
+        self.assertEqual(cold, warm)
+        self.assertEqual(cold, verified)
+
 
 if __name__ == "__main__":
     unittest.main()
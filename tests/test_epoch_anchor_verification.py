@@ -1,9 +1,14 @@
+import contextlib
 import importlib.util
+import io
+import json
+import os
 import shutil
 import sys
 from pathlib import Path
 import tempfile
 import unittest
+from unittest import mock
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = str(ROOT / "src")
@@ -22,6 +27,14 @@ SPEC_VERIFY.loader.exec_module(verify_epoch)
 
 
 class EpochAnchorVerificationTests(unittest.TestCase):
+    def setUp(self):
+        # Keep anchors built from temporary roots out of the developer's cache.
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patcher = mock.patch.dict(os.environ, {"HPL_CACHE_DIR": cache_dir.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def _copy_required_files(self, dest_root: Path):
         required = anchor_epoch.collect_required_paths(ROOT)
         all_paths = required["schemas"] + required["registries"] + required["tooling"] + required["scheduler_spec"]
@@ -55,6 +68,47 @@ class EpochAnchorVerificationTests(unittest.TestCase):
             self.assertFalse(ok)
             self.assertTrue(errors)
 
+    def _poison_hash_index(self, root: Path):
+        # Record real digests, then swap them for a wrong one behind the
+        # unchanged stat tuples.
+        cache = anchor_epoch.FileHashCache(verify=True)
+        anchor_epoch.build_epoch_anchor("epoch-3", None, "deadbeef", root=root, file_hashes=cache)
+        index = json.loads(cache.index_path.read_text(encoding="utf-8"))
+        for entry in index["entries"].values():
+            entry[-1] = "sha256:" + "0" * 64
+        cache.index_path.write_text(json.dumps(index), encoding="utf-8")
+
+    def test_verify_hashes_fails_on_a_stale_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.dict(os.environ, {"HPL_CACHE_DIR": tmpdir}):
+            temp_root = Path(tmpdir) / "root"
+            self._copy_required_files(temp_root)
+            anchor = anchor_epoch.build_epoch_anchor("epoch-3", None, "deadbeef", root=temp_root)
+            self._poison_hash_index(temp_root)
+
+            cache = anchor_epoch.FileHashCache(verify=True)
+            ok, errors = verify_epoch.verify_epoch_anchor(anchor, root=temp_root, file_hashes=cache)
+
+        self.assertFalse(ok)
+        self.assertGreater(cache.stats()["stale"], 0)
+        self.assertEqual(errors, [f"hash cache: {cache.stats()['stale']} stale digest(s)"])
+
+    def test_anchor_cli_reports_hash_cache_counters_when_verifying(self):
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch.dict(os.environ, {"HPL_CACHE_DIR": tmpdir}):
+            temp_root = Path(tmpdir) / "root"
+            self._copy_required_files(temp_root)
+            self._poison_hash_index(temp_root)
+            argv = ["anchor_epoch.py", "--root", str(temp_root), "--git-commit", "deadbeef", "--verify-hashes"]
+            stdout, stderr = io.StringIO(), io.StringIO()
+            with mock.patch.object(sys, "argv", argv), contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(
+                stderr
+            ):
+                code = anchor_epoch.main()
+
+        self.assertEqual(code, 0)
+        self.assertIn("hash cache: hits=", stderr.getvalue())
+        self.assertIn("cached digest(s) did not match file contents", stderr.getvalue())
+        self.assertIn("epoch_id", stdout.getvalue())
+
 
 if __name__ == "__main__":
     unittest.main()
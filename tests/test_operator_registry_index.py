@@ -0,0 +1,116 @@
+import importlib.util
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = str(ROOT / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from hpl import scheduler
+from hpl.cache import JsonCache
+from hpl.execution_token import ExecutionToken
+from hpl.operators import registry
+from hpl.runtime.context import RuntimeContext
+from hpl.runtime.contracts import ExecutionContract
+from hpl.runtime.engine import RuntimeEngine
+
+
+def _program_ir(operator_id):
+    return {
+        "program_id": "test_program",
+        "hamiltonian": {"terms": [{"operator_id": operator_id, "cls": "C", "coefficient": 1.0}]},
+        "operators": {operator_id: {"type": "unspecified", "commutes_with": [], "backend_map": []}},
+        "invariants": [],
+        "scheduler": {"collapse_policy": "unspecified", "authorized_observers": []},
+    }
+
+
+class OperatorRegistryIndexTests(unittest.TestCase):
+    def setUp(self):
+        registry.clear_registry_cache()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = JsonCache("operator_registry", root=Path(self._tmp.name) / "cache")
+        patcher = mock.patch.object(registry, "_INDEX_CACHE", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        registry.clear_registry_cache()
+        self._tmp.cleanup()
+
+    def test_scheduler_and_runtime_share_one_snapshot(self):
+        registry_path = ROOT / "axioms_H" / "operators" / "registry.json"
+        operator_id = json.loads(registry_path.read_text(encoding="utf-8"))["operators"][0]["id"]
+
+        with mock.patch.object(registry, "_build_index", wraps=registry._build_index) as build:
+            plan = scheduler.plan(_program_ir(operator_id), scheduler.SchedulerContext(operator_registry_enforced=True))
+            token = ExecutionToken.from_dict(plan.execution_token)
+            result = RuntimeEngine().run(
+                plan.to_dict(),
+                RuntimeContext(execution_token=token),
+                ExecutionContract(allowed_steps={operator_id}),
+            )
+
+        self.assertEqual(plan.status, "planned")
+        self.assertEqual(result.status, "completed")
+        self.assertEqual(build.call_count, 1)
+        self.assertIs(registry.load_operator_registries(), registry.load_operator_registries())
+
+    def test_snapshot_is_read_only_and_tracks_file_contents(self):
+        path = Path(self._tmp.name) / "registry.json"
+        path.write_text(json.dumps({"operators": [{"id": "OP_A"}]}), encoding="utf-8")
+        first = registry.load_operator_registries(registry_paths=[path])
+
+        with self.assertRaises(TypeError):
+            first.operators["OP_B"] = {}  # type: ignore[index]
+        self.assertEqual(first.operator_ids, frozenset({"OP_A"}))
+
+        path.write_text(json.dumps({"operators": [{"id": "OP_A"}, {"id": "OP_B"}]}), encoding="utf-8")
+        second = registry.load_operator_registries(registry_paths=[path])
+
+        self.assertNotEqual(first.digest, second.digest)
+        self.assertEqual(second.operator_ids, frozenset({"OP_A", "OP_B"}))
+
+    def test_persisted_index_skips_revalidation(self):
+        first = registry.load_operator_registries()
+        registry.clear_registry_cache()
+        self.cache.clear_memory()
+
+        with mock.patch.object(registry, "_build_index", side_effect=AssertionError("revalidated")):
+            second = registry.load_operator_registries()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(first.digest, second.digest)
+        self.assertEqual(first.errors, second.errors)
+        self.assertEqual(dict(first.operators), dict(second.operators))
+
+    def test_validator_changes_invalidate_the_persisted_index(self):
+        first = registry.load_operator_registries()
+        registry.clear_registry_cache()
+        self.cache.clear_memory()
+
+        source = ROOT / "tools" / "validate_operator_registries.py"
+        edited = Path(self._tmp.name) / "validate_operator_registries.py"
+        edited.write_text(source.read_text(encoding="utf-8") + "\n# rules changed\n", encoding="utf-8")
+        spec = importlib.util.spec_from_file_location("edited_validator", edited)
+        validator = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(validator)
+        validator.SCHEMA_PATH = ROOT / "docs" / "spec" / "06_operator_registry_schema.json"
+
+        with mock.patch.object(registry, "load_tool", return_value=validator), mock.patch.object(
+            registry, "_build_index", wraps=registry._build_index
+        ) as build:
+            second = registry.load_operator_registries()
+
+        self.assertNotEqual(first.digest, second.digest)
+        self.assertEqual(build.call_count, 1)
+        self.assertEqual(first.errors, second.errors)
+
+
+if __name__ == "__main__":
+    unittest.main()
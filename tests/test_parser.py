@@ -1,3 +1,4 @@
+import io
 import sys
 from pathlib import Path
 import unittest
@@ -7,12 +8,29 @@ SRC_PATH = str(ROOT / "src")
 if SRC_PATH not in sys.path:
     sys.path.insert(0, SRC_PATH)
 
+from hpl.ast import Node, SourceLocation
 from hpl.emergence.dsl import parser
 from hpl.errors import ParseError
 
 
 EXAMPLE_PATH = ROOT / "examples" / "momentum_trade.hpl"
 
+STREAM_SAMPLES = [
+    "",
+    "; only a comment (with parens)",
+    "(a b) ; trailing comment without newline",
+    "(term OP_1 2.5)\n(term OP_2 -3)\r\n  (x .5 1e3 +7 ١٢)",
+    "(a ;comment ) still comment\n b)",
+    "atom1 atom2\n\n  (nested (deeper (deepest 0.25)))",
+]
+
+
+def _parse_outcome(parse, *args):
+    try:
+        return parse(*args)
+    except ParseError as exc:
+        return (exc.message, exc.location)
+
 
 class ParserTests(unittest.TestCase):
     def test_parser_surface_sexpr(self):
@@ -30,6 +48,44 @@ class ParserTests(unittest.TestCase):
         with self.assertRaises(ParseError):
             parser.parse_program(")")
 
+    def test_parser_locations_and_atoms(self):
+        program = parser.parse_program("; header\n  (term OP 1.5 -2 x)")
+        term = program[0]
+        self.assertEqual(term.location, SourceLocation(2, 3))
+        self.assertEqual(
+            [child.value for child in term.as_list()], ["term", "OP", 1.5, -2, "x"]
+        )
+        self.assertEqual(term.as_list()[2], Node(1.5, SourceLocation(2, 12)))
+
+    def test_parser_error_locations(self):
+        with self.assertRaises(ParseError) as unclosed:
+            parser.parse_program("(a\n  (b c)\n (d")
+        self.assertEqual(unclosed.exception.location, SourceLocation(3, 2))
+        with self.assertRaises(ParseError) as unexpected:
+            parser.parse_program("(a)\n ; ) ignored\n   )")
+        self.assertEqual(unexpected.exception.location, SourceLocation(3, 4))
+
+    def test_parse_stream_matches_parse_program(self):
+        samples = STREAM_SAMPLES + [EXAMPLE_PATH.read_text(encoding="utf-8"), "(a (b", "(a))"]
+        for sample in samples:
+            expected = _parse_outcome(parser.parse_program, sample)
+            for chunk_size in (1, 2, 3, 7, 64):
+                with self.subTest(sample=sample[:30], chunk_size=chunk_size):
+                    self.assertEqual(
+                        _parse_outcome(parser.parse_stream, io.StringIO(sample), chunk_size),
+                        expected,
+                    )
+
+    def test_parser_large_generated_program(self):
+        lines = ["(hamiltonian"]
+        lines.extend(f"  (term OP_{idx} {idx * 0.5}) ; c{idx}" for idx in range(2000))
+        lines.append(")")
+        program = parser.parse_program("\n".join(lines))
+        terms = program[0].as_list()[1:]
+        self.assertEqual(len(terms), 2000)
+        self.assertEqual(terms[-1].location, SourceLocation(2001, 3))
+        self.assertEqual(terms[-1].as_list()[2].value, 999.5)
+
 
 if __name__ == "__main__":
     unittest.main()
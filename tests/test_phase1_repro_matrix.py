@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+from tools import phase1_repro_matrix
+
+
+def _reference(root: Path, demo_dir: str, git_commit: str) -> Path:
+    folder = root / demo_dir / f"machine_a_{git_commit[:7]}"
+    folder.mkdir(parents=True)
+    (folder / "anchor_manifest.json").write_text(json.dumps({"git_commit": git_commit}), encoding="utf-8")
+    (folder / "anchor_leaves.json").write_text(json.dumps({"inputs": []}), encoding="utf-8")
+    return folder
+
+
+def _config(repo_root: Path, cache_dir: Path) -> phase1_repro_matrix.MatrixConfig:
+    return phase1_repro_matrix.MatrixConfig(
+        repo_root=repo_root,
+        cache_dir=cache_dir,
+        signing_key=repo_root / "unused.sk",
+        public_key=repo_root / "unused.pub",
+        repo_slug="local/test",
+        jobs=2,
+        fetch=False,
+        skip_tests=True,
+        recreate_venvs=False,
+    )
+
+
+def test_discover_cases_reads_demo_and_commit_from_references(tmp_path: Path) -> None:
+    _reference(tmp_path, "navier_stokes", "f06023ac75d7bddb75d3ecb038b5cd5beae80a6b")
+    _reference(tmp_path, "trading_io_shadow", "0c395653a9ae9ddbf4b37604af860a29358f826d")
+    (_reference(tmp_path, "net_shadow", "1234567890abcdef1234567890abcdef12345678") / "anchor_leaves.json").unlink()
+
+    cases = phase1_repro_matrix.discover_cases(tmp_path)
+    assert [case.case_id for case in cases] == ["navier-stokes@f06023ac75d7", "trading-io-shadow@0c395653a9ae"]
+
+    only_ns = phase1_repro_matrix.discover_cases(tmp_path, demos=["navier-stokes"])
+    assert [case.demo_name for case in only_ns] == ["navier-stokes"]
+    by_commit = phase1_repro_matrix.discover_cases(tmp_path, commits=["0c39565"])
+    assert [case.demo_name for case in by_commit] == ["trading-io-shadow"]
+
+
+def test_lock_digest_follows_the_dependency_lock(tmp_path: Path) -> None:
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "x"\ndependencies = ["pynacl==1.5.0"]\n', encoding="utf-8"
+    )
+    (tmp_path / "requirements.txt").write_text("pynacl==1.5.0  # pinned\n\n", encoding="utf-8")
+
+    assert phase1_repro_matrix.lock_requirements(tmp_path) == ["cryptography", "pynacl==1.5.0", "pytest"]
+    digest = phase1_repro_matrix.lock_digest(tmp_path)
+    assert phase1_repro_matrix.lock_digest(tmp_path) == digest
+
+    (tmp_path / "requirements.txt").write_text("pynacl==1.5.0\nrequests==2.0\n", encoding="utf-8")
+    assert phase1_repro_matrix.lock_digest(tmp_path) != digest
+
+
+def test_once_computes_each_key_a_single_time() -> None:
+    once = phase1_repro_matrix._Once()
+    calls = []
+
+    def compute() -> str:
+        calls.append(1)
+        time.sleep(0.02)
+        return "venv"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(once.get("digest", compute))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["venv"] * 4
+    assert len(calls) == 1
+
+
+def test_worktrees_are_reused_while_head_matches(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "tracked.txt").write_text("committed", encoding="utf-8")
+    (repo / ".gitignore").write_text("artifacts/\n", encoding="utf-8")
+    for cmd in (
+        ["git", "init", "-q"],
+        ["git", "add", "."],
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "init"],
+    ):
+        subprocess.run(cmd, cwd=repo, check=True)
+    commit = subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+    cache_dir = tmp_path / "cache"
+
+    first = phase1_repro_matrix.ReproMatrix(_config(repo, cache_dir))
+    worktree = first._prepare_worktree(commit)
+    assert first.reused[f"worktree:{commit}"] is False
+    (worktree / "stray.txt").write_text("stray", encoding="utf-8")
+    (worktree / "tracked.txt").write_text("edited", encoding="utf-8")
+    (worktree / "artifacts").mkdir()
+    (worktree / "artifacts" / "stale.json").write_text("{}", encoding="utf-8")
+
+    second = phase1_repro_matrix.ReproMatrix(_config(repo, cache_dir))
+    assert second._prepare_worktree(commit) == worktree
+    assert second.reused[f"worktree:{commit}"] is True
+    # Reuse starts from a pristine checkout: no edits, strays or ignored artifacts.
+    assert not (worktree / "stray.txt").exists()
+    assert not (worktree / "artifacts").exists()
+    assert (worktree / "tracked.txt").read_text(encoding="utf-8") == "committed"
@@ -0,0 +1,121 @@
+import importlib.util
+import sys
+import unittest
+from dataclasses import replace
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = str(ROOT / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from hpl import scheduler
+from hpl.execution_token import ExecutionToken, TokenMinter
+
+BENCH_SPEC = importlib.util.spec_from_file_location("bench_plan_session", ROOT / "tools" / "bench_plan_session.py")
+bench_plan_session = importlib.util.module_from_spec(BENCH_SPEC)
+BENCH_SPEC.loader.exec_module(bench_plan_session)
+
+IO_POLICY = {"io_allowed": True, "io_scopes": ["order_submit", "broker_connect"], "io_endpoints_allowed": ["broker://demo"]}
+NET_POLICY = {"net_mode": "DRY_RUN", "net_caps": ["net_connect"], "net_endpoints_allowlist": ["net://demo"]}
+
+
+def _program_ir():
+    return {
+        "program_id": "session_program",
+        "hamiltonian": {"terms": [{"operator_id": "SURF_A", "cls": "C", "coefficient": 1.0}]},
+        "operators": {"SURF_A": {"type": "unspecified", "commutes_with": [], "backend_map": []}},
+        "invariants": [],
+        "scheduler": {"collapse_policy": "unspecified", "authorized_observers": []},
+    }
+
+
+class TokenMinterTests(unittest.TestCase):
+    def test_minted_tokens_match_build(self):
+        options = {
+            "allowed_backends": ["qasm", "python"],
+            "io_policy": IO_POLICY,
+            "net_policy": NET_POLICY,
+            "delta_s_policy": {"policy_id": "D1"},
+            "delta_s_budget": 2,
+            "measurement_modes_allowed": ["projective"],
+            "collapse_requires_delta_s": True,
+        }
+        minter = TokenMinter(**options)
+        for budget in (0, 1, 100, 99999):
+            token, token_json = minter.render(budget)
+            with self.subTest(budget=budget):
+                self.assertEqual(token, ExecutionToken.build(budget_steps=budget, **options))
+                self.assertEqual(token_json, scheduler._canonical_json(token.to_dict()))
+
+
+class PlanSessionTests(unittest.TestCase):
+    def test_session_plans_match_plan(self):
+        cases = [
+            (scheduler.SchedulerContext(), [{}, {"budget_steps": 7}]),
+            (
+                scheduler.SchedulerContext(track="trading_io_shadow", emit_effect_steps=True, io_policy=IO_POLICY),
+                [{"io_order": {"symbol": "X", "qty": idx}, "budget_steps": 50 + idx} for idx in range(3)],
+            ),
+            (
+                scheduler.SchedulerContext(track="net_shadow", emit_effect_steps=True, net_policy=NET_POLICY),
+                [{"net_message": {"kind": "ping", "payload": str(idx)}, "timestamp": f"t{idx}"} for idx in range(3)],
+            ),
+            (
+                scheduler.SchedulerContext(emit_effect_steps=True, backend_target="qasm"),
+                [{"artifact_paths": {"backend_ir": "b.json", "qasm": "out.qasm"}}],
+            ),
+            (
+                scheduler.SchedulerContext(
+                    require_epoch_verification=True,
+                    anchor_path=Path("anchor.json"),
+                    timestamp="session-open",
+                ),
+                [{"timestamp": f"t{idx}"} for idx in range(2)] + [{}],
+            ),
+        ]
+
+        def verify(ctx):
+            return {"anchor_ok": True, "signature_ok": True, "errors": []}, []
+
+        with mock.patch("hpl.scheduler._verify_epoch_and_signature", side_effect=verify):
+            for ctx, bindings in cases:
+                session = scheduler.PlanSession(_program_ir(), ctx)
+                for binding in bindings:
+                    with self.subTest(track=ctx.track, binding=binding):
+                        expected = scheduler.plan(_program_ir(), replace(ctx, **binding)).to_dict()
+                        self.assertEqual(session.plan(**binding).to_dict(), expected)
+
+    def test_session_verifies_epoch_once(self):
+        ctx = scheduler.SchedulerContext(
+            require_epoch_verification=True,
+            anchor_path=Path("anchor.json"),
+            signature_path=Path("anchor.sig"),
+        )
+        outcome = ({"anchor_ok": False, "signature_ok": False, "errors": ["bad"]}, ["bad"])
+        with mock.patch("hpl.scheduler._verify_epoch_and_signature", return_value=outcome) as mock_verify:
+            session = scheduler.PlanSession(_program_ir(), ctx)
+            plans = [session.plan(budget_steps=idx) for idx in range(3)]
+            expected = scheduler.plan(_program_ir(), replace(ctx, budget_steps=2))
+
+        self.assertEqual(mock_verify.call_count, 2)
+        self.assertEqual(plans[-1].to_dict(), expected.to_dict())
+        self.assertEqual(plans[0].status, "denied")
+        self.assertIsNot(plans[0].verification, plans[1].verification)
+
+    def test_fixed_and_unknown_fields_are_rejected(self):
+        session = scheduler.PlanSession(_program_ir(), scheduler.SchedulerContext())
+        with self.assertRaises(ValueError):
+            session.plan(io_policy=IO_POLICY)
+        with self.assertRaises(TypeError):
+            session.plan(not_a_field=1)
+
+    def test_benchmark_reports_throughput(self):
+        summary = bench_plan_session.run(200)
+        self.assertEqual(summary["plans"], 200)
+        self.assertGreater(summary["plans_per_second"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
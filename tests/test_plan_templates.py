@@ -0,0 +1,114 @@
+import hashlib
+import json
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = str(ROOT / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from hpl import scheduler
+from hpl.plan_templates import Param, PlanTemplate, StepTemplate
+
+
+def _canonical_json(data):
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+
+def _program_ir():
+    return {
+        "program_id": "template_program",
+        "hamiltonian": {"terms": []},
+        "operators": {},
+        "invariants": [],
+        "scheduler": {},
+    }
+
+
+SAMPLE = PlanTemplate(
+    "sample",
+    [
+        StepTemplate("fetch", "FETCH", args={"path": Param("path"), "limit": 3}),
+        StepTemplate("verify", "VERIFY", args={"anchor": Param("anchor")}, when="verify"),
+        StepTemplate(
+            "write",
+            "WRITE",
+            args={"mode": "append", "out_path": Param("out_path", optional=True)},
+            requires={"backend": Param("backend")},
+        ),
+        StepTemplate("summary", "SUMMARY", indexed=False),
+    ],
+)
+
+
+class PlanTemplateTests(unittest.TestCase):
+    def test_instantiate_binds_params_and_numbers_steps(self):
+        params = {"path": "in.json", "verify": False, "anchor": None, "out_path": None, "backend": "PYTHON"}
+        steps = SAMPLE.instantiate(params)
+
+        self.assertEqual([step["step_id"] for step in steps], ["fetch_0", "write_1", "summary"])
+        self.assertEqual(steps[0]["args"], {"path": "in.json", "limit": 3})
+        self.assertEqual(steps[1]["args"], {"mode": "append"})
+        self.assertEqual(steps[1]["requires"], {"backend": "PYTHON"})
+
+        params.update(verify=True, anchor="anchor.json", out_path="out.json")
+        steps = SAMPLE.instantiate(params)
+        self.assertEqual([step["step_id"] for step in steps], ["fetch_0", "verify_1", "write_2", "summary"])
+        self.assertEqual(list(steps[2]["args"]), ["mode", "out_path"])
+
+    def test_render_memoizes_steps_json_but_returns_fresh_steps(self):
+        template = PlanTemplate("memo", [StepTemplate("fetch", "FETCH", args={"path": Param("path")})])
+        first, first_json = template.render({"path": "a.json"})
+        first[0]["args"]["path"] = "mutated"
+        second, second_json = template.render({"path": "a.json"})
+
+        self.assertIs(first_json, second_json)
+        self.assertEqual(second[0]["args"], {"path": "a.json"})
+        self.assertEqual(second_json, _canonical_json(second))
+        self.assertNotEqual(template.render({"path": "b.json"})[1], first_json)
+
+    def test_container_params_bypass_the_memo(self):
+        template = PlanTemplate("ir", [StepTemplate("lower", "LOWER", args={"program_ir": Param("program_ir")})])
+        program_ir = _program_ir()
+        _, before = template.render({"program_ir": program_ir})
+        program_ir["program_id"] = "changed"
+        steps, after = template.render({"program_ir": program_ir})
+
+        self.assertNotEqual(before, after)
+        self.assertEqual(after, _canonical_json(steps))
+
+    def test_non_scalar_literal_is_rejected(self):
+        with self.assertRaises(TypeError):
+            PlanTemplate("bad", [StepTemplate("fetch", "FETCH", args={"paths": ["a", "b"]})])
+
+
+class TemplatedSchedulerTests(unittest.TestCase):
+    def test_plan_id_matches_canonical_plan_digest(self):
+        for track in (None, "trading_shadow_mode", "navier_stokes", "net_shadow"):
+            ctx = scheduler.SchedulerContext(
+                track=track,
+                emit_effect_steps=True,
+                trading_policy_path=Path("policy.json"),
+                trading_fixture_path=Path("fixture.json"),
+            )
+            plan = scheduler.plan(_program_ir(), ctx).to_dict()
+            core = {key: plan[key] for key in (
+                "program_id",
+                "status",
+                "steps",
+                "reasons",
+                "verification",
+                "execution_token",
+                "operator_registry_enforced",
+                "operator_registry_paths",
+            )}
+            digest = hashlib.sha256(_canonical_json(core).encode("utf-8")).hexdigest()
+            with self.subTest(track=track):
+                self.assertTrue(plan["steps"])
+                self.assertEqual(plan["plan_id"], f"sha256:{digest}")
+
+
+if __name__ == "__main__":
+    unittest.main()
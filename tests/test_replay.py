@@ -0,0 +1,233 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = str(ROOT / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from hpl import scheduler  # noqa: E402
+from hpl.cli import main  # noqa: E402
+from hpl.execution_token import ExecutionToken  # noqa: E402
+from hpl.runtime.context import RuntimeContext  # noqa: E402
+from hpl.runtime.contracts import ExecutionContract  # noqa: E402
+from hpl.runtime import replay as replay_module  # noqa: E402
+from hpl.runtime.engine import RuntimeEngine  # noqa: E402
+from hpl.runtime.replay import (  # noqa: E402
+    MANIFEST_FORMAT,
+    ReplayOptions,
+    load_pairs,
+    replay,
+    summarize,
+)
+
+FIXTURES = ROOT / "tests" / "fixtures" / "pde"
+
+
+def _program_ir(steps):
+    return {
+        "program_id": "replay_fixture",
+        "hamiltonian": {
+            "terms": [{"operator_id": f"op_{idx}", "cls": "C", "coefficient": 1.0} for idx in range(steps)]
+        },
+        "operators": {},
+        "invariants": [],
+        "scheduler": {"collapse_policy": None, "authorized_observers": []},
+    }
+
+
+def _archive(work_dir, program_ir, ctx):
+    work_dir.mkdir(parents=True, exist_ok=True)
+    plan = scheduler.plan(program_ir, ctx).to_dict()
+    token = plan.get("execution_token")
+    runtime_ctx = RuntimeContext(
+        execution_token=ExecutionToken.from_dict(token) if isinstance(token, dict) else None,
+        trace_sink=work_dir,
+    )
+    allowed = sorted({str(step.get("step_id") or step.get("operator_id")) for step in plan["steps"]})
+    result = RuntimeEngine().run(plan, runtime_ctx, ExecutionContract(allowed_steps=set(allowed)))
+    (work_dir / "plan.json").write_text(json.dumps(plan), encoding="utf-8")
+    (work_dir / "contract.json").write_text(json.dumps({"allowed_steps": allowed}), encoding="utf-8")
+    (work_dir / "runtime.json").write_text(json.dumps(result.to_dict()), encoding="utf-8")
+    return result
+
+
+def _build_archive(root):
+    _archive(root / "noop", _program_ir(3), scheduler.SchedulerContext(budget_steps=3))
+    ns_dir = root / "tracks" / "ns"
+    ns_dir.mkdir(parents=True)
+    shutil.copy(FIXTURES / "ns_state_initial.json", ns_dir / "ns_state.json")
+    shutil.copy(FIXTURES / "ns_policy_safe.json", ns_dir / "ns_policy.json")
+    ctx = scheduler.SchedulerContext(
+        track="navier_stokes",
+        emit_effect_steps=True,
+        ns_state_path=Path("ns_state.json"),
+        ns_policy_path=Path("ns_policy.json"),
+    )
+    result = _archive(ns_dir, _program_ir(0), ctx)
+    assert result.status == "completed", result.reasons
+
+
+_REPLAY_PAIR = replay_module.replay_pair
+
+
+def _crash_worker_on_bad_pair(pair, options):
+    # Module-level so forked pool workers can unpickle it.
+    if pair.pair_id == "bad":
+        os._exit(1)
+    return _REPLAY_PAIR(pair, options)
+
+
+class ReplayTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name) / "archive"
+        _build_archive(self.root)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_archived_plans_replay_identically_in_a_pool(self):
+        archived = {path: path.read_bytes() for path in self.root.rglob("*") if path.is_file()}
+
+        pairs = load_pairs(self.root)
+        reports = list(replay(pairs, ReplayOptions(), jobs=2))
+
+        self.assertEqual(sorted(pair.pair_id for pair in pairs), ["noop", "tracks/ns"])
+        self.assertEqual(len(reports), 2)
+        for report in reports:
+            self.assertTrue(report["match"], report)
+            self.assertIsNone(report["first_divergence"])
+        self.assertEqual(summarize(reports)["summary"], {"plans": 2, "matched": 2, "diverged": 0, "errors": 0})
+        self.assertEqual({path: path.read_bytes() for path in self.root.rglob("*") if path.is_file()}, archived)
+
+    def test_divergence_reports_the_first_differing_step(self):
+        runtime_path = self.root / "tracks" / "ns" / "runtime.json"
+        archived = json.loads(runtime_path.read_text(encoding="utf-8"))
+        entry = archived["transcript"][2]
+        entry["artifact_digests"] = {name: "sha256:" + "0" * 64 for name in entry["artifact_digests"]}
+        archived["transcript"][4]["ok"] = False
+        runtime_path.write_text(json.dumps(archived), encoding="utf-8")
+
+        reports = {report["pair_id"]: report for report in replay(load_pairs(self.root), ReplayOptions())}
+
+        self.assertTrue(reports["noop"]["match"])
+        diverged = reports["tracks/ns"]
+        self.assertFalse(diverged["match"])
+        self.assertEqual(diverged["first_divergence"]["index"], 2)
+        self.assertEqual(diverged["first_divergence"]["step_id"], entry["step_id"])
+        self.assertEqual(diverged["first_divergence"]["fields"], ["artifact_digests"])
+        self.assertIn("transcript", diverged["differing_fields"])
+        self.assertEqual(summarize(list(reports.values()))["summary"]["diverged"], 1)
+
+    def test_manifest_pairs_resolve_relative_to_the_manifest(self):
+        manifest = self.root / "replay.json"
+        manifest.write_text(
+            json.dumps(
+                {
+                    "format": MANIFEST_FORMAT,
+                    "pairs": [
+                        {
+                            "id": "ns",
+                            "plan": "tracks/ns/plan.json",
+                            "result": "tracks/ns/runtime.json",
+                            "contract": "tracks/ns/contract.json",
+                        },
+                        {"id": "missing", "plan": "gone/plan.json", "result": "gone/runtime.json"},
+                    ],
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        reports = {report["pair_id"]: report for report in replay(load_pairs(manifest), ReplayOptions())}
+
+        self.assertTrue(reports["ns"]["match"])
+        self.assertFalse(reports["missing"]["match"])
+        self.assertIn("error", reports["missing"])
+        with self.assertRaises(ValueError):
+            manifest.write_text(json.dumps({"format": "other", "pairs": []}), encoding="utf-8")
+            load_pairs(manifest)
+
+    def test_runs_archived_by_hpl_run_without_a_contract_match(self):
+        run_root = Path(self._tmp.name) / "cli_runs"
+        for name in ("noop", "tracks/ns"):
+            source = self.root / name
+            target = run_root / name
+            shutil.copytree(source, target)
+            (target / "contract.json").unlink()
+            (target / "runtime.json").unlink()
+            self.assertEqual(main(["run", str(target / "plan.json"), "--out", str(target / "runtime.json")]), 0)
+        denied = json.loads((run_root / "tracks" / "ns" / "runtime.json").read_text(encoding="utf-8"))
+
+        reports = list(replay(load_pairs(run_root), ReplayOptions()))
+
+        self.assertNotEqual(denied["status"], "completed")
+        self.assertEqual(len(reports), 2)
+        for report in reports:
+            self.assertTrue(report["match"], report)
+
+    def test_a_malformed_pair_is_reported_without_stopping_the_replay(self):
+        bad_dir = self.root / "bad"
+        bad_dir.mkdir()
+        (bad_dir / "plan.json").write_text(json.dumps({"steps": 5}), encoding="utf-8")
+        (bad_dir / "runtime.json").write_text(json.dumps({"result_id": "x"}), encoding="utf-8")
+
+        for jobs in (1, 2):
+            reports = {report["pair_id"]: report for report in replay(load_pairs(self.root), ReplayOptions(), jobs)}
+            self.assertEqual(sorted(reports), ["bad", "noop", "tracks/ns"])
+            self.assertFalse(reports["bad"]["match"])
+            self.assertIn("error", reports["bad"])
+            self.assertTrue(reports["noop"]["match"])
+            self.assertEqual(summarize(list(reports.values()))["summary"]["errors"], 1)
+
+    def test_a_crashed_worker_is_reported_per_pair(self):
+        shutil.copytree(self.root / "noop", self.root / "bad")
+
+        with mock.patch.object(replay_module, "replay_pair", _crash_worker_on_bad_pair):
+            reports = {report["pair_id"]: report for report in replay(load_pairs(self.root), ReplayOptions(), 2)}
+
+        # The broken pool fails whatever was still pending, but every pair is reported.
+        self.assertEqual(sorted(reports), ["bad", "noop", "tracks/ns"])
+        self.assertFalse(reports["bad"]["match"])
+        self.assertIn("error", reports["bad"])
+
+    def test_backend_gating_follows_the_archived_run(self):
+        target = Path(self._tmp.name) / "qasm_runs" / "noop"
+        _archive(target, _program_ir(2), scheduler.SchedulerContext(allowed_backends=["CLASSICAL"]))
+        (target / "contract.json").unlink()
+        plan_path = str(target / "plan.json")
+        self.assertEqual(main(["run", plan_path, "--out", str(target / "runtime.json"), "--backend", "qasm"]), 0)
+        archived = json.loads((target / "runtime.json").read_text(encoding="utf-8"))
+        pairs = load_pairs(target.parent)
+
+        self.assertIn("backend not permitted: QASM", archived["reasons"])
+        self.assertTrue(next(replay(pairs, ReplayOptions(backend="qasm")))["match"])
+        self.assertFalse(next(replay(pairs, ReplayOptions()))["match"])
+        out_path = Path(self._tmp.name) / "qasm.jsonl"
+        self.assertEqual(main(["replay", str(target.parent), "--backend", "qasm", "--out", str(out_path)]), 0)
+
+    def test_cli_streams_one_line_per_plan_and_a_summary(self):
+        out_path = Path(self._tmp.name) / "replay.jsonl"
+        work_dir = Path(self._tmp.name) / "work"
+
+        code = main(["replay", str(self.root), "--jobs", "1", "--out", str(out_path), "--work-dir", str(work_dir)])
+
+        lines = [json.loads(line) for line in out_path.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual(code, 0)
+        self.assertEqual(sorted(line["pair_id"] for line in lines[:-1]), ["noop", "tracks/ns"])
+        self.assertTrue(lines[-1]["ok"])
+        self.assertTrue((work_dir / "tracks_ns" / "ns_state_final.json").exists())
+
+        (self.root / "noop" / "runtime.json").write_text(json.dumps({"result_id": "x"}), encoding="utf-8")
+        self.assertEqual(main(["replay", str(self.root), "--jobs", "1", "--out", str(out_path)]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = str(ROOT / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from hpl import scheduler
+from hpl.execution_token import ExecutionToken
+from hpl.runtime import profiling
+from hpl.runtime.contracts import ExecutionContract
+from hpl.runtime.context import RuntimeContext
+from hpl.runtime.engine import RuntimeEngine
+
+
+FIXTURE = ROOT / "tests" / "fixtures" / "program_ir_minimal.json"
+CLI = [sys.executable, "-m", "hpl.cli"]
+TEST_KEY = ROOT / "tests" / "fixtures" / "keys" / "ci_ed25519_test.sk"
+
+
+def _env():
+    env = os.environ.copy()
+    env["PYTHONPATH"] = SRC_PATH + os.pathsep + env.get("PYTHONPATH", "")
+    env["HPL_IO_ENABLED"] = "1"
+    env["HPL_IO_ADAPTER"] = "mock"
+    env["HPL_IO_ADAPTER_READY"] = "1"
+    return env
+
+
+class RuntimeProfilerTests(unittest.TestCase):
+    def test_profiled_run_matches_unprofiled_run(self):
+        program_ir = json.loads(FIXTURE.read_text(encoding="utf-8"))
+        plan = scheduler.plan(program_ir, scheduler.SchedulerContext())
+        token = ExecutionToken.from_dict(plan.execution_token or {})
+        contract = ExecutionContract(allowed_steps={step["operator_id"] for step in plan.steps})
+        ctx = RuntimeContext(execution_token=token)
+        profiler = profiling.RuntimeProfiler()
+
+        profiled = RuntimeEngine(profiler=profiler).run(plan, ctx, contract)
+        plain = RuntimeEngine().run(plan, ctx, contract)
+
+        self.assertEqual(profiled.to_dict(), plain.to_dict())
+        profile = profiler.to_dict()
+        self.assertEqual(profile["format"], profiling.PROFILE_FORMAT)
+        self.assertEqual(len(profile["steps"]), len(plan.steps))
+        self.assertEqual(profile["by_effect_type"]["NOOP"]["count"], len(plan.steps))
+        for step in profile["steps"]:
+            self.assertGreaterEqual(step["wall_s"], 0)
+            self.assertEqual(step["artifact_count"], 0)
+
+    @unittest.skipUnless(Path("/proc/self/io").exists(), "requires /proc/self/io")
+    def test_phase_counts_bytes_written(self):
+        profiler = profiling.RuntimeProfiler()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with profiler.phase("write"):
+                (Path(tmp_dir) / "blob.bin").write_bytes(b"x" * 65536)
+        (phase,) = profiler.to_dict()["phases"]
+        self.assertEqual(phase["phase"], "write")
+        self.assertGreaterEqual(phase["bytes_written"], 65536)
+        self.assertLess(phase["bytes_read"], 65536)
+
+    def test_demo_profile_is_written_outside_the_bundle(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            summaries = []
+            for name, extra in (("plain", []), ("profiled", ["--profile"])):
+                out_dir = Path(tmp_dir) / name
+                completed = subprocess.run(
+                    CLI
+                    + ["demo", "trading-io-shadow", "--out-dir", str(out_dir), "--signing-key", str(TEST_KEY), "--enable-io"]
+                    + extra,
+                    cwd=ROOT,
+                    env=_env(),
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                summaries.append(json.loads(completed.stdout))
+            profile = json.loads((Path(tmp_dir) / "profiled" / profiling.PROFILE_FILENAME).read_text(encoding="utf-8"))
+            bundle_files = {path.name for path in Path(summaries[1]["bundle_path"]).iterdir()}
+
+        self.assertEqual(summaries[0]["bundle_id"], summaries[1]["bundle_id"])
+        self.assertNotIn(profiling.PROFILE_FILENAME, bundle_files)
+        self.assertEqual(
+            [phase["phase"] for phase in profile["phases"]],
+            ["compile", "plan", "run", "redaction", "bundle", "sign"],
+        )
+        self.assertTrue(profile["steps"])
+        self.assertTrue(any(name.startswith("IO_") for name in profile["by_effect_type"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = str(ROOT / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from hpl import service
+
+CLI = [sys.executable, "-m", "hpl.cli"]
+EXAMPLE_PATH = ROOT / "examples" / "momentum_trade.hpl"
+
+
+def _env():
+    env = os.environ.copy()
+    env["PYTHONPATH"] = SRC_PATH + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def _request(request_id, method, **params):
+    return {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+
+
+class ServiceApiTests(unittest.TestCase):
+    def test_compile_plan_run_match_cli_outputs(self):
+        source = EXAMPLE_PATH.read_text(encoding="utf-8")
+        program_ir = service.compile_program(source, program_id="momentum_trade")
+        plan = service.plan_program(program_ir, budget_steps=50)
+        result = service.run_plan(plan, backend="classical")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            ir_path = tmp / "momentum_trade.json"
+            plan_path = tmp / "plan.json"
+            run_path = tmp / "run.json"
+            for args in (
+                ["ir", str(EXAMPLE_PATH), "--out", str(ir_path)],
+                ["plan", str(ir_path), "--out", str(plan_path), "--budget-steps", "50"],
+                ["run", str(plan_path), "--out", str(run_path), "--backend", "classical"],
+            ):
+                subprocess.check_call(CLI + args, cwd=ROOT, env=_env())
+
+            self.assertEqual(json.loads(ir_path.read_text(encoding="utf-8")), program_ir)
+            self.assertEqual(json.loads(plan_path.read_text(encoding="utf-8")), plan)
+            self.assertEqual(json.loads(run_path.read_text(encoding="utf-8")), result)
+        self.assertEqual(plan["status"], "planned")
+
+    def test_dispatch_reports_errors_as_jsonrpc(self):
+        bad_source = service.dispatch(_request(1, "compile", source="(unclosed"))
+        unknown = service.dispatch(_request(2, "nope"))
+        bad_params = service.dispatch(_request(3, "compile", text="x"))
+        notification = service.dispatch({"jsonrpc": "2.0", "method": "ping"})
+
+        self.assertEqual(bad_source["error"]["code"], service.HPL_ERROR)
+        self.assertEqual(bad_source["error"]["data"]["type"], "ParseError")
+        self.assertEqual(unknown["error"]["code"], service.METHOD_NOT_FOUND)
+        self.assertEqual(bad_params["error"]["code"], service.INVALID_PARAMS)
+        self.assertIsNone(notification)
+
+    def test_pooled_batch_matches_serial_batch(self):
+        source = EXAMPLE_PATH.read_text(encoding="utf-8")
+        requests = [
+            _request(idx, "compile_and_plan", source=source, program_id=f"program_{idx}")
+            for idx in range(4)
+        ]
+        requests.append(_request(4, "compile", source="(unclosed"))
+
+        serial = service.run_batch(requests, max_workers=1)
+        pooled = service.run_batch(requests, max_workers=2)
+
+        self.assertEqual(serial, pooled)
+        self.assertEqual([response["id"] for response in pooled], [0, 1, 2, 3, 4])
+        self.assertIn("error", pooled[4])
+
+
+class ServiceTransportTests(unittest.TestCase):
+    def test_stdio_server_answers_each_line(self):
+        lines = [
+            json.dumps(_request(1, "ping")),
+            "not json",
+            json.dumps([_request(2, "ping"), {"jsonrpc": "2.0", "method": "ping"}]),
+        ]
+        completed = subprocess.run(
+            CLI + ["serve"],
+            input="\n".join(lines) + "\n",
+            capture_output=True,
+            text=True,
+            cwd=ROOT,
+            env=_env(),
+            check=True,
+        )
+        replies = [json.loads(line) for line in completed.stdout.splitlines()]
+
+        self.assertEqual(replies[0]["result"], "pong")
+        self.assertEqual(replies[1]["error"]["code"], service.PARSE_ERROR)
+        self.assertEqual(replies[2], [{"id": 2, "jsonrpc": "2.0", "result": "pong"}])
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "requires Unix sockets")
+    def test_unix_socket_server(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            socket_path = Path(tmp_dir) / "hpl.sock"
+            process = subprocess.Popen(
+                CLI + ["serve", "--socket", str(socket_path)],
+                cwd=ROOT,
+                env=_env(),
+            )
+            try:
+                deadline = time.monotonic() + 10
+                while not socket_path.exists() and time.monotonic() < deadline:
+                    time.sleep(0.05)
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                    client.connect(str(socket_path))
+                    client.sendall((json.dumps(_request(7, "ping")) + "\n").encode("utf-8"))
+                    reply = client.makefile("r", encoding="utf-8").readline()
+            finally:
+                process.terminate()
+                process.wait(timeout=10)
+
+        self.assertEqual(json.loads(reply), {"id": 7, "jsonrpc": "2.0", "result": "pong"})
+
+
+if __name__ == "__main__":
+    unittest.main()
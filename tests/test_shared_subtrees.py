@@ -0,0 +1,56 @@
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = str(ROOT / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from hpl.ast import Node
+from hpl.axioms import validator
+from hpl.emergence.dsl import parser
+from hpl.emergence.macros import expander
+from hpl.dynamics import ir_emitter
+from hpl.trace import TraceCollector
+
+
+EXAMPLE_PATH = ROOT / "examples" / "momentum_trade.hpl"
+
+
+def _term(operator_id: str) -> Node:
+    return Node([Node("term"), Node(operator_id), Node(1.0)])
+
+
+class SharedSubtreeTests(unittest.TestCase):
+    def test_validation_terms_match_for_reused_node_objects(self):
+        term = _term("SURF_A")
+        hamiltonian = Node([Node("hamiltonian"), term, _term("SURF_B"), term])
+        invariant = Node([Node("invariant"), Node("inv"), Node([Node("evolve"), Node("p"), hamiltonian])])
+        program = [hamiltonian, invariant, hamiltonian]
+
+        self.assertEqual(
+            validator.validate_and_collect_terms(program),
+            ir_emitter._collect_terms(program),
+        )
+
+    def test_parsed_programs_validate_like_the_emitter(self):
+        source = EXAMPLE_PATH.read_text(encoding="utf-8")
+        expanded = expander.expand_program(parser.parse_program(source + "\n" + source))
+
+        self.assertEqual(
+            validator.validate_and_collect_terms(expanded),
+            ir_emitter._collect_terms(expanded),
+        )
+
+    def test_trace_assigns_a_node_per_occurrence(self):
+        shared = _term("SURF_A")
+        trace = TraceCollector()
+        trace.record_phase([shared, shared], "axiomatic")
+        nodes = trace.to_dict()["nodes"]
+
+        self.assertEqual(len(nodes), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import hashlib
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = str(ROOT / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from hpl import spec_tree  # noqa: E402
+from hpl.cache import CACHE_DIR_ENV, FileHashCache, cache_key  # noqa: E402
+from hpl.spec_tree import snapshot  # noqa: E402
+
+GATE_PATH = ROOT / "tools" / "ci_gate_spec_integrity.py"
+GATE_SPEC = importlib.util.spec_from_file_location("ci_gate_spec_integrity", GATE_PATH)
+ci_gate_spec_integrity = importlib.util.module_from_spec(GATE_SPEC)
+GATE_SPEC.loader.exec_module(ci_gate_spec_integrity)
+
+
+def _sha256(payload):
+    return f"sha256:{hashlib.sha256(payload).hexdigest()}"
+
+
+class SpecTreeTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.repo = self.tmp / "repo"
+        (self.repo / "docs" / "spec").mkdir(parents=True)
+        (self.repo / "audit_H").mkdir()
+        (self.repo / "docs" / "spec" / "model.md").write_bytes(b"model v1\n")
+        (self.repo / "docs" / "spec" / "schema.json").write_bytes(b"{}\n")
+        (self.repo / "audit_H" / "notes.md").write_bytes(b"notes\n")
+        self._patch = mock.patch.dict(os.environ, {CACHE_DIR_ENV: str(self.tmp / "cache")})
+        self._patch.start()
+
+    def tearDown(self):
+        self._patch.stop()
+        self._tmp.cleanup()
+
+    def _git(self, *args):
+        subprocess.run(["git", *args], cwd=self.repo, check=True, capture_output=True)
+
+    def test_git_snapshot_trusts_only_clean_index_entries(self):
+        self._git("init", "-q")
+        self._git("add", ".")
+        (self.repo / "docs" / "spec" / "schema.json").write_bytes(b'{"changed": true}\n')
+        (self.repo / "audit_H" / "notes.md").unlink()
+        (self.repo / "audit_H" / "helper.py").write_bytes(b"print()\n")
+
+        tree = snapshot(self.repo)
+
+        self.assertEqual(tree.source, "git")
+        self.assertEqual(tree.paths(), ["audit_H/helper.py", "docs/spec/model.md", "docs/spec/schema.json"])
+        self.assertIsNotNone(tree.entries["docs/spec/model.md"])
+        self.assertIsNone(tree.entries["docs/spec/schema.json"])
+        self.assertIsNone(tree.entries["audit_H/helper.py"])
+        self.assertEqual(list(ci_gate_spec_integrity._scan_h_folders_for_executables(tree)), ["audit_H/helper.py"])
+
+    def test_gate_scan_sees_untracked_and_ignored_executables(self):
+        self._git("init", "-q")
+        (self.repo / ".gitignore").write_text("*.local.py\n", encoding="utf-8")
+        self._git("add", ".")
+        (self.repo / "audit_H" / "untracked.py").write_bytes(b"print()\n")
+        (self.repo / "audit_H" / "ignored.local.py").write_bytes(b"print()\n")
+
+        self.assertNotIn("audit_H/ignored.local.py", snapshot(self.repo).paths())
+        tree = snapshot(self.repo, include_ignored=True)
+
+        self.assertEqual(
+            list(ci_gate_spec_integrity._scan_h_folders_for_executables(tree)),
+            ["audit_H/ignored.local.py", "audit_H/untracked.py"],
+        )
+        with mock.patch.object(ci_gate_spec_integrity, "ROOT", self.repo):
+            self.assertEqual(
+                list(ci_gate_spec_integrity._scan_h_folders_for_executables()),
+                ["audit_H/ignored.local.py", "audit_H/untracked.py"],
+            )
+
+    def test_clean_files_are_digested_once_per_blob(self):
+        self._git("init", "-q")
+        self._git("add", ".")
+        paths = [self.repo / "docs" / "spec" / "model.md", self.repo / "docs" / "spec" / "schema.json"]
+        tree = snapshot(self.repo)
+        first = tree.digests(paths, FileHashCache())
+
+        with mock.patch("hpl.spec_tree._hash_blob_file", side_effect=AssertionError("blob re-read")), mock.patch(
+            "hpl.cache._hash_file", side_effect=AssertionError("file re-read")
+        ):
+            second = snapshot(self.repo).digests(paths, FileHashCache())
+
+        self.assertEqual(first, second)
+        self.assertEqual(first[paths[0]], _sha256(b"model v1\n"))
+
+        # Verify mode ignores the blob cache and re-reads every file.
+        verified = tree.digests(paths, FileHashCache(verify=True))
+        self.assertEqual(verified, first)
+
+    def test_checkout_conversions_bypass_the_shared_blob_cache(self):
+        (self.repo / ".gitattributes").write_text("docs/spec/model.md eol=crlf\n", encoding="utf-8")
+        converted = self.repo / "docs" / "spec" / "model.md"
+        plain = self.repo / "docs" / "spec" / "schema.json"
+        converted.write_bytes(b"converted model\n")
+        plain.write_bytes(b'{"plain": true}\n')
+        self._git("init", "-q")
+        self._git("add", ".")
+        tree = snapshot(self.repo)
+        # Another checkout recorded these blobs with different on-disk bytes.
+        self.addCleanup(spec_tree._BLOB_DIGESTS.clear_memory)
+        for path in (converted, plain):
+            spec_tree._BLOB_DIGESTS.put(cache_key("blob", tree.blob_id(path)), "sha256:" + "0" * 64)
+
+        digests = tree.digests([converted, plain], FileHashCache())
+
+        self.assertEqual(digests[converted], _sha256(b"converted model\n"))
+        self.assertEqual(digests[plain], "sha256:" + "0" * 64)
+
+    def test_walk_snapshot_outside_git_matches_file_contents(self):
+        (self.repo / "__pycache__").mkdir()
+        (self.repo / "__pycache__" / "mod.pyc").write_bytes(b"\0")
+        (self.repo / ".hidden").mkdir()
+        (self.repo / ".hidden" / "skip.py").write_bytes(b"\0")
+
+        with mock.patch("hpl.spec_tree._git", return_value=None):
+            tree = snapshot(self.repo)
+        path = self.repo / "audit_H" / "notes.md"
+
+        self.assertEqual(tree.source, "walk")
+        self.assertEqual(tree.paths(), ["audit_H/notes.md", "docs/spec/model.md", "docs/spec/schema.json"])
+        self.assertEqual(tree.digests([path], FileHashCache())[path], _sha256(b"notes\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
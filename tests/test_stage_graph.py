@@ -0,0 +1,146 @@
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = str(ROOT / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from hpl import compile_cache  # noqa: E402
+from hpl.cache import CACHE_DIR_ENV, JsonCache  # noqa: E402
+from hpl.cli import main  # noqa: E402
+from hpl.stage_graph import Stage, StageGraph  # noqa: E402
+
+
+class StageGraphTests(unittest.TestCase):
+    def test_independent_stages_overlap_up_to_the_bound(self):
+        lock = threading.Lock()
+        active = {"now": 0, "peak": 0}
+
+        def work(name):
+            def run(results):
+                with lock:
+                    active["now"] += 1
+                    active["peak"] = max(active["peak"], active["now"])
+                time.sleep(0.05)
+                with lock:
+                    active["now"] -= 1
+                return name
+
+            return run
+
+        stages = [Stage("a", work("a"))]
+        stages += [Stage(f"b{idx}", work(f"b{idx}"), deps=("a",)) for idx in range(4)]
+        stages.append(Stage("c", lambda results: sorted(results), deps=tuple(f"b{idx}" for idx in range(4))))
+
+        results = StageGraph(stages, max_workers=2).run()
+
+        self.assertEqual(active["peak"], 2)
+        self.assertEqual(results["c"], ["a", "b0", "b1", "b2", "b3"])
+
+    def test_dependencies_must_be_declared_first(self):
+        with self.assertRaises(ValueError):
+            StageGraph([Stage("b", lambda results: None, deps=("a",)), Stage("a", lambda results: None)])
+        with self.assertRaises(ValueError):
+            StageGraph([Stage("a", lambda results: None), Stage("a", lambda results: None)])
+
+    def test_first_failure_stops_the_graph(self):
+        ran = []
+
+        def fail(results):
+            raise RuntimeError("stage failed")
+
+        stages = [
+            Stage("fail", fail),
+            Stage("ok", lambda results: ran.append("ok")),
+            Stage("after", lambda results: ran.append("after"), deps=("fail",)),
+        ]
+        for workers in (1, 2):
+            ran.clear()
+            with self.assertRaises(RuntimeError):
+                StageGraph(stages, max_workers=workers).run()
+            self.assertNotIn("after", ran)
+
+    def test_cached_stage_restores_outputs_without_running(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_path = Path(tmp_dir) / "out.json"
+            calls = []
+
+            def write(results):
+                calls.append(1)
+                out_path.write_text('{"value":1}', encoding="utf-8")
+                return {"value": 1}
+
+            stage = Stage("write", write, key=lambda results: "input-digest", outputs=(out_path,))
+            cache = JsonCache("stages", root=Path(tmp_dir) / "cache")
+            StageGraph([stage], cache=cache).run()
+            out_path.unlink()
+            cache.clear_memory()
+
+            graph = StageGraph([stage], cache=cache)
+            results = graph.run()
+
+            self.assertEqual(len(calls), 1)
+            self.assertTrue(graph.runs["write"].cache_hit)
+            self.assertEqual(results["write"], {"value": 1})
+            self.assertEqual(out_path.read_text(encoding="utf-8"), '{"value":1}')
+
+
+class LifecycleStageCacheTests(unittest.TestCase):
+    def _lifecycle(self, out_dir, jobs):
+        stdout = io.StringIO()
+        argv = [
+            "lifecycle",
+            str(ROOT / "examples" / "momentum_trade.hpl"),
+            "--backend",
+            "qasm",
+            "--legacy",
+            "--out-dir",
+            str(out_dir),
+            "--jobs",
+            str(jobs),
+        ]
+        with contextlib.redirect_stdout(stdout):
+            self.assertEqual(main(argv), 0)
+        work_files = {path.name: path.read_bytes() for path in sorted((out_dir / "work").iterdir())}
+        return json.loads(stdout.getvalue()), work_files
+
+    def test_unchanged_lifecycle_reuses_plan_and_lowering(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            with mock.patch.dict(os.environ, {CACHE_DIR_ENV: str(tmp / "cache")}):
+                summary, work_files = self._lifecycle(tmp / "out", jobs=1)
+                with mock.patch("hpl.scheduler.plan", side_effect=AssertionError("plan re-ran")), mock.patch(
+                    "hpl.backends.classical_lowering.lower_program_ir_to_backend_ir",
+                    side_effect=AssertionError("lowering re-ran"),
+                ):
+                    cached_summary, cached_files = self._lifecycle(tmp / "out", jobs=3)
+
+        self.assertEqual(summary["bundle_id"], cached_summary["bundle_id"])
+        self.assertEqual(work_files, cached_files)
+        self.assertIn("program.qasm", cached_files)
+
+    def test_schema_changes_rerun_the_ir_stage(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            with mock.patch.dict(os.environ, {CACHE_DIR_ENV: str(tmp / "cache")}):
+                self._lifecycle(tmp / "out", jobs=1)
+                with mock.patch("hpl.compile_cache.compile_file", wraps=compile_cache.compile_file) as compile_file:
+                    self._lifecycle(tmp / "out", jobs=1)
+                    self.assertEqual(compile_file.call_count, 0)
+                    with mock.patch("hpl.dynamics.ir_emitter.schema_digest", return_value="sha256:edited"):
+                        self._lifecycle(tmp / "out", jobs=1)
+                    self.assertEqual(compile_file.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = str(ROOT / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from hpl import tool_loader
+from tools import bundle_evidence
+
+
+class ToolLoaderTests(unittest.TestCase):
+    def test_load_tool_returns_package_module(self):
+        self.assertIs(tool_loader.load_tool("bundle_evidence"), bundle_evidence)
+        self.assertEqual(bundle_evidence.__name__, "tools.bundle_evidence")
+
+    def test_repeat_loads_do_not_reimport(self):
+        first = tool_loader.load_tool("verify_epoch")
+        with mock.patch.object(
+            tool_loader.importlib, "import_module", side_effect=AssertionError("re-imported")
+        ):
+            second = tool_loader.load_tool("verify_epoch")
+        self.assertIs(first, second)
+        self.assertIs(first.anchor_epoch, tool_loader.load_tool("anchor_epoch"))
+
+    def test_sys_path_is_left_untouched(self):
+        script = (
+            "import sys\n"
+            f"sys.path.insert(0, {SRC_PATH!r})\n"
+            "before = list(sys.path)\n"
+            "from hpl.tool_loader import load_tool\n"
+            "load_tool('verify_epoch'); load_tool('bundle_evidence')\n"
+            "assert sys.path == before, [p for p in sys.path if p not in before]\n"
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result = subprocess.run([sys.executable, "-c", script], cwd=tmp_dir, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_foreign_tools_package_is_not_replaced(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            (Path(tmp_dir) / "tools").mkdir()
+            (Path(tmp_dir) / "tools" / "__init__.py").write_text("", encoding="utf-8")
+            script = (
+                "import sys\n"
+                f"sys.path[:0] = [{tmp_dir!r}, {SRC_PATH!r}]\n"
+                "import tools\n"
+                "from hpl.tool_loader import load_tool\n"
+                "try:\n"
+                "    load_tool('verify_epoch')\n"
+                "except ImportError:\n"
+                "    sys.exit(0)\n"
+                "sys.exit(1)\n"
+            )
+            result = subprocess.run([sys.executable, "-c", script], cwd=tmp_dir, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,7 +13,7 @@ from hpl.emergence.dsl import parser
 from hpl.emergence.macros import expander
 from hpl.axioms import validator
 from hpl.dynamics import ir_emitter
-from hpl.trace import TraceCollector
+from hpl.trace import TraceCollector, read_ndjson, trace_from_columns
 
 
 EXAMPLE_PATH = ROOT / "examples" / "momentum_trade.hpl"
@@ -55,5 +55,44 @@ class TraceabilityTests(unittest.TestCase):
         self.assertEqual(ir_plain, ir_traced)
 
 
+    def test_trace_node_paths_and_ids(self):
+        _ir, trace = self._run_pipeline()
+        data = trace.to_dict()
+        by_phase = {}
+        for node in data["nodes"]:
+            by_phase.setdefault(node["phase"], []).append(node)
+        for phase, nodes in by_phase.items():
+            self.assertEqual(
+                [node["node_id"] for node in nodes],
+                [f"{phase}:{idx}" for idx in range(1, len(nodes) + 1)],
+            )
+            self.assertEqual(nodes[0]["path"], [0])
+        ids = {node["node_id"] for node in data["nodes"]}
+        for mapping in data["mappings"]:
+            self.assertIn(mapping["from"], ids)
+            self.assertIn(mapping["to"], ids)
+
+    def test_compact_serialisations_round_trip(self):
+        _ir, trace = self._run_pipeline()
+        expected = trace.to_dict()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            compact_path = Path(tmp) / "momentum.trace.json"
+            trace.write_json(compact_path, compact=True)
+            ndjson_path = Path(tmp) / "momentum.trace.ndjson"
+            trace.write_ndjson(ndjson_path)
+            full_path = Path(tmp) / "full.trace.json"
+            trace.write_json(full_path)
+
+            columns = json.loads(compact_path.read_text(encoding="utf-8"))
+            self.assertEqual(trace_from_columns(columns), expected)
+            self.assertEqual(read_ndjson(ndjson_path), expected)
+            self.assertLess(compact_path.stat().st_size, full_path.stat().st_size)
+
+    def test_columns_reject_unknown_format(self):
+        with self.assertRaises(ValueError):
+            trace_from_columns({"format": "other"})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,160 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = str(ROOT / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from hpl import compile_cache, scheduler, tracing
+from hpl.cache import JsonCache
+from hpl.execution_token import ExecutionToken
+from hpl.runtime.contracts import ExecutionContract
+from hpl.runtime.context import RuntimeContext
+from hpl.runtime.engine import RuntimeEngine
+from hpl.runtime.io.adapter import MockBrokerAdapter
+
+
+EXAMPLE_PATH = ROOT / "examples" / "momentum_trade.hpl"
+CLI = [sys.executable, "-m", "hpl.cli"]
+TEST_KEY = ROOT / "tests" / "fixtures" / "keys" / "ci_ed25519_test.sk"
+
+
+class _Recorder:
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_start(self, span):
+        self.started.append(span.name)
+
+    def on_end(self, span):
+        self.ended.append(span)
+
+    def by_name(self, name):
+        return [span for span in self.ended if span.name == name]
+
+
+class TracingTests(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(tracing.clear_hooks)
+
+    def test_disabled_spans_share_one_noop(self):
+        self.assertFalse(tracing.enabled())
+        self.assertIs(tracing.span("parse"), tracing.span("plan", step_id="s1"))
+        with tracing.span("parse") as active:
+            self.assertIsNone(active)
+        adapter = MockBrokerAdapter()
+        self.assertIs(tracing.trace_adapter(adapter, "io.adapter"), adapter)
+
+    def test_pipeline_spans_nest_under_their_stage(self):
+        recorder = tracing.register_hook(_Recorder())
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with mock.patch.object(compile_cache, "_COMPILE_CACHE", JsonCache("compile", root=Path(tmp_dir))):
+                compiled = compile_cache.compile_source(
+                    EXAMPLE_PATH.read_text(encoding="utf-8"), program_id="momentum_trade"
+                )
+        plan = scheduler.plan(compiled.program_ir, scheduler.SchedulerContext())
+        token = ExecutionToken.from_dict(plan.execution_token or {})
+        contract = ExecutionContract(allowed_steps={step["operator_id"] for step in plan.steps})
+        RuntimeEngine().run(plan, RuntimeContext(execution_token=token), contract)
+
+        self.assertEqual(recorder.started[:5], ["compile", "parse", "expand", "validate", "emit_ir"])
+        (compile_span,) = recorder.by_name("compile")
+        for name in ("parse", "expand", "validate", "emit_ir"):
+            (stage,) = recorder.by_name(name)
+            self.assertEqual(stage.parent_span_id, compile_span.span_id)
+            self.assertEqual(stage.trace_id, compile_span.trace_id)
+            self.assertGreaterEqual(stage.end_time_ns, stage.start_time_ns)
+        (plan_span,) = recorder.by_name("plan")
+        self.assertIsNone(plan_span.parent_span_id)
+        (run_span,) = recorder.by_name("run")
+        steps = recorder.by_name("run.step")
+        self.assertEqual(len(steps), len(plan.steps))
+        self.assertEqual({span.attributes["effect_type"] for span in steps}, {"NOOP"})
+        self.assertTrue(all(span.parent_span_id == run_span.span_id for span in steps))
+
+    def test_errors_mark_the_span_and_propagate(self):
+        recorder = tracing.register_hook(_Recorder())
+        with self.assertRaises(ValueError):
+            with tracing.span("anchor"):
+                raise ValueError("boom")
+        (span,) = recorder.ended
+        self.assertEqual(span.status, tracing.STATUS_ERROR)
+        self.assertEqual(span.error, "ValueError: boom")
+
+    def test_adapter_calls_open_spans(self):
+        recorder = tracing.register_hook(_Recorder())
+        adapter = tracing.trace_adapter(MockBrokerAdapter(), "io.adapter")
+        with tracing.span("run.step", step_id="submit") as step:
+            adapter.submit_order("mock://broker", {"symbol": "X"}, {})
+        (call,) = recorder.by_name("io.adapter.submit_order")
+        self.assertEqual(call.parent_span_id, step.span_id)
+        self.assertEqual(call.attributes, {"adapter": "MockBrokerAdapter"})
+
+    def test_exporters_write_jsonl_and_otlp(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            jsonl = tracing.JsonlExporter(Path(tmp_dir) / "spans.jsonl")
+            otlp = tracing.OtlpFileExporter(Path(tmp_dir) / "spans.otlp.json")
+            tracing.register_hook(jsonl)
+            tracing.register_hook(otlp)
+            with tracing.span("bundle", artifacts=3):
+                with tracing.span("sign"):
+                    pass
+            jsonl.close()
+            otlp.close()
+            lines = [json.loads(line) for line in jsonl.path.read_text(encoding="utf-8").splitlines()]
+            exported = json.loads(otlp.path.read_text(encoding="utf-8"))
+
+        self.assertEqual([line["name"] for line in lines], ["sign", "bundle"])
+        self.assertEqual(lines[0]["parent_span_id"], lines[1]["span_id"])
+        (resource,) = exported["resourceSpans"]
+        self.assertEqual(resource["resource"]["attributes"][0]["value"], {"stringValue": tracing.SERVICE_NAME})
+        spans = resource["scopeSpans"][0]["spans"]
+        self.assertEqual(len(spans[1]["traceId"]), 32)
+        self.assertEqual(len(spans[1]["spanId"]), 16)
+        self.assertNotIn("parentSpanId", spans[1])
+        self.assertEqual(spans[0]["parentSpanId"], spans[1]["spanId"])
+        self.assertEqual(spans[1]["attributes"], [{"key": "artifacts", "value": {"intValue": "3"}}])
+
+    def test_cli_exports_demo_spans_from_env(self):
+        env = os.environ.copy()
+        env["PYTHONPATH"] = SRC_PATH + os.pathsep + env.get("PYTHONPATH", "")
+        env["HPL_IO_ENABLED"] = "1"
+        env["HPL_IO_ADAPTER"] = "mock"
+        env["HPL_IO_ADAPTER_READY"] = "1"
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            trace_path = Path(tmp_dir) / "spans.jsonl"
+            env[tracing.TRACE_JSONL_ENV] = str(trace_path)
+            subprocess.run(
+                CLI
+                + [
+                    "demo",
+                    "trading-io-shadow",
+                    "--out-dir",
+                    str(Path(tmp_dir) / "out"),
+                    "--signing-key",
+                    str(TEST_KEY),
+                    "--enable-io",
+                ],
+                cwd=ROOT,
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            names = [json.loads(line)["name"] for line in trace_path.read_text(encoding="utf-8").splitlines()]
+
+        for name in ("compile", "plan", "run", "run.step", "bundle"):
+            self.assertIn(name, names)
+        self.assertTrue(any(name.startswith("io.adapter.") for name in names))
+
+
+if __name__ == "__main__":
+    unittest.main()
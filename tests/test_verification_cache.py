@@ -0,0 +1,117 @@
+import importlib.util
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = str(ROOT / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+from hpl import scheduler, verification_cache
+
+TOOLS_DIR = ROOT / "tools"
+ANCHOR_SPEC = importlib.util.spec_from_file_location("anchor_epoch", TOOLS_DIR / "anchor_epoch.py")
+anchor_epoch = importlib.util.module_from_spec(ANCHOR_SPEC)
+ANCHOR_SPEC.loader.exec_module(anchor_epoch)
+
+SIGN_SPEC = importlib.util.spec_from_file_location("sign_anchor", TOOLS_DIR / "sign_anchor.py")
+sign_anchor = importlib.util.module_from_spec(SIGN_SPEC)
+SIGN_SPEC.loader.exec_module(sign_anchor)
+
+FIXTURES = ROOT / "tests" / "fixtures" / "keys"
+TEST_PRIVATE_KEY = FIXTURES / "ci_ed25519_test.sk"
+TEST_PUBLIC_KEY = FIXTURES / "ci_ed25519_test.pub"
+
+
+def _copy_required_tree(target: Path) -> None:
+    for paths in anchor_epoch.collect_required_paths(ROOT).values():
+        for path in paths:
+            destination = target / path.relative_to(ROOT)
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(path, destination)
+
+
+def _build_anchor(root: Path):
+    return anchor_epoch.build_epoch_anchor(
+        epoch_id="test-epoch",
+        timestamp="1970-01-01T00:00:00Z",
+        git_commit="test",
+        root=root,
+        emit_witness=False,
+    )
+
+
+def _sample_program_ir():
+    return {
+        "program_id": "test_program",
+        "hamiltonian": {"terms": [{"operator_id": "SURF_A", "cls": "C", "coefficient": 1.0}]},
+        "operators": {"SURF_A": {"type": "unspecified", "commutes_with": [], "backend_map": []}},
+        "invariants": [],
+        "scheduler": {"collapse_policy": "unspecified", "authorized_observers": []},
+    }
+
+
+class VerificationCacheTests(unittest.TestCase):
+    def setUp(self):
+        verification_cache.clear_verification_cache()
+
+    def tearDown(self):
+        verification_cache.clear_verification_cache()
+
+    def test_repeat_verification_hits_cache_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            _copy_required_tree(tmp)
+            anchor = _build_anchor(tmp)
+
+            first = verification_cache.verify_epoch_anchor(anchor, root=tmp, git_commit_override="test")
+            second = verification_cache.verify_epoch_anchor(anchor, root=tmp, git_commit_override="test")
+
+            schema = anchor_epoch.collect_required_paths(tmp)["schemas"][0]
+            schema.write_text(schema.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+            third = verification_cache.verify_epoch_anchor(anchor, root=tmp, git_commit_override="test")
+
+        self.assertTrue(first.ok)
+        self.assertFalse(first.cache_hit)
+        self.assertTrue(second.ok)
+        self.assertTrue(second.cache_hit)
+        self.assertFalse(third.ok)
+        self.assertFalse(third.cache_hit)
+
+    def test_warm_plan_marks_witness_without_changing_plan_id(self):
+        anchor = _build_anchor(ROOT)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = Path(tmp_dir)
+            anchor_path = tmp / "anchor.json"
+            anchor_path.write_text(json.dumps(anchor, sort_keys=True), encoding="utf-8")
+            signing_key = sign_anchor._load_signing_key(TEST_PRIVATE_KEY, "UNUSED")
+            signature_path = tmp / "anchor.sig"
+            signature_path.write_text(
+                sign_anchor.sign_anchor_file(anchor_path, signing_key).hex(), encoding="utf-8"
+            )
+            ctx = scheduler.SchedulerContext(
+                require_epoch_verification=True,
+                anchor_path=anchor_path,
+                signature_path=signature_path,
+                public_key_path=TEST_PUBLIC_KEY,
+                git_commit_override="test",
+            )
+            cold = scheduler.plan(_sample_program_ir(), ctx)
+            warm = scheduler.plan(_sample_program_ir(), ctx)
+
+        def _epoch_witness(plan):
+            return next(w for w in plan.witness_records if w["stage"] == "epoch_verification")
+
+        self.assertEqual(cold.status, "planned")
+        self.assertEqual(cold.plan_id, warm.plan_id)
+        self.assertNotIn("cache_hit", warm.verification)
+        self.assertNotIn("notes", _epoch_witness(cold))
+        self.assertEqual(_epoch_witness(warm)["notes"], scheduler.VERIFICATION_CACHE_HIT_NOTE)
+
+
+if __name__ == "__main__":
+    unittest.main()
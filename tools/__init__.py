@@ -0,0 +1 @@
+"""Repository tooling (anchors, bundles, validators) importable as ``tools``."""
@@ -15,6 +15,9 @@ import sys
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
+from hpl import tracing
+from hpl.cache import FileHashCache
+from hpl.spec_tree import SpecTree, snapshot
 from hpl.trace import emit_witness_record
 
 
@@ -40,15 +43,22 @@ TOOL_FILES = [
 
 SCHEDULER_SPEC = Path("docs/spec/scr_level3_scheduler_model.md")
 
+# Shared across calls so repeated anchors in one process load the index once.
+_FILE_HASHES = FileHashCache()
+
 
 def main() -> int:
     args = _parse_args()
+    # A fresh cache per run so its counters describe this anchor only; it
+    # still reads the persistent index, and honours HPL_HASH_VERIFY.
+    file_hashes = FileHashCache(verify=True if args.verify_hashes else None)
     anchor = build_epoch_anchor(
         epoch_id=args.epoch_id,
         timestamp=args.timestamp,
         git_commit=args.git_commit,
         root=args.root,
         emit_witness=args.emit_witness,
+        file_hashes=file_hashes,
     )
 
     output = _anchor_to_json(anchor, pretty=args.pretty)
@@ -56,16 +66,41 @@ def main() -> int:
         args.output.write_text(output, encoding="utf-8")
     else:
         print(output)
+    if file_hashes.verify:
+        report_hash_cache(file_hashes)
     return 0
 
 
+def report_hash_cache(file_hashes: FileHashCache) -> Dict[str, int]:
+    """Print verify-mode cache counters to stderr, warning on stale entries."""
+    stats = file_hashes.stats()
+    print(f"hash cache: hits={stats['hits']} misses={stats['misses']} stale={stats['stale']}", file=sys.stderr)
+    if stats["stale"]:
+        print(
+            f"warning: {stats['stale']} cached digest(s) did not match file contents; "
+            "digests above were re-read, but unverified runs would have trusted them",
+            file=sys.stderr,
+        )
+    return stats
+
+
+@tracing.traced("anchor")
 def build_epoch_anchor(
     epoch_id: str,
     timestamp: Optional[str],
     git_commit: Optional[str],
     root: Path = ROOT,
     emit_witness: bool = False,
+    verify_hashes: bool = False,
+    file_hashes: Optional[FileHashCache] = None,
 ) -> Dict[str, object]:
+    """Hash the spec, registry and tooling files into an epoch anchor.
+
+    The tree is listed once (see ``hpl.spec_tree``). Clean files are
+    digested by git blob id and other files by the shared stat-keyed hash
+    cache, so only new content is read. ``verify_hashes`` re-reads every
+    file regardless. Pass ``file_hashes`` to read its counters afterwards.
+    """
     epoch_id = epoch_id or DEFAULT_EPOCH_ID
     timestamp = timestamp or DEFAULT_TIMESTAMP
 
@@ -75,16 +110,19 @@ def build_epoch_anchor(
         commit = "unknown"
         notes.append("git_commit unavailable; set to 'unknown'")
 
-    schema_hashes = _hash_files([root / path for path in SCHEMA_FILES], root)
+    if file_hashes is None:
+        file_hashes = FileHashCache(verify=True) if verify_hashes else _FILE_HASHES
+    tree = snapshot(root)
+    schema_hashes = _hash_files([root / path for path in SCHEMA_FILES], root, file_hashes, tree)
     registry_paths = _collect_registry_paths(root)
-    registry_hashes = _hash_files(registry_paths, root)
-    tooling_hashes = _hash_files([root / path for path in TOOL_FILES], root)
+    registry_hashes = _hash_files(registry_paths, root, file_hashes, tree)
+    tooling_hashes = _hash_files([root / path for path in TOOL_FILES], root, file_hashes, tree)
 
     callgraph_hash, callgraph_note = _compute_callgraph_hash(registry_paths)
     if callgraph_note:
         notes.append(callgraph_note)
 
-    scheduler_hash, scheduler_note = _scheduler_contract_hash(root)
+    scheduler_hash, scheduler_note = _scheduler_contract_hash(root, file_hashes, tree)
     if scheduler_note:
         notes.append(scheduler_note)
 
@@ -136,6 +174,11 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument("--output", type=Path)
     parser.add_argument("--pretty", action="store_true")
     parser.add_argument("--root", type=Path, default=ROOT)
+    parser.add_argument(
+        "--verify-hashes",
+        action="store_true",
+        help="Re-hash every file instead of trusting cached digests for unchanged stat data.",
+    )
     return parser.parse_args()
 
 
@@ -155,13 +198,21 @@ def _resolve_git_commit(root: Path) -> Optional[str]:
         return None
 
 
-def _hash_files(paths: Iterable[Path], root: Path) -> Dict[str, str]:
-    hashes: Dict[str, str] = {}
-    for path in sorted(paths):
+def _hash_files(
+    paths: Iterable[Path],
+    root: Path,
+    file_hashes: Optional[FileHashCache] = None,
+    tree: Optional[SpecTree] = None,
+) -> Dict[str, str]:
+    ordered = sorted(paths)
+    for path in ordered:
         if not path.exists():
             raise FileNotFoundError(f"Required file not found: {path}")
+    digests = _digests(ordered, file_hashes, tree)
+    hashes: Dict[str, str] = {}
+    for path in ordered:
         rel = str(path.relative_to(root)).replace("\\", "/")
-        hashes[rel] = _hash_bytes(path.read_bytes())
+        hashes[rel] = digests[path]
     return hashes
 
 
@@ -194,11 +245,22 @@ def _compute_callgraph_hash(registry_paths: List[Path]) -> Tuple[str, Optional[s
     return _digest_text(_canonical_json(edges_sorted)), None
 
 
-def _scheduler_contract_hash(root: Path) -> Tuple[Optional[str], Optional[str]]:
+def _scheduler_contract_hash(
+    root: Path,
+    file_hashes: Optional[FileHashCache] = None,
+    tree: Optional[SpecTree] = None,
+) -> Tuple[Optional[str], Optional[str]]:
     path = root / SCHEDULER_SPEC
     if not path.exists():
         return None, "scheduler_contract_hash unavailable; scheduler spec not found"
-    return _hash_bytes(path.read_bytes()), None
+    return _digests([path], file_hashes, tree)[path], None
+
+
+def _digests(paths: List[Path], file_hashes: Optional[FileHashCache], tree: Optional[SpecTree]) -> Dict[Path, str]:
+    file_hashes = file_hashes or _FILE_HASHES
+    if tree is None:
+        return file_hashes.digests(paths)
+    return tree.digests(paths, file_hashes)
 
 
 def _hash_bytes(payload: bytes) -> str:
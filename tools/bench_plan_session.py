@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from hpl import scheduler  # noqa: E402
+
+DEFAULT_MIN_RATE = 10_000
+
+IO_POLICY = {
+    "io_allowed": True,
+    "io_scopes": ["BROKER_CONNECT", "ORDER_SUBMIT", "ORDER_CANCEL"],
+    "io_endpoints_allowed": ["broker://demo"],
+}
+
+
+def _program_ir() -> Dict[str, object]:
+    return {
+        "program_id": "bench_plan_session",
+        "hamiltonian": {"terms": []},
+        "operators": {},
+        "invariants": [],
+        "scheduler": {},
+    }
+
+
+def _orders(count: int) -> List[Dict[str, object]]:
+    return [
+        {"symbol": "DEMO", "side": "buy" if idx % 2 else "sell", "qty": idx % 7 + 1, "price": 100 + idx % 13}
+        for idx in range(count)
+    ]
+
+
+def run(count: int) -> Dict[str, object]:
+    ctx = scheduler.SchedulerContext(
+        track="trading_io_shadow",
+        emit_effect_steps=True,
+        io_policy=IO_POLICY,
+        io_endpoint="broker://demo",
+    )
+    session = scheduler.PlanSession(_program_ir(), ctx)
+    orders = _orders(count)
+
+    start = time.perf_counter()
+    for idx, order in enumerate(orders):
+        session.plan(io_order=order, budget_steps=100 + idx % 8)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "plans": count,
+        "seconds": round(elapsed, 6),
+        "plans_per_second": round(count / elapsed, 1) if elapsed else None,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure PlanSession plan issuance throughput.")
+    parser.add_argument("--count", type=int, default=50_000)
+    parser.add_argument("--min-rate", type=float, default=DEFAULT_MIN_RATE, help="fail below this many plans/s")
+    args = parser.parse_args(argv)
+
+    summary = run(args.count)
+    print(json.dumps(summary, indent=2))
+    rate = summary["plans_per_second"]
+    if rate is not None and rate < args.min_rate:
+        print(f"Plan session throughput below {args.min_rate:g} plans/s.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
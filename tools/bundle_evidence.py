@@ -14,9 +14,14 @@ from nacl.exceptions import BadSignatureError
 from nacl.signing import SigningKey, VerifyKey
 
 ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
+SRC_PATH = ROOT / "src"
+# Only needed when run as a script; as ``tools.<name>`` the package is already bound.
+if not __package__ and str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
 
+from hpl import tracing
 from tools import verify_epoch
 from tools import verify_anchor_signature
 
@@ -85,6 +90,7 @@ def main() -> int:
     return 0 if overall_ok else 1
 
 
+@tracing.traced("bundle")
 def build_bundle(
     out_dir: Path,
     artifacts: List[Artifact],
@@ -179,6 +185,7 @@ def _collect_artifacts(args: argparse.Namespace) -> List[Artifact]:
         "net_response_log": args.net_response_log,
         "net_event_log": args.net_event_log,
         "net_session_manifest": args.net_session_manifest,
+        "budget_ledger": args.budget_ledger,
     }
 
     artifacts: List[Artifact] = []
@@ -537,6 +544,7 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument("--net-response-log", type=Path)
     parser.add_argument("--net-event-log", type=Path)
     parser.add_argument("--net-session-manifest", type=Path)
+    parser.add_argument("--budget-ledger", type=Path, help="budget ledger snapshot JSON")
     parser.add_argument("--pub", type=Path, default=DEFAULT_PUBLIC_KEY)
     parser.add_argument("--extra", type=Path, action="append", default=[])
     parser.add_argument("--quantum-semantics-v1", action="store_true")
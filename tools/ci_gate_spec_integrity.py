@@ -3,11 +3,18 @@ from __future__ import annotations
 import os
 import re
 import subprocess
+import sys
 from pathlib import Path
-from typing import Iterable, Set
+from typing import Iterable, Optional, Set
 
 
 ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = ROOT / "src"
+
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from hpl.spec_tree import SpecTree, snapshot
 FREEZE_DECLARATION = ROOT / "docs" / "spec" / "00_spec_freeze_declaration_v1.md"
 DISALLOWED_EXTS = {
     ".py",
@@ -78,13 +85,13 @@ def _read_normative_files() -> Set[str]:
     return set(matches)
 
 
-def _scan_h_folders_for_executables() -> Iterable[str]:
+def _scan_h_folders_for_executables(tree: Optional[SpecTree] = None) -> Iterable[str]:
+    tree = tree or snapshot(ROOT, include_ignored=True)
     violations = []
-    for folder in ROOT.iterdir():
-        if folder.is_dir() and folder.name.endswith("_H"):
-            for path in folder.rglob("*"):
-                if path.is_file() and path.suffix.lower() in DISALLOWED_EXTS:
-                    violations.append(str(path.relative_to(ROOT)))
+    for rel in tree.paths():
+        folder, _, rest = rel.partition("/")
+        if rest and folder.endswith("_H") and Path(rest).suffix.lower() in DISALLOWED_EXTS:
+            violations.append(str(Path(rel)))
     return violations
 
 
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import string
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 CONTRACT_FIELDS = [
@@ -104,6 +105,141 @@ def _first_divergent_leaf(
     return None
 
 
+def index_leaves(leaves: List[Dict[str, object]]) -> Dict[str, Dict[str, object]]:
+    return {str(leaf.get("path")): leaf for leaf in leaves if isinstance(leaf, dict)}
+
+
+def diff_leaves(
+    a_leaves: List[Dict[str, object]], b_leaves: List[Dict[str, object]]
+) -> Dict[str, object]:
+    """Every added, removed and changed leaf, matched by path rather than index."""
+    a_index = index_leaves(a_leaves)
+    b_index = index_leaves(b_leaves)
+    added = sorted(path for path in b_index if path not in a_index)
+    removed = sorted(path for path in a_index if path not in b_index)
+    changed = []
+    for path in sorted(path for path in a_index if path in b_index):
+        a = a_index[path]
+        b = b_index[path]
+        if a.get("leaf_hash") != b.get("leaf_hash") or a.get("sha256") != b.get("sha256"):
+            changed.append(
+                {
+                    "relpath": path,
+                    "machine_a": {"file_hash": a.get("sha256"), "leaf_hash": a.get("leaf_hash")},
+                    "machine_b": {"file_hash": b.get("sha256"), "leaf_hash": b.get("leaf_hash")},
+                }
+            )
+    return {
+        "added": added,
+        "removed": removed,
+        "changed": changed,
+        "unchanged_count": len(a_index) - len(removed) - len(changed),
+    }
+
+
+def merkle_levels(leaf_hashes: List[object]) -> Optional[List[List[str]]]:
+    """Every level of the anchor Merkle tree, leaves first, root last.
+
+    Odd levels pair their last node with itself, as in anchor_generator.
+    Returns None when a leaf hash is missing or not hex.
+    """
+    level: List[str] = []
+    for item in leaf_hashes:
+        if not isinstance(item, str):
+            return None
+        value = item.split("sha256:", 1)[1] if item.startswith("sha256:") else item
+        if not value or any(ch not in string.hexdigits for ch in value):
+            return None
+        level.append(value.lower())
+    if not level:
+        return [[hashlib.sha256(b"").hexdigest()]]
+    levels = [level]
+    while len(level) > 1:
+        padded = level + [level[-1]] if len(level) % 2 == 1 else level
+        level = [
+            hashlib.sha256(bytes.fromhex(padded[idx]) + bytes.fromhex(padded[idx + 1])).hexdigest()
+            for idx in range(0, len(padded), 2)
+        ]
+        levels.append(level)
+    return levels
+
+
+def localize_divergence(
+    a_levels: List[List[str]], b_levels: List[List[str]]
+) -> Tuple[List[int], int]:
+    """Leaf indices under differing subtrees of two same-shape trees.
+
+    Walks down from the root into differing children only, so each
+    divergent leaf costs O(log n) node comparisons. Returns the indices
+    and the number of nodes compared.
+    """
+    top = len(a_levels) - 1
+    compared = 1
+    if a_levels[top][0] == b_levels[top][0]:
+        return [], compared
+    divergent: List[int] = []
+    stack = [(top, 0)]
+    while stack:
+        depth, idx = stack.pop()
+        if depth == 0:
+            divergent.append(idx)
+            continue
+        child_level = depth - 1
+        for child in (2 * idx + 1, 2 * idx):
+            if child >= len(a_levels[child_level]):
+                continue
+            compared += 1
+            if a_levels[child_level][child] != b_levels[child_level][child]:
+                stack.append((child_level, child))
+    return sorted(divergent), compared
+
+
+def _merkle_localization(
+    a_manifest: Dict[str, object],
+    b_manifest: Dict[str, object],
+    a_leaves: List[Dict[str, object]],
+    b_leaves: List[Dict[str, object]],
+) -> Optional[Dict[str, object]]:
+    a_levels = merkle_levels([leaf.get("leaf_hash") for leaf in a_leaves])
+    b_levels = merkle_levels([leaf.get("leaf_hash") for leaf in b_leaves])
+    if a_levels is None or b_levels is None:
+        return None
+    result: Dict[str, object] = {
+        "root_rebuilt": {
+            "machine_a": f"sha256:{a_levels[-1][0]}" == a_manifest.get("merkle_root"),
+            "machine_b": f"sha256:{b_levels[-1][0]}" == b_manifest.get("merkle_root"),
+        },
+    }
+    if len(a_leaves) != len(b_leaves):
+        # Different leaf counts give differently shaped trees; the path diff covers them.
+        result["divergent_leaves"] = None
+        return result
+    indices, compared = localize_divergence(a_levels, b_levels)
+    result["nodes_compared"] = compared
+    result["divergent_leaves"] = [
+        {"index": idx, "machine_a": a_leaves[idx].get("path"), "machine_b": b_leaves[idx].get("path")}
+        for idx in indices
+    ]
+    return result
+
+
+def _leaf_report(
+    a_manifest: Dict[str, object],
+    b_manifest: Dict[str, object],
+    a_leaves_path: Path,
+    b_leaves_path: Path,
+) -> Dict[str, object]:
+    a_leaves = _load_json(a_leaves_path).get("inputs", [])
+    b_leaves = _load_json(b_leaves_path).get("inputs", [])
+    if not isinstance(a_leaves, list) or not isinstance(b_leaves, list):
+        return {}
+    return {
+        "first_divergent_leaf": _first_divergent_leaf(a_leaves, b_leaves),
+        "leaf_diff": diff_leaves(a_leaves, b_leaves),
+        "merkle_localization": _merkle_localization(a_manifest, b_manifest, a_leaves, b_leaves),
+    }
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Compare two anchor contract states.")
     parser.add_argument("--machine-a-manifest", type=Path, required=True)
@@ -153,6 +289,10 @@ def main() -> int:
             "ROOT_CAUSE": root_cause,
             "NEXT_ACTION": next_action,
         }
+        if a_contract["leaves_digest"] != b_contract["leaves_digest"]:
+            # Merkle roots are not compared, but the leaf diff shows what moved.
+            leaf_report = _leaf_report(a_manifest, b_manifest, args.machine_a_leaves, args.machine_b_leaves)
+            output["leaf_diff"] = leaf_report.get("leaf_diff")
         print(json.dumps(output, sort_keys=True, separators=(",", ":")))
         print("Reference anchor is from a different contract state. Refusing comparison.")
         return 1
@@ -164,10 +304,8 @@ def main() -> int:
     else:
         root_cause = "contract matched, merkle mismatched"
         next_action = "Run deterministic leaf diff"
-        a_leaves = _load_json(args.machine_a_leaves).get("inputs", [])
-        b_leaves = _load_json(args.machine_b_leaves).get("inputs", [])
-        if isinstance(a_leaves, list) and isinstance(b_leaves, list):
-            first_divergent_leaf = _first_divergent_leaf(a_leaves, b_leaves)
+        leaf_report = _leaf_report(a_manifest, b_manifest, args.machine_a_leaves, args.machine_b_leaves)
+        first_divergent_leaf = leaf_report.get("first_divergent_leaf")
 
     output = {
         "machine_a_contract": a_contract,
@@ -178,6 +316,9 @@ def main() -> int:
         "NEXT_ACTION": next_action,
         "first_divergent_leaf": first_divergent_leaf,
     }
+    if not merkle_match:
+        output["leaf_diff"] = leaf_report.get("leaf_diff")
+        output["merkle_localization"] = leaf_report.get("merkle_localization")
     print(json.dumps(output, sort_keys=True, separators=(",", ":")))
     return 0 if merkle_match else 1
 
@@ -25,6 +25,8 @@ class HplBridge:
         return cls._instance
 
     def parse(self, source: str) -> ParseResult:
+        if self._use_import:
+            return self._parse_in_process(source)
         import tempfile as _tf
         with _tf.NamedTemporaryFile(suffix=".hpl", mode="w", delete=False) as f:
             f.write(source)
@@ -55,6 +57,8 @@ class HplBridge:
             return ValidationResult(valid=False, violated_axioms=[str(exc)], witnesses=[])
 
     def plan(self, ir: dict, backend: str = "classical", budget_steps: int = 100, enable_io: bool = False) -> ExecutionPlan:
+        if self._use_import:
+            return self._plan_in_process(ir, backend, budget_steps, enable_io)
         import tempfile as _tf, hashlib
         with _tf.NamedTemporaryFile(suffix=".json", mode="w", delete=False) as f:
             json.dump(ir, f)
@@ -86,6 +90,8 @@ class HplBridge:
             Path(ir_path).unlink(missing_ok=True)
 
     def run(self, plan: ExecutionPlan) -> RuntimeResult:
+        if self._use_import and isinstance(plan.policy_summary.get("plan"), dict):
+            return self._run_in_process(plan)
         import tempfile as _tf
         # plan_file may have been written during plan(); if not, write it now
         plan_file = plan.policy_summary.get("plan_file", "")
@@ -100,18 +106,19 @@ class HplBridge:
         try:
             args = ["run", plan_file, "--out", out_path, "--backend", plan.backend]
             rc, out, err = self._run_cli(args)
-            success = rc == 0
             output_data = {}
             try:
                 output_data = json.loads(Path(out_path).read_text())
             except Exception:
                 pass
+            if isinstance(output_data, dict) and "status" in output_data:
+                return self._runtime_result(output_data)
             return RuntimeResult(
-                success=success,
-                output=json.dumps(output_data) if output_data else out,
-                witness_records=output_data.get("witness_records", []),
-                transcript=output_data.get("transcript", [{"step": "run", "rc": rc}]),
-                refusal_reasons=output_data.get("refusal_reasons", [err] if not success and err else []),
+                success=False,
+                output=out,
+                witness_records=[],
+                transcript=[{"step": "run", "rc": rc}],
+                refusal_reasons=[err or out or f"hpl run exited {rc} without a result"],
             )
         finally:
             if cleanup_plan:
@@ -120,11 +127,58 @@ class HplBridge:
 
     def _try_import(self) -> bool:
         try:
-            import hpl  # noqa: F401
+            import hpl.service  # noqa: F401
             return True
         except ImportError:
             return False
 
+    # In-process path: the hpl service keeps schemas, caches and handlers warm
+    # and returns the same dicts the CLI writes, without temp files. Any
+    # failure maps to the same refusal the subprocess path reports for a
+    # non-zero exit.
+    def _parse_in_process(self, source: str) -> ParseResult:
+        from hpl.service import compile_program
+        try:
+            ir = compile_program(source, program_id="agent_program")
+        except Exception as exc:
+            return ParseResult(success=False, ast_json=None, errors=[str(exc)], source=source)
+        return ParseResult(success=True, ast_json=ir, errors=[], source=source)
+
+    def _plan_in_process(self, ir: dict, backend: str, budget_steps: int, enable_io: bool) -> ExecutionPlan:
+        from hpl.service import plan_program
+        try:
+            data = plan_program(ir, allowed_backends=backend, budget_steps=budget_steps)
+        except Exception as exc:
+            raise RuntimeError(str(exc)) from exc
+        token_id = (data.get("execution_token") or {}).get("token_id", "")
+        return ExecutionPlan(
+            token_id=token_id,
+            backend=backend,
+            steps=data.get("steps", []),
+            policy_summary={"backend": backend, "budget_steps": budget_steps, "enable_io": enable_io, "plan": data},
+        )
+
+    def _run_in_process(self, plan: ExecutionPlan) -> RuntimeResult:
+        from hpl.service import run_plan
+        try:
+            data = run_plan(plan.policy_summary["plan"], backend=plan.backend)
+        except Exception as exc:
+            return RuntimeResult(success=False, output="", witness_records=[], transcript=[], refusal_reasons=[str(exc)])
+        return self._runtime_result(data)
+
+    @staticmethod
+    def _runtime_result(data: dict) -> RuntimeResult:
+        # Both paths judge a run by the runtime result it produced: `hpl run`
+        # exits 0 on a denial too, so the exit code cannot tell them apart.
+        success = data.get("status") == "completed"
+        return RuntimeResult(
+            success=success,
+            output=json.dumps(data),
+            witness_records=data.get("witness_records", []),
+            transcript=data.get("transcript", []),
+            refusal_reasons=[] if success else list(data.get("reasons", [])),
+        )
+
     def _run_cli(self, args: list[str], stdin: str | None = None) -> tuple[int, str, str]:
         cmd = [sys.executable, "-m", "hpl.cli"] + args
         if self._hpl_repo:
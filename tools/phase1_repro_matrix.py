@@ -0,0 +1,381 @@
+"""Run Track A reproducibility for many demo/commit references at once.
+
+    python tools/phase1_repro_matrix.py
+    python tools/phase1_repro_matrix.py --demo navier-stokes --commit f06023a --jobs 4
+
+Every reference under ``references/phase1/<demo>/machine_a_<sha>/`` that
+holds an ``anchor_manifest.json`` and ``anchor_leaves.json`` is one case.
+For each case the demo is run at the manifest's ``git_commit``, anchored
+and verified as in ``phase1_track_a_run``, and compared with the reference
+through ``compare_anchor_contract``. All results go into one report.
+
+Compared with one Track A run per case:
+
+- worktrees live under ``--cache-dir`` and are reused while their HEAD
+  still matches the commit, and ``git fetch`` runs once per invocation;
+- venvs are keyed by a digest of the commit's dependency lock (pyproject
+  dependencies, requirements.txt, the tool requirements and the Python
+  version) and shared by every commit with that digest. They hold only the
+  dependencies, and each case imports ``hpl`` from its own worktree through
+  ``PYTHONPATH``;
+- each commit's test suite runs once per invocation, whatever the number of
+  demos checked at it;
+- cases run concurrently, up to ``--jobs`` at a time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+import tomllib
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, TypeVar
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools import phase1_track_a_run as track_a  # noqa: E402
+
+REPORT_FORMAT = "hpl.repro_matrix.v1"
+DEFAULT_REFERENCES_ROOT = Path("references/phase1")
+TOOL_REQUIREMENTS = ("pytest", "pynacl", "cryptography")
+LOCK_FILES = ("pyproject.toml", "requirements.txt")
+VENV_MARKER = ".hpl_lock_digest"
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ReproCase:
+    demo_name: str
+    git_commit: str
+    reference_manifest: Path
+    reference_leaves: Path
+
+    @property
+    def case_id(self) -> str:
+        return f"{self.demo_name}@{self.git_commit[:12]}"
+
+
+@dataclass(frozen=True)
+class MatrixConfig:
+    repo_root: Path
+    cache_dir: Path
+    signing_key: Path
+    public_key: Path
+    repo_slug: str
+    jobs: int
+    fetch: bool
+    skip_tests: bool
+    recreate_venvs: bool
+
+
+class _Once:
+    """Compute each key at most once, even when several threads ask at the same time."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._futures: Dict[str, Future] = {}
+
+    def get(self, key: str, compute: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+            if owner:
+                future = self._futures[key] = Future()
+        if owner:
+            try:
+                future.set_result(compute())
+            except BaseException as exc:
+                future.set_exception(exc)
+        return future.result()
+
+
+def discover_cases(
+    references_root: Path,
+    demos: Optional[Sequence[str]] = None,
+    commits: Optional[Sequence[str]] = None,
+) -> List[ReproCase]:
+    cases: List[ReproCase] = []
+    for manifest in sorted(references_root.glob("*/machine_a_*/anchor_manifest.json")):
+        leaves = manifest.with_name("anchor_leaves.json")
+        if not leaves.exists():
+            continue
+        demo_name = manifest.parent.parent.name.replace("_", "-")
+        git_commit = str(track_a._load_reference_contract(manifest)["git_commit"])
+        if demos and demo_name not in demos:
+            continue
+        if commits and not any(git_commit.startswith(prefix) for prefix in commits):
+            continue
+        cases.append(ReproCase(demo_name, git_commit, manifest.resolve(), leaves.resolve()))
+    return cases
+
+
+def lock_requirements(worktree_dir: Path) -> List[str]:
+    """Dependencies a venv for this checkout needs, from its lock files."""
+    requirements = set()
+    pyproject = worktree_dir / "pyproject.toml"
+    if pyproject.exists():
+        project = tomllib.loads(pyproject.read_text(encoding="utf-8")).get("project", {})
+        requirements.update(str(item).strip() for item in project.get("dependencies", []))
+    requirements_txt = worktree_dir / "requirements.txt"
+    if requirements_txt.exists():
+        for line in requirements_txt.read_text(encoding="utf-8").splitlines():
+            text = line.split("#", 1)[0].strip()
+            if text:
+                requirements.add(text)
+    # Tool requirements only fill in projects the checkout does not pin itself.
+    pinned = {_project_name(item) for item in requirements}
+    requirements.update(item for item in TOOL_REQUIREMENTS if _project_name(item) not in pinned)
+    return sorted(requirements)
+
+
+def _project_name(requirement: str) -> str:
+    return re.split(r"[\s<>=!~;\[(]", requirement, maxsplit=1)[0].lower().replace("_", "-")
+
+
+def lock_digest(worktree_dir: Path) -> str:
+    payload = {
+        "python": f"{sys.version_info.major}.{sys.version_info.minor}",
+        "requirements": lock_requirements(worktree_dir),
+        "lock_files": {
+            name: hashlib.sha256((worktree_dir / name).read_bytes()).hexdigest()
+            for name in LOCK_FILES
+            if (worktree_dir / name).exists()
+        },
+    }
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ReproMatrix:
+    def __init__(self, config: MatrixConfig) -> None:
+        self.config = config
+        self._git_lock = threading.Lock()
+        self._fetched = _Once()
+        self._worktrees = _Once()
+        self._venvs = _Once()
+        self._tests = _Once()
+        self.reused: Dict[str, bool] = {}
+
+    def run(self, cases: Sequence[ReproCase]) -> Dict[str, object]:
+        with ThreadPoolExecutor(max_workers=max(1, self.config.jobs), thread_name_prefix="hpl-repro") as pool:
+            results = list(pool.map(self.run_case, cases))
+        return {
+            "format": REPORT_FORMAT,
+            "ok": bool(results) and all(item["CONTRACT_MATCH"] and item["MERKLE_MATCH"] for item in results),
+            "cases": results,
+        }
+
+    def run_case(self, case: ReproCase) -> Dict[str, object]:
+        started = time.perf_counter()
+        record: Dict[str, object] = {
+            "case": case.case_id,
+            "demo_name": case.demo_name,
+            "git_commit": case.git_commit,
+            "reference_manifest": str(case.reference_manifest),
+            "reference_leaves": str(case.reference_leaves),
+        }
+        try:
+            worktree_dir = self._worktrees.get(case.git_commit, lambda: self._prepare_worktree(case.git_commit))
+            digest = lock_digest(worktree_dir)
+            python_path = self._venvs.get(digest, lambda: self._prepare_venv(digest, worktree_dir))
+            env = _worktree_env(worktree_dir)
+            if not self.config.skip_tests:
+                self._tests.get(
+                    f"{case.git_commit}:{digest}",
+                    lambda: track_a._run([str(python_path), "-m", "pytest", "-q"], cwd=worktree_dir, env=env),
+                )
+            out_dir = Path("artifacts") / "phase1" / case.demo_name.replace("-", "_") / "repro_matrix"
+            generated = track_a._run_demo_and_anchor(
+                python_path=python_path,
+                worktree_dir=worktree_dir,
+                config=self._track_a_config(case, worktree_dir, out_dir),
+                reference_commit=case.git_commit,
+                env=env,
+            )
+            compare = track_a._compare_contracts(
+                python_path=Path(sys.executable),
+                repo_root=self.config.repo_root,
+                reference_manifest=case.reference_manifest,
+                reference_leaves=case.reference_leaves,
+                candidate_manifest=generated["anchor_manifest"],
+                candidate_leaves=generated["anchor_leaves"],
+            )
+            record.update(
+                {
+                    "candidate_manifest": str(generated["anchor_manifest"]),
+                    "candidate_leaves": str(generated["anchor_leaves"]),
+                    "bundle_dir": str(generated["bundle_dir"]),
+                    "lock_digest": digest,
+                    "worktree_reused": self.reused.get(f"worktree:{case.git_commit}", False),
+                    "venv_reused": self.reused.get(f"venv:{digest}", False),
+                    "CONTRACT_MATCH": bool(compare.get("CONTRACT_MATCH")),
+                    "MERKLE_MATCH": bool(compare.get("MERKLE_MATCH")),
+                    "ROOT_CAUSE": str(compare.get("ROOT_CAUSE")),
+                    "NEXT_ACTION": str(compare.get("NEXT_ACTION")),
+                    "first_divergent_leaf": compare.get("first_divergent_leaf"),
+                    "compare_exit_code": int(compare.get("compare_exit_code", 1)),
+                }
+            )
+        except Exception as exc:
+            record.update(
+                {
+                    "CONTRACT_MATCH": False,
+                    "MERKLE_MATCH": False,
+                    "ROOT_CAUSE": "repro_case_failed",
+                    "NEXT_ACTION": str(exc),
+                }
+            )
+        record["seconds"] = round(time.perf_counter() - started, 3)
+        return record
+
+    def _prepare_worktree(self, git_commit: str) -> Path:
+        worktree_dir = self.config.cache_dir / "worktrees" / git_commit[:12]
+        if worktree_dir.exists() and _worktree_head(worktree_dir) == git_commit:
+            # Edits and artifacts left by an earlier or aborted run must not
+            # leak into this check, so a dirty worktree is reset first.
+            if not _worktree_clean(worktree_dir):
+                track_a._run(["git", "checkout", "-f", git_commit], cwd=worktree_dir)
+                track_a._run(["git", "clean", "-fdxq"], cwd=worktree_dir)
+            self.reused[f"worktree:{git_commit}"] = True
+            return worktree_dir
+        with self._git_lock:
+            # git serialises worktree changes through a lock in the main repository.
+            if self.config.fetch:
+                self._fetched.get(
+                    "origin", lambda: track_a._run(["git", "fetch", "origin"], cwd=self.config.repo_root)
+                )
+            worktree_dir.parent.mkdir(parents=True, exist_ok=True)
+            track_a._add_worktree(self.config.repo_root, worktree_dir, git_commit)
+        self.reused[f"worktree:{git_commit}"] = False
+        return worktree_dir
+
+    def _prepare_venv(self, digest: str, worktree_dir: Path) -> Path:
+        venv_dir = self.config.cache_dir / "venvs" / digest[:16]
+        python_path = track_a._venv_python(venv_dir)
+        marker = venv_dir / VENV_MARKER
+        if self.config.recreate_venvs and venv_dir.exists():
+            shutil.rmtree(venv_dir)
+        elif marker.exists() and marker.read_text(encoding="utf-8").strip() == digest and python_path.exists():
+            self.reused[f"venv:{digest}"] = True
+            return python_path
+        if venv_dir.exists():
+            # An unmarked venv is a leftover from an interrupted install.
+            shutil.rmtree(venv_dir)
+        track_a._run([sys.executable, "-m", "venv", str(venv_dir)], cwd=worktree_dir)
+        track_a._run([str(python_path), "-m", "pip", "install", "-U", "pip"], cwd=worktree_dir)
+        track_a._run([str(python_path), "-m", "pip", "install", *lock_requirements(worktree_dir)], cwd=worktree_dir)
+        marker.write_text(digest, encoding="utf-8")
+        self.reused[f"venv:{digest}"] = False
+        return python_path
+
+    def _track_a_config(self, case: ReproCase, worktree_dir: Path, out_dir: Path) -> track_a.TrackAConfig:
+        return track_a.TrackAConfig(
+            repo_root=self.config.repo_root,
+            worktree_dir=worktree_dir,
+            reference_manifest=case.reference_manifest,
+            reference_leaves=case.reference_leaves,
+            out_dir=out_dir,
+            demo_name=case.demo_name,
+            signing_key=self.config.signing_key,
+            public_key=self.config.public_key,
+            repo_slug=self.config.repo_slug,
+            skip_tests=self.config.skip_tests,
+            recreate_venv=self.config.recreate_venvs,
+        )
+
+
+def _worktree_head(worktree_dir: Path) -> Optional[str]:
+    result = track_a._run(["git", "rev-parse", "HEAD"], cwd=worktree_dir, capture=True, check=False)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _worktree_clean(worktree_dir: Path) -> bool:
+    result = track_a._run(
+        ["git", "status", "--porcelain", "--ignored"], cwd=worktree_dir, capture=True, check=False
+    )
+    return result.returncode == 0 and not result.stdout.strip()
+
+
+def _worktree_env(worktree_dir: Path) -> Dict[str, str]:
+    env = os.environ.copy()
+    src_path = str(worktree_dir / "src")
+    env["PYTHONPATH"] = src_path + os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else src_path
+    return env
+
+
+def _resolve(repo_root: Path, path: Path) -> Path:
+    return path.resolve() if path.is_absolute() else (repo_root / path).resolve()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run Track A reproducibility for many demo/commit references.")
+    parser.add_argument("--repo-root", type=Path, default=Path.cwd())
+    parser.add_argument("--references-root", type=Path, default=DEFAULT_REFERENCES_ROOT)
+    parser.add_argument("--demo", action="append", help="only cases for this demo (repeatable)")
+    parser.add_argument("--commit", action="append", help="only cases whose commit starts with this (repeatable)")
+    parser.add_argument("--cache-dir", type=Path, default=Path.cwd().parent / "hpl-repro-cache")
+    parser.add_argument("--jobs", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--signing-key", type=Path, default=track_a.DEFAULT_SIGNING_KEY)
+    parser.add_argument("--public-key", type=Path, default=track_a.DEFAULT_PUBLIC_KEY)
+    parser.add_argument("--repo", default=track_a.DEFAULT_REPO_SLUG)
+    parser.add_argument("--no-fetch", action="store_true", help="use only commits already in the repository")
+    parser.add_argument("--skip-tests", action="store_true")
+    parser.add_argument("--recreate-venvs", action="store_true")
+    parser.add_argument("--report", type=Path, help="write the aggregated report here")
+    args = parser.parse_args(argv)
+
+    repo_root = args.repo_root.resolve()
+    config = MatrixConfig(
+        repo_root=repo_root,
+        cache_dir=args.cache_dir.resolve(),
+        signing_key=_resolve(repo_root, args.signing_key),
+        public_key=_resolve(repo_root, args.public_key),
+        repo_slug=args.repo,
+        jobs=args.jobs,
+        fetch=not args.no_fetch,
+        skip_tests=bool(args.skip_tests),
+        recreate_venvs=bool(args.recreate_venvs),
+    )
+    try:
+        track_a._ensure_paths_exist([config.signing_key, config.public_key])
+        cases = discover_cases(_resolve(repo_root, args.references_root), args.demo, args.commit)
+        if not cases:
+            raise ValueError("no reference anchors matched the requested demos/commits")
+        report = ReproMatrix(config).run(cases)
+    except Exception as exc:
+        error = {
+            "format": REPORT_FORMAT,
+            "ok": False,
+            "ROOT_CAUSE": "repro_matrix_failed",
+            "NEXT_ACTION": str(exc),
+        }
+        print(json.dumps(error, sort_keys=True, separators=(",", ":")))
+        return 2
+
+    text = json.dumps(report, sort_keys=True, separators=(",", ":"))
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(text, encoding="utf-8")
+    print(text)
+    for item in report["cases"]:  # type: ignore[union-attr]
+        print(
+            f"{item['case']} CONTRACT_MATCH={'true' if item['CONTRACT_MATCH'] else 'false'} "
+            f"MERKLE_MATCH={'true' if item['MERKLE_MATCH'] else 'false'}"
+        )
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -45,12 +45,14 @@ def _run(
     cwd: Path,
     capture: bool = False,
     check: bool = True,
+    env: Optional[Dict[str, str]] = None,
 ) -> subprocess.CompletedProcess[str]:
     result = subprocess.run(
         list(cmd),
         cwd=cwd,
         text=True,
         capture_output=capture,
+        env=env,
     )
     if check and result.returncode != 0:
         detail = (result.stderr or result.stdout or "").strip()
@@ -96,6 +98,10 @@ def _ensure_paths_exist(paths: Iterable[Path]) -> None:
 
 def _ensure_worktree(repo_root: Path, worktree_dir: Path, git_commit: str) -> None:
     _run(["git", "fetch", "origin"], cwd=repo_root, check=True)
+    _add_worktree(repo_root, worktree_dir, git_commit)
+
+
+def _add_worktree(repo_root: Path, worktree_dir: Path, git_commit: str) -> None:
     cat_result = _run(["git", "cat-file", "-e", f"{git_commit}^{{commit}}"], cwd=repo_root, check=False)
     if cat_result.returncode != 0:
         raise RuntimeError(f"Reference git_commit not found in repository: {git_commit}")
@@ -159,6 +165,7 @@ def _run_demo_and_anchor(
     worktree_dir: Path,
     config: TrackAConfig,
     reference_commit: str,
+    env: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Path]:
     demo_result = _run(
         [
@@ -177,6 +184,7 @@ def _run_demo_and_anchor(
         cwd=worktree_dir,
         capture=True,
         check=True,
+        env=env,
     )
     demo_payload = _extract_json_line(demo_result.stdout)
     if not demo_payload.get("ok"):
@@ -206,6 +214,7 @@ def _run_demo_and_anchor(
         ],
         cwd=worktree_dir,
         check=True,
+        env=env,
     )
     _run(
         [
@@ -218,6 +227,7 @@ def _run_demo_and_anchor(
         ],
         cwd=worktree_dir,
         check=True,
+        env=env,
     )
     return {
         "bundle_dir": bundle_dir,
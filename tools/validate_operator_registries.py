@@ -51,12 +51,15 @@ def _resolve_registry_paths(args: List[str]) -> List[Path]:
 
 
 def validate_registry_file(path: Path, schema: Dict) -> List[str]:
-    errors: List[str] = []
     try:
         data = json.loads(path.read_text(encoding="utf-8"))
     except json.JSONDecodeError as exc:
         return [f"Invalid JSON: {exc}"]
+    return validate_registry_data(data, schema)
+
 
+def validate_registry_data(data: object, schema: Dict) -> List[str]:
+    errors: List[str] = []
     _validate_object(data, schema, errors, "root")
     return errors
 
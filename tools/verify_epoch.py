@@ -1,25 +1,35 @@
 from __future__ import annotations
 
 import argparse
-import importlib.util
 import json
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 ROOT = Path(__file__).resolve().parents[1]
-TOOLS_PATH = ROOT / "tools" / "anchor_epoch.py"
-SPEC = importlib.util.spec_from_file_location("anchor_epoch", TOOLS_PATH)
-anchor_epoch = importlib.util.module_from_spec(SPEC)
-SPEC.loader.exec_module(anchor_epoch)
+# Only needed when run as a script; as ``tools.<name>`` the package is already bound.
+if not __package__ and str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools import anchor_epoch
 
 build_epoch_anchor = anchor_epoch.build_epoch_anchor
+FileHashCache = anchor_epoch.FileHashCache
 
 
 def main() -> int:
     args = _parse_args()
     anchor = json.loads(args.anchor.read_text(encoding="utf-8"))
-    ok, errors = verify_epoch_anchor(anchor, root=args.root, git_commit_override=args.git_commit)
-    result = {"ok": ok, "errors": errors}
+    file_hashes = FileHashCache(verify=True if args.verify_hashes else None)
+    ok, errors = verify_epoch_anchor(
+        anchor,
+        root=args.root,
+        git_commit_override=args.git_commit,
+        file_hashes=file_hashes,
+    )
+    result: Dict[str, object] = {"ok": ok, "errors": errors}
+    if file_hashes.verify:
+        result["hash_cache"] = file_hashes.stats()
     print(json.dumps(result, indent=2))
     return 0 if ok else 1
 
@@ -28,8 +38,12 @@ def verify_epoch_anchor(
     anchor: Dict[str, object],
     root: Path,
     git_commit_override: Optional[str] = None,
+    verify_hashes: bool = False,
+    file_hashes: Optional[FileHashCache] = None,
 ) -> Tuple[bool, List[str]]:
     errors: List[str] = []
+    if file_hashes is None and verify_hashes:
+        file_hashes = FileHashCache(verify=True)
 
     epoch_id = anchor.get("epoch_id")
     timestamp = anchor.get("timestamp_utc")
@@ -50,6 +64,8 @@ def verify_epoch_anchor(
         git_commit=str(git_commit) if git_commit else None,
         root=root,
         emit_witness=emit_witness,
+        verify_hashes=verify_hashes,
+        file_hashes=file_hashes,
     )
 
     errors.extend(_compare_field(anchor, current, "git_commit"))
@@ -62,6 +78,12 @@ def verify_epoch_anchor(
     if emit_witness:
         errors.extend(_compare_field(anchor, current, "papas_witness_digest"))
 
+    # A stale entry means runs without verification would have trusted a
+    # digest that no longer matches the file, so the cache fails the check.
+    stale = file_hashes.stats()["stale"] if file_hashes is not None and file_hashes.verify else 0
+    if stale:
+        errors.append(f"hash cache: {stale} stale digest(s)")
+
     return not errors, errors
 
 
@@ -78,6 +100,11 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument("anchor", type=Path)
     parser.add_argument("--root", type=Path, default=ROOT)
     parser.add_argument("--git-commit")
+    parser.add_argument(
+        "--verify-hashes",
+        action="store_true",
+        help="Re-hash every file instead of trusting cached digests for unchanged stat data.",
+    )
     return parser.parse_args()
 
 